@@ -13,7 +13,7 @@ from warnings import warn
 import RCAIDE
 from RCAIDE.Framework.Analyses.Atmospheric import Atmospheric
 from RCAIDE.Framework.Mission.Common.Conditions import Conditions
-from RCAIDE.Framework.Core import Units
+from RCAIDE.Framework.Core import Units, Data
 from RCAIDE.Framework.Core.Arrays import atleast_2d_col
 
 from RCAIDE.Library.Attributes.Gases import Air
@@ -56,6 +56,10 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = RCAIDE.Library.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        self.settings.use_atmosphere_table        = False  # interpolates the temperature and pressure in a table instead of the layer equations
+        self.settings.atmosphere_table_resolution = 10.    # m, largest spacing of the table in geopotential altitude
+        self.table                                = None   # built by build_atmosphere_table on first use
     
     def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
 
@@ -83,6 +87,7 @@ class US_Standard_1976(Atmospheric):
            
         Properties Used:
         self.
+          settings.use_atmosphere_table          [-]
           fluid_properties.gas_specific_constant [J/(kg*K)]
           planet.sea_level_gravity               [m/s^2]
           planet.mean_radius                     [m]
@@ -95,18 +100,9 @@ class US_Standard_1976(Atmospheric):
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
-        planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
         Rad       = self.planet.mean_radius
-        R         = gas.gas_specific_constant
         delta_isa = temperature_deviation
         
-        # check properties
-        if not gas == Air():
-            warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('US Standard Atmosphere not using Earth planet properties')          
-        
         # convert input if necessary
         zs = atleast_2d_col(zs)
 
@@ -125,6 +121,73 @@ class US_Standard_1976(Atmospheric):
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
             zs[zs > zmax] = zmax        
 
+        if self.settings.use_atmosphere_table:
+            table = self.build_atmosphere_table()
+            
+            # locate the table interval with a single search, altitudes at a break use the layer above it
+            i = np.clip(np.searchsorted(table.altitude,zs,side='right') - 1,0,len(table.altitude) - 2)
+            w = (zs - table.altitude[i])/(table.altitude[i+1] - table.altitude[i])
+            p = np.exp(table.log_pressure[i] + w*(table.log_pressure[i+1] - table.log_pressure[i]))
+            T = table.temperature[i] + w*(table.temperature[i+1] - table.temperature[i]) + delta_isa
+        else:
+            p,T = self.compute_layer_values(zs,delta_isa)
+            
+        rho   = gas.compute_density(T,p)
+        a     = gas.compute_speed_of_sound(T,p,var_gamma)
+        mu    = gas.compute_absolute_viscosity(T)
+        K     = gas.compute_thermal_conductivity(T)  
+        Pr    = gas.compute_prandtl_number(T)
+        
+        atmo_data = Conditions()
+        atmo_data.expand_rows(zs.shape[0])
+        atmo_data.pressure                     = p
+        atmo_data.temperature                  = T
+        atmo_data.density                      = rho
+        atmo_data.speed_of_sound               = a
+        atmo_data.dynamic_viscosity            = mu
+        atmo_data.kinematic_viscosity          = mu/rho
+        atmo_data.thermal_conductivity         = K
+        atmo_data.prandtl_number               = Pr 
+        
+        return atmo_data
+
+    def compute_layer_values(self,zs,delta_isa):
+        """Computes the pressure and temperature from the equations of the layers of the atmosphere.
+
+        Assumptions:
+        US 1976 Standard Atmosphere
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        zs                                       [m] geopotential altitude
+        delta_isa                                [K]
+
+        Output:
+        p                                        [Pa]
+        T                                        [K]
+           
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        gas       = self.fluid_properties
+        planet    = self.planet
+        grav      = self.planet.sea_level_gravity        
+        R         = gas.gas_specific_constant
+        
+        # check properties
+        if not gas == Air():
+            warn('US Standard Atmosphere not using Air fluid properties')
+        if not planet == Earth():
+            warn('US Standard Atmosphere not using Earth planet properties')          
+
         # initialize return data
         zeros = np.zeros_like(zs)
         p     = zeros * 0.0
@@ -155,24 +218,86 @@ class US_Standard_1976(Atmospheric):
         p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
         
         T     = T0 - dz*alpha + delta_isa
-        rho   = gas.compute_density(T,p)
-        a     = gas.compute_speed_of_sound(T,p,var_gamma)
-        mu    = gas.compute_absolute_viscosity(T)
-        K     = gas.compute_thermal_conductivity(T)  
-        Pr    = gas.compute_prandtl_number(T)
         
-        atmo_data = Conditions()
-        atmo_data.expand_rows(zs.shape[0])
-        atmo_data.pressure                     = p
-        atmo_data.temperature                  = T
-        atmo_data.density                      = rho
-        atmo_data.speed_of_sound               = a
-        atmo_data.dynamic_viscosity            = mu
-        atmo_data.kinematic_viscosity          = mu/rho
-        atmo_data.thermal_conductivity         = K
-        atmo_data.prandtl_number               = Pr 
+        return p,T
+
+    def build_atmosphere_table(self):
+        """Tabulates the logarithm of the pressure and the temperature of the standard day in geopotential altitude.
+        Every layer is tabulated from its own equations, including both of its breaks, so that the temperature is
+        linear and the logarithm of the pressure is smooth between neighbouring points. The piecewise linear
+        interpolation is monotone and the relative pressure error of each layer is bounded by
+        h^2/8 g |dT/dz|/(R T_min^2), with h the spacing of the layer. The table does not depend on the temperature deviation, which only offsets the temperature, and it is
+        rebuilt when the breaks, gas, planet or resolution change.
+
+        Assumptions:
+        US 1976 Standard Atmosphere
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        None
+
+        Output:
+        table.
+          altitude                               [m] geopotential altitude
+          temperature                            [K]
+          log_pressure                           [-]
+          pressure_error_bound                   [-] largest relative pressure error
+           
+        Properties Used:
+        self.
+          settings.atmosphere_table_resolution   [m]
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        resolution = self.settings.atmosphere_table_resolution
+        breaks     = self.breaks
+        key        = (float(resolution),float(self.fluid_properties.gas_specific_constant),float(self.planet.sea_level_gravity),
+                      np.asarray(breaks.altitude).tobytes(),np.asarray(breaks.temperature).tobytes(),np.asarray(breaks.pressure).tobytes())
+        if self.table is not None and self.table.key == key:
+            return self.table
         
-        return atmo_data
+        # each layer holds both of its breaks, the rounded break pressures make the equations of neighbouring layers
+        # differ slightly at their common break
+        grav         = self.planet.sea_level_gravity        
+        R            = self.fluid_properties.gas_specific_constant
+        z_breaks     = np.asarray(breaks.altitude,dtype=float)
+        altitudes    = []
+        temperatures = []
+        pressures    = []
+        bound        = 0.
+        for i in range(len(z_breaks)-1):
+            num_points = int(np.ceil((z_breaks[i+1] - z_breaks[i])/resolution))
+            z          = np.linspace(z_breaks[i],z_breaks[i+1],num_points + 1)
+            dz         = z - z_breaks[i]
+            T0         = breaks.temperature[i]
+            p0         = breaks.pressure[i]
+            alpha      = -(breaks.temperature[i+1] - breaks.temperature[i])/(z_breaks[i+1] - z_breaks[i])
+            if alpha == 0.:
+                p = p0 * np.exp(-1.*dz*grav/(R*T0))
+            else:
+                p = p0 * ( (1.-alpha*dz/T0) **(1.*grav/(alpha*R)) )
+            altitudes.append(z)
+            temperatures.append(T0 - dz*alpha)
+            pressures.append(p)
+            
+            # bound of the interpolation error of the logarithm of the pressure
+            T_min = min(breaks.temperature[i],breaks.temperature[i+1])
+            bound = max(bound,np.max(np.diff(z))**2/8*grav*abs(alpha)/(R*T_min**2))
+        
+        table                      = Data()
+        table.key                  = key
+        table.altitude             = np.concatenate(altitudes)
+        table.temperature          = np.concatenate(temperatures)
+        table.log_pressure         = np.log(np.concatenate(pressures))
+        table.pressure_error_bound = np.expm1(bound) 
+        self.table                 = table
+        return table
 
 
 # ----------------------------------------------------------------------
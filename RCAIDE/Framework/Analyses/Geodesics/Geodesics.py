@@ -6,19 +6,25 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------  
 # RCAIDE imports
-from  RCAIDE.Library.Methods.Geodesics.Geodesics import Geodesic_Calculate
+from  RCAIDE.Library.Methods.Geodesics.Geodesics         import Geodesic_Calculate
+from  RCAIDE.Library.Methods.Geodesics.compute_geodesics import compute_geodesic_inverse
+
+# package imports
+import numpy as np
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Calculate Distance between two coordinate locations
 # ----------------------------------------------------------------------------------------------------------------------  
 def Calculate_Distance(coord1, coord2):
-    """This passes the coordinates to the distance calculation method and then returns the results in kilometers
+    """This passes the coordinates to the distance calculation method and then returns the results in kilometers.
+       Arrays of coordinates, with the latitude and longitude along the last axis, are computed together
+       by the vectorized geodesic solution and broadcast against each other.
     
        Inputs:
-       - Coordinates (lat, long)
+       - Coordinates (lat, long) or arrays of coordinates (..., 2)
        
        Outputs:
-       - Distance in kilometers between the two coordinates.
+       - Distance in kilometers between the two coordinates, or array of distances.
        
        Assumptions:
        None
@@ -26,5 +32,10 @@ def Calculate_Distance(coord1, coord2):
        Source:
        None 
             """    
-    distance = Geodesic_Calculate(coord1, coord2).kilometers
-    return(distance)
\ No newline at end of file
+    coord1 = np.asarray(coord1)
+    coord2 = np.asarray(coord2)
+    if coord1.ndim > 1 or coord2.ndim > 1:
+        distance = compute_geodesic_inverse(coord1[...,0],coord1[...,1],coord2[...,0],coord2[...,1]).distance / 1000.
+    else:
+        distance = Geodesic_Calculate(coord1, coord2).kilometers
+    return(distance)
@@ -11,7 +11,8 @@
 import RCAIDE
 from RCAIDE.Library.Methods.Noise.Common.decibel_arithmetic                           import SPL_arithmetic  
 from RCAIDE.Library.Methods.Noise.Common.generate_hemisphere_microphone_locations     import generate_hemisphere_microphone_locations  
-from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor.compute_rotor_noise  import compute_rotor_noise 
+from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor.compute_rotor_noise  import prepare_rotor_noise 
+from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor.compute_rotor_noise_tasks import compute_rotor_noise_tasks 
 from .Noise      import Noise
 
 # package imports
@@ -63,6 +64,10 @@ class Frequency_Domain_Buildup(Noise):
         self.tag                                   =  "Frequency_Domain_Buildup"        
         self.settings.fidelity                     = 'line_source'
         self.settings.use_plane_loading_surrogate =  True 
+        self.settings.share_blade_loading          = True  # reuses the blade loading computed by the panel method for the same airfoil, angle of attack and Reynolds number
+        self.settings.harmonic_noise_memory_budget = 1E8   # bytes, computes the harmonic noise in chunks of microphones that fit in the budget, None for a single chunk
+        self.settings.number_of_noise_workers      = 1     # rotor and control point noise tasks run in a pool when more than 1
+        self.settings.noise_executor               = 'thread'  # 'thread' or 'process' pool of the noise tasks
     def evaluate_noise(self,segment):
         """ Process vehicle to setup vehicle, condititon and configuration
     
@@ -74,7 +79,9 @@ class Frequency_Domain_Buildup(Noise):
     
         Inputs:
         self.settings.
-            center_frequencies  - 1/3 octave band frequencies   [unitless]
+            center_frequencies      - 1/3 octave band frequencies                  [unitless]
+            number_of_noise_workers - number of threads or processes of the pool   [unitless]
+            noise_executor          - 'thread' or 'process' pool                   [unitless]
     
         Outputs:
         None
@@ -96,18 +103,28 @@ class Frequency_Domain_Buildup(Noise):
         total_SPL_dBA          = np.ones((ctrl_pts,N_hemisphere_mics))*1E-16 
         total_SPL_spectra      = np.ones((ctrl_pts,N_hemisphere_mics,dim_cf))*1E-16  
          
-        # iterate through sources and iteratively add rotor noise
+        # prepare the rotors in order, the noise of each rotor and control point is then independent
         rotor_tag = None
+        rotors    = []
         i = 0
         for network in config.networks:
             for propulsor in network.propulsors:
                 for sub_tag , sub_item in  propulsor.items():
                     if isinstance(sub_item, RCAIDE.Library.Components.Powertrain.Converters.Rotor): 
-                        rotor_tag         = compute_rotor_noise(microphone_locations,sub_item,segment,settings, rotor_index = i, previous_rotor_tag= rotor_tag, identical_propulsors=network.identical_propulsors)   
-                        total_SPL_dBA     = SPL_arithmetic(np.concatenate((total_SPL_dBA[:,None,:],conditions.noise.converters[sub_item.tag].SPL_dBA[:,None,:]),axis =1),sum_axis=1)
-                        total_SPL_spectra = SPL_arithmetic(np.concatenate((total_SPL_spectra[:,None,:,:],conditions.noise.converters[sub_item.tag].SPL_1_3_spectrum[:,None,:,:]),axis =1),sum_axis=1) 
+                        prepare_rotor_noise(sub_item,conditions,settings, rotor_index = i, previous_rotor_tag= rotor_tag, identical_propulsors=network.identical_propulsors)   
+                        rotor_tag = sub_item.tag
+                        rotors.append(sub_item)
                         i += 1
                         
+        # compute the noise of the rotors, concurrently if settings.number_of_noise_workers is more than 1
+        rotor_results = compute_rotor_noise_tasks(microphone_locations,rotors,conditions,settings)
+        
+        # iteratively add rotor noise in the order of the rotors
+        for rotor,Results in zip(rotors,rotor_results):
+            conditions.noise.converters[rotor.tag] = Results
+            total_SPL_dBA     = SPL_arithmetic(np.concatenate((total_SPL_dBA[:,None,:],conditions.noise.converters[rotor.tag].SPL_dBA[:,None,:]),axis =1),sum_axis=1)
+            total_SPL_spectra = SPL_arithmetic(np.concatenate((total_SPL_spectra[:,None,:,:],conditions.noise.converters[rotor.tag].SPL_1_3_spectrum[:,None,:,:]),axis =1),sum_axis=1) 
+                        
         conditions.noise.hemisphere_SPL_dBA              = total_SPL_dBA
         conditions.noise.hemisphere_SPL_1_3_spectrum_dBA = total_SPL_spectra  
         return
\ No newline at end of file
@@ -116,6 +116,17 @@ class Vortex_Lattice_Method(Stability):
         self.settings.leading_edge_suction_multiplier                    = 1.0  
         self.settings.use_VORLAX_matrix_calculation                      = False
         self.settings.floating_point_precision                           = np.float32     
+        self.settings.influence_matrix_memory_budget                     = None   # bytes, builds the influence matrix in tiles of control points when set
+        self.settings.cache_vortex_distribution                          = True   # reuses the vortex distribution between calls while the wings and fuselages are unchanged
+        self.settings.share_surrogates                                   = True   # reuses the surrogates trained by any analysis of the process for the same vehicle, settings and training grids
+
+        # on-disk cache of the surrogate training data, keyed by a hash of the geometry, settings and training grids
+        self.settings.surrogate_cache                                    = Data()
+        self.settings.surrogate_cache.enabled                            = False
+        self.settings.surrogate_cache.directory                          = None   # defaults to ~/.cache/RCAIDE/VLM_surrogates
+        self.settings.surrogate_cache.maximum_entries                    = 32
+        self.settings.surrogate_cache.maximum_size                       = None   # bytes
+        self.settings.number_of_training_workers                         = 1      # surrogate training sweeps run in a process pool when more than 1
     
         # conditions table, used for surrogate model training
         self.training                                               = Data()
@@ -202,11 +213,9 @@ class Vortex_Lattice_Method(Stability):
 
         # If we are using the surrogate
         if use_surrogate == True: 
-            # sample training data
-            train_VLM_surrogates(self)
-
-            # build surrogate
-            build_VLM_surrogates(self)  
+            # reuse the surrogates of an identical analysis of this process, otherwise load or sample the
+            # training data and build the surrogates
+            get_VLM_surrogates(self)  
     
         # build the evaluation process
         compute   =  self.process.compute                  
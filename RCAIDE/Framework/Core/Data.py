@@ -25,7 +25,15 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
                             '_'*len(chars) + string.ascii_lowercase )
 
 dictgetitem = dict.__getitem__
+dictget      = dict.get
 objgetattrib = object.__getattribute__
+objsetattrib = object.__setattr__
+
+# marks a key that is not in the dictionary
+missing = object()
+
+# names defined on each class and its bases, see class_attributes()
+class_attribute_cache = {}
 
 # ----------------------------------------------------------------------
 #   Data
@@ -46,7 +54,8 @@ class Data(dict):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Looks k up as a key first, if it is not a key treats it as an object attribute.
+            Neither lookup raises an exception unless k is not found at all.
     
             Source:
             N/A
@@ -60,16 +69,17 @@ class Data(dict):
             Properties Used:
             N/A
             """         
-        try:
-            return dictgetitem(self,k)
-        except:
+        v = dictget(self,k,missing)
+        if v is missing:
             return objgetattrib(self,k)
+        return v
 
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            If k is already an object attribute, either on the instance or on its class, it is set as one.
+            Otherwise it is treated as a key.
     
             Source:
             N/A
@@ -84,12 +94,10 @@ class Data(dict):
             Properties Used:
             N/A    
         """
-        try:
-            objgetattrib(self, k)
-        except:
+        if k in objgetattrib(self,'__dict__') or k in class_attributes(type(self)):
+            objsetattrib(self, k, v) 
+        else:
             self[k] = v
-        else:          
-            object.__setattr__(self, k, v) 
     
     def __defaults__(self):
         """ A stub for all classes that come later
@@ -539,6 +547,7 @@ class Data(dict):
                 will only pack int, float, np.array and np.matrix (max rank 2)
                 if using output = 'matrix', all data values must have 
                 same length (if 1D) or number of rows (if 2D), otherwise is skipped
+                vectors are packed from a cached layout plan, see get_pack_plan()
     
             Source:
             N/A
@@ -561,6 +570,13 @@ class Data(dict):
         if not output in ('vector','array'): raise Exception('output type must be "vector" or "array"')        
         vector = output == 'vector'
         
+        # vectors are filled straight into the buffer of the layout plan
+        if vector:
+            plan = self.get_pack_plan()
+            for D,k,start,shape,view in plan.entries:
+                view[...] = D[k]
+            return plan.buffer.copy()
+        
         # list to pre-dump array elements
         M = []
         
@@ -588,16 +604,11 @@ class Data(dict):
                 elif rank > 2: continue
                 # make column vectors
                 v = atleast_2d_col(v)
-                # handle output type
-                if vector:
-                    # unravel into 1d vector
-                    v = v.ravel(order='F')
-                else:
-                    # check array size
-                    size[0] = size[0] or v.shape[0] # updates size once on first array
-                    if v.shape[0] != size[0]: 
-                        #warn ('array size mismatch, skipping. all values in data must have same number of rows for array packing',RuntimeWarning)
-                        continue
+                # check array size
+                size[0] = size[0] or v.shape[0] # updates size once on first array
+                if v.shape[0] != size[0]: 
+                    #warn ('array size mismatch, skipping. all values in data must have same number of rows for array packing',RuntimeWarning)
+                    continue
                 # dump to list
                 M.append(v)
             #: for each value
@@ -610,10 +621,7 @@ class Data(dict):
             M = np.hstack(M)
         else:
             # empty result
-            if vector:
-                M = np.array([])
-            else:
-                M = np.array([[]])
+            M = np.array([[]])
         
         # done!
         return M
@@ -624,7 +632,7 @@ class Data(dict):
             of the contained values are the same as the data from which the array was packed
     
             Assumptions:
-            N/A
+            Vectors are unpacked with the cached layout plan, see get_pack_plan()
     
             Source:
             N/A
@@ -640,13 +648,26 @@ class Data(dict):
         """           
 
         
+        # check input type
+        vector = M.ndim  == 1
+        
+        # vectors are copied into the buffer of the layout plan and sliced from there
+        if vector:
+            plan   = self.get_pack_plan()
+            buffer = plan.buffer
+            buffer[:] = M[:buffer.shape[0]]
+            for D,k,start,shape,view in plan.entries:
+                if shape:
+                    D[k][...] = view
+                else:
+                    D[k] = M[start]
+            if not M.shape[0] == buffer.shape[0]: warn('did not unpack all values',RuntimeWarning)
+            return self
+        
         # dont require dict to have numpy
         import numpy as np
         from .Arrays import atleast_2d_col, array_type, matrix_type
         
-        # check input type
-        vector = M.ndim  == 1
-        
         # valid types for output
         valid_types = ( int, float,
                         array_type,
@@ -671,38 +692,21 @@ class Data(dict):
                 # get unpack index
                 index = _index[0]                
                 
-                # skip if too big
-                if rank > 2: 
+                # skip if too big or scalar
+                if rank > 2 or rank == 0: 
                     continue
-                
-                # scalars
-                elif rank == 0:
-                    if vector:
-                        D[k] = M[index]
-                        index += 1
-                    else:#array
-                        continue
-                        #raise RuntimeError , 'array size mismatch, all values in data must have same number of rows for array unpacking'
+                    #raise RuntimeError , 'array size mismatch, all values in data must have same number of rows for array unpacking'
                     
                 # 1d vectors
                 elif rank == 1:
-                    n = len(v)
-                    if vector:
-                        D[k][:] = M[index:(index+n)]
-                        index += n
-                    else:#array
-                        D[k][:] = M[:,index]
-                        index += 1
+                    D[k][:] = M[:,index]
+                    index += 1
                     
                 # 2d arrays
                 elif rank == 2:
                     n,m = v.shape
-                    if vector:
-                        D[k][:,:] = np.reshape( M[index:(index+(n*m))] ,[n,m], order='F')
-                        index += n*m 
-                    else:#array
-                        D[k][:,:] = M[:,index:(index+m)]
-                        index += m
+                    D[k][:,:] = M[:,index:(index+m)]
+                    index += m
                 
                 #: switch rank
                 
@@ -717,4 +721,164 @@ class Data(dict):
         if not M.shape[-1] == _index[0]: warn('did not unpack all values',RuntimeWarning)
          
         # done!
-        return self      
\ No newline at end of file
+        return self
+    
+    def get_pack_plan(self):
+        """ Returns the layout used to pack and unpack this data as a vector. The plan is built by walking the data
+            once and is cached on the instance. It is rebuilt whenever a key is added or removed, or a value changes
+            type or shape, anywhere in the tree.
+    
+            Assumptions:
+            Values are only modified in place or replaced by values of the same type and shape between calls
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+            
+            Outputs:
+            plan.entries - (container, key, start, shape, buffer view) of each packed value
+            plan.leaves  - (container, key, type, shape) of every value checked when the plan is reused
+            plan.buffer  - contiguous vector the packed values are written into
+    
+            Properties Used:
+            N/A    
+        """
+        plan = objgetattrib(self,'__dict__').get('_pack_plan')
+        if plan is None or not plan.is_valid():
+            plan = Pack_Plan(self)
+            object.__setattr__(self,'_pack_plan',plan)
+        return plan
+
+
+# ----------------------------------------------------------------------
+#   Class Attributes
+# ----------------------------------------------------------------------
+
+def class_attributes(cls):
+    """ Returns the names defined on a class and all of its bases, which are the names object.__getattribute__ finds
+        on the class. The set is computed once per class.
+    
+        Assumptions:
+        Attributes are not added to a class after its instances start setting attributes
+
+        Source:
+        N/A
+
+        Inputs:
+        cls    [type]
+
+        Outputs:
+        names  [frozenset]
+
+        Properties Used:
+        N/A    
+    """
+    names = class_attribute_cache.get(cls)
+    if names is None:
+        names = frozenset(name for klass in cls.__mro__ for name in vars(klass))
+        class_attribute_cache[cls] = names
+    return names
+
+# ----------------------------------------------------------------------
+#   Pack Plan
+# ----------------------------------------------------------------------
+
+# valid types for packing
+pack_types = ( int, float, array_type, matrix_type )
+
+class Pack_Plan(object):
+    """ A flat layout of the values that Data.pack_array() packs into a vector, used to avoid walking the data on
+        every call.
+        
+        Assumptions:
+        Follows the traversal and type rules of Data.pack_array()
+        
+        Source:
+        N/A
+    """
+    
+    __slots__ = ('entries','containers','children','leaves','buffer')
+    
+    def __init__(self,data):
+        """ Walks the data and lays out every packable value in a contiguous buffer
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            data   [Data()]
+    
+            Outputs:
+            N/A
+    
+            Properties Used:
+            N/A    
+        """        
+        layout          = []
+        self.containers = []
+        self.children   = []
+        self.leaves     = []
+        size            = [0]
+        
+        def do_plan(D):
+            keys = tuple(D.keys())
+            self.containers.append((D,keys))
+            for k in keys:
+                v = D[k]
+                if isinstance(v,dict):
+                    self.children.append((D,k,v))
+                    do_plan(v) # recursion!
+                    continue
+                self.leaves.append((D,k,type(v),getattr(v,'shape',None)))
+                if not isinstance(v,pack_types): continue
+                shape = np.shape(v)
+                if len(shape) > 2: continue
+                start = size[0]
+                size[0] += int(np.prod(shape))
+                layout.append((D,k,start,size[0],shape))
+        
+        do_plan(data)
+        
+        self.buffer  = np.zeros(size[0])
+        self.entries = []
+        for D,k,start,stop,shape in layout:
+            view = self.buffer[start:stop]
+            if len(shape) == 2:
+                # column major, as in ravel(order='F')
+                view = view.reshape(shape[::-1]).T
+            self.entries.append((D,k,start,shape,view))
+        
+    def is_valid(self):
+        """ Checks that the data still has the keys, types and shapes the plan was built from
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+    
+            Outputs:
+            valid  [bool]
+    
+            Properties Used:
+            N/A    
+        """  
+        for D,keys in self.containers:
+            if tuple(D.keys()) != keys:
+                return False
+        for D,k,child in self.children:
+            if D[k] is not child:
+                return False
+        for D,k,kind,shape in self.leaves:
+            v = D[k]
+            if type(v) is not kind or getattr(v,'shape',None) != shape:
+                return False
+        return True
@@ -133,6 +133,110 @@ class Conditions(Data):
                     self[k] = np.resize(v,[rows,v.shape[1]])
         
         return
+    
+    def freeze(self):
+        """ Moves every float array with one row per control point, anywhere in these conditions, into a single
+            contiguous 2-D block. Each array is replaced by a view into the block, so the whole state can be copied,
+            saved and restored at once. Arrays that were replaced since the last freeze are copied back into the block.
+    
+            Assumptions:
+            Only arrays with self._size rows inside nested Conditions are moved into the block
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            block    [array]
+    
+            Properties Used:
+            None
+        """
+        rows   = self._size
+        fields = []
+        
+        def do_collect(D):
+            for k,v in D.items():
+                if isinstance(v,Conditions):
+                    do_collect(v)
+                elif isinstance(v,np.ndarray) and v.ndim == 2 and v.shape[0] == rows and v.dtype == np.float64:
+                    fields.append((D,k,v))
+        
+        do_collect(self)
+        
+        layout = tuple((id(D),k,v.shape[1]) for D,k,v in fields)
+        block  = self.__dict__.get('_block')
+        
+        # reuse the block if the layout has not changed
+        if block is not None and block.layout == layout and all(view.base is block.buffer for view in block.views):
+            for (D,k,v),view in zip(fields,block.views):
+                if v is not view:
+                    view[...] = v
+                    D[k]      = view
+            return block.buffer
+        
+        # otherwise lay out a new one, column major so each array is contiguous
+        block        = Data()
+        block.layout = layout
+        block.buffer = np.empty((rows,sum(v.shape[1] for D,k,v in fields)),order='F')
+        block.views  = []
+        col          = 0
+        for D,k,v in fields:
+            view      = block.buffer[:,col:col+v.shape[1]]
+            view[...] = v
+            D[k]      = view
+            col      += v.shape[1]
+            block.views.append(view)
+        object.__setattr__(self,'_block',block)
+        
+        return block.buffer
+    
+    def snapshot(self):
+        """ Returns a copy of every array with one row per control point, for use with restore()
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            snapshot [array]
+    
+            Properties Used:
+            None
+        """
+        return self.freeze().copy()
+    
+    def restore(self,snapshot):
+        """ Writes a snapshot taken with snapshot() back into these conditions
+    
+            Assumptions:
+            The conditions have not gained or lost arrays since the snapshot was taken
+    
+            Source:
+            N/A
+    
+            Inputs:
+            snapshot [array]
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        block = self.freeze()
+        if block.shape != snapshot.shape:
+            raise ValueError('snapshot does not match the layout of these conditions')
+        block[...] = snapshot
+        
+        return
                 
 class expanded_array(Data):
     """ This is an array that will expand later when the mission is initialized. It is called specifically by conditions
@@ -45,6 +45,7 @@ class Numerics(Conditions):
         """           
         self.tag                              = 'numerics' 
         self.number_of_control_points         = 16
+        self.freeze_conditions                = False # store per control point conditions in one contiguous block
         self.discretization_method            = chebyshev_data
         self.solver                           = Data()
         self.solver.type                      = "optimize" # options: "optimize", "root_finder"
@@ -55,6 +56,7 @@ class Numerics(Conditions):
         self.solver.print_output              = True
         self.solver.max_evaluations           = 200
         self.solver.step_size                 = 1E-8    
+        self.solver.jacobian                  = "finite_difference" # options: "finite_difference", "colored" (root_finder only)
         
         self.dimensionless                    = Conditions()
         self.dimensionless.control_points     = np.empty([0,0])
@@ -13,6 +13,7 @@ from RCAIDE.Library.Methods.Powertrain.Systems.compute_avionics_power_draw
 from RCAIDE.Library.Methods.Powertrain.Systems.compute_payload_power_draw                 import compute_payload_power_draw
 from RCAIDE.Library.Methods.Powertrain.Converters.Motor.compute_motor_performance         import *
 from RCAIDE.Library.Methods.Powertrain.Converters.Generator.compute_generator_performance import * 
+from RCAIDE.Library.Methods.Powertrain.Distributors.Electrical_Bus                       import supports_bus_battery_time_marching
 from RCAIDE.Library.Components import Component
 
 # python imports 
@@ -235,59 +236,63 @@ class Network(Component):
         # 3.2 Electric Sources   
         for bus in  busses:
             if bus.active: 
-                for t_idx in range(state.numerics.number_of_control_points):            
-                    stored_results_flag       = False
-                    stored_battery_cell_tag   = None
+                # batteries without fuel cells or thermal management are computed over all control points at once
+                if supports_bus_battery_time_marching(bus,coolant_lines):
+                    bus.compute_battery_performance(state,delta_t)
+                else:
+                    for t_idx in range(state.numerics.number_of_control_points):            
+                        stored_results_flag       = False
+                        stored_battery_cell_tag   = None
                     
-                    # ------------------------------------------------------------------------------------------------------------------- 
-                    # 3.1 Batteries
-                    # -------------------------------------------------------------------------------------------------------------------                
-                    for battery_module in  bus.battery_modules:                   
-                        if bus.identical_battery_modules == False:
-                            # run analysis  
-                            stored_results_flag, stored_battery_cell_tag =  battery_module.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
-                        else:             
-                            if stored_results_flag == False: 
-                                # run battery analysis 
-                                stored_results_flag, stored_battery_cell_tag  =  battery_module.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
-                            else:
-                                # use previous battery results 
-                                battery_module.reuse_stored_data(state,bus,stored_results_flag, stored_battery_cell_tag)
+                        # ------------------------------------------------------------------------------------------------------------------- 
+                        # 3.1 Batteries
+                        # -------------------------------------------------------------------------------------------------------------------                
+                        for battery_module in  bus.battery_modules:                   
+                            if bus.identical_battery_modules == False:
+                                # run analysis  
+                                stored_results_flag, stored_battery_cell_tag =  battery_module.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
+                            else:             
+                                if stored_results_flag == False: 
+                                    # run battery analysis 
+                                    stored_results_flag, stored_battery_cell_tag  =  battery_module.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
+                                else:
+                                    # use previous battery results 
+                                    battery_module.reuse_stored_data(state,bus,stored_results_flag, stored_battery_cell_tag)
                       
-                    # ------------------------------------------------------------------------------------------------------------------- 
-                    # 3.2 Fuel Cell Stacks
-                    # ------------------------------------------------------------------------------------------------------------------- 
-                    stored_results_flag       = False   
-                    stored_fuel_cell_tag      = None                  
-                    for fuel_cell_stack in  bus.fuel_cell_stacks:                   
-                        if bus.identical_fuel_cell_stacks == False:
-                            # run analysis  
-                            stored_results_flag, stored_fuel_cell_tag =  fuel_cell_stack.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
-                        else:             
-                            if stored_results_flag == False: 
-                                # run battery analysis 
-                                stored_results_flag, stored_fuel_cell_tag  =  fuel_cell_stack.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
-                            else:
-                                # use previous battery results 
-                                fuel_cell_stack.reuse_stored_data(state,bus,stored_results_flag, stored_fuel_cell_tag)
+                        # ------------------------------------------------------------------------------------------------------------------- 
+                        # 3.2 Fuel Cell Stacks
+                        # ------------------------------------------------------------------------------------------------------------------- 
+                        stored_results_flag       = False   
+                        stored_fuel_cell_tag      = None                  
+                        for fuel_cell_stack in  bus.fuel_cell_stacks:                   
+                            if bus.identical_fuel_cell_stacks == False:
+                                # run analysis  
+                                stored_results_flag, stored_fuel_cell_tag =  fuel_cell_stack.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
+                            else:             
+                                if stored_results_flag == False: 
+                                    # run battery analysis 
+                                    stored_results_flag, stored_fuel_cell_tag  =  fuel_cell_stack.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
+                                else:
+                                    # use previous battery results 
+                                    fuel_cell_stack.reuse_stored_data(state,bus,stored_results_flag, stored_fuel_cell_tag)
                              
-                        # compute cryogen mass flow rate 
-                        fuel_cell_stack_conditions  = state.conditions.energy[bus.tag].fuel_cell_stacks[fuel_cell_stack.tag]                        
-                        cryogen_mdot[t_idx]        += fuel_cell_stack_conditions.H2_mass_flow_rate[t_idx]
+                            # compute cryogen mass flow rate 
+                            fuel_cell_stack_conditions  = state.conditions.energy[bus.tag].fuel_cell_stacks[fuel_cell_stack.tag]                        
+                            cryogen_mdot[t_idx]        += fuel_cell_stack_conditions.H2_mass_flow_rate[t_idx]
                         
-                        # compute total mass flow rate 
-                        total_mdot[t_idx]     += fuel_cell_stack_conditions.H2_mass_flow_rate[t_idx]    
+                            # compute total mass flow rate 
+                            total_mdot[t_idx]     += fuel_cell_stack_conditions.H2_mass_flow_rate[t_idx]    
                        
-                    # Step 3: Compute bus properties          
-                    bus.compute_distributor_conditions(state,t_idx, delta_t)
+                        # Step 3: Compute bus properties          
+                        bus.compute_distributor_conditions(state,t_idx, delta_t)
                     
-                    # Step 4 : Battery Thermal Management Calculations                    
-                    for coolant_line in coolant_lines:
-                        if t_idx != state.numerics.number_of_control_points-1: 
-                            for heat_exchanger in coolant_line.heat_exchangers: 
-                                heat_exchanger.compute_heat_exchanger_performance(state,bus,coolant_line,delta_t[t_idx],t_idx) 
-                            for reservoir in coolant_line.reservoirs:   
-                                reservoir.compute_reservior_coolant_temperature(state,coolant_line,delta_t[t_idx],t_idx) 
+                        # Step 4 : Battery Thermal Management Calculations                    
+                        for coolant_line in coolant_lines:
+                            if t_idx != state.numerics.number_of_control_points-1: 
+                                for heat_exchanger in coolant_line.heat_exchangers: 
+                                    heat_exchanger.compute_heat_exchanger_performance(state,bus,coolant_line,delta_t[t_idx],t_idx) 
+                                for reservoir in coolant_line.reservoirs:   
+                                    reservoir.compute_reservior_coolant_temperature(state,coolant_line,delta_t[t_idx],t_idx) 
            
                 # Step 5: Determine mass flow from cryogenic tanks 
                 for cryogenic_tank in bus.cryogenic_tanks:
@@ -62,6 +62,10 @@ class Electrical_Bus(Component):
     battery_module_electric_configuration : str
         Configuration of battery modules ('Series' or 'Parallel') (default: 'Series')
 
+    vectorized_battery_time_marching : bool
+        Flag to compute the battery modules over all control points of a segment at once when
+        the bus has no fuel cell stacks or thermal management system (default: True)
+
     Notes
     -----
     The electrical bus manages power distribution between sources and consumers,
@@ -109,6 +113,7 @@ class Electrical_Bus(Component):
         self.charging_c_rate                        = 1.0 
         self.battery_module_electric_configuration  = "Series"
         self.fuel_cell_stack_electric_configuration = "Series"
+        self.vectorized_battery_time_marching       = True 
         
     def append_operating_conditions(self, segment):
         """
@@ -160,4 +165,18 @@ class Electrical_Bus(Component):
             Time step
         """
         compute_bus_conditions(self,state,t_idx, delta_t)
+        return    
+
+    def compute_battery_performance(self,state,delta_t):
+        """
+        Compute the battery modules and the electrical conditions over all control points
+        
+        Parameters
+        ----------
+        state : Data
+            Current system state
+        delta_t : numpy.ndarray
+            Time steps
+        """
+        compute_bus_battery_performance(self,state,delta_t)
         return    
\ No newline at end of file
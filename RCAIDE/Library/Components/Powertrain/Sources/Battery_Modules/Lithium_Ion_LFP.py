@@ -12,6 +12,7 @@ import RCAIDE
 from RCAIDE.Framework.Core          import Units,Data
 from .Generic_Battery_Module import  Generic_Battery_Module
 from RCAIDE.Library.Methods.Powertrain.Sources.Batteries.Lithium_Ion_LFP  import * 
+from RCAIDE.Library.Methods.Powertrain.Sources.Batteries.Common.cell_data_cache import load_cell_data
 
 # package imports 
 import numpy as np  
@@ -140,8 +141,8 @@ class Lithium_Ion_LFP(Generic_Battery_Module):
         self.cell.radial_thermal_conductivity = 0.475                                                     # [J/kgK]  
         self.cell.axial_thermal_conductivity  = 37.6                                                      # [J/kgK]  
 
-        battery_raw_data                      = load_battery_results()                                                   
-        self.cell.discharge_performance_map   = create_discharge_performance_map(battery_raw_data)
+        # shared by every LFP module of the process, see load_cell_data
+        self.cell.discharge_performance_map   = load_cell_data(battery_results_file(),process_discharge_data,build_discharge_performance_map)
 
         return                                     
 
@@ -250,6 +251,25 @@ def create_discharge_performance_map(raw_data):
         University of Michigan.
         https://hdl.handle.net/2027.42/97341
     """    
+    return build_discharge_performance_map(process_discharge_data(raw_data))
+
+def process_discharge_data(raw_data):
+    """
+    Gathers the discharge curves of an LFP battery cell into arrays of points and voltages
+
+    Parameters
+    ----------
+    raw_data : dict
+        Dictionary containing battery test data, see create_discharge_performance_map
+
+    Returns
+    -------
+    processed_data : Data
+        - points : array
+            C-rate, temperature and discharge capacity of the measurements (n,3)
+        - voltages : array
+            Voltage of the measurements (n)
+    """
     # Prepare lists for the data needed for interpolation
     c_rates = []
     temperatures = []
@@ -270,11 +290,28 @@ def create_discharge_performance_map(raw_data):
             temperatures.extend([initial_temp] * len(data['discharge']))
 
     # Convert lists to numpy arrays
-    points = np.array([c_rates, temperatures, discharge_capacities]).T
-    values = np.array(voltages)
+    processed_data        = Data()
+    processed_data.points   = np.array([c_rates, temperatures, discharge_capacities],dtype=float).T
+    processed_data.voltages = np.array(voltages,dtype=float)
+    return processed_data
 
+def build_discharge_performance_map(processed_data):
+    """
+    Creates the interpolator of the discharge voltage of an LFP battery cell
+
+    Parameters
+    ----------
+    processed_data : Data
+        Output of process_discharge_data
+
+    Returns
+    -------
+    battery_data : NearestNDInterpolator
+        Interpolator function that takes [C-rate, temperature, discharge_capacity]
+        and returns voltage
+    """
     # Create the interpolant
-    battery_data = NearestNDInterpolator(points, values) # Can be replaced by a Linear Interpolator for a better fit but computation time increases by 30 times. 
+    battery_data = NearestNDInterpolator(processed_data.points, processed_data.voltages) # Can be replaced by a Linear Interpolator for a better fit but computation time increases by 30 times. 
 
     return battery_data
 
@@ -293,10 +330,12 @@ def load_battery_results():
     Returns:
         battery_data: raw data from battery   [unitless]
     '''    
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    full_path = os.path.join(current_dir, 'lfp_raw_data.res')
-
     # Load the raw_data using RCAIDE.load()
-    raw_data = RCAIDE.load(full_path)
+    raw_data = RCAIDE.load(battery_results_file())
+
+    return raw_data
 
-    return raw_data
\ No newline at end of file
+def battery_results_file():
+    """ Returns the file of the experimental raw data of LFP cells """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, 'lfp_raw_data.res')
@@ -11,6 +11,7 @@ import RCAIDE
 from RCAIDE.Framework.Core                                            import Units , Data
 from .Generic_Battery_Module                                          import Generic_Battery_Module   
 from RCAIDE.Library.Methods.Powertrain.Sources.Batteries.Lithium_Ion_NMC  import *
+from RCAIDE.Library.Methods.Powertrain.Sources.Batteries.Common.cell_data_cache import load_cell_data
 # package imports 
 import numpy as np
 import os 
@@ -166,8 +167,8 @@ class Lithium_Ion_NMC(Generic_Battery_Module):
         self.cell.axial_thermal_conductivity  = 32.2                                                                             # [J/kgK] # estimated
     
                                               
-        battery_raw_data                      = load_battery_results()                                                   
-        self.cell.discharge_performance_map   = create_discharge_performance_map(battery_raw_data)  
+        # shared by every NMC module of the process, see load_cell_data
+        self.cell.discharge_performance_map   = load_cell_data(battery_results_file(),process_discharge_data,build_discharge_performance_map)
 
         return  
     
@@ -295,13 +296,31 @@ def create_discharge_performance_map(raw_data):
     
     Uses regular grid interpolation for smooth predictions across the operating space.
     """   
+    return build_discharge_performance_map(process_discharge_data(raw_data))
+
+def process_discharge_data(raw_data):
+    """
+    Resamples the discharge curves of a LiNiMnCoO2 battery cell on a regular state of charge grid
+
+    Parameters
+    ----------
+    raw_data : Data
+        Container with experimental battery data, see create_discharge_performance_map
+
+    Returns
+    -------
+    processed_data : Data
+        - Voltage : array
+            State of charge and voltage per current and temperature (5,6,15,2)
+        - Temperature : array
+            State of charge and temperature per current and temperature (5,6,15,2)
+    """
     # Process raw data   
     processed_data = Data() 
     processed_data.Voltage        = np.zeros((5,6,15,2)) # current , operating temperature , state_of_charge vs voltage      
     processed_data.Temperature    = np.zeros((5,6,15,2)) # current , operating temperature , state_of_charge vs temperature 
 
     # Reshape  Data          
-    raw_data.Voltage 
     for i, Amps in enumerate(raw_data.Voltage):
         for j , Deg in enumerate(Amps):
             min_x    = 0 
@@ -323,7 +342,22 @@ def create_discharge_performance_map(raw_data):
             vec[:,0] = x/max_x
             vec[:,1] = y
             processed_data.Temperature[i,j,:,:]= vec  
-    
+    return processed_data
+
+def build_discharge_performance_map(processed_data):
+    """
+    Creates the interpolators of the discharge performance map of a LiNiMnCoO2 battery cell
+
+    Parameters
+    ----------
+    processed_data : Data
+        Output of process_discharge_data
+
+    Returns
+    -------
+    battery_data : Data
+        Container with interpolation functions, see create_discharge_performance_map
+    """
     # Create performance maps  
     battery_data             = Data() 
     amps                    = np.linspace(0, 8, 5)
@@ -350,7 +384,11 @@ def load_battery_results():
        Returns:
            battery_data: raw data from battery   [unitless]
     '''    
+    return RCAIDE.load(battery_results_file())
+
+def battery_results_file():
+    """ Returns the file of the experimental raw data of NMC cells """
     ospath    = os.path.abspath(__file__)
     separator = os.path.sep
     rel_path  = os.path.dirname(ospath) + separator     
-    return RCAIDE.load(rel_path+ 'NMC_Raw_Data.res')
\ No newline at end of file
+    return rel_path + 'NMC_Raw_Data.res'
@@ -10,6 +10,7 @@
 
 from .aero_coeff             import aero_coeff    
 from .airfoil_analysis       import airfoil_analysis 
+from .boundary_layer_lanes   import gather_lanes, scatter_lanes
 from .heads_method           import heads_method       
 from .hess_smith             import hess_smith               
 from .infl_coeff             import infl_coeff       
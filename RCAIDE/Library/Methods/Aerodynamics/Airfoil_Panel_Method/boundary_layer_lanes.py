@@ -0,0 +1,81 @@
+# RCAIDE/Methods/Aerodynamics/Airfoil_Panel_Method/boundary_layer_lanes.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+# gather_lanes
+# ----------------------------------------------------------------------------------------------------------------------
+def gather_lanes(values,mask,lanes):
+    """ Packs the unmasked surface values of the selected cases and control points (the lanes) so that the
+    boundary layer of all lanes can be marched together. The unmasked values of each lane are moved to the front of
+    its column in their original order and the remaining stations repeat the last unmasked value.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    values  - surface values of all cases and control points (npanel,ncases,ncpts)                      [unitless]
+    mask    - mask of the values, True where the boundary layer is not computed (npanel,ncases,ncpts)    [boolean]
+    lanes   - cases and control points to compute (ncases,ncpts)                                         [boolean]
+
+    Outputs:
+    lane_values - packed values of the lanes (npanel,nlanes)                                             [unitless]
+    n           - number of unmasked stations of each lane (nlanes)                                      [unitless]
+    stations    - panel index of each packed station (npanel,nlanes)                                     [unitless]
+
+    Properties Used:
+    N/A
+    """
+    npanel      = np.shape(values)[0]
+    lane_cols   = np.flatnonzero(lanes)
+    data        = np.ma.getdata(values).reshape(npanel,-1)[:,lane_cols]
+    lane_mask   = np.broadcast_to(mask,np.shape(values)).reshape(npanel,-1)[:,lane_cols]
+
+    # stable sort keeps the unmasked stations in the order of the surface coordinate
+    stations    = np.argsort(lane_mask,axis = 0,kind = 'stable')
+    n           = np.sum(~lane_mask,axis = 0)
+    padding     = np.minimum(np.arange(npanel)[:,None],np.maximum(n - 1,0))
+    lane_values = np.take_along_axis(data,np.take_along_axis(stations,padding,axis = 0),axis = 0)
+
+    return lane_values, n, stations
+
+# ----------------------------------------------------------------------------------------------------------------------
+# scatter_lanes
+# ----------------------------------------------------------------------------------------------------------------------
+def scatter_lanes(output,lane_values,n,stations,lanes):
+    """ Writes the packed values of the lanes back at their unmasked panels, the inverse of gather_lanes
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    output      - array of all cases and control points to write to (npanel,ncases,ncpts)                [unitless]
+    lane_values - packed values of the lanes (npanel,nlanes)                                             [unitless]
+    n           - number of unmasked stations of each lane (nlanes)                                      [unitless]
+    stations    - panel index of each packed station (npanel,nlanes)                                     [unitless]
+    lanes       - cases and control points that were computed (ncases,ncpts)                             [boolean]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    npanel    = np.shape(output)[0]
+    valid     = np.arange(npanel)[:,None] < n
+    lane_cols = np.broadcast_to(np.flatnonzero(lanes),np.shape(valid))
+    output.reshape(npanel,-1)[stations[valid],lane_cols[valid]] = lane_values[valid]
+    return
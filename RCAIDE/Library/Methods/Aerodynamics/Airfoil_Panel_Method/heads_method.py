@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports    
 from RCAIDE.Framework.Core import Data 
+from .boundary_layer_lanes import gather_lanes, scatter_lanes
 
 # package imports  
 import numpy as np 
@@ -41,6 +42,7 @@ def heads_method(npanel,ncases,ncpts,NU,DEL_0,THETA_0,DELTA_STAR_0,CF_0,ShapeFac
     DVE_I          - derivative of boundary layer velocity at all panels                           [m/s^2] 
     npanel         - number of points on surface                                                   [unitless]
     tol            - boundary layer error correction tolerance                                     [unitless]
+    wrong_columns  - cases that are not computed                                                   [unitless]
 
     Outputs: 
     RESULTS.
@@ -66,113 +68,91 @@ def heads_method(npanel,ncases,ncpts,NU,DEL_0,THETA_0,DELTA_STAR_0,CF_0,ShapeFac
     RE_X_H       = np.zeros_like(X_H)
     DELTA_H      = np.zeros_like(X_H)      
     
-    for case in range(ncases):
-        for cpt in range(ncpts):  
-            # length of tubulent surface  
-            l = TURBULENT_SURF[case,cpt] 
-            if l == 0.0:
-                pass
-            else: 
-                def getcf(ind, nu, H, THETA):
-                    ReTheta = Ve_i[ind]*THETA/nu;
-                    cf_var = 0.246*(10**(-0.678*H))*(ReTheta**-0.268);
-                    return cf_var
-                
-                def getH(H1_var):
-                    if H1_var<3.3:
-                        H_var = 3.0    # This is the bug. Why does the code keep defaulting to this scenario (Does this indicate stall ?)
-                    elif H1_var < 5.39142:
-                        H_var = 0.6778 + 1.153793*(H1_var-3.3)**-0.32637;
-                    elif H1_var >= 5.39142:
-                        H_var = 1.1 + 0.8598636*(H1_var - 3.3)**-0.777;
-                    return H_var 
-             
-                # define RK4 slope function for Theta
-                def dTheta_by_dx(index, X, THETA, VETHETAH1):
-                    return 0.5*cf[index] - (THETA/Ve_i[index])*(2+H[index])*(dVe_i[index])
-                
-                # define RK4 slope function for VeThetaH1
-                def dVeThetaH1_by_dx(index, X, THETA, VETHETAH1):
-                    return Ve_i[index]*0.0306*(((VETHETAH1/(Ve_i[index]*THETA))-3)**-0.6169)
-                
-                if case in wrong_columns:
-                    continue 
-                
-                x_i          = TURBULENT_COORD.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False] 
-                Ve_i         = VE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                dVe_i        = DVE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                Re_L         = RE_L[case,cpt]
-                n            = len(x_i)
-                dx           = np.diff(x_i)
-                nu           = NU[case,cpt]
-                
-                H            = np.zeros(n) 
-                H[0]         = ShapeFactor_0[case,cpt]
-                Theta        = np.zeros(n)
-                Theta[0]     = THETA_0[case,cpt]
-                H1           = np.zeros(n) 
-                H1[0]        = (DEL_0[case,cpt] - DELTA_STAR_0[case,cpt])/THETA_0[case,cpt]
-                if H1[0]<3.3:
-                    H1[0] = 3.417285
-                
-                cf           = np.zeros(n)
-                cf[0]        = CF_0[case,cpt] 
-                VeThetaH1    = np.zeros(n)
-                VeThetaH1[0] = Ve_i[0]*Theta[0]*H1[0]
-                
-                for i in range(1,n):
-                    # initialise the variable values at the current grid point using previous grid points (to define the error functions)
-                    H_er = H[i-1];  cf_er = cf[i-1];  H1_er = H1[i-1];  Theta_er = Theta[i-1]
-                    # assign previous grid point values of H and Cf to start RK4
-                    H[i] = H[i-1]; cf[i] = cf[i-1]
-                    
-                    #assume some error values
-                    erH = 0.2; erH1 = 0.2; erTheta = 0.2; ercf = 0.2;
-                    
-                    # iterate to get the variables at the grid point
-                    while abs(erH)>0.00001 or abs(erH1)>0.00001 or abs(erTheta)>0.00001 or abs(ercf)>0.00001:
-                        
-                        # get Theta and VeThetaH1
-                        Theta[i], VeThetaH1[i] = RK4(i-1, dx, x_i, Theta, VeThetaH1, dTheta_by_dx, dVeThetaH1_by_dx)
-                        if np.isnan(VeThetaH1[i]):
-                            VeThetaH1[i] = VeThetaH1[i-1]
-                       
-                        # get H1
-                        H1[i] = VeThetaH1[i]/(Ve_i[i]*Theta[i])
-                        
-                        # get H
-                        H[i] = getH(H1[i])
-                        
-                        # get skin friction
-                        cf[i] = getcf(i, nu, H[i], Theta[i])
-                        
-                        # define errors
-                        erH = (H[i]-H_er)/H[i];
-                        erH1 = (H1[i]-H1_er)/H1[i];
-                        erTheta = (Theta[i]-Theta_er)/Theta[i];
-                        ercf = (cf[i]-cf_er)/cf[i];
-                        
-                        # assign current iteration variable values to the Var_er
-                        H_er = H[i]
-                        H1_er = H1[i]
-                        Theta_er = Theta[i]
-                        cf_er = cf[i]
-                
-                
-                delta_star   = H*Theta
-                Re_theta     = Ve_i*Theta/nu
-                Re_x         = (Ve_i*x_i)/nu
-                delta        = (Theta*H1) + delta_star
-                
-                indices = np.where(TURBULENT_COORD.mask[:,case,cpt] == False)
-                np.put(X_H[:,case,cpt],indices,x_i )
-                np.put(THETA_H[:,case,cpt],indices,Theta)
-                np.put(DELTA_STAR_H[:,case,cpt],indices,delta_star)
-                np.put(H_H[:,case,cpt],indices,H)
-                np.put(CF_H[:,case,cpt],indices,cf)
-                np.put(RE_THETA_H[:,case,cpt],indices,Re_theta)
-                np.put(RE_X_H[:,case,cpt],indices,Re_x)
-                np.put(DELTA_H[:,case,cpt],indices,delta)
+    # every case and control point with a turbulent surface is a lane, the lanes are marched together along the surface
+    lanes                = TURBULENT_SURF != 0.0
+    lanes[wrong_columns] = False
+    turb_mask            = np.ma.getmaskarray(TURBULENT_COORD)
+    x_i, n, stations     = gather_lanes(TURBULENT_COORD,turb_mask,lanes)
+    Ve_i,_,_             = gather_lanes(VE_I,turb_mask,lanes)
+    dVe_i,_,_            = gather_lanes(DVE_I,turb_mask,lanes)
+    dx                   = np.diff(x_i,axis = 0)
+    nu                   = NU[lanes]
+    
+    H            = np.zeros_like(x_i) 
+    H[0]         = ShapeFactor_0[lanes]
+    Theta        = np.zeros_like(x_i)
+    Theta[0]     = THETA_0[lanes]
+    H1           = np.zeros_like(x_i) 
+    H1[0]        = (DEL_0[lanes] - DELTA_STAR_0[lanes])/THETA_0[lanes]
+    H1[0][H1[0]<3.3] = 3.417285
+    
+    cf           = np.zeros_like(x_i)
+    cf[0]        = CF_0[lanes] 
+    VeThetaH1    = np.zeros_like(x_i)
+    VeThetaH1[0] = Ve_i[0]*Theta[0]*H1[0]
+    
+    # define RK4 slope function for Theta, at the previous grid point of the iterated lanes
+    def dTheta_by_dx(THETA, VETHETAH1):
+        return 0.5*cf_k - (THETA/Ve_k)*(2+H_k)*(dVe_k)
+    
+    # define RK4 slope function for VeThetaH1
+    def dVeThetaH1_by_dx(THETA, VETHETAH1):
+        return Ve_k*0.0306*(((VETHETAH1/(Ve_k*THETA))-3)**-0.6169)
+    
+    for i in range(1,np.max(n,initial = 1)):
+        # lanes reaching the grid point
+        k = np.flatnonzero(i < n)
+        
+        # initialise the variable values at the current grid point using previous grid points (to define the error functions)
+        H_er = H[i-1,k];  cf_er = cf[i-1,k];  H1_er = H1[i-1,k];  Theta_er = Theta[i-1,k]
+        
+        # iterate to get the variables at the grid point, each lane until it converges
+        while len(k) > 0:
+            Ve_k  = Ve_i[i-1,k]; dVe_k = dVe_i[i-1,k]; H_k = H[i-1,k]; cf_k = cf[i-1,k]
+            
+            # get Theta and VeThetaH1
+            Theta_k, VeThetaH1_k = RK4(dx[i-1,k], Theta[i-1,k], VeThetaH1[i-1,k], dTheta_by_dx, dVeThetaH1_by_dx)
+            VeThetaH1_k = np.where(np.isnan(VeThetaH1_k),VeThetaH1[i-1,k],VeThetaH1_k)
+           
+            # get H1
+            H1_k = VeThetaH1_k/(Ve_i[i,k]*Theta_k)
+            
+            # get H
+            H_new_k = getH(H1_k)
+            
+            # get skin friction
+            cf_new_k = getcf(Ve_i[i,k], nu[k], H_new_k, Theta_k)
+            
+            Theta[i,k] = Theta_k; VeThetaH1[i,k] = VeThetaH1_k; H1[i,k] = H1_k; H[i,k] = H_new_k; cf[i,k] = cf_new_k
+            
+            # define errors
+            erH     = (H_new_k-H_er)/H_new_k
+            erH1    = (H1_k-H1_er)/H1_k
+            erTheta = (Theta_k-Theta_er)/Theta_k
+            ercf    = (cf_new_k-cf_er)/cf_new_k
+            
+            # keep iterating the lanes that have not converged, with the current iteration variable values as Var_er
+            iterate  = (abs(erH)>0.00001) | (abs(erH1)>0.00001) | (abs(erTheta)>0.00001) | (abs(ercf)>0.00001)
+            k        = k[iterate]
+            H_er     = H_new_k[iterate]
+            H1_er    = H1_k[iterate]
+            Theta_er = Theta_k[iterate]
+            cf_er    = cf_new_k[iterate]
+    
+    delta_star   = H*Theta
+    Re_theta     = Ve_i*Theta/nu
+    Re_x         = (Ve_i*x_i)/nu
+    delta        = (Theta*H1) + delta_star
+    
+    # Store results at the unmasked panels
+    scatter_lanes(X_H,x_i,n,stations,lanes)
+    scatter_lanes(THETA_H,Theta,n,stations,lanes)
+    scatter_lanes(DELTA_STAR_H,delta_star,n,stations,lanes)
+    scatter_lanes(H_H,H,n,stations,lanes)
+    scatter_lanes(CF_H,cf,n,stations,lanes)
+    scatter_lanes(RE_THETA_H,Re_theta,n,stations,lanes)
+    scatter_lanes(RE_X_H,Re_x,n,stations,lanes)
+    scatter_lanes(DELTA_H,delta,n,stations,lanes)
 
     RESULTS = Data(
             X_H          = X_H,      
@@ -188,19 +168,36 @@ def heads_method(npanel,ncases,ncpts,NU,DEL_0,THETA_0,DELTA_STAR_0,CF_0,ShapeFac
     return  RESULTS
 
 
-def RK4(ind, dx, x, Theta_var, VeThetaH1_var, Theta_slope, VeThetaH1_slope):
-    k1 = Theta_slope(ind,  x[ind],  Theta_var[ind],  VeThetaH1_var[ind])
-    l1 = VeThetaH1_slope(ind,  x[ind],  Theta_var[ind],  VeThetaH1_var[ind])
+def getcf(Ve, nu, H, THETA):
+    """ Computes the skin friction coefficient of the Ludwieg-Tillmann correlation """
+    ReTheta = Ve*THETA/nu;
+    cf_var = 0.246*(10**(-0.678*H))*(ReTheta**-0.268);
+    return cf_var
+
+
+def getH(H1_var):
+    """ Computes the shape factor from the entrainment shape factor H1 """
+    H_var       = np.full(np.shape(H1_var),3.0)    # This is the bug. Why does the code keep defaulting to this scenario (Does this indicate stall ?)
+    mid         = (H1_var >= 3.3) & (H1_var < 5.39142)
+    high        = H1_var >= 5.39142
+    H_var[mid]  = 0.6778 + 1.153793*(H1_var[mid]-3.3)**-0.32637;
+    H_var[high] = 1.1 + 0.8598636*(H1_var[high] - 3.3)**-0.777;
+    return H_var
+
+
+def RK4(dx, Theta_var, VeThetaH1_var, Theta_slope, VeThetaH1_slope):
+    k1 = Theta_slope(Theta_var,  VeThetaH1_var)
+    l1 = VeThetaH1_slope(Theta_var,  VeThetaH1_var)
     
-    k2 = Theta_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k1*dx[ind]/2),  VeThetaH1_var[ind] + (l1*dx[ind]/2))
-    l2 = VeThetaH1_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k1*dx[ind]/2),  VeThetaH1_var[ind] + (l1*dx[ind]/2))
+    k2 = Theta_slope(Theta_var + (k1*dx/2),  VeThetaH1_var + (l1*dx/2))
+    l2 = VeThetaH1_slope(Theta_var + (k1*dx/2),  VeThetaH1_var + (l1*dx/2))
     
-    k3 = Theta_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k2*dx[ind]/2),  VeThetaH1_var[ind] + (l2*dx[ind]/2))
-    l3 = VeThetaH1_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k2*dx[ind]/2),  VeThetaH1_var[ind] + (l2*dx[ind]/2))
+    k3 = Theta_slope(Theta_var + (k2*dx/2),  VeThetaH1_var + (l2*dx/2))
+    l3 = VeThetaH1_slope(Theta_var + (k2*dx/2),  VeThetaH1_var + (l2*dx/2))
     
-    k4 = Theta_slope(ind,  x[ind] + dx[ind],  Theta_var[ind] + (k3*dx[ind]),  VeThetaH1_var[ind] + (l2*dx[ind]))
-    l4 = VeThetaH1_slope(ind,  x[ind] + dx[ind],  Theta_var[ind] + (k3*dx[ind]),  VeThetaH1_var[ind] + (l2*dx[ind]))
+    k4 = Theta_slope(Theta_var + (k3*dx),  VeThetaH1_var + (l2*dx))
+    l4 = VeThetaH1_slope(Theta_var + (k3*dx),  VeThetaH1_var + (l2*dx))
     
-    Theta_new = Theta_var[ind] + ((dx[ind]/6)*(k1 + 2*k2 + 2*k3 + k4))
-    VeThetaH1_new = VeThetaH1_var[ind] + ((dx[ind]/6)*(l1 + 2*l2 + 2*l3 + l4))
-    return Theta_new, VeThetaH1_new 
\ No newline at end of file
+    Theta_new = Theta_var + ((dx/6)*(k1 + 2*k2 + 2*k3 + k4))
+    VeThetaH1_new = VeThetaH1_var + ((dx/6)*(l1 + 2*l2 + 2*l3 + l4))
+    return Theta_new, VeThetaH1_new
@@ -14,7 +14,7 @@ from .velocity_distribution import velocity_distribution
 
 # pacakge imports  
 import numpy as np  
-from scipy.linalg import solve
+from scipy.linalg import lu_factor, lu_solve
  
 # ----------------------------------------------------------------------------------------------------------------------
 # hess_smith
@@ -56,24 +56,72 @@ def hess_smith(x_coord,y_coord,alpha,Re,npanel):
     # generate panel geometry data for later use   
     l,st,ct,xbar,ybar,norm = panel_geometry(x_coord,y_coord,npanel,ncases,ncpts) 
     
+    # the influence coefficients only depend on the airfoil geometry, so they are computed once per distinct geometry
+    geometry_index, unique_geometry = find_distinct_geometries(x_coord,y_coord)
+    ngeom     = len(unique_geometry)
+    x_geom    = np.reshape(x_coord,(npanel+1,-1))[:,unique_geometry][:,:,None]
+    y_geom    = np.reshape(y_coord,(npanel+1,-1))[:,unique_geometry][:,:,None]
+    st_geom   = np.reshape(st,(npanel,-1))[:,unique_geometry][:,:,None]
+    ct_geom   = np.reshape(ct,(npanel,-1))[:,unique_geometry][:,:,None]
+    xbar_geom = np.reshape(xbar,(npanel,-1))[:,unique_geometry][:,:,None]
+    ybar_geom = np.reshape(ybar,(npanel,-1))[:,unique_geometry][:,:,None]
+    
     # compute matrix of aerodynamic influence coefficients
-    ainfl         = infl_coeff(x_coord,y_coord,xbar,ybar,st,ct,npanel,ncases,ncpts) # ncases x ncpts x npanel+1 x npanel+1 
+    ainfl         = infl_coeff(x_geom,y_geom,xbar_geom,ybar_geom,st_geom,ct_geom,npanel,ngeom,1)[:,0] # ngeom x npanel+1 x npanel+1 
     
     # compute right hand side vector for the specified angle of attack 
     b_2d          = np.zeros((npanel+1,ncases, ncpts))
     b_2d[:-1,:,:] = st*np.cos(alpha_2d) - np.sin(alpha_2d)*ct
     b_2d[-1,:,:]  = -(ct[0,:,:]*np.cos(alpha_2d[-1,:,:]) + st[0,:,:]*np.sin(alpha_2d[-1,:,:]))-(ct[-1,:,:]*np.cos(alpha_2d[-1,:,:]) +st[-1,:,:]*np.sin(alpha_2d[-1,:,:]))
+    b_2d          = np.reshape(b_2d,(npanel+1,-1))
     
-    qg = np.zeros((npanel+1, ncases, ncpts))  
-    for i in range(ncases):
-        for j in range(ncpts):
-            A = ainfl[i, j, :, :]     
-            B = b_2d[:, i, j]        
-            
-
-            qg[:, i, j] = solve(A, B)
+    if ngeom == ncases*ncpts:
+        # every case has its own geometry, solve them all in one batched call
+        qg = np.linalg.solve(ainfl,b_2d.T[:,:,None])[:,:,0].T
+    else:
+        # factor the matrix of each geometry once and back-substitute all the cases sharing it
+        qg = np.zeros((npanel+1,ncases*ncpts))
+        for i in range(ngeom):
+            cases       = geometry_index == i 
+            qg[:,cases] = lu_solve(lu_factor(ainfl[i]),b_2d[:,cases])
+    qg = np.reshape(qg,(npanel+1,ncases,ncpts))
     
     # compute the tangential velocity distribution at the midpoint of panels 
-    vt            = velocity_distribution(qg,x_coord,y_coord,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts)
+    vt            = velocity_distribution(qg,x_geom,y_geom,xbar_geom,ybar_geom,st_geom,ct_geom,alpha_2d,npanel,ncases,ncpts,geometry_index)
+    
+    return  xbar,ybar,vt,norm 
+
+def find_distinct_geometries(x_coord,y_coord):
+    """Finds the distinct airfoil geometries among the cases of the panel method.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs
+    x_coord          -  x coordinates of the surface nodes, npanel+1 x ncases x ncpts   [unitless]
+    y_coord          -  y coordinates of the surface nodes, npanel+1 x ncases x ncpts   [unitless]
+
+    Outputs
+    geometry_index   -  distinct geometry of each case, flattened over ncases x ncpts  [unitless]
+    unique_geometry  -  flattened index of the first case of each distinct geometry    [unitless]
+
+    Properties Used:
+    N/A
+    """
+    npoints = len(x_coord)
+    coords  = np.concatenate((np.reshape(x_coord,(npoints,-1)),np.reshape(y_coord,(npoints,-1))),axis=0)
+    
+    # most often all the cases share one geometry
+    if np.all(coords == coords[:,:1]):
+        return np.zeros(coords.shape[1],dtype=int), np.array([0])
+    
+    _, unique_geometry, geometry_index = np.unique(coords.T,axis=0,return_index=True,return_inverse=True)
     
-    return  xbar,ybar,vt,norm 
\ No newline at end of file
+    # number the geometries in the order of the cases rather than in sorted order
+    order       = np.argsort(unique_geometry)
+    rank        = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return rank[np.reshape(geometry_index,-1)], unique_geometry[order]
\ No newline at end of file
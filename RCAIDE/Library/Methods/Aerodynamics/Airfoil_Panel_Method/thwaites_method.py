@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
 from RCAIDE.Framework.Core import Data 
+from .boundary_layer_lanes import gather_lanes, scatter_lanes
 
 # pacakge imports  
 import numpy as np
@@ -38,6 +39,7 @@ def thwaites_method(npanel,ncases,ncpts,NU,L,RE_L,X_I,VE_I, DVE_I,tol,wrong_colu
     VE_I           - boundary layer velocity at transition location                              [m/s] 
     DVE_I          - initial derivative value of boundary layer velocity at transition location  [m/s-m] 
     tol            - boundary layer error correction tolerance                                   [unitless]
+    wrong_columns  - cases that are not computed                                                 [unitless]
 
     Outputs: 
     RESULTS.
@@ -63,83 +65,65 @@ def thwaites_method(npanel,ncases,ncpts,NU,L,RE_L,X_I,VE_I, DVE_I,tol,wrong_colu
     RE_X_T       = np.zeros_like(X_T)
     DELTA_T      = np.zeros_like(X_T)  
       
-    for case in range(ncases):
-        for cpt in range(ncpts):
-            
-            def dy_by_dx(index, X, Y):
-                return 0.45*nu*Ve_i[index]**5
-
-            if case in wrong_columns:
-                continue           
-            
-            l              = L[case,cpt]
-            theta_0        = THETA_0 
-            Re_L           = RE_L[case,cpt]
-            x_i            = X_I.data[:,case,cpt][X_I.mask[:,case,cpt] ==False]
-            x_mask         = X_I.mask[:,case,cpt]    # debug step
-            Ve_i           = VE_I.data[:,case,cpt][VE_I.mask[:,case,cpt] ==False]
-            V_mask         = VE_I.mask[:,case,cpt]   # debug step
-            dVe_i          = DVE_I.data[:,case,cpt][DVE_I.mask[:,case,cpt] ==False]
-            nu             = NU[case,cpt]
-            n              = len(x_i)
-            dx_i           = np.diff(x_i)
-            theta2_Ve6     = np.zeros(n)
-            theta2_Ve6[0]  = (theta_0**2)*Ve_i[0]**6
-            
-            # determine (Theta**2)*(Ve**6)
-            for i in range(1,n):
-                theta2_Ve6[i] = RK4(i-1, dx_i, x_i, theta2_Ve6, dy_by_dx)
-            
-            # Compute momentum thickness
-            theta       = np.sqrt(theta2_Ve6/Ve_i**6)
-            
-            # find theta values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol)[0] 
-            if len(idx1)> 1:  
-                np.put(theta,idx1 + 1, theta[idx1])
-                
-            # Thwaites separation criteria 
-            lambda_val  = theta**2*dVe_i/nu 
-            
-            # Compute H 
-            H           = getH(lambda_val)
-            H[H<0]      = 1E-6   # H cannot be negative 
-            # find H values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((H[1:] - H[:-1])/H[:-1]) > tol)[0]
-            if len(idx1)> 1: 
-                np.put(H,idx1 + 1, H[idx1]) 
-            
-            # Compute Reynolds numbers based on momentum thickness  
-            Re_theta    = Ve_i*theta/nu
-            
-            # Compute Reynolds numbers based on distance along airfoil
-            Re_x        = Ve_i*x_i/nu
-            
-            # Compute skin friction 
-            cf          = abs(getcf(lambda_val, Re_theta)) 
-            
-            # Compute displacement thickness
-            del_star    = H*theta   
-            
-            # Compute boundary layer thickness 
-            delta       = 5.2*x_i/np.sqrt(Re_x)
-            delta[0]    = 0   
-            
-            # Reynolds number at x=0 cannot be negative 
-            Re_x[0]     = 1E-5
-            
-            # Find where matrices are not masked 
-            indices = np.where(X_I.mask[:,case,cpt] == False)
-            
-            # Store results 
-            np.put(X_T[:,case,cpt],indices,x_i)
-            np.put(THETA_T[:,case,cpt],indices,theta)
-            np.put(DELTA_STAR_T[:,case,cpt],indices,del_star)
-            np.put(H_T[:,case,cpt],indices,H)
-            np.put(CF_T[:,case,cpt],indices ,cf)
-            np.put(RE_THETA_T[:,case,cpt],indices,Re_theta)
-            np.put(RE_X_T[:,case,cpt],indices,Re_x)
-            np.put(DELTA_T[:,case,cpt],indices,delta)
+    # every case and control point is a lane, the lanes are marched together along the surface
+    lanes                = np.ones((ncases,ncpts),dtype=bool)
+    lanes[wrong_columns] = False
+    x_i, n, stations     = gather_lanes(X_I,np.ma.getmaskarray(X_I),lanes)
+    Ve_i,_,_             = gather_lanes(VE_I,np.ma.getmaskarray(VE_I),lanes)
+    dVe_i,_,_            = gather_lanes(DVE_I,np.ma.getmaskarray(DVE_I),lanes)
+    nu                   = NU[lanes]
+    valid                = np.arange(npanel)[:,None] < n
+    
+    # determine (Theta**2)*(Ve**6), the RK4 slope 0.45*nu*Ve**5 only depends on the station so the steps of all
+    # lanes are known upfront and accumulated along the surface, the stations past the end of a lane have no length
+    dx_i           = np.diff(x_i,axis = 0)
+    slope          = 0.45*nu*Ve_i[:-1]**5
+    change         = (dx_i/6)*(slope + 2*slope + 2*slope + slope)
+    theta2_Ve6     = np.cumsum(np.concatenate(((THETA_0**2)*Ve_i[:1]**6,change)),axis = 0)
+    
+    # Compute momentum thickness
+    theta       = np.sqrt(theta2_Ve6/Ve_i**6)
+    
+    # find theta values that do not converge and replace them with neighbor
+    theta       = replace_jumps(theta,valid,tol)
+        
+    # Thwaites separation criteria 
+    lambda_val  = theta**2*dVe_i/nu 
+    
+    # Compute H 
+    H           = getH(lambda_val)
+    H[H<0]      = 1E-6   # H cannot be negative 
+    # find H values that do not converge and replace them with neighbor
+    H           = replace_jumps(H,valid,tol)
+    
+    # Compute Reynolds numbers based on momentum thickness  
+    Re_theta    = Ve_i*theta/nu
+    
+    # Compute Reynolds numbers based on distance along airfoil
+    Re_x        = Ve_i*x_i/nu
+    
+    # Compute skin friction 
+    cf          = abs(getcf(lambda_val, Re_theta)) 
+    
+    # Compute displacement thickness
+    del_star    = H*theta   
+    
+    # Compute boundary layer thickness 
+    delta       = 5.2*x_i/np.sqrt(Re_x)
+    delta[0]    = 0   
+    
+    # Reynolds number at x=0 cannot be negative 
+    Re_x[0]     = 1E-5
+    
+    # Store results at the unmasked panels
+    scatter_lanes(X_T,x_i,n,stations,lanes)
+    scatter_lanes(THETA_T,theta,n,stations,lanes)
+    scatter_lanes(DELTA_STAR_T,del_star,n,stations,lanes)
+    scatter_lanes(H_T,H,n,stations,lanes)
+    scatter_lanes(CF_T,cf,n,stations,lanes)
+    scatter_lanes(RE_THETA_T,Re_theta,n,stations,lanes)
+    scatter_lanes(RE_X_T,Re_x,n,stations,lanes)
+    scatter_lanes(DELTA_T,delta,n,stations,lanes)
     
     RESULTS = Data(
         X_T          = X_T,      
@@ -157,6 +141,34 @@ def thwaites_method(npanel,ncases,ncpts,NU,L,RE_L,X_I,VE_I, DVE_I,tol,wrong_colu
 
 
 
+def replace_jumps(values,valid,tol):
+    """ Replaces the values of a lane that jump by more than the tolerance with the value of the previous
+    station, if a lane has more than one such jump
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs: 
+    values  - boundary layer property of the lanes (npanel,nlanes) [unitless]
+    valid   - stations belonging to each lane (npanel,nlanes)      [boolean]
+    tol     - boundary layer error correction tolerance            [unitless]
+
+    Outputs:  
+    values  - corrected boundary layer property                    [unitless]
+
+    Properties Used:
+    N/A
+    """
+    jumps          = (abs((values[1:] - values[:-1])/values[:-1]) > tol) & valid[1:]
+    jumps          = jumps & (np.sum(jumps,axis = 0) > 1)
+    corrected      = np.array(values)
+    corrected[1:]  = np.where(jumps,values[:-1],values[1:])
+    return corrected
+
+
 def getH(lambda_val ): 
     """ Computes the shape factor, H
 
@@ -206,13 +218,3 @@ def getcf(lambda_val , Re_theta):
     cf      = 2*l/Re_theta  
     return cf
 
-
-def RK4(ind, dx, x, Var, Slope):
-    m1 = Slope(ind,  x[ind],  Var[ind])
-    m2 = Slope(ind,  x[ind] + dx[ind]/2,  Var[ind] + m1*dx[ind]/2)
-    m3 = Slope(ind,  x[ind] + dx[ind]/2,  Var[ind] + m2*dx[ind]/2)
-    m4 = Slope(ind,  x[ind] + dx[ind],  Var[ind] + m3*dx[ind])
-    
-    change = (dx[ind]/6)*(m1 + 2*m2 + 2*m3 + m4)
-    return Var[ind] + change            
-            
@@ -13,7 +13,7 @@ import numpy as np
 # ---------------------------------------------------------------------------------------------------------------------- 
 # velocity_distribution
 # ---------------------------------------------------------------------------------------------------------------------- 
-def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts):
+def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts,geometry_index=None):
     """Compute the tangential velocity distribution at the       
                  midpoint of each panel   
     
@@ -25,15 +25,17 @@ def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts):
     
     Inputs:                                                    
 
-     qg          -  Vector of source/sink and vortex strengths    [unitless]          
-     x           -  Vector of x coordinates of the surface nodes  [unitless]         
-     y           -  Vector of y coordinates of the surface nodes  [unitless]            
-     xbar        -  x-coordinate of the midpoint of each panel    [unitless]           
-     ybar        -  y-coordinate of the midpoint of each panel    [unitless]           
-     st          -  np.sin(theta) for each panel                  [radians]                
-     ct          -  np.cos(theta) for each panel                  [radians]             
-     al          -  Angle of attack in radians                    [radians]             
-     npanel      -  Number of panels on the airfoil               [unitless]  
+     qg             -  Vector of source/sink and vortex strengths    [unitless]          
+     x              -  Vector of x coordinates of the surface nodes  [unitless]         
+     y              -  Vector of y coordinates of the surface nodes  [unitless]            
+     xbar           -  x-coordinate of the midpoint of each panel    [unitless]           
+     ybar           -  y-coordinate of the midpoint of each panel    [unitless]           
+     st             -  np.sin(theta) for each panel                  [radians]                
+     ct             -  np.cos(theta) for each panel                  [radians]             
+     al             -  Angle of attack in radians                    [radians]             
+     npanel         -  Number of panels on the airfoil               [unitless]  
+     geometry_index -  Geometry of each case flattened over ncases x ncpts, when the geometry 
+                       inputs only hold the distinct geometries      [unitless]  
 
      Outputs:                                                        
 
@@ -42,12 +44,16 @@ def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts):
     Properties Used:
     N/A
     """   
+    if geometry_index is None:
+        geometry_index = np.arange(ncases*ncpts)
+    ngeom    = np.reshape(st,(npanel,-1)).shape[1]
+    st_cases = np.reshape(np.reshape(st,(npanel,-1))[:,geometry_index],(npanel,ncases,ncpts))
+    ct_cases = np.reshape(np.reshape(ct,(npanel,-1))[:,geometry_index],(npanel,ncases,ncpts))
+    
     # flow tangency boundary condition - source distribution  
-    vt_2d = ct *np.cos(alpha_2d) + st*np.sin(alpha_2d)
-    gamma = np.repeat(qg[-1,:,:][np.newaxis,:,:],npanel, axis = 0)  
+    vt_2d = ct_cases *np.cos(alpha_2d) + st_cases*np.sin(alpha_2d)
     
-    # convert 1d matrices to 2d 
-    qg_2d                = np.repeat(qg[:-1,:,:][np.newaxis,:,:,:],npanel, axis = 0) 
+    # convert 1d matrices to 2d, once per geometry
     x_2d                 = np.repeat(np.swapaxes(np.swapaxes(x,0, 2),0,1)[:,:,np.newaxis,:],npanel, axis = 2)
     y_2d                 = np.repeat(np.swapaxes(np.swapaxes(y,0, 2),0,1)[:,:,np.newaxis,:],npanel, axis = 2)
     xbar_2d              = np.repeat(np.swapaxes(np.swapaxes(xbar,0, 2),0,1)[:,:,:,np.newaxis],npanel, axis = 3)
@@ -67,19 +73,25 @@ def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts):
     r_ratio              = rij_dot_rij_plus_1/rij/rij_plus_1
     r_ratio[r_ratio>1.0] = 1.0 # numerical noise     
     betaij               = np.real(anglesign*np.arccos(r_ratio))     
-    # betaij[aoas,res,diag_indices,diag_indices] = np.pi
-    for i in range(ncases):
-        for j in range(ncpts):
-            np.fill_diagonal(betaij[i,j,:,:], np.pi)   
+    diagonal             = np.arange(npanel)
+    betaij[:,:,diagonal,diagonal] = np.pi
+    
+    # velocity induced at panel i by the sources of panel j and by the vortex of unit strength 
+    log_r_ratio          = np.log(rij_plus_1/rij)
+    source_kernel        = np.reshape(sti_minus_j*betaij - cti_minus_j*log_r_ratio,(ngeom,npanel,npanel))/2/np.pi
+    vortex_kernel        = np.reshape(np.sum(sti_minus_j*log_r_ratio + cti_minus_j*betaij,axis=3),(ngeom,npanel))/2/np.pi
+    
+    q     = np.reshape(qg[:-1,:,:],(npanel,-1))
+    gamma = np.reshape(qg[-1,:,:],-1)
+    if ngeom == ncases*ncpts:
+        vt_induced = np.einsum('gij,jg->ig',source_kernel,q)
+    else:
+        vt_induced = np.zeros((npanel,ncases*ncpts))
+        for i in range(ngeom):
+            cases               = geometry_index == i
+            vt_induced[:,cases] = source_kernel[i] @ q[:,cases]
+    vt_induced += vortex_kernel[geometry_index].T*gamma
     
-    # swap axes 
-    sti_minus_j_2d  = np.swapaxes(np.swapaxes(sti_minus_j,0,2),1,3) 
-    betaij_2d       = np.swapaxes(np.swapaxes(betaij,0,2),1,3) 
-    cti_minus_j_2d  = np.swapaxes(np.swapaxes(cti_minus_j,0,2),1,3) 
-    rij_2d          = np.swapaxes(np.swapaxes(rij,0,2),1,3) 
-    rij_plus_1_2d   = np.swapaxes(np.swapaxes(rij_plus_1,0,2),1,3) 
-     
-    vt_2d += np.sum(qg_2d/2/np.pi*(sti_minus_j_2d*betaij_2d - cti_minus_j_2d*np.log(rij_plus_1_2d/rij_2d)),1)  + \
-             np.sum(gamma/2/np.pi*(sti_minus_j_2d*np.log(rij_plus_1_2d/rij_2d) + cti_minus_j_2d*betaij_2d),1)
+    vt_2d += np.reshape(vt_induced,(npanel,ncases,ncpts))
     
     return  vt_2d
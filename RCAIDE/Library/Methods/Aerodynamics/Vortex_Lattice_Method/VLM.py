@@ -11,11 +11,14 @@
 
 # package imports 
 import numpy as np 
+import time
+import tracemalloc
 from RCAIDE.Framework.Core import Data
 from .compute_wing_induced_velocity      import compute_wing_induced_velocity
-from .generate_vortex_distribution       import generate_vortex_distribution 
+from .vortex_distribution_cache          import get_vortex_distribution 
 from .compute_RHS_matrix                 import compute_RHS_matrix 
 from scipy.integrate import trapezoid
+from scipy.linalg    import lu_factor, lu_solve
 from copy import  deepcopy
 # ----------------------------------------------------------------------
 #  Vortex Lattice
@@ -93,6 +96,8 @@ def VLM(conditions,settings,geometry):
     settings.discretize_control_surfaces       [Boolean], set to True to generate control surface panels
     settings.use_VORLAX_matrix_calculation     [boolean]
     settings.floating_point_precision          [float16/32/64]
+    settings.influence_matrix_memory_budget    [bytes], None to build the influence matrix in one piece
+    settings.cache_vortex_distribution         [boolean], reuse the vortex distribution of an unchanged geometry
        
     conditions.aerodynamics.angles.alpha    [radians]
     conditions.aerodynamics.angles.beta   [radians]
@@ -120,6 +125,8 @@ def VLM(conditions,settings,geometry):
         alpha_i                                [radians] , Induced angle of each strip in each wing (array of numpy arrays)
         CP                                     [Unitless], Pressure coefficient of each panel
         gamma                                  [Unitless], Vortex strengths of each panel
+        solve_report                           [Data]    , Timing and memory of the vortex strength solve
+        influence_report                       [Data]    , Tiling and peak memory of the influence matrix build
 
     
     Properties Used:
@@ -184,8 +191,8 @@ def VLM(conditions,settings,geometry):
     # ---------------------------------------------------------------------------------------
     # STEPS 1-9: Generate Panelization and Vortex Distribution
     # ------------------ --------------------------------------------------------------------    
-    # generate vortex distribution (VLM steps 1-9)
-    VD   = generate_vortex_distribution(geometry,settings)  
+    # generate vortex distribution (VLM steps 1-9), or reuse the one of an unchanged geometry
+    VD   = get_vortex_distribution(geometry,settings)  
     
     if not VD.is_postprocessed:
         raise ValueError('postprocess_VD has not been called since the panels have been modified')
@@ -244,38 +251,21 @@ def VLM(conditions,settings,geometry):
     RHS     = rhs.RHS*1 # this matches numpy=1.26 in terms of dimension
     ONSET   = rhs.ONSET*1
 
-    # Build induced velocity matrix, C_mn
+    # Build the aerodynamic influence coefficient matrix from the induced velocities, C_mn
     # This is not affected by AoA, so we can use unique mach numbers only
     m_unique, inv = np.unique(mach,return_inverse=True)
     m_unique      = np.atleast_2d(m_unique).T
     inv           = inv.reshape(-1) # this is done to ensure compatibility across numpy1.0 and numpy2.0
-    C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True)
+    A, s, RFLAG_small, EW_small, influence_report = compute_influence_matrix(VD,m_unique,delta,phi,settings)
     
-    C_mn  = C_mn_small[inv,:,:,:]
     RFLAG = RFLAG_small[inv,:]
     EW    = EW_small[inv,:,:]
 
     # Turn off sonic vortices when Mach>1
     RHS = RHS*RFLAG
-    
-    # To ensure compatibility for np.linalg.solve across numpy1.0 and numpy2.0
-    RHS = np.atleast_3d(RHS)
-
-    # Build Aerodynamic Influence Coefficient Matrix
-    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
-    if not use_VORLAX_induced_velocity:
-        A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-            + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-            - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42 
-    else:
-        A = EW
 
     # Compute vortex strength
-    GAMMA  = np.linalg.solve(A,RHS)
-
-    # To ensure compatibility for np.linalg.solve across numpy1.0 and numpy2.0
-    RHS    = RHS.squeeze(axis=2)
-    GAMMA  = GAMMA.squeeze(axis=2)
+    GAMMA, solve_report = solve_vortex_strengths(A,RHS,inv)
 
     # ---------------------------------------------------------------------------------------
     # STEP 11: Compute Pressure Coefficient
@@ -529,6 +519,8 @@ def VLM(conditions,settings,geometry):
     results.V_distribution    = rhs.V_distribution
     results.V_x               = rhs.Vx_ind_total
     results.V_z               = rhs.Vz_ind_total 
+    results.solve_report      = solve_report
+    results.influence_report  = influence_report
 
     # Dimensionalize the lift and drag for each wing 
     i = 0 
@@ -607,6 +599,166 @@ def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD,
     
     return CLE
 
+# ----------------------------------------------------------------------
+#  Influence matrix
+# ----------------------------------------------------------------------
+def compute_influence_matrix(VD, mach, delta, phi, settings):
+    """ Builds the aerodynamic influence coefficient matrix of each unique mach number. With a memory budget 
+    the induced velocities are computed for tiles of receiving control points and each tile is reduced into A 
+    before the next one is computed, so the full velocity matrices are never held at once.
+    
+    Assumptions:
+    The flow tangency angles only depend on the geometry
+    
+    Source:
+    N/A
+    
+    Inputs:
+    VD                                         - vortex distribution                  [Unitless]
+    mach                                       - unique mach numbers                  [Unitless]
+    delta, phi                                 - flow tangency angles                 [radians]
+    settings.use_VORLAX_matrix_calculation                                            [boolean]
+    settings.influence_matrix_memory_budget                                           [bytes]
+    
+    Outputs:
+    A                 - aerodynamic influence coefficient matrices                    [Unitless]
+    s                 - semispan of the horshoe vortex                                [m]
+    RFLAG             - sonic vortex flag                                             [boolean]
+    EW                - normalwash in the VORLAX frame                                [Unitless]
+    report.
+      tiles           - number of tiles of receiving control points                   [Unitless]
+      rows_per_tile   - receiving control points per tile                             [Unitless]
+      time            - time spent building the matrices                              [s]
+      peak_memory     - peak memory allocated while building the matrices             [bytes]
+    
+    Properties Used:
+    N/A
+    """
+    n_cp     = VD.n_cp
+    n_mach   = len(mach)
+    budget   = settings.influence_matrix_memory_budget 
+    
+    # size the tiles from the float32 temporaries of compute_wing_induced_velocity, the budget does not include
+    # A and EW, which are always held in full
+    row_size = 4*n_cp*(16*n_mach + 24)
+    if budget is None:
+        rows_per_tile = n_cp
+    else:
+        rows_per_tile = int(min(max(budget//row_size,1),n_cp))
+    
+    # flow tangency factors of each receiving control point
+    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
+    F_x = np.atleast_3d(np.sin(delta[:1])*np.cos(phi[:1]))
+    F_y = np.atleast_3d(np.cos(delta[:1])*np.sin(phi[:1]))
+    F_z = np.atleast_3d(np.cos(phi[:1])*np.cos(delta[:1]))
+    
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    t0    = time.perf_counter()
+    
+    if rows_per_tile == n_cp:
+        C_mn, s, RFLAG, EW = compute_wing_induced_velocity(VD,mach,compute_EW=True)
+        if not use_VORLAX_induced_velocity:
+            A =   np.multiply(C_mn[:,:,:,0],F_x) \
+                + np.multiply(C_mn[:,:,:,1],F_y) \
+                - np.multiply(C_mn[:,:,:,2],F_z)   # validated from book eqn 7.42 
+        else:
+            A = EW
+        C_mn = None
+    else:
+        EW = np.empty((n_mach,n_cp,n_cp),dtype=np.float32)
+        if not use_VORLAX_induced_velocity:
+            A = np.empty((n_mach,n_cp,n_cp),dtype=np.result_type(np.float32,F_x))
+        else:
+            A = EW
+        for row in range(0,n_cp,rows_per_tile):
+            rows = slice(row,min(row + rows_per_tile,n_cp))
+            C_mn, s_tile, RFLAG, EW[:,rows] = compute_wing_induced_velocity(VD,mach,compute_EW=True,rows=rows)
+            if row == 0:
+                s = s_tile
+            if not use_VORLAX_induced_velocity:
+                A[:,rows] =   np.multiply(C_mn[:,:,:,0],F_x[:,rows]) \
+                            + np.multiply(C_mn[:,:,:,1],F_y[:,rows]) \
+                            - np.multiply(C_mn[:,:,:,2],F_z[:,rows])
+            C_mn = None
+    
+    t1   = time.perf_counter()
+    peak = tracemalloc.get_traced_memory()[1] - start
+    if not tracing:
+        tracemalloc.stop()
+    
+    report               = Data()
+    report.tiles         = int(np.ceil(n_cp/rows_per_tile))
+    report.rows_per_tile = rows_per_tile
+    report.time          = t1 - t0
+    report.peak_memory   = peak
+    
+    return A, s, RFLAG, EW, report
+
+# ----------------------------------------------------------------------
+#  Vortex strength solve
+# ----------------------------------------------------------------------
+def solve_vortex_strengths(A, RHS, inv):
+    """ Solves A*GAMMA = RHS for every case, factoring each influence matrix only once. The cases that share
+    an influence matrix are back-substituted together as the columns of a single right hand side.
+    
+    Assumptions:
+    The influence matrix of case i is A[inv[i]]
+    
+    Source:
+    N/A
+    
+    Inputs:
+    A           - influence matrices, one per unique mach number   [Unitless]
+    RHS         - right hand side of each case                     [Unitless]
+    inv         - index of the influence matrix of each case       [Unitless]
+    
+    Outputs:
+    GAMMA       - vortex strengths of each case                    [Unitless]
+    report.
+      factorizations          - number of LU factorizations        [Unitless]
+      back_substitutions      - number of right hand sides solved  [Unitless]
+      factorization_time      - time spent factoring A             [s]
+      back_substitution_time  - time spent solving for GAMMA       [s]
+      matrix_memory           - memory held by the factorizations  [bytes]
+      broadcast_memory        - memory of one matrix per case      [bytes]
+    
+    Properties Used:
+    N/A
+    """
+    dtype  = np.result_type(A,RHS)
+    n_cp   = RHS.shape[1]
+    GAMMA  = np.zeros((RHS.shape[0],n_cp),dtype=dtype)
+    
+    report                        = Data()
+    report.factorizations         = 0
+    report.back_substitutions     = RHS.shape[0]
+    report.factorization_time     = 0.
+    report.back_substitution_time = 0.
+    report.matrix_memory          = 0
+    report.broadcast_memory       = RHS.shape[0]*n_cp*n_cp*dtype.itemsize
+    
+    for i in range(A.shape[0]):
+        cases = np.where(inv == i)[0]
+        if len(cases) == 0:
+            continue
+        t0       = time.perf_counter()
+        lu, piv  = lu_factor(np.asarray(A[i],dtype=dtype),check_finite=False)
+        t1       = time.perf_counter()
+        GAMMA[cases] = lu_solve((lu,piv),RHS[cases].T,check_finite=False).T
+        t2       = time.perf_counter()
+        
+        report.factorizations         += 1
+        report.factorization_time     += t1 - t0
+        report.back_substitution_time += t2 - t1
+        report.matrix_memory          += lu.nbytes + piv.nbytes
+    
+    return GAMMA, report
+
 # ----------------------------------------------------------------------
 #  Vectorized cumsum from indices
 # ----------------------------------------------------------------------
@@ -0,0 +1,377 @@
+# RCAIDE/Library/Methods/Aerodynamics/Vortex_Lattice_Method/VLM_surrogate_cache.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import  Data
+
+# package imports
+import numpy  as np
+import hashlib
+import json
+import os
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Cache state
+# ----------------------------------------------------------------------------------------------------------------------
+# bump when the layout of the stored training data changes
+cache_format_version = 1
+
+# counters of the current process
+cache_counters           = Data()
+cache_counters.hits      = 0
+cache_counters.misses    = 0
+cache_counters.writes    = 0
+cache_counters.evictions = 0
+
+# training entries that are outputs of train_VLM_surrogates rather than inputs
+training_outputs = ['subsonic','supersonic','transonic']
+
+# settings that do not change the trained coefficients
+ignored_settings = ['surrogate_cache','vortex_distribution','number_of_training_workers','influence_matrix_memory_budget','cache_vortex_distribution','share_surrogates']
+
+# settings of the lift and drag buildup, which the training does not use, so that the aerodynamics and stability
+# analyses of a vehicle share their training data
+buildup_settings = ['fuselage_lift_correction','trim_drag_correction_factor','wing_parasite_drag_form_factor','fuselage_parasite_drag_form_factor',
+                    'drag_reduction_factors','maximum_lift_coefficient_factor','maximum_lift_coefficient','oswald_efficiency_factor','span_efficiency',
+                    'viscous_lift_dependent_drag_factor','drag_coefficient_increment','recalculate_total_wetted_area','supersonic',
+                    'lift_to_drag_adjustment','spoiler_drag_increment']
+
+# control surface flags set while training
+control_surface_flags = ['aileron_flag','elevator_flag','rudder_flag','slat_flag','flap_flag']
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  load_VLM_surrogate_training
+# ----------------------------------------------------------------------------------------------------------------------
+def load_VLM_surrogate_training(aerodynamics):
+    """Loads previously trained VLM surrogate data from the on-disk cache.
+
+    Assumptions:
+        The trained data only depends on the vehicle geometry used by VLM, the analysis settings
+        and the training grids, see compute_VLM_training_hash
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless]
+
+    Returns:
+        hit                : True if the training data was loaded   [boolean]
+    """
+    cache = aerodynamics.settings.surrogate_cache
+    if not cache.enabled:
+        return False
+
+    filename = cache_filename(aerodynamics)
+    if not os.path.isfile(filename):
+        cache_counters.misses += 1
+        return False
+
+    try:
+        with np.load(filename,allow_pickle=False) as archive:
+            tree    = json.loads(str(archive['tree']))
+            payload = decode_tree(tree,archive)
+    except (OSError,ValueError,KeyError):
+        # unreadable entries are dropped and retrained
+        os.remove(filename)
+        cache_counters.misses += 1
+        return False
+
+    aerodynamics.training.subsonic   = payload.training.subsonic
+    aerodynamics.training.supersonic = payload.training.supersonic
+    aerodynamics.training.transonic  = payload.training.transonic
+    for key,value in payload.reference_values.items():
+        aerodynamics.reference_values[key] = value
+    for key in control_surface_flags:
+        aerodynamics[key] = payload.flags[key]
+
+    # mark the entry as recently used for the eviction policy
+    os.utime(filename)
+    cache_counters.hits += 1
+    return True
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  save_VLM_surrogate_training
+# ----------------------------------------------------------------------------------------------------------------------
+def save_VLM_surrogate_training(aerodynamics):
+    """Stores the VLM surrogate training data of an analysis in the on-disk cache and evicts
+    the least recently used entries beyond the cache limits.
+
+    Assumptions:
+        train_VLM_surrogates has been run on the analysis
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless]
+
+    Returns:
+        None
+    """
+    cache = aerodynamics.settings.surrogate_cache
+    if not cache.enabled:
+        return
+
+    payload                     = Data()
+    payload.training            = Data()
+    payload.training.subsonic   = aerodynamics.training.subsonic
+    payload.training.supersonic = aerodynamics.training.supersonic
+    payload.training.transonic  = aerodynamics.training.transonic
+    payload.reference_values    = aerodynamics.reference_values
+    payload.flags               = Data()
+    for key in control_surface_flags:
+        payload.flags[key] = aerodynamics[key]
+
+    arrays   = {}
+    tree     = encode_tree(payload,arrays)
+    filename = cache_filename(aerodynamics)
+    os.makedirs(os.path.dirname(filename),exist_ok=True)
+
+    # write to a temporary file first so concurrent jobs never read a partial entry
+    temporary = filename + '.' + str(os.getpid()) + '.tmp'
+    with open(temporary,'wb') as f:
+        np.savez(f,tree=np.array(json.dumps(tree)),**arrays)
+    os.replace(temporary,filename)
+    cache_counters.writes += 1
+
+    evict_VLM_surrogate_cache(cache.directory,cache.maximum_entries,cache.maximum_size)
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  evict_VLM_surrogate_cache
+# ----------------------------------------------------------------------------------------------------------------------
+def evict_VLM_surrogate_cache(directory=None, maximum_entries=None, maximum_size=None):
+    """Removes the least recently used cache entries until the cache holds at most maximum_entries
+    entries and maximum_size bytes.
+
+    Assumptions:
+        Loading an entry refreshes its modification time
+
+    Source:
+        None
+
+    Args:
+        directory          : cache directory, None for the default    [unitless]
+        maximum_entries    : number of entries kept, None for no limit [unitless]
+        maximum_size       : bytes kept, None for no limit            [bytes]
+
+    Returns:
+        evicted            : number of removed entries                [unitless]
+    """
+    entries = cache_entries(directory)
+    entries.sort(key=lambda entry: entry[1])
+
+    count   = len(entries)
+    size    = sum(entry[2] for entry in entries)
+    evicted = 0
+    for filename,_,nbytes in entries:
+        over_count = maximum_entries is not None and count > maximum_entries
+        over_size  = maximum_size is not None and size > maximum_size
+        if not (over_count or over_size):
+            break
+        os.remove(filename)
+        count   -= 1
+        size    -= nbytes
+        evicted += 1
+
+    cache_counters.evictions += evicted
+    return evicted
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  clear_VLM_surrogate_cache
+# ----------------------------------------------------------------------------------------------------------------------
+def clear_VLM_surrogate_cache(directory=None):
+    """Removes every entry of the VLM surrogate cache.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        directory          : cache directory, None for the default    [unitless]
+
+    Returns:
+        evicted            : number of removed entries                [unitless]
+    """
+    return evict_VLM_surrogate_cache(directory,maximum_entries=0)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  VLM_surrogate_cache_statistics
+# ----------------------------------------------------------------------------------------------------------------------
+def VLM_surrogate_cache_statistics(directory=None):
+    """Reports the content of the VLM surrogate cache and the cache activity of the current process.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        directory          : cache directory, None for the default    [unitless]
+
+    Returns:
+        statistics.
+          directory        : cache directory                          [unitless]
+          entries          : number of stored entries                 [unitless]
+          size             : bytes on disk                            [bytes]
+          hits             : trainings loaded from the cache          [unitless]
+          misses           : trainings not found in the cache         [unitless]
+          writes           : trainings stored in the cache            [unitless]
+          evictions        : entries removed by the eviction policy   [unitless]
+    """
+    entries = cache_entries(directory)
+
+    statistics           = Data()
+    statistics.directory = cache_directory(directory)
+    statistics.entries   = len(entries)
+    statistics.size      = sum(entry[2] for entry in entries)
+    statistics.hits      = cache_counters.hits
+    statistics.misses    = cache_counters.misses
+    statistics.writes    = cache_counters.writes
+    statistics.evictions = cache_counters.evictions
+    return statistics
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_VLM_training_hash
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_VLM_training_hash(aerodynamics):
+    """Computes a content hash of everything the VLM surrogate training depends on.
+
+    Assumptions:
+        VLM only reads the wings, fuselages, booms, reference area and center of gravity of the
+        vehicle, plus the networks when the propeller wake model is used. The settings of the lift
+        and drag buildup are not used by the training.
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis          [unitless]
+
+    Returns:
+        key                : hexadecimal sha256 digest                [unitless]
+    """
+    vehicle  = aerodynamics.vehicle
+    settings = aerodynamics.settings
+
+    geometry                   = Data()
+    geometry.wings             = vehicle.wings
+    geometry.fuselages         = vehicle.get('fuselages')
+    geometry.booms             = vehicle.get('booms')
+    geometry.reference_area    = vehicle.reference_area
+    geometry.center_of_gravity = vehicle.mass_properties.center_of_gravity
+    if settings.propeller_wake_model:
+        geometry.networks      = vehicle.get('networks')
+
+    relevant_settings = Data()
+    for key,value in settings.items():
+        if key not in ignored_settings and key not in buildup_settings:
+            relevant_settings[key] = value
+
+    training = Data()
+    for key,value in aerodynamics.training.items():
+        if key not in training_outputs:
+            training[key] = value
+
+    h = hashlib.sha256()
+    update_hash(h,[cache_format_version,RCAIDE.__version__,type(aerodynamics).__name__],set())
+    update_hash(h,geometry,set())
+    update_hash(h,relevant_settings,set())
+    update_hash(h,training,set())
+    return h.hexdigest()
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def cache_directory(directory):
+    """ Returns the cache directory, defaulting to ~/.cache/RCAIDE/VLM_surrogates """
+    if directory is None:
+        directory = os.path.join(os.path.expanduser('~'),'.cache','RCAIDE','VLM_surrogates')
+    return directory
+
+def cache_filename(aerodynamics):
+    """ Returns the cache file of the training data of an analysis """
+    directory = cache_directory(aerodynamics.settings.surrogate_cache.directory)
+    return os.path.join(directory,compute_VLM_training_hash(aerodynamics) + '.npz')
+
+def cache_entries(directory):
+    """ Lists the (filename, modification time, size) of every cache entry """
+    directory = cache_directory(directory)
+    entries   = []
+    if not os.path.isdir(directory):
+        return entries
+    for name in os.listdir(directory):
+        if name.endswith('.npz'):
+            filename = os.path.join(directory,name)
+            stat     = os.stat(filename)
+            entries.append((filename,stat.st_mtime,stat.st_size))
+    return entries
+
+def update_hash(h, value, seen):
+    """ Feeds a canonical byte representation of a value into a hash """
+    if isinstance(value,dict):
+        if id(value) in seen:
+            return
+        seen.add(id(value))
+        h.update(('{' + type(value).__name__).encode())
+        for key,item in value.items():
+            h.update(repr(key).encode())
+            update_hash(h,item,seen)
+        h.update(b'}')
+    elif isinstance(value,(list,tuple)):
+        h.update(b'[')
+        for item in value:
+            update_hash(h,item,seen)
+        h.update(b']')
+    elif isinstance(value,(np.ndarray,np.generic)):
+        value = np.ascontiguousarray(value)
+        h.update((value.dtype.str + repr(value.shape)).encode())
+        if value.dtype.hasobject:
+            update_hash(h,value.tolist(),seen)
+        else:
+            h.update(value.tobytes())
+    elif isinstance(value,(bool,int,float,complex,str,bytes,type(None))):
+        h.update((type(value).__name__ + repr(value)).encode())
+    elif isinstance(value,type) or callable(value):
+        h.update((getattr(value,'__module__','') + '.' + getattr(value,'__qualname__',type(value).__name__)).encode())
+    else:
+        h.update(type(value).__name__.encode())
+    return
+
+def encode_tree(value, arrays):
+    """ Splits a Data tree into a json serializable structure and a dictionary of arrays """
+    if isinstance(value,dict):
+        return {'data': [[key,encode_tree(item,arrays)] for key,item in value.items()]}
+    if value is None:
+        return {'none': True}
+    if isinstance(value,(bool,int,float,str)):
+        return {'value': value}
+    name         = 'array_' + str(len(arrays))
+    arrays[name] = np.asarray(value)
+    return {'array': name, 'scalar': np.ndim(value) == 0}
+
+def decode_tree(tree, archive):
+    """ Rebuilds a Data tree from encode_tree output """
+    if 'data' in tree:
+        data = Data()
+        for key,item in tree['data']:
+            data[key] = decode_tree(item,archive)
+        return data
+    if 'none' in tree:
+        return None
+    if 'value' in tree:
+        return tree['value']
+    array = archive[tree['array']]
+    if tree['scalar']:
+        return array[()]
+    return array
@@ -0,0 +1,151 @@
+# RCAIDE/Library/Methods/Aerodynamics/Vortex_Lattice_Method/VLM_surrogate_registry.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from RCAIDE.Framework.Core                                                          import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.train_VLM_surrogates import train_VLM_surrogates
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.build_VLM_surrogates import build_VLM_surrogates
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM_surrogate_cache  import load_VLM_surrogate_training, save_VLM_surrogate_training, compute_VLM_training_hash, control_surface_flags
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Registry state
+# ----------------------------------------------------------------------------------------------------------------------
+# trained surrogates of the current process, least recently used first
+surrogate_registry                 = Data()
+surrogate_registry.entries         = Data()
+surrogate_registry.maximum_entries = 8
+surrogate_registry.hits            = 0
+surrogate_registry.misses          = 0
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  get_VLM_surrogates
+# ----------------------------------------------------------------------------------------------------------------------
+def get_VLM_surrogates(aerodynamics):
+    """Provides the surrogates of a VLM analysis. The surrogates built by an earlier analysis of the process with
+    the same vehicle, settings and training grids are reused, whether it was an aerodynamics or a stability analysis
+    or belonged to another configuration. Otherwise the training data is loaded from the on-disk cache or trained,
+    and the surrogates are built and registered.
+
+    Assumptions:
+        The trained data only depends on what compute_VLM_training_hash covers. Registered surrogates are shared
+        between analyses and should not be modified.
+
+    Source:
+        None
+
+    Args:
+        aerodynamics                            : VLM analysis                             [unitless]
+        aerodynamics.settings.share_surrogates  : reuse surrogates between analyses        [boolean]
+
+    Returns:
+        hit                                     : True if registered surrogates were reused [boolean]
+    """
+    if not aerodynamics.settings.share_surrogates:
+        build_surrogates(aerodynamics)
+        return False
+
+    key     = compute_VLM_training_hash(aerodynamics)
+    entries = surrogate_registry.entries
+    if key in entries:
+        # move the entry to the end to mark it as most recently used
+        entry        = entries.pop(key)
+        entries[key] = entry
+        surrogate_registry.hits += 1
+
+        aerodynamics.training.subsonic   = entry.training.subsonic
+        aerodynamics.training.supersonic = entry.training.supersonic
+        aerodynamics.training.transonic  = entry.training.transonic
+        for name,value in entry.reference_values.items():
+            aerodynamics.reference_values[name] = value
+        for name in control_surface_flags:
+            aerodynamics[name] = entry.flags[name]
+        aerodynamics.surrogates = entry.surrogates
+        return True
+
+    build_surrogates(aerodynamics)
+    surrogate_registry.misses += 1
+
+    entry                     = Data()
+    entry.training            = Data()
+    entry.training.subsonic   = aerodynamics.training.subsonic
+    entry.training.supersonic = aerodynamics.training.supersonic
+    entry.training.transonic  = aerodynamics.training.transonic
+    entry.reference_values    = Data()
+    for name,value in aerodynamics.reference_values.items():
+        entry.reference_values[name] = value
+    entry.flags               = Data()
+    for name in control_surface_flags:
+        entry.flags[name] = aerodynamics[name]
+    entry.surrogates          = aerodynamics.surrogates
+    entries[key]              = entry
+    while len(entries) > surrogate_registry.maximum_entries:
+        del entries[next(iter(entries.keys()))]
+
+    return False
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  clear_VLM_surrogate_registry
+# ----------------------------------------------------------------------------------------------------------------------
+def clear_VLM_surrogate_registry():
+    """Removes every registered surrogate. Modified vehicles, settings or training grids are detected by
+    get_VLM_surrogates, this frees the memory held by the registry.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    surrogate_registry.entries = Data()
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  VLM_surrogate_registry_statistics
+# ----------------------------------------------------------------------------------------------------------------------
+def VLM_surrogate_registry_statistics():
+    """Reports the content and activity of the VLM surrogate registry of the current process.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        None
+
+    Returns:
+        statistics.
+          entries          : number of registered surrogates          [unitless]
+          maximum_entries  : number of surrogates kept                [unitless]
+          hits             : analyses served from the registry        [unitless]
+          misses           : analyses that built their surrogates     [unitless]
+    """
+    statistics                 = Data()
+    statistics.entries         = len(surrogate_registry.entries)
+    statistics.maximum_entries = surrogate_registry.maximum_entries
+    statistics.hits            = surrogate_registry.hits
+    statistics.misses          = surrogate_registry.misses
+    return statistics
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def build_surrogates(aerodynamics):
+    """ Loads the training data from the on-disk cache, or trains and stores it, then builds the surrogates """
+    if not load_VLM_surrogate_training(aerodynamics):
+        train_VLM_surrogates(aerodynamics)
+        save_VLM_surrogate_training(aerodynamics)
+    build_VLM_surrogates(aerodynamics)
+    return
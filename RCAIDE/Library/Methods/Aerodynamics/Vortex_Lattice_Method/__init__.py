@@ -17,5 +17,8 @@ from .generate_vortex_distribution            import generate_vortex_distributio
 from .make_VLM_wings                          import make_VLM_wings
 from .train_VLM_surrogates                    import train_VLM_surrogates
 from .VLM                                     import VLM
+from .VLM_surrogate_cache                     import load_VLM_surrogate_training, save_VLM_surrogate_training, evict_VLM_surrogate_cache, clear_VLM_surrogate_cache, VLM_surrogate_cache_statistics, compute_VLM_training_hash
+from .VLM_surrogate_registry                  import get_VLM_surrogates, clear_VLM_surrogate_registry, VLM_surrogate_registry_statistics
+from .vortex_distribution_cache               import get_vortex_distribution, clear_vortex_distribution_cache, vortex_distribution_cache_statistics
 from .evaluate_VLM                            import *  
 
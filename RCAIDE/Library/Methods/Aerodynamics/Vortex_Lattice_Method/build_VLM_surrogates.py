@@ -10,6 +10,7 @@ from RCAIDE.Framework.Core import  Data
 # package imports 
 from scipy.interpolate                                           import RegularGridInterpolator
 from scipy import interpolate
+import numpy as np
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Vortex_Lattice
@@ -310,6 +311,9 @@ def build_surrogate(aerodynamics, training):
         surrogates.dCL_ddelta_s     = interpolate.interp1d(mach_data,training.dCL_ddelta_s     ,kind = 'linear',   bounds_error=False, fill_value="extrapolate") 
         surrogates.dCM_ddelta_s     = interpolate.interp1d(mach_data,training.dCM_ddelta_s     ,kind = 'linear',   bounds_error=False, fill_value="extrapolate") 
         surrogates.dCN_ddelta_s     = interpolate.interp1d(mach_data,training.dCN_ddelta_s     ,kind = 'linear',   bounds_error=False, fill_value="extrapolate")   
+    
+    # stacked tables evaluated together by evaluate_surrogate
+    surrogates.fused = build_fused_surrogate(surrogates)
    
     return surrogates
  
@@ -319,6 +323,7 @@ def no_surrogate(aerodynamics, training):
     # unpack data
     surrogates     = Data() 
     vehicle        = aerodynamics.vehicle 
+    surrogates.fused = None
     
     surrogates.Clift_wing_alpha = Data()
     surrogates.Cdrag_wing_alpha = Data() 
@@ -549,4 +554,58 @@ def no_surrogate(aerodynamics, training):
         surrogates.dCM_ddelta_s     = None
         surrogates.dCN_ddelta_s     = None
    
-    return surrogates 
\ No newline at end of file
+    return surrogates
+
+def build_fused_surrogate(surrogates):
+    """Stacks the tables of a set of surrogates that share a grid so they can be interpolated together.
+    
+    Assumptions:
+        Every table of the set is tabulated on the same Mach numbers
+        
+    Source:
+        None
+
+    Args:
+        surrogates         : surrogates of one Mach regime, see build_surrogate   [unitless] 
+        
+    Returns: 
+        fused.
+          Mach                    : Mach number grid                                 [unitless]
+          derivatives.names       : stability derivatives                            [unitless]
+          derivatives.values      : derivatives, shape (Mach, derivative)            [unitless]
+          tables[perturbation].
+            grid                  : perturbation grid, ascending                     [unitless]
+            names                 : (coefficient, wing tag or None) of every column   [unitless]
+            values                : coefficients, shape (grid, Mach, coefficient)    [unitless]
+    """
+    fused         = Data()
+    fused.tables  = Data()
+    columns       = Data()
+    derivatives   = []
+    
+    def add_table(perturbation, name, tag, interpolator):
+        if perturbation not in columns:
+            columns[perturbation] = Data(grid = interpolator.grid[0], names = [], values = [])
+            fused.Mach            = interpolator.grid[1]
+        columns[perturbation].names.append((name,tag))
+        columns[perturbation].values.append(interpolator.values)
+        
+    for name, value in surrogates.items():
+        if isinstance(value, RegularGridInterpolator):
+            add_table(name.split('_',1)[1], name, None, value)
+        elif isinstance(value, interpolate.interp1d):
+            derivatives.append((name, value))
+    for name in ['Clift_wing_alpha','Cdrag_wing_alpha']:
+        for tag, value in surrogates[name].items():
+            add_table('alpha', name, tag, value)
+            
+    for perturbation, table in columns.items():
+        fused.tables[perturbation] = Data(grid   = table.grid,
+                                          names  = table.names,
+                                          values = np.stack(table.values,axis=-1))
+        
+    fused.derivatives        = Data()
+    fused.derivatives.names  = [name for name, _ in derivatives]
+    fused.derivatives.values = np.stack([value.y for _, value in derivatives],axis=-1)
+    
+    return fused
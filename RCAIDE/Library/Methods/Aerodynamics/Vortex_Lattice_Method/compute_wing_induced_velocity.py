@@ -11,7 +11,7 @@
 # package imports 
 import numpy as np 
 
-def compute_wing_induced_velocity(VD,mach,compute_EW=False):
+def compute_wing_induced_velocity(VD,mach,compute_EW=False,rows=None):
     """ This computes the induced velocities at each control point of the vehicle vortex lattice 
 
     Assumptions: 
@@ -19,6 +19,9 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     
     Outside of a call to the VLM() function itself, EW does not need to be computed, as C_mn 
     provides the same information in the body-frame. 
+    
+    The velocities can be computed for a block of control points only, rows, so that the 
+    influence matrix can be built in tiles of limited memory. 
 
     Source:  
     1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
@@ -29,6 +32,7 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     Inputs: 
     VD       - vehicle vortex distribution                    [Unitless] 
     mach                                                      [Unitless] 
+    rows     - slice of the receiving control points, all if None [Unitless] 
     
     Outputs:                                
     C_mn     - total induced velocity matrix                  [Unitless] 
@@ -47,6 +51,8 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     n_cp         = VD.n_cp
     n_mach       = len(mach)
     mach         = np.array(mach,dtype=np.float32)
+    if rows is None:
+        rows     = slice(0,n_cp)
 
     # Control points from the VLM 
     XAH   = np.array(np.atleast_2d(VD.XAH*1.),dtype=np.float32)
@@ -111,9 +117,9 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     zc = 0.5*(za+zb)
     
     # This is the receiving point, or the control points
-    xo = XC.T
-    yo = YC.T
-    zo = ZC.T
+    xo = XC.T[rows]
+    yo = YC.T[rows]
+    zo = ZC.T[rows]
     
     # Incline the vortex
     theta    = np.arctan2(zb-za,yb-ya)
@@ -191,7 +197,7 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     
     if np.sum(sup)>0:
         U[sup], V[sup], W[sup], RFLAG[sup,:] = supersonic(zobar,XSQ1,RO1_sup,XSQ2,RO2_sup,XTY,t,B2_sup,ZSQ,TOLSQ,TOL,TOLSQ2,\
-                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind)
+                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind,rows)
          
     
     # Rotate into the vehicle frame and pack into a velocity matrix
@@ -201,8 +207,8 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     if compute_EW == True:
         # Calculate the W velocity in the VORLAX frame for later calcs
         # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
-        COS1   = np.cos(DL.T - DL)
-        SIN1   = np.sin(DL.T - DL) 
+        COS1   = np.cos(DL.T[rows] - DL)
+        SIN1   = np.sin(DL.T[rows] - DL) 
         WEIGHT = 1
         
         EW = (W*COS1-V*SIN1)*WEIGHT
@@ -283,7 +289,7 @@ def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     
     return U, V, W
 
-def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind):
+def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind, rows):
     """  This computes the induced velocities at each control point 
     of the vehicle vortex lattice for supersonic mach numbers
 
@@ -319,6 +325,7 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     n_cp         number of control points                     [-]
     TE_ind       indices of the trailing edge                 [-]
     LE_ind       indices of the leading edge                  [-]
+    rows         slice of the receiving control points        [-]
     
 
     
@@ -420,7 +427,7 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     # DETERMINE IF TRANSVERSE VORTEX LEG OF HORSESHOE ASSOCIATED TO THE
     # CONTROL POINT UNDER CONSIDERATION IS SONIC (SWEPT PARALLEL TO MACH
     # LINE)? IF SO THEN RFLAG = 0.0, OTHERWISE RFLAG = 1.0.
-    size   = shape[1]
+    size   = shape[2]
     n_mach = shape[0]    
     T2S = np.atleast_2d(T2[0,:])*np.ones((n_mach,1))
     T2F = np.zeros((n_mach,size))
@@ -454,7 +461,7 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     # FROM LINE 2647 VORLAX, the IR .NE. IRR means that we're looking at vortices that affect themselves
     WWAVE   = np.zeros(shape,dtype=np.float32)
     COX     = CHORD /RNMAX
-    eye     = np.eye(n_cp,dtype=np.int8)
+    eye     = np.eye(n_cp,dtype=np.int8)[rows]
     T2      = np.broadcast_to(T2,shape)*eye
     B2_full = np.broadcast_to(B2,shape)*eye
     COX     = np.broadcast_to(COX,shape)*eye
@@ -469,27 +476,22 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     # IN FRONT OF AND BEHIND IT.
     
     # Zero out the row
-    FLAG_bool_rep     = np.broadcast_to(FLAG_bool,shape)
+    FLAG_bool_rep     = np.broadcast_to(FLAG_bool[:,rows],shape)
     W[FLAG_bool_rep]  = 0. # Default to zero
 
     # The self velocity goes to 2
     FLAG_bool_split   = np.array(np.split(FLAG_bool.ravel(),n_mach))
     FLAG_ind          = np.array(np.where(FLAG_bool_split))
-    squares           = np.zeros((size,size,n_mach))
-    squares[FLAG_ind[1],FLAG_ind[1],FLAG_ind[0]] = 1
-    squares           = np.ravel(squares,order='F')
-    
-    FLAG_bool_self    = np.where(squares==1)[0]
-    W                 = W.ravel()
-    W[FLAG_bool_self] = 2. # It's own value, -2
+    FLAG_bool_self    = FLAG_ind[0]*size*size + FLAG_ind[1]*(size + 1)
     
     # The panels before and after go to -1
+    # The indices are flat indices of the full matrix, only those within the receiving rows are set
     FLAG_bool_bef = FLAG_bool_self - 1
     FLAG_bool_aft = FLAG_bool_self + 1
-    W[FLAG_bool_bef] = -1.
-    W[FLAG_bool_aft] = -1.
-    
-    W = np.reshape(W,shape)
+    for FLAG_bool_set, value in [(FLAG_bool_self,2.),(FLAG_bool_bef,-1.),(FLAG_bool_aft,-1.)]:
+        m, i, j = np.unravel_index(FLAG_bool_set % (n_mach*size*size),(n_mach,size,size))
+        in_rows = (i >= rows.start) & (i < rows.stop)
+        W[m[in_rows],i[in_rows] - rows.start,j[in_rows]] = value
 
     return U, V, W, RFLAG
 
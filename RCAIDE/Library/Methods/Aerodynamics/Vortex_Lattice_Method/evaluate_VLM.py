@@ -73,9 +73,9 @@ def evaluate_surrogate(state,settings,vehicle):
 
     # Spline for Subsonic-to-Transonic-to-Supersonic Regimes
     sub_trans_spline = Cubic_Spline_Blender(hsub_min,hsub_max)
-    h_sub            = lambda M:sub_trans_spline.compute(M)          
+    h_sub            = sub_trans_spline.compute(Mach)          
     sup_trans_spline = Cubic_Spline_Blender(hsup_max, hsup_min) 
-    h_sup            = lambda M:sup_trans_spline.compute(M)
+    h_sup            = sup_trans_spline.compute(Mach)
     
     u           = np.atleast_2d(conditions.freestream.u)
     v           = np.atleast_2d(conditions.freestream.v)
@@ -87,20 +87,33 @@ def evaluate_surrogate(state,settings,vehicle):
     # -----------------------------------------------------------------------------------------------------------------------
     # Query surrogates  
     # ----------------------------------------------------------------------------------------------------------------------- 
-    pts_alpha   = np.hstack((AoA,Mach))
-    pts_beta    = np.hstack((Beta,Mach))  
-    pts_u       = np.hstack((u,Mach))
-    pts_v       = np.hstack((v,Mach))
-    pts_w       = np.hstack((w,Mach))
-    pts_p       = np.hstack((p,Mach))
-    pts_q       = np.hstack((q,Mach))
-    pts_r       = np.hstack((r,Mach))
+    perturbations         = Data()
+    perturbations.alpha   = AoA
+    perturbations.beta    = Beta
+    perturbations.u       = u
+    perturbations.v       = v
+    perturbations.w       = w
+    perturbations.p       = p
+    perturbations.q       = q
+    perturbations.r       = r
+    if aerodynamics.aileron_flag: 
+        perturbations.delta_a = conditions.control_surfaces.aileron.deflection
+    if aerodynamics.elevator_flag: 
+        perturbations.delta_e = conditions.control_surfaces.elevator.deflection
+    if aerodynamics.rudder_flag: 
+        perturbations.delta_r = conditions.control_surfaces.rudder.deflection
+    if aerodynamics.flap_flag: 
+        perturbations.delta_f = conditions.control_surfaces.flap.deflection
+    if aerodynamics.slat_flag: 
+        perturbations.delta_s = conditions.control_surfaces.slat.deflection
+        
+    # every coefficient and derivative of a Mach regime in one pass
+    sub_values   = evaluate_fused_surrogate(sub_sur.fused,  Mach,perturbations)
+    trans_values = evaluate_fused_surrogate(trans_sur.fused,Mach,perturbations)
+    sup_values   = evaluate_fused_surrogate(sup_sur.fused,  Mach,perturbations)
     
     # Alpha 
-    results_alpha = compute_coefficients(sub_sur.Clift_alpha,  sub_sur.Cdrag_alpha,  sub_sur.CX_alpha,  sub_sur.CY_alpha,  sub_sur.CZ_alpha,  sub_sur.CL_alpha,  sub_sur.CM_alpha,   sub_sur.CN_alpha,
-                                         trans_sur.Clift_alpha,trans_sur.Cdrag_alpha,trans_sur.CX_alpha,trans_sur.CY_alpha,trans_sur.CZ_alpha,trans_sur.CL_alpha,trans_sur.CM_alpha, trans_sur.CN_alpha,
-                                         sup_sur.Clift_alpha,  sup_sur.Cdrag_alpha,  sup_sur.CX_alpha,  sup_sur.CY_alpha,  sup_sur.CZ_alpha,  sup_sur.CL_alpha,  sup_sur.CM_alpha,   sup_sur.CN_alpha,
-                                         h_sub,h_sup,Mach, pts_alpha)        
+    results_alpha = compute_coefficients(sub_values,trans_values,sup_values,'alpha',h_sub,h_sup)        
 
     Clift_alpha             = results_alpha.Clift   
     Cdrag_alpha             = results_alpha.Cdrag   
@@ -120,10 +133,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_alpha[AoA==0.0]      = 0  
     
     # Beta 
-    results_beta  = compute_coefficients(sub_sur.Clift_beta,  sub_sur.Cdrag_beta,  sub_sur.CX_beta,  sub_sur.CY_beta,  sub_sur.CZ_beta,  sub_sur.CL_beta,  sub_sur.CM_beta,   sub_sur.CN_beta,
-                                         trans_sur.Clift_beta,trans_sur.Cdrag_beta,trans_sur.CX_beta,trans_sur.CY_beta,trans_sur.CZ_beta,trans_sur.CL_beta,trans_sur.CM_beta, trans_sur.CN_beta,
-                                         sup_sur.Clift_beta,  sup_sur.Cdrag_beta,  sup_sur.CX_beta,  sup_sur.CY_beta,  sup_sur.CZ_beta,  sup_sur.CL_beta,  sup_sur.CM_beta,   sup_sur.CN_beta,
-                                         h_sub,h_sup,Mach, pts_beta)
+    results_beta  = compute_coefficients(sub_values,trans_values,sup_values,'beta',h_sub,h_sup)
      
     Clift_beta              = results_beta.Clift   
     Cdrag_beta              = results_beta.Cdrag 
@@ -143,10 +153,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_beta[Beta==0.0]      = 0
 
     # u  
-    results_u     =  compute_coefficients(sub_sur.Clift_u,  sub_sur.Cdrag_u,  sub_sur.CX_u,  sub_sur.CY_u,  sub_sur.CZ_u,  sub_sur.CL_u,  sub_sur.CM_u,   sub_sur.CN_u,
-                                          trans_sur.Clift_u,trans_sur.Cdrag_u,trans_sur.CX_u,trans_sur.CY_u,trans_sur.CZ_u,trans_sur.CL_u,trans_sur.CM_u, trans_sur.CN_u,
-                                          sup_sur.Clift_u,  sup_sur.Cdrag_u,  sup_sur.CX_u,  sup_sur.CY_u,  sup_sur.CZ_u,  sup_sur.CL_u,  sup_sur.CM_u,   sup_sur.CN_u,
-                                          h_sub,h_sup,Mach, pts_u)
+    results_u     =  compute_coefficients(sub_values,trans_values,sup_values,'u',h_sub,h_sup)
                   
     Clift_u           = results_u.Clift   
     Cdrag_u           = results_u.Cdrag   
@@ -166,10 +173,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_u[u==0.0]      = 0  
 
     # v  
-    results_v     =  compute_coefficients(sub_sur.Clift_v,  sub_sur.Cdrag_v,  sub_sur.CX_v,  sub_sur.CY_v,  sub_sur.CZ_v,  sub_sur.CL_v,  sub_sur.CM_v,   sub_sur.CN_v,
-                                          trans_sur.Clift_v,trans_sur.Cdrag_v,trans_sur.CX_v,trans_sur.CY_v,trans_sur.CZ_v,trans_sur.CL_v,trans_sur.CM_v, trans_sur.CN_v,
-                                          sup_sur.Clift_v,  sup_sur.Cdrag_v,  sup_sur.CX_v,  sup_sur.CY_v,  sup_sur.CZ_v,  sup_sur.CL_v,  sup_sur.CM_v,   sup_sur.CN_v,
-                                          h_sub,h_sup,Mach, pts_v)
+    results_v     =  compute_coefficients(sub_values,trans_values,sup_values,'v',h_sub,h_sup)
      
     Clift_v           = results_v.Clift   
     Cdrag_v           = results_v.Cdrag   
@@ -189,10 +193,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_v[v==0.0]      = 0
 
     # w  
-    results_w    =  compute_coefficients(sub_sur.Clift_w,  sub_sur.Cdrag_w,  sub_sur.CX_w,  sub_sur.CY_w,  sub_sur.CZ_w,  sub_sur.CL_w,  sub_sur.CM_w,   sub_sur.CN_w,
-                                         trans_sur.Clift_w,trans_sur.Cdrag_w,trans_sur.CX_w,trans_sur.CY_w,trans_sur.CZ_w,trans_sur.CL_w,trans_sur.CM_w, trans_sur.CN_w,
-                                         sup_sur.Clift_w,  sup_sur.Cdrag_w,  sup_sur.CX_w,  sup_sur.CY_w,  sup_sur.CZ_w,  sup_sur.CL_w,  sup_sur.CM_w,   sup_sur.CN_w,
-                                         h_sub,h_sup,Mach, pts_w)
+    results_w    =  compute_coefficients(sub_values,trans_values,sup_values,'w',h_sub,h_sup)
      
     Clift_w           = results_w.Clift   
     Cdrag_w           = results_w.Cdrag   
@@ -212,10 +213,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_w[w==0.0]      = 0
                         
     # p  
-    results_p    =  compute_coefficients(sub_sur.Clift_p,  sub_sur.Cdrag_p,  sub_sur.CX_p,  sub_sur.CY_p,  sub_sur.CZ_p,  sub_sur.CL_p,  sub_sur.CM_p,   sub_sur.CN_p,
-                                         trans_sur.Clift_p,trans_sur.Cdrag_p,trans_sur.CX_p,trans_sur.CY_p,trans_sur.CZ_p,trans_sur.CL_p,trans_sur.CM_p, trans_sur.CN_p,
-                                         sup_sur.Clift_p,  sup_sur.Cdrag_p,  sup_sur.CX_p,  sup_sur.CY_p,  sup_sur.CZ_p,  sup_sur.CL_p,  sup_sur.CM_p,   sup_sur.CN_p,
-                                         h_sub,h_sup,Mach, pts_p)
+    results_p    =  compute_coefficients(sub_values,trans_values,sup_values,'p',h_sub,h_sup)
      
     Clift_p           = results_p.Clift   
     Cdrag_p           = results_p.Cdrag   
@@ -235,10 +233,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_p[p==0.0]      = 0 
      
     # q  
-    results_q    =  compute_coefficients(sub_sur.Clift_q,  sub_sur.Cdrag_q,  sub_sur.CX_q,  sub_sur.CY_q,  sub_sur.CZ_q,  sub_sur.CL_q,  sub_sur.CM_q,   sub_sur.CN_q,
-                                         trans_sur.Clift_q,trans_sur.Cdrag_q,trans_sur.CX_q,trans_sur.CY_q,trans_sur.CZ_q,trans_sur.CL_q,trans_sur.CM_q, trans_sur.CN_q,
-                                         sup_sur.Clift_q,  sup_sur.Cdrag_q,  sup_sur.CX_q,  sup_sur.CY_q,  sup_sur.CZ_q,  sup_sur.CL_q,  sup_sur.CM_q,   sup_sur.CN_q,
-                                         h_sub,h_sup,Mach, pts_q)
+    results_q    =  compute_coefficients(sub_values,trans_values,sup_values,'q',h_sub,h_sup)
      
     Clift_q           = results_q.Clift   
     Cdrag_q           = results_q.Cdrag   
@@ -258,10 +253,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_q[q==0.0]      = 0
     
     # r  
-    results_r    =  compute_coefficients(sub_sur.Clift_r,  sub_sur.Cdrag_r,  sub_sur.CX_r,  sub_sur.CY_r,  sub_sur.CZ_r,  sub_sur.CL_r,  sub_sur.CM_r,   sub_sur.CN_r,
-                                         trans_sur.Clift_r,trans_sur.Cdrag_r,trans_sur.CX_r,trans_sur.CY_r,trans_sur.CZ_r,trans_sur.CL_r,trans_sur.CM_r, trans_sur.CN_r,
-                                         sup_sur.Clift_r,  sup_sur.Cdrag_r,  sup_sur.CX_r,  sup_sur.CY_r,  sup_sur.CZ_r,  sup_sur.CL_r,  sup_sur.CM_r,   sup_sur.CN_r,
-                                         h_sub,h_sup,Mach, pts_r)
+    results_r    =  compute_coefficients(sub_values,trans_values,sup_values,'r',h_sub,h_sup)
      
     Clift_r           = results_r.Clift   
     Cdrag_r           = results_r.Cdrag   
@@ -304,12 +296,8 @@ def evaluate_surrogate(state,settings,vehicle):
     # Addition of Control Surface Effect 
     # -----------------------------------------------------------------------------------------------------------------------    
     if aerodynamics.aileron_flag: 
-        pts_delta_a     = np.hstack((conditions.control_surfaces.aileron.deflection,Mach))
         
-        results_delta_a =  compute_coefficients(sub_sur.Clift_delta_a,sub_sur.Cdrag_delta_a,sub_sur.CX_delta_a,sub_sur.CY_delta_a,sub_sur.CZ_delta_a,sub_sur.CL_delta_a,sub_sur.CM_delta_a, sub_sur.CN_delta_a,
-         trans_sur.Clift_delta_a,trans_sur.Cdrag_delta_a,trans_sur.CX_delta_a,trans_sur.CY_delta_a,trans_sur.CZ_delta_a,trans_sur.CL_delta_a,trans_sur.CM_delta_a, trans_sur.CN_delta_a,
-         sup_sur.Clift_delta_a,sup_sur.Cdrag_delta_a,sup_sur.CX_delta_a,sup_sur.CY_delta_a,sup_sur.CZ_delta_a,sup_sur.CL_delta_a,sup_sur.CM_delta_a, sup_sur.CN_delta_a,
-        h_sub,h_sup,Mach, pts_delta_a)
+        results_delta_a =  compute_coefficients(sub_values,trans_values,sup_values,'delta_a',h_sub,h_sup)
          
         Clift_delta_a   = results_delta_a.Clift   
         Cdrag_delta_a   = results_delta_a.Cdrag   
@@ -347,12 +335,8 @@ def evaluate_surrogate(state,settings,vehicle):
         conditions.control_surfaces.aileron.static_stability.coefficients.N          = CN_delta_a             
         
     if aerodynamics.elevator_flag: 
-        pts_delta_e     = np.hstack((conditions.control_surfaces.elevator.deflection,Mach))
 
-        results_delta_e =  compute_coefficients(sub_sur.Clift_delta_e,sub_sur.Cdrag_delta_e,sub_sur.CX_delta_e,sub_sur.CY_delta_e,sub_sur.CZ_delta_e,sub_sur.CL_delta_e,sub_sur.CM_delta_e, sub_sur.CN_delta_e,
-         trans_sur.Clift_delta_e,trans_sur.Cdrag_delta_e,trans_sur.CX_delta_e,trans_sur.CY_delta_e,trans_sur.CZ_delta_e,trans_sur.CL_delta_e,trans_sur.CM_delta_e, trans_sur.CN_delta_e,
-         sup_sur.Clift_delta_e,sup_sur.Cdrag_delta_e,sup_sur.CX_delta_e,sup_sur.CY_delta_e,sup_sur.CZ_delta_e,sup_sur.CL_delta_e,sup_sur.CM_delta_e, sup_sur.CN_delta_e,
-        h_sub,h_sup,Mach, pts_delta_e)
+        results_delta_e =  compute_coefficients(sub_values,trans_values,sup_values,'delta_e',h_sub,h_sup)
          
         Clift_delta_e   = results_delta_e.Clift   
         Cdrag_delta_e   = results_delta_e.Cdrag   
@@ -390,12 +374,8 @@ def evaluate_surrogate(state,settings,vehicle):
         conditions.control_surfaces.elevator.static_stability.coefficients.N         = CN_delta_e            
         
     if aerodynamics.rudder_flag:  
-        pts_delta_r    = np.hstack((conditions.control_surfaces.rudder.deflection,Mach))
         
-        results_delta_r =  compute_coefficients(sub_sur.Clift_delta_r,sub_sur.Cdrag_delta_r,sub_sur.CX_delta_r,sub_sur.CY_delta_r,sub_sur.CZ_delta_r,sub_sur.CL_delta_r,sub_sur.CM_delta_r, sub_sur.CN_delta_r,
-                                                trans_sur.Clift_delta_r,trans_sur.Cdrag_delta_r,trans_sur.CX_delta_r,trans_sur.CY_delta_r,trans_sur.CZ_delta_r,trans_sur.CL_delta_r,trans_sur.CM_delta_r, trans_sur.CN_delta_r,
-                                                sup_sur.Clift_delta_r,sup_sur.Cdrag_delta_r,sup_sur.CX_delta_r,sup_sur.CY_delta_r,sup_sur.CZ_delta_r,sup_sur.CL_delta_r,sup_sur.CM_delta_r, sup_sur.CN_delta_r,
-                                                h_sub,h_sup,Mach, pts_delta_r)
+        results_delta_r =  compute_coefficients(sub_values,trans_values,sup_values,'delta_r',h_sub,h_sup)
          
         Clift_delta_r   = results_delta_r.Clift   
         Cdrag_delta_r   = results_delta_r.Cdrag   
@@ -433,12 +413,8 @@ def evaluate_surrogate(state,settings,vehicle):
         conditions.control_surfaces.rudder.static_stability.coefficients.N           = CN_delta_r         
         
     if aerodynamics.flap_flag:
-        pts_delta_f    = np.hstack((conditions.control_surfaces.flap.deflection,Mach))
         
-        results_delta_f =  compute_coefficients(sub_sur.Clift_delta_f,sub_sur.Cdrag_delta_f,sub_sur.CX_delta_f,sub_sur.CY_delta_f,sub_sur.CZ_delta_f,sub_sur.CL_delta_f,sub_sur.CM_delta_f, sub_sur.CN_delta_f,
-         trans_sur.Clift_delta_f,trans_sur.Cdrag_delta_f,trans_sur.CX_delta_f,trans_sur.CY_delta_f,trans_sur.CZ_delta_f,trans_sur.CL_delta_f,trans_sur.CM_delta_f, trans_sur.CN_delta_f,
-         sup_sur.Clift_delta_f,sup_sur.Cdrag_delta_f,sup_sur.CX_delta_f,sup_sur.CY_delta_f,sup_sur.CZ_delta_f,sup_sur.CL_delta_f,sup_sur.CM_delta_f, sup_sur.CN_delta_f,
-        h_sub,h_sup,Mach, pts_delta_f)
+        results_delta_f =  compute_coefficients(sub_values,trans_values,sup_values,'delta_f',h_sub,h_sup)
          
         Clift_delta_f   = results_delta_f.Clift   
         Cdrag_delta_f   = results_delta_f.Cdrag   
@@ -476,12 +452,8 @@ def evaluate_surrogate(state,settings,vehicle):
         conditions.control_surfaces.flap.static_stability.coefficients.N             = CN_delta_f           
         
     if aerodynamics.slat_flag: 
-        pts_delta_s    = np.hstack((conditions.control_surfaces.slat.deflection,Mach)) 
         
-        results_delta_s =  compute_coefficients(sub_sur.Clift_delta_s,sub_sur.Cdrag_delta_s,sub_sur.CX_delta_s,sub_sur.CY_delta_s,sub_sur.CZ_delta_s,sub_sur.CL_delta_s,sub_sur.CM_delta_s, sub_sur.CN_delta_s,
-         trans_sur.Clift_delta_s,trans_sur.Cdrag_delta_s,trans_sur.CX_delta_s,trans_sur.CY_delta_s,trans_sur.CZ_delta_s,trans_sur.CL_delta_s,trans_sur.CM_delta_s, trans_sur.CN_delta_s,
-         sup_sur.Clift_delta_s,sup_sur.Cdrag_delta_s,sup_sur.CX_delta_s,sup_sur.CY_delta_s,sup_sur.CZ_delta_s,sup_sur.CL_delta_s,sup_sur.CM_delta_s, sup_sur.CN_delta_s,
-        h_sub,h_sup,Mach, pts_delta_s)
+        results_delta_s =  compute_coefficients(sub_values,trans_values,sup_values,'delta_s',h_sub,h_sup)
          
         Clift_delta_s   = results_delta_s.Clift   
         Cdrag_delta_s   = results_delta_s.Cdrag   
@@ -519,110 +491,110 @@ def evaluate_surrogate(state,settings,vehicle):
         conditions.control_surfaces.slat.static_stability.coefficients.N             = CN_delta_s                     
      
     
-    conditions.static_stability.derivatives.Clift_alpha = compute_stability_derivative(sub_sur.dClift_dalpha ,trans_sur.dClift_dalpha ,sup_sur.dClift_dalpha ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_alpha    = compute_stability_derivative(sub_sur.dCX_dalpha    ,trans_sur.dCX_dalpha    ,sup_sur.dCX_dalpha    ,h_sub,h_sup,Mach)  
-    conditions.static_stability.derivatives.CY_alpha    = compute_stability_derivative(sub_sur.dCY_dalpha    ,trans_sur.dCY_dalpha    ,sup_sur.dCY_dalpha    ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_alpha    = compute_stability_derivative(sub_sur.dCZ_dalpha    ,trans_sur.dCZ_dalpha    ,sup_sur.dCZ_dalpha    ,h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CL_alpha    = compute_stability_derivative(sub_sur.dCL_dalpha    ,trans_sur.dCL_dalpha    ,sup_sur.dCL_dalpha    ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_alpha    = compute_stability_derivative(sub_sur.dCM_dalpha    ,trans_sur.dCM_dalpha    ,sup_sur.dCM_dalpha    ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_alpha    = compute_stability_derivative(sub_sur.dCN_dalpha    ,trans_sur.dCN_dalpha    ,sup_sur.dCN_dalpha    ,h_sub,h_sup,Mach)
-
-    conditions.static_stability.derivatives.Clift_beta  = compute_stability_derivative(sub_sur.dClift_dbeta  ,trans_sur.dClift_dbeta  ,sup_sur.dClift_dbeta  ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_beta     = compute_stability_derivative(sub_sur.dCX_dbeta     ,trans_sur.dCX_dbeta     ,sup_sur.dCX_dbeta     ,h_sub,h_sup,Mach)  
-    conditions.static_stability.derivatives.CY_beta     = compute_stability_derivative(sub_sur.dCY_dbeta     ,trans_sur.dCY_dbeta     ,sup_sur.dCY_dbeta     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_beta     = compute_stability_derivative(sub_sur.dCZ_dbeta     ,trans_sur.dCZ_dbeta     ,sup_sur.dCZ_dbeta     ,h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CL_beta     = compute_stability_derivative(sub_sur.dCL_dbeta     ,trans_sur.dCL_dbeta     ,sup_sur.dCL_dbeta     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_beta     = compute_stability_derivative(sub_sur.dCM_dbeta     ,trans_sur.dCM_dbeta     ,sup_sur.dCM_dbeta     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_beta     = compute_stability_derivative(sub_sur.dCN_dbeta     ,trans_sur.dCN_dbeta     ,sup_sur.dCN_dbeta     ,h_sub,h_sup,Mach)
-
-    conditions.static_stability.derivatives.Clift_p     = compute_stability_derivative(sub_sur.dClift_dp     ,trans_sur.dClift_dp     ,sup_sur.dClift_dp     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_q     = compute_stability_derivative(sub_sur.dClift_dq     ,trans_sur.dClift_dq     ,sup_sur.dClift_dq     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_r     = compute_stability_derivative(sub_sur.dClift_dr     ,trans_sur.dClift_dr     ,sup_sur.dClift_dr     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_u        = compute_stability_derivative(sub_sur.dCX_du        ,trans_sur.dCX_du        ,sup_sur.dCX_du        ,h_sub,h_sup,Mach)   
-    conditions.static_stability.derivatives.CX_v        = compute_stability_derivative(sub_sur.dCX_dv        ,trans_sur.dCX_dv        ,sup_sur.dCX_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_w        = compute_stability_derivative(sub_sur.dCX_dw        ,trans_sur.dCX_dw        ,sup_sur.dCX_dw        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_u        = compute_stability_derivative(sub_sur.dCY_du        ,trans_sur.dCY_du        ,sup_sur.dCY_du        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_v        = compute_stability_derivative(sub_sur.dCY_dv        ,trans_sur.dCY_dv        ,sup_sur.dCY_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_w        = compute_stability_derivative(sub_sur.dCY_dw        ,trans_sur.dCY_dw        ,sup_sur.dCY_dw        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_u        = compute_stability_derivative(sub_sur.dCZ_du        ,trans_sur.dCZ_du        ,sup_sur.dCZ_du        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_v        = compute_stability_derivative(sub_sur.dCZ_dv        ,trans_sur.dCZ_dv        ,sup_sur.dCZ_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_w        = compute_stability_derivative(sub_sur.dCZ_dw        ,trans_sur.dCZ_dw        ,sup_sur.dCZ_dw        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_u        = compute_stability_derivative(sub_sur.dCL_du        ,trans_sur.dCL_du        ,sup_sur.dCL_du        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_v        = compute_stability_derivative(sub_sur.dCL_dv        ,trans_sur.dCL_dv        ,sup_sur.dCL_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_w        = compute_stability_derivative(sub_sur.dCL_dw        ,trans_sur.dCL_dw        ,sup_sur.dCL_dw        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_u        = compute_stability_derivative(sub_sur.dCM_du        ,trans_sur.dCM_du        ,sup_sur.dCM_du        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_v        = compute_stability_derivative(sub_sur.dCM_dv        ,trans_sur.dCM_dv        ,sup_sur.dCM_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_w        = compute_stability_derivative(sub_sur.dCM_dw        ,trans_sur.dCM_dw        ,sup_sur.dCM_dw        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_u        = compute_stability_derivative(sub_sur.dCN_du        ,trans_sur.dCN_du        ,sup_sur.dCN_du        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_v        = compute_stability_derivative(sub_sur.dCN_dv        ,trans_sur.dCN_dv        ,sup_sur.dCN_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_w        = compute_stability_derivative(sub_sur.dCN_dw        ,trans_sur.dCN_dw        ,sup_sur.dCN_dw        ,h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CX_p        = compute_stability_derivative(sub_sur.dCX_dp        ,trans_sur.dCX_dp        ,sup_sur.dCX_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_q        = compute_stability_derivative(sub_sur.dCX_dq        ,trans_sur.dCX_dq        ,sup_sur.dCX_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_r        = compute_stability_derivative(sub_sur.dCX_dr        ,trans_sur.dCX_dr        ,sup_sur.dCX_dr        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_p        = compute_stability_derivative(sub_sur.dCY_dp        ,trans_sur.dCY_dp        ,sup_sur.dCY_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_q        = compute_stability_derivative(sub_sur.dCY_dq        ,trans_sur.dCY_dq        ,sup_sur.dCY_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_r        = compute_stability_derivative(sub_sur.dCY_dr        ,trans_sur.dCY_dr        ,sup_sur.dCY_dr        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_p        = compute_stability_derivative(sub_sur.dCZ_dp        ,trans_sur.dCZ_dp        ,sup_sur.dCZ_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_q        = compute_stability_derivative(sub_sur.dCZ_dq        ,trans_sur.dCZ_dq        ,sup_sur.dCZ_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_r        = compute_stability_derivative(sub_sur.dCZ_dr        ,trans_sur.dCZ_dr        ,sup_sur.dCZ_dr        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_p        = compute_stability_derivative(sub_sur.dCL_dp        ,trans_sur.dCL_dp        ,sup_sur.dCL_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_q        = compute_stability_derivative(sub_sur.dCL_dq        ,trans_sur.dCL_dq        ,sup_sur.dCL_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_r        = compute_stability_derivative(sub_sur.dCL_dr        ,trans_sur.dCL_dr        ,sup_sur.dCL_dr        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_p        = compute_stability_derivative(sub_sur.dCM_dp        ,trans_sur.dCM_dp        ,sup_sur.dCM_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_q        = compute_stability_derivative(sub_sur.dCM_dq        ,trans_sur.dCM_dq        ,sup_sur.dCM_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_r        = compute_stability_derivative(sub_sur.dCM_dr        ,trans_sur.dCM_dr        ,sup_sur.dCM_dr        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_p        = compute_stability_derivative(sub_sur.dCN_dp        ,trans_sur.dCN_dp        ,sup_sur.dCN_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_q        = compute_stability_derivative(sub_sur.dCN_dq        ,trans_sur.dCN_dq        ,sup_sur.dCN_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_r        = compute_stability_derivative(sub_sur.dCN_dr        ,trans_sur.dCN_dr        ,sup_sur.dCN_dr        ,h_sub,h_sup,Mach)
+    conditions.static_stability.derivatives.Clift_alpha = compute_stability_derivative(sub_values,trans_values,sup_values,'dClift_dalpha',h_sub,h_sup)
+    conditions.static_stability.derivatives.CX_alpha    = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_dalpha',h_sub,h_sup)  
+    conditions.static_stability.derivatives.CY_alpha    = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_dalpha',h_sub,h_sup)
+    conditions.static_stability.derivatives.CZ_alpha    = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_dalpha',h_sub,h_sup) 
+    conditions.static_stability.derivatives.CL_alpha    = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_dalpha',h_sub,h_sup)
+    conditions.static_stability.derivatives.CM_alpha    = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_dalpha',h_sub,h_sup)
+    conditions.static_stability.derivatives.CN_alpha    = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_dalpha',h_sub,h_sup)
+
+    conditions.static_stability.derivatives.Clift_beta  = compute_stability_derivative(sub_values,trans_values,sup_values,'dClift_dbeta',h_sub,h_sup)
+    conditions.static_stability.derivatives.CX_beta     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_dbeta',h_sub,h_sup)  
+    conditions.static_stability.derivatives.CY_beta     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_dbeta',h_sub,h_sup)
+    conditions.static_stability.derivatives.CZ_beta     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_dbeta',h_sub,h_sup) 
+    conditions.static_stability.derivatives.CL_beta     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_dbeta',h_sub,h_sup)
+    conditions.static_stability.derivatives.CM_beta     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_dbeta',h_sub,h_sup)
+    conditions.static_stability.derivatives.CN_beta     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_dbeta',h_sub,h_sup)
+
+    conditions.static_stability.derivatives.Clift_p     = compute_stability_derivative(sub_values,trans_values,sup_values,'dClift_dp',h_sub,h_sup)
+    conditions.static_stability.derivatives.Clift_q     = compute_stability_derivative(sub_values,trans_values,sup_values,'dClift_dq',h_sub,h_sup)
+    conditions.static_stability.derivatives.Clift_r     = compute_stability_derivative(sub_values,trans_values,sup_values,'dClift_dr',h_sub,h_sup)
+    conditions.static_stability.derivatives.CX_u        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_du',h_sub,h_sup)   
+    conditions.static_stability.derivatives.CX_v        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_dv',h_sub,h_sup)
+    conditions.static_stability.derivatives.CX_w        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_dw',h_sub,h_sup)
+    conditions.static_stability.derivatives.CY_u        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_du',h_sub,h_sup)
+    conditions.static_stability.derivatives.CY_v        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_dv',h_sub,h_sup)
+    conditions.static_stability.derivatives.CY_w        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_dw',h_sub,h_sup)
+    conditions.static_stability.derivatives.CZ_u        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_du',h_sub,h_sup)
+    conditions.static_stability.derivatives.CZ_v        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_dv',h_sub,h_sup)
+    conditions.static_stability.derivatives.CZ_w        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_dw',h_sub,h_sup)
+    conditions.static_stability.derivatives.CL_u        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_du',h_sub,h_sup)
+    conditions.static_stability.derivatives.CL_v        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_dv',h_sub,h_sup)
+    conditions.static_stability.derivatives.CL_w        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_dw',h_sub,h_sup)
+    conditions.static_stability.derivatives.CM_u        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_du',h_sub,h_sup)
+    conditions.static_stability.derivatives.CM_v        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_dv',h_sub,h_sup)
+    conditions.static_stability.derivatives.CM_w        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_dw',h_sub,h_sup)
+    conditions.static_stability.derivatives.CN_u        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_du',h_sub,h_sup)
+    conditions.static_stability.derivatives.CN_v        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_dv',h_sub,h_sup)
+    conditions.static_stability.derivatives.CN_w        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_dw',h_sub,h_sup) 
+    conditions.static_stability.derivatives.CX_p        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_dp',h_sub,h_sup)
+    conditions.static_stability.derivatives.CX_q        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_dq',h_sub,h_sup)
+    conditions.static_stability.derivatives.CX_r        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_dr',h_sub,h_sup)
+    conditions.static_stability.derivatives.CY_p        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_dp',h_sub,h_sup)
+    conditions.static_stability.derivatives.CY_q        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_dq',h_sub,h_sup)
+    conditions.static_stability.derivatives.CY_r        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_dr',h_sub,h_sup)
+    conditions.static_stability.derivatives.CZ_p        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_dp',h_sub,h_sup)
+    conditions.static_stability.derivatives.CZ_q        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_dq',h_sub,h_sup)
+    conditions.static_stability.derivatives.CZ_r        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_dr',h_sub,h_sup)
+    conditions.static_stability.derivatives.CL_p        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_dp',h_sub,h_sup)
+    conditions.static_stability.derivatives.CL_q        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_dq',h_sub,h_sup)
+    conditions.static_stability.derivatives.CL_r        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_dr',h_sub,h_sup)
+    conditions.static_stability.derivatives.CM_p        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_dp',h_sub,h_sup)
+    conditions.static_stability.derivatives.CM_q        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_dq',h_sub,h_sup)
+    conditions.static_stability.derivatives.CM_r        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_dr',h_sub,h_sup)
+    conditions.static_stability.derivatives.CN_p        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_dp',h_sub,h_sup)
+    conditions.static_stability.derivatives.CN_q        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_dq',h_sub,h_sup)
+    conditions.static_stability.derivatives.CN_r        = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_dr',h_sub,h_sup)
 
     if aerodynamics.elevator_flag: 
-        conditions.static_stability.derivatives.Clift_delta_e  = compute_stability_derivative(sub_sur.dClift_ddelta_e  ,trans_sur.dClift_ddelta_e  ,sup_sur.dClift_ddelta_e  ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CX_delta_e     = compute_stability_derivative(sub_sur.dCX_ddelta_e     ,trans_sur.dCX_ddelta_e     ,sup_sur.dCX_ddelta_e     ,h_sub,h_sup,Mach)  
-        conditions.static_stability.derivatives.CY_delta_e     = compute_stability_derivative(sub_sur.dCY_ddelta_e     ,trans_sur.dCY_ddelta_e     ,sup_sur.dCY_ddelta_e     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CZ_delta_e     = compute_stability_derivative(sub_sur.dCZ_ddelta_e     ,trans_sur.dCZ_ddelta_e     ,sup_sur.dCZ_ddelta_e     ,h_sub,h_sup,Mach) 
-        conditions.static_stability.derivatives.CL_delta_e     = compute_stability_derivative(sub_sur.dCL_ddelta_e     ,trans_sur.dCL_ddelta_e     ,sup_sur.dCL_ddelta_e     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CM_delta_e     = compute_stability_derivative(sub_sur.dCM_ddelta_e     ,trans_sur.dCM_ddelta_e     ,sup_sur.dCM_ddelta_e     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CN_delta_e     = compute_stability_derivative(sub_sur.dCN_ddelta_e     ,trans_sur.dCN_ddelta_e     ,sup_sur.dCN_ddelta_e     ,h_sub,h_sup,Mach) 
+        conditions.static_stability.derivatives.Clift_delta_e  = compute_stability_derivative(sub_values,trans_values,sup_values,'dClift_ddelta_e',h_sub,h_sup)
+        conditions.static_stability.derivatives.CX_delta_e     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_ddelta_e',h_sub,h_sup)  
+        conditions.static_stability.derivatives.CY_delta_e     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_ddelta_e',h_sub,h_sup)
+        conditions.static_stability.derivatives.CZ_delta_e     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_ddelta_e',h_sub,h_sup) 
+        conditions.static_stability.derivatives.CL_delta_e     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_ddelta_e',h_sub,h_sup)
+        conditions.static_stability.derivatives.CM_delta_e     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_ddelta_e',h_sub,h_sup)
+        conditions.static_stability.derivatives.CN_delta_e     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_ddelta_e',h_sub,h_sup) 
 
     if aerodynamics.aileron_flag: 
-        conditions.static_stability.derivatives.Clift_delta_a  = compute_stability_derivative(sub_sur.dClift_ddelta_a  ,trans_sur.dClift_ddelta_a  ,sup_sur.dClift_ddelta_a  ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CX_delta_a     = compute_stability_derivative(sub_sur.dCX_ddelta_a     ,trans_sur.dCX_ddelta_a     ,sup_sur.dCX_ddelta_a     ,h_sub,h_sup,Mach)  
-        conditions.static_stability.derivatives.CY_delta_a     = compute_stability_derivative(sub_sur.dCY_ddelta_a     ,trans_sur.dCY_ddelta_a     ,sup_sur.dCY_ddelta_a     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CZ_delta_a     = compute_stability_derivative(sub_sur.dCZ_ddelta_a     ,trans_sur.dCZ_ddelta_a     ,sup_sur.dCZ_ddelta_a     ,h_sub,h_sup,Mach) 
-        conditions.static_stability.derivatives.CL_delta_a     = compute_stability_derivative(sub_sur.dCL_ddelta_a     ,trans_sur.dCL_ddelta_a     ,sup_sur.dCL_ddelta_a     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CM_delta_a     = compute_stability_derivative(sub_sur.dCM_ddelta_a     ,trans_sur.dCM_ddelta_a     ,sup_sur.dCM_ddelta_a     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CN_delta_a     = compute_stability_derivative(sub_sur.dCN_ddelta_a     ,trans_sur.dCN_ddelta_a     ,sup_sur.dCN_ddelta_a     ,h_sub,h_sup,Mach) 
+        conditions.static_stability.derivatives.Clift_delta_a  = compute_stability_derivative(sub_values,trans_values,sup_values,'dClift_ddelta_a',h_sub,h_sup)
+        conditions.static_stability.derivatives.CX_delta_a     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_ddelta_a',h_sub,h_sup)  
+        conditions.static_stability.derivatives.CY_delta_a     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_ddelta_a',h_sub,h_sup)
+        conditions.static_stability.derivatives.CZ_delta_a     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_ddelta_a',h_sub,h_sup) 
+        conditions.static_stability.derivatives.CL_delta_a     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_ddelta_a',h_sub,h_sup)
+        conditions.static_stability.derivatives.CM_delta_a     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_ddelta_a',h_sub,h_sup)
+        conditions.static_stability.derivatives.CN_delta_a     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_ddelta_a',h_sub,h_sup) 
 
     if aerodynamics.rudder_flag: 
-        conditions.static_stability.derivatives.Clift_delta_r  = compute_stability_derivative(sub_sur.dClift_ddelta_r  ,trans_sur.dClift_ddelta_r  ,sup_sur.dClift_ddelta_r  ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CX_delta_r     = compute_stability_derivative(sub_sur.dCX_ddelta_r     ,trans_sur.dCX_ddelta_r     ,sup_sur.dCX_ddelta_r     ,h_sub,h_sup,Mach)  
-        conditions.static_stability.derivatives.CY_delta_r     = compute_stability_derivative(sub_sur.dCY_ddelta_r     ,trans_sur.dCY_ddelta_r     ,sup_sur.dCY_ddelta_r     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CZ_delta_r     = compute_stability_derivative(sub_sur.dCZ_ddelta_r     ,trans_sur.dCZ_ddelta_r     ,sup_sur.dCZ_ddelta_r     ,h_sub,h_sup,Mach) 
-        conditions.static_stability.derivatives.CL_delta_r     = compute_stability_derivative(sub_sur.dCL_ddelta_r     ,trans_sur.dCL_ddelta_r     ,sup_sur.dCL_ddelta_r     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CM_delta_r     = compute_stability_derivative(sub_sur.dCM_ddelta_r     ,trans_sur.dCM_ddelta_r     ,sup_sur.dCM_ddelta_r     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CN_delta_r     = compute_stability_derivative(sub_sur.dCN_ddelta_r     ,trans_sur.dCN_ddelta_r     ,sup_sur.dCN_ddelta_r     ,h_sub,h_sup,Mach) 
+        conditions.static_stability.derivatives.Clift_delta_r  = compute_stability_derivative(sub_values,trans_values,sup_values,'dClift_ddelta_r',h_sub,h_sup)
+        conditions.static_stability.derivatives.CX_delta_r     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_ddelta_r',h_sub,h_sup)  
+        conditions.static_stability.derivatives.CY_delta_r     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_ddelta_r',h_sub,h_sup)
+        conditions.static_stability.derivatives.CZ_delta_r     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_ddelta_r',h_sub,h_sup) 
+        conditions.static_stability.derivatives.CL_delta_r     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_ddelta_r',h_sub,h_sup)
+        conditions.static_stability.derivatives.CM_delta_r     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_ddelta_r',h_sub,h_sup)
+        conditions.static_stability.derivatives.CN_delta_r     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_ddelta_r',h_sub,h_sup) 
 
     if aerodynamics.flap_flag: 
-        conditions.static_stability.derivatives.Clift_delta_f  = compute_stability_derivative(sub_sur.dClift_ddelta_f  ,trans_sur.dClift_ddelta_f  ,sup_sur.dClift_ddelta_f  ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CX_delta_f     = compute_stability_derivative(sub_sur.dCX_ddelta_f     ,trans_sur.dCX_ddelta_f     ,sup_sur.dCX_ddelta_f     ,h_sub,h_sup,Mach)  
-        conditions.static_stability.derivatives.CY_delta_f     = compute_stability_derivative(sub_sur.dCY_ddelta_f     ,trans_sur.dCY_ddelta_f     ,sup_sur.dCY_ddelta_f     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CZ_delta_f     = compute_stability_derivative(sub_sur.dCZ_ddelta_f     ,trans_sur.dCZ_ddelta_f     ,sup_sur.dCZ_ddelta_f     ,h_sub,h_sup,Mach) 
-        conditions.static_stability.derivatives.CL_delta_f     = compute_stability_derivative(sub_sur.dCL_ddelta_f     ,trans_sur.dCL_ddelta_f     ,sup_sur.dCL_ddelta_f     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CM_delta_f     = compute_stability_derivative(sub_sur.dCM_ddelta_f     ,trans_sur.dCM_ddelta_f     ,sup_sur.dCM_ddelta_f     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CN_delta_f     = compute_stability_derivative(sub_sur.dCN_ddelta_f     ,trans_sur.dCN_ddelta_f     ,sup_sur.dCN_ddelta_f     ,h_sub,h_sup,Mach) 
+        conditions.static_stability.derivatives.Clift_delta_f  = compute_stability_derivative(sub_values,trans_values,sup_values,'dClift_ddelta_f',h_sub,h_sup)
+        conditions.static_stability.derivatives.CX_delta_f     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_ddelta_f',h_sub,h_sup)  
+        conditions.static_stability.derivatives.CY_delta_f     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_ddelta_f',h_sub,h_sup)
+        conditions.static_stability.derivatives.CZ_delta_f     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_ddelta_f',h_sub,h_sup) 
+        conditions.static_stability.derivatives.CL_delta_f     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_ddelta_f',h_sub,h_sup)
+        conditions.static_stability.derivatives.CM_delta_f     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_ddelta_f',h_sub,h_sup)
+        conditions.static_stability.derivatives.CN_delta_f     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_ddelta_f',h_sub,h_sup) 
 
     if aerodynamics.slat_flag: 
-        conditions.static_stability.derivatives.Clift_delta_s  = compute_stability_derivative(sub_sur.dClift_ddelta_s  ,trans_sur.dClift_ddelta_s  ,sup_sur.dClift_ddelta_s  ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CX_delta_s     = compute_stability_derivative(sub_sur.dCX_ddelta_s     ,trans_sur.dCX_ddelta_s     ,sup_sur.dCX_ddelta_s     ,h_sub,h_sup,Mach)  
-        conditions.static_stability.derivatives.CY_delta_s     = compute_stability_derivative(sub_sur.dCY_ddelta_s     ,trans_sur.dCY_ddelta_s     ,sup_sur.dCY_ddelta_s     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CZ_delta_s     = compute_stability_derivative(sub_sur.dCZ_ddelta_s     ,trans_sur.dCZ_ddelta_s     ,sup_sur.dCZ_ddelta_s     ,h_sub,h_sup,Mach) 
-        conditions.static_stability.derivatives.CL_delta_s     = compute_stability_derivative(sub_sur.dCL_ddelta_s     ,trans_sur.dCL_ddelta_s     ,sup_sur.dCL_ddelta_s     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CM_delta_s     = compute_stability_derivative(sub_sur.dCM_ddelta_s     ,trans_sur.dCM_ddelta_s     ,sup_sur.dCM_ddelta_s     ,h_sub,h_sup,Mach)
-        conditions.static_stability.derivatives.CN_delta_s     = compute_stability_derivative(sub_sur.dCN_ddelta_s     ,trans_sur.dCN_ddelta_s     ,sup_sur.dCN_ddelta_s     ,h_sub,h_sup,Mach) 
+        conditions.static_stability.derivatives.Clift_delta_s  = compute_stability_derivative(sub_values,trans_values,sup_values,'dClift_ddelta_s',h_sub,h_sup)
+        conditions.static_stability.derivatives.CX_delta_s     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCX_ddelta_s',h_sub,h_sup)  
+        conditions.static_stability.derivatives.CY_delta_s     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCY_ddelta_s',h_sub,h_sup)
+        conditions.static_stability.derivatives.CZ_delta_s     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCZ_ddelta_s',h_sub,h_sup) 
+        conditions.static_stability.derivatives.CL_delta_s     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCL_ddelta_s',h_sub,h_sup)
+        conditions.static_stability.derivatives.CM_delta_s     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCM_ddelta_s',h_sub,h_sup)
+        conditions.static_stability.derivatives.CN_delta_s     = compute_stability_derivative(sub_values,trans_values,sup_values,'dCN_ddelta_s',h_sub,h_sup) 
 
     for wing in vehicle.wings:   
-        inviscid_wing_lifts = compute_coefficient(sub_sur.Clift_wing_alpha[wing.tag],trans_sur.Clift_wing_alpha[wing.tag],sup_sur.Cdrag_wing_alpha[wing.tag] ,h_sub,h_sup,Mach,pts_alpha)
-        inviscid_wing_drags = compute_coefficient(sub_sur.Cdrag_wing_alpha[wing.tag],trans_sur.Cdrag_wing_alpha[wing.tag],sup_sur.Cdrag_wing_alpha[wing.tag] ,h_sub,h_sup,Mach,pts_alpha)
+        inviscid_wing_lifts = compute_coefficient(sub_values,trans_values,sup_values,'Clift_wing_alpha',wing.tag,h_sub,h_sup)
+        inviscid_wing_drags = compute_coefficient(sub_values,trans_values,sup_values,'Cdrag_wing_alpha',wing.tag,h_sub,h_sup)
         # Pack 
         conditions.aerodynamics.coefficients.lift.induced.inviscid_wings[wing.tag] =  inviscid_wing_lifts 
         conditions.aerodynamics.coefficients.lift.compressible_wings[wing.tag]     =  inviscid_wing_lifts 
@@ -635,7 +607,8 @@ def evaluate_surrogate(state,settings,vehicle):
 
  
 def evaluate_no_surrogate(state,settings,base_vehicle):
-    """Evaluates forces and moments directly using VLM.
+    """Evaluates forces and moments directly using VLM. Control points sharing the same control surface deflections
+    are solved together, so that each deflected panelization is built and solved once.
     
     Assumptions:
         The following stability derivatives are multiplied by correction 
@@ -683,97 +656,117 @@ def evaluate_no_surrogate(state,settings,base_vehicle):
             if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Flap: 
                 settings.flap_flag     = True    
     
-    for i in range(len(Mach)): 
-        for wing in vehicle.wings: 
-            for control_surface in wing.control_surfaces:  
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Aileron:  
-                    if trim ==  True:
-                        control_surface.deflection = conditions.control_surfaces.aileron.deflection[i,0]
-                    else: 
-                        conditions.control_surfaces.aileron.deflection[i, 0] = control_surface.deflection
-                        
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Elevator:    
-                    if trim ==  True: 
-                        control_surface.deflection = conditions.control_surfaces.elevator.deflection[i,0]
-                    else:   
-                        conditions.control_surfaces.elevator.deflection[i, 0] = control_surface.deflection
-                        
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Rudder:    
-                    if trim ==  True: 
-                        control_surface.deflection = conditions.control_surfaces.rudder.deflection[i,0]
-                    else:   
-                        conditions.control_surfaces.rudder.deflection[i, 0] = control_surface.deflection
-                                            
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Slat:  
-                    conditions.control_surfaces.slat.deflection[i, 0] = control_surface.deflection
+    # assign the deflections of every control point and collect the ones set by the trim
+    n_points    = len(Mach)
+    deflections = [np.zeros(n_points)]
+    for wing in vehicle.wings: 
+        for control_surface in wing.control_surfaces:  
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Aileron:  
+                if trim ==  True:
+                    deflections.append(conditions.control_surfaces.aileron.deflection[:,0])
+                else: 
+                    conditions.control_surfaces.aileron.deflection[:, 0] = control_surface.deflection
                     
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Flap:   
-                    conditions.control_surfaces.flap.deflection[i, 0] = control_surface.deflection
-        
-        VLM_results = VLM(conditions,settings,vehicle)
-        Clift = VLM_results.CLift
-        Cdrag = VLM_results.CDrag_induced
-        CX    = VLM_results.CX
-        CY    = VLM_results.CY
-        CZ    = VLM_results.CZ
-        CL    = VLM_results.CL
-        CM    = VLM_results.CM
-        CN    = VLM_results.CN
-        S_ref = VLM_results.S_ref
-        b_ref = VLM_results.b_ref
-        c_ref = VLM_results.c_ref
-        X_ref = VLM_results.X_ref
-        Y_ref = VLM_results.Y_ref
-        Z_ref = VLM_results.Z_ref
-        
-        # Dimensionalize the lift and drag for each wing  
-        conditions.aerodynamics.coefficients.lift.induced.inviscid_wings  = VLM_results.CLift_wings
-        conditions.aerodynamics.coefficients.lift.compressible_wings      = VLM_results.CLift_wings        
-        conditions.aerodynamics.coefficients.drag.induced.inviscid_wings  = VLM_results.CDrag_induced_wings
-        conditions.aerodynamics.coefficients.lift.induced.spanwise        = VLM_results.sectional_CLift
-        conditions.aerodynamics.coefficients.drag.induced.spanwise        = VLM_results.sectional_CDrag_induced
-        conditions.aerodynamics.coefficients.surface_pressure             = VLM_results.CP
-        conditions.aerodynamics.coefficients.lift.total                   = Clift
-        conditions.aerodynamics.coefficients.drag.induced.inviscid        = Cdrag
-        conditions.aerodynamics.angles.induced                            = VLM_results.alpha_induced 
-        conditions.aerodynamics.chord_sections                            = VLM_results.chord_sections    
-        conditions.aerodynamics.spanwise_stations                         = VLM_results.spanwise_stations  
-        
-        for wing in  vehicle.wings: 
-            RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_wing(state,settings,wing)
-        for fuslage in vehicle.fuselages: 
-            RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_fuselage(state,settings,fuslage)
-        for boom in vehicle.booms: 
-            RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_fuselage(state,settings,boom)  
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_nacelle(state,settings,vehicle)
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_pylon(state,settings,vehicle) 
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_total(state,settings,vehicle)
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.induced_drag(state,settings,vehicle) 
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.cooling_drag(state,settings,vehicle)     
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.compressibility_drag(state,settings,vehicle)
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.miscellaneous_drag(state,settings,vehicle) 
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.spoiler_drag(state,settings,vehicle)
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.total_drag(state,settings,vehicle)  
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Elevator:    
+                if trim ==  True: 
+                    deflections.append(conditions.control_surfaces.elevator.deflection[:,0])
+                else:   
+                    conditions.control_surfaces.elevator.deflection[:, 0] = control_surface.deflection
+                    
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Rudder:    
+                if trim ==  True: 
+                    deflections.append(conditions.control_surfaces.rudder.deflection[:,0])
+                else:   
+                    conditions.control_surfaces.rudder.deflection[:, 0] = control_surface.deflection
+                                        
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Slat:  
+                conditions.control_surfaces.slat.deflection[:, 0] = control_surface.deflection
+                
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Flap:   
+                conditions.control_surfaces.flap.deflection[:, 0] = control_surface.deflection
+
+    # group the control points sharing a deflection state, each deflected panelization is then built and solved once
+    _, group = np.unique(np.array(deflections).T, axis=0, return_inverse=True)
+    group    = np.reshape(group,-1)
     
-        T_wind2inertial = conditions.frames.wind.transform_to_inertial 
-        Cdrag_visc      = state.conditions.aerodynamics.coefficients.drag.total
-        CX_visc         = orientation_product(T_wind2inertial,Cdrag_visc)[:,0][:,None]   
-      
-        no_beta   = np.all(conditions.aerodynamics.angles.beta == 0)
-        no_ail    = np.all(conditions.control_surfaces.aileron.deflection == 0) 
-        no_rud    = np.all(conditions.control_surfaces.rudder.deflection == 0) 
-        no_bank   = np.all(conditions.aerodynamics.angles.phi == 0)  
+    VLM_results = Data()
+    for g in range(np.max(group) + 1):
+        rows = np.where(group == g)[0]
+        set_control_surface_deflections(vehicle,conditions,rows[0],trim)
+        if settings.propeller_wake_model:
+            # the rotor wakes are stored for all control points, so the group is solved at every control point
+            group_results = VLM(conditions,settings,vehicle)
+            scatter_VLM_results(VLM_results,group_results,rows,n_points,group_rows=rows)
+        else:
+            group_results = VLM(slice_VLM_conditions(conditions,rows),settings,vehicle)
+            scatter_VLM_results(VLM_results,group_results,rows,n_points)
         
-        if no_beta and no_ail and no_rud and no_bank:
-            CY = CY * 0
-        conditions.static_stability.coefficients.lift[i, 0]  = Clift[i, 0]
-        conditions.static_stability.coefficients.drag[i, 0]  = Cdrag_visc[i, 0] 
-        conditions.static_stability.coefficients.X[i, 0]     = CX[i, 0]
-        conditions.static_stability.coefficients.Y[i, 0]     = CY[i, 0]
-        conditions.static_stability.coefficients.Z[i, 0]     = CZ[i, 0]
-        conditions.static_stability.coefficients.L[i, 0]     = CL[i, 0]
-        conditions.static_stability.coefficients.M[i, 0]     = CM[i, 0] 
-        conditions.static_stability.coefficients.N[i, 0]     = CN[i, 0]     
+    # the stability derivatives are computed with the deflections of the last control point
+    set_control_surface_deflections(vehicle,conditions,n_points - 1,trim)
+    
+    Clift = VLM_results.CLift
+    Cdrag = VLM_results.CDrag_induced
+    CX    = VLM_results.CX
+    CY    = VLM_results.CY
+    CZ    = VLM_results.CZ
+    CL    = VLM_results.CL
+    CM    = VLM_results.CM
+    CN    = VLM_results.CN
+    S_ref = VLM_results.S_ref
+    b_ref = VLM_results.b_ref
+    c_ref = VLM_results.c_ref
+    X_ref = VLM_results.X_ref
+    Y_ref = VLM_results.Y_ref
+    Z_ref = VLM_results.Z_ref
+    
+    # Dimensionalize the lift and drag for each wing  
+    conditions.aerodynamics.coefficients.lift.induced.inviscid_wings  = VLM_results.CLift_wings
+    conditions.aerodynamics.coefficients.lift.compressible_wings      = VLM_results.CLift_wings        
+    conditions.aerodynamics.coefficients.drag.induced.inviscid_wings  = VLM_results.CDrag_induced_wings
+    conditions.aerodynamics.coefficients.lift.induced.spanwise        = VLM_results.sectional_CLift
+    conditions.aerodynamics.coefficients.drag.induced.spanwise        = VLM_results.sectional_CDrag_induced
+    conditions.aerodynamics.coefficients.surface_pressure             = VLM_results.CP
+    conditions.aerodynamics.coefficients.lift.total                   = Clift
+    conditions.aerodynamics.coefficients.drag.induced.inviscid        = Cdrag
+    conditions.aerodynamics.angles.induced                            = VLM_results.alpha_induced 
+    conditions.aerodynamics.chord_sections                            = VLM_results.chord_sections    
+    conditions.aerodynamics.spanwise_stations                         = VLM_results.spanwise_stations  
+    
+    for wing in  vehicle.wings: 
+        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_wing(state,settings,wing)
+    for fuslage in vehicle.fuselages: 
+        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_fuselage(state,settings,fuslage)
+    for boom in vehicle.booms: 
+        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_fuselage(state,settings,boom)  
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_nacelle(state,settings,vehicle)
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_pylon(state,settings,vehicle) 
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_total(state,settings,vehicle)
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.induced_drag(state,settings,vehicle) 
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.cooling_drag(state,settings,vehicle)     
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.compressibility_drag(state,settings,vehicle)
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.miscellaneous_drag(state,settings,vehicle) 
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.spoiler_drag(state,settings,vehicle)
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.total_drag(state,settings,vehicle)  
+
+    T_wind2inertial = conditions.frames.wind.transform_to_inertial 
+    Cdrag_visc      = state.conditions.aerodynamics.coefficients.drag.total
+    CX_visc         = orientation_product(T_wind2inertial,Cdrag_visc)[:,0][:,None]   
+  
+    no_beta   = np.all(conditions.aerodynamics.angles.beta == 0)
+    no_ail    = np.all(conditions.control_surfaces.aileron.deflection == 0) 
+    no_rud    = np.all(conditions.control_surfaces.rudder.deflection == 0) 
+    no_bank   = np.all(conditions.aerodynamics.angles.phi == 0)  
+    
+    if no_beta and no_ail and no_rud and no_bank:
+        CY = CY * 0
+    conditions.static_stability.coefficients.lift[:, 0]  = Clift[:, 0]
+    conditions.static_stability.coefficients.drag[:, 0]  = Cdrag_visc[:, 0] 
+    conditions.static_stability.coefficients.X[:, 0]     = CX[:, 0]
+    conditions.static_stability.coefficients.Y[:, 0]     = CY[:, 0]
+    conditions.static_stability.coefficients.Z[:, 0]     = CZ[:, 0]
+    conditions.static_stability.coefficients.L[:, 0]     = CL[:, 0]
+    conditions.static_stability.coefficients.M[:, 0]     = CM[:, 0] 
+    conditions.static_stability.coefficients.N[:, 0]     = CN[:, 0]     
 
     # --------------------------------------------------------------------------------------------      
     # Unpack Pertubations 
@@ -1434,96 +1427,200 @@ def evaluate_no_surrogate(state,settings,base_vehicle):
 
     return
 
-def compute_stability_derivative(sub_sur,trans_sur,sup_sur,h_sub,h_sup,Mach):
-    if trans_sur ==  None and  sup_sur == None:
-        derivative = h_sub(Mach)*sub_sur(Mach) 
-        return derivative
+def set_control_surface_deflections(vehicle,conditions,i,trim):
+    """Sets the aileron, elevator and rudder deflections of the vehicle to the ones of a control point when the
+    aircraft is trimmed.
+    
+    Assumptions:
+        None
         
-    derivative = h_sub(Mach)*sub_sur(Mach) +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_sur(Mach)  + h_sup(Mach)*sup_sur(Mach) 
-    return derivative
+    Source:
+        None
 
-def compute_coefficients(sub_sur_Clift,sub_sur_Cdrag,sub_sur_CX,sub_sur_CY,sub_sur_CZ,sub_sur_CL,sub_sur_CM,sub_sur_CN,
-                         trans_sur_Clift,trans_sur_Cdrag,trans_sur_CX,trans_sur_CY,trans_sur_CZ,trans_sur_CL,trans_sur_CM,trans_sur_CN,
-                         sup_sur_Clift,sup_sur_Cdrag,sup_sur_CX,sup_sur_CY,sup_sur_CZ,sup_sur_CL,sup_sur_CM,sup_sur_CN,
-                         h_sub,h_sup,Mach, pts): 
-    
+    Args:
+        vehicle     : vehicle configuration       [unitless]
+        conditions  : flight conditions           [unitless]
+        i           : index of the control point  [unitless]
+        trim        : trim flag                   [boolean]
+        
+    Returns: 
+        None  
+    """
+    if trim !=  True:
+        return
+    for wing in vehicle.wings: 
+        for control_surface in wing.control_surfaces:  
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Aileron:  
+                control_surface.deflection = conditions.control_surfaces.aileron.deflection[i,0]
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Elevator:    
+                control_surface.deflection = conditions.control_surfaces.elevator.deflection[i,0]
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Rudder:    
+                control_surface.deflection = conditions.control_surfaces.rudder.deflection[i,0]
+    return
 
-     #  subsonic 
-    sub_Clift     = np.atleast_2d(sub_sur_Clift(pts)).T  
-    sub_Cdrag     = np.atleast_2d(sub_sur_Cdrag(pts)).T  
-    sub_CX        = np.atleast_2d(sub_sur_CX(pts)).T 
-    sub_CY        = np.atleast_2d(sub_sur_CY(pts)).T     
-    sub_CZ        = np.atleast_2d(sub_sur_CZ(pts)).T     
-    sub_CL        = np.atleast_2d(sub_sur_CL(pts)).T     
-    sub_CM        = np.atleast_2d(sub_sur_CM(pts)).T     
-    sub_CN        = np.atleast_2d(sub_sur_CN(pts)).T
+def slice_VLM_conditions(conditions,rows):
+    """Extracts the flight conditions read by VLM at a subset of control points.
     
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args:
+        conditions  : flight conditions            [unitless]
+        rows        : indices of the control points [unitless]
+        
+    Returns: 
+        sliced_conditions : flight conditions at the control points [unitless]
+    """
+    sliced_conditions = RCAIDE.Framework.Mission.Common.Results()
+    sliced_conditions.expand_rows(len(rows))
+    sliced_conditions.aerodynamics.angles.alpha       = conditions.aerodynamics.angles.alpha[rows]
+    sliced_conditions.aerodynamics.angles.beta        = conditions.aerodynamics.angles.beta[rows]
+    sliced_conditions.freestream.mach_number          = conditions.freestream.mach_number[rows]
+    sliced_conditions.freestream.velocity             = conditions.freestream.velocity[rows]
+    sliced_conditions.static_stability.pitch_rate     = conditions.static_stability.pitch_rate[rows]
+    sliced_conditions.static_stability.roll_rate      = conditions.static_stability.roll_rate[rows]
+    sliced_conditions.static_stability.yaw_rate       = conditions.static_stability.yaw_rate[rows]
+    return sliced_conditions
+
+def scatter_VLM_results(results,group_results,rows,n_points,group_rows=slice(None)):
+    """Places the VLM results of a group of control points in the results of all control points. Values that do not
+    depend on the control point, such as the reference quantities, are taken from the group.
     
-    if trans_sur_Clift ==  None and  sup_sur_Clift == None:
+    Assumptions:
+        All deflected panelizations have the same number of panels and strips
+        
+    Source:
+        None
+
+    Args:
+        results        : VLM results of all control points, filled in place  [unitless]
+        group_results  : VLM results of the group                            [unitless]
+        rows           : indices of the control points of the group          [unitless]
+        n_points       : number of control points                            [unitless]
+        group_rows     : rows of the group results to use, all by default    [unitless]
+        
+    Returns: 
+        None  
+    """
+    for key, value in group_results.items():
+        if key in ['CLift_wings','CDrag_induced_wings']:
+            if key not in results:
+                results[key] = Data()
+            for tag, wing_value in value.items():
+                if tag not in results[key]:
+                    results[key][tag] = np.zeros((n_points,) + np.shape(wing_value)[1:])
+                results[key][tag][rows] = wing_value[group_rows]
+        elif key in ['CLift','CDrag_induced','CX','CY','CZ','CL','CM','CN','sectional_CLift','sectional_CDrag_induced','CP','alpha_induced']:
+            if key not in results:
+                results[key] = np.zeros((n_points,) + np.shape(value)[1:],dtype=value.dtype)
+            results[key][rows] = value[group_rows]
+        else:
+            results[key] = value
+    return
+
+def evaluate_fused_surrogate(fused,Mach,perturbations):
+    """Interpolates every stacked table of a Mach regime, see build_fused_surrogate. The Mach cell and weights are
+    found once and shared by all tables, and the cell of each perturbation once for all coefficients of its table.
     
-        results       = Data() 
-        results.Clift = h_sub(Mach) 
-        results.Cdrag = h_sub(Mach) 
-        results.CX    = h_sub(Mach) 
-        results.CY    = h_sub(Mach) 
-        results.CZ    = h_sub(Mach) 
-        results.CL    = h_sub(Mach) 
-        results.CM    = h_sub(Mach) 
-        results.CN    = h_sub(Mach) 
+    Assumptions:
+        Linear interpolation, extrapolated outside of the grids like the RegularGridInterpolator and interp1d
+        surrogates they replace
         
-        return results
-   
+    Source:
+        None
+
+    Args:
+        fused          : stacked surrogate tables, None if the regime has no surrogates  [unitless]
+        Mach           : Mach number, shape (n,1)                                         [unitless]
+        perturbations  : perturbation of each table, shape (n,1)                          [unitless]
+        
+    Returns: 
+        values         : every coefficient and derivative, shape (n,1), None if fused is None  [unitless]
+    """
+    if fused is None:
+        return None
+    
+    values        = Data()
+    i_Mach, t_Mach = grid_weights(fused.Mach,Mach[:,0])
+    
+    derivatives   = fused.derivatives.values[i_Mach]*(1 - t_Mach) + fused.derivatives.values[i_Mach + 1]*t_Mach
+    for j, name in enumerate(fused.derivatives.names):
+        values[name] = derivatives[:,j,None]
+    
+    for perturbation, table in fused.tables.items():
+        if perturbation not in perturbations:
+            continue
+        i, t   = grid_weights(table.grid,perturbations[perturbation][:,0])
+        V      = table.values
+        lower  = V[i,i_Mach]*(1 - t_Mach)     + V[i,i_Mach + 1]*t_Mach
+        upper  = V[i + 1,i_Mach]*(1 - t_Mach) + V[i + 1,i_Mach + 1]*t_Mach
+        coefs  = lower*(1 - t) + upper*t
+        for j, (name, tag) in enumerate(table.names):
+            if tag is None:
+                values[name] = coefs[:,j,None]
+            else:
+                if name not in values:
+                    values[name] = Data()
+                values[name][tag] = coefs[:,j,None]
     
-    # transonic   
-    trans_Clift   = np.atleast_2d(trans_sur_Clift(pts)).T  
-    trans_Cdrag   = np.atleast_2d(trans_sur_Cdrag(pts)).T  
-    trans_CX      = np.atleast_2d(trans_sur_CX(pts)).T 
-    trans_CY      = np.atleast_2d(trans_sur_CY(pts)).T     
-    trans_CZ      = np.atleast_2d(trans_sur_CZ(pts)).T     
-    trans_CL      = np.atleast_2d(trans_sur_CL(pts)).T     
-    trans_CM      = np.atleast_2d(trans_sur_CM(pts)).T     
-    trans_CN      = np.atleast_2d(trans_sur_CN(pts)).T
-
-    # supersonic 
-    sup_Clift     = np.atleast_2d(sup_sur_Clift(pts)).T  
-    sup_Cdrag     = np.atleast_2d(sup_sur_Cdrag(pts)).T  
-    sup_CX        = np.atleast_2d(sup_sur_CX(pts)).T 
-    sup_CY        = np.atleast_2d(sup_sur_CY(pts)).T     
-    sup_CZ        = np.atleast_2d(sup_sur_CZ(pts)).T     
-    sup_CL        = np.atleast_2d(sup_sur_CL(pts)).T     
-    sup_CM        = np.atleast_2d(sup_sur_CM(pts)).T     
-    sup_CN        = np.atleast_2d(sup_sur_CN(pts)).T            
+    return values
 
+def grid_weights(grid,x):
+    """Finds the cell of an ascending grid holding each point and the linear weight of its upper node.
+    Points outside the grid use the first or last cell. Returns the cell index and the weight, shape (n,1)."""
+    i = np.clip(np.searchsorted(grid,x) - 1,0,len(grid) - 2)
+    t = (x - grid[i])/(grid[i + 1] - grid[i])
+    return i, t[:,None]
+
+def compute_stability_derivative(sub_values,trans_values,sup_values,name,h_sub,h_sup):
+    sub_sur = sub_values[name]
+    if trans_values is None and sup_values is None:
+        derivative = h_sub*sub_sur
+        return derivative
+    
+    trans_sur  = trans_values[name]
+    sup_sur    = sup_values[name]
+    derivative = h_sub*sub_sur +   (1 - (h_sup + h_sub))*trans_sur  + h_sup*sup_sur
+    return derivative
+
+def compute_coefficients(sub_values,trans_values,sup_values,perturbation,h_sub,h_sup): 
+    
+    names = ['Clift','Cdrag','CX','CY','CZ','CL','CM','CN']
+    
+    if trans_values is None and sup_values is None: 
+        results = Data() 
+        for name in names:
+            results[name] = np.array(h_sub) 
+        return results
+    
     # apply 
-    results       = Data() 
-    results.Clift = h_sub(Mach)*sub_Clift + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_Clift  + h_sup(Mach)*sup_Clift
-    results.Cdrag = h_sub(Mach)*sub_Cdrag + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_Cdrag  + h_sup(Mach)*sup_Cdrag
-    results.CX    = h_sub(Mach)*sub_CX    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CX     + h_sup(Mach)*sup_CX   
-    results.CY    = h_sub(Mach)*sub_CY    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CY     + h_sup(Mach)*sup_CY   
-    results.CZ    = h_sub(Mach)*sub_CZ    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CZ     + h_sup(Mach)*sup_CZ   
-    results.CL    = h_sub(Mach)*sub_CL    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CL     + h_sup(Mach)*sup_CL   
-    results.CM    = h_sub(Mach)*sub_CM    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CM     + h_sup(Mach)*sup_CM   
-    results.CN    = h_sub(Mach)*sub_CN    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CN     + h_sup(Mach)*sup_CN
+    results = Data() 
+    for name in names:
+        key           = name + '_' + perturbation
+        results[name] = h_sub*sub_values[key] + (1 - (h_sup + h_sub))*trans_values[key]  + h_sup*sup_values[key]
 
     return results
 
 
-def compute_coefficient(sub_sur_coef,trans_sur_coef, sup_sur_coef, h_sub,h_sup,Mach, pts): 
+def compute_coefficient(sub_values,trans_values,sup_values,name,tag,h_sub,h_sup): 
 
-    #  subsonic 
-    sub_coef  = np.atleast_2d(sub_sur_coef(pts)).T     
-   
-    if trans_sur_coef == None and sup_sur_coef == None:
-        coef = h_sub(Mach) 
+    if trans_values is None and sup_values is None:
+        coef = np.array(h_sub) 
         return  coef
     
+    #  subsonic 
+    sub_coef   = sub_values[name][tag]
+    
     # transonic 
-    trans_coef  = np.atleast_2d(trans_sur_coef(pts)).T    
+    trans_coef = trans_values[name][tag]
 
-    # supersonic 
-    sup_coef  = np.atleast_2d(sub_sur_coef(pts)).T             
+    # supersonic, as previously evaluated from the subsonic table 
+    sup_coef   = sub_values[name][tag]
 
     # apply  
-    coef = h_sub(Mach)*sub_coef +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_coef  + h_sub(Mach)*sup_coef 
+    coef = h_sub*sub_coef +   (1 - (h_sup + h_sub))*trans_coef  + h_sub*sup_coef
 
-    return coef
\ No newline at end of file
+    return coef
@@ -12,6 +12,15 @@ from copy import deepcopy
 
 # package imports
 import numpy  as np
+import warnings
+from concurrent.futures         import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools                  import repeat
+from pickle                     import PicklingError
+
+# VLM outputs used by the surrogate training
+training_outputs = ['CLift','CDrag_induced','CX','CY','CZ','CL','CM','CN','S_ref','b_ref','c_ref','X_ref','Y_ref','Z_ref',
+                    'CLift_wings','CDrag_induced_wings']
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Vortex_Lattice
@@ -126,9 +135,11 @@ def train_model(aerodynamics, Mach):
     len_r          = len(yaw_rate) 
     
     # --------------------------------------------------------------------------------------------------------------
-    # Alpha
+    # Training sweeps, evaluated together so they can be run in parallel
     # --------------------------------------------------------------------------------------------------------------
+    sweeps = []
     
+    # angle of attack
     # Setup new array shapes for vectorization 
     # stakcing 9x9 matrices into one horizontal line(81)  
     AoAs       = np.atleast_2d(np.tile(AoA,len_Mach).T.flatten()).T 
@@ -138,8 +149,113 @@ def train_model(aerodynamics, Mach):
     conditions                                      = RCAIDE.Framework.Mission.Common.Results()
     conditions.freestream.mach_number               = Machs
     conditions.aerodynamics.angles.alpha            = np.ones_like(Machs)*AoAs 
+    sweeps.append(training_sweep('alpha',conditions))
+    
+    # sideslip
+    Betas         = np.atleast_2d(np.tile(Beta,len_Mach).T.flatten()).T 
+    Machs         = np.atleast_2d(np.repeat(Mach,len_Beta)).T        
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(rows= len(Machs))
+    conditions.freestream.mach_number               = Machs 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.ones_like(Machs)*Betas   
+    sweeps.append(training_sweep('beta',conditions))
+    
+    # velocity u
+    u_s     = np.atleast_2d(np.tile(u, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len_u)).T                   
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.freestream.mach_number               = Machs + Machs*u_s 
+    sweeps.append(training_sweep('u',conditions))
+    
+    # velocity v
+    v_s     = np.atleast_2d(np.tile(v, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len_v)).T    
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
+    conditions.freestream.mach_number               = Machs
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs)       
+    sweeps.append(training_sweep('v',conditions))
+    
+    # velocity w
+    w_s     = np.atleast_2d(np.tile(w, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len_w)).T
+     
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
+    conditions.freestream.mach_number               = Machs 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    sweeps.append(training_sweep('w',conditions))
+    
+    # pitch rate
+    q_s     = np.atleast_2d(np.tile(pitch_rate, len_Mach).T.flatten()).T 
+    Machs   = np.atleast_2d(np.repeat(Mach,len_q)).T
 
-    VLM_results = VLM(conditions,settings,vehicle)
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.freestream.mach_number               = Machs 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.static_stability.pitch_rate          = np.ones_like(Machs)*q_s     
+    conditions.freestream.velocity                  = Machs * 343 # speed of sound   
+    sweeps.append(training_sweep('pitch_rate',conditions))
+    
+    # roll rate
+    p_s     = np.atleast_2d(np.tile(roll_rate, len_Mach).T.flatten()).T 
+    Machs         = np.atleast_2d(np.repeat(Mach,len_p)).T
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.freestream.mach_number               = Machs  
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.static_stability.roll_rate           = np.ones_like(Machs)*p_s 
+    conditions.freestream.velocity                  = Machs * 343 # speed of sound           
+    sweeps.append(training_sweep('roll_rate',conditions))
+    
+    # yaw rate
+    r_s     = np.atleast_2d(np.tile(yaw_rate, len_Mach).T.flatten()).T 
+    Machs         = np.atleast_2d(np.repeat(Mach,len_r)).T
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs)*1E-2 
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+    conditions.freestream.mach_number               = Machs 
+    conditions.static_stability.yaw_rate            = np.ones_like(Machs)*r_s
+    conditions.freestream.velocity                  = Machs * 343
+    sweeps.append(training_sweep('yaw_rate',conditions))
+    
+    # control surfaces, one sweep per deflection
+    Machs  = np.atleast_2d(np.repeat(Mach,1)).T
+    for wing in vehicle.wings: 
+        for control_surface in wing.control_surfaces: 
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Aileron:
+                surface, deflections = 'aileron', delta_a
+            elif type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Elevator:
+                surface, deflections = 'elevator', delta_e
+            elif type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Rudder:
+                surface, deflections = 'rudder', delta_r
+            elif type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Flap:
+                surface, deflections = 'flap', delta_f
+            elif type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Slat:
+                surface, deflections = 'slat', delta_s
+            else:
+                continue
+            for d_i in range(len(deflections)):
+                conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+                conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+                conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+                conditions.freestream.mach_number               = Machs    
+                sweeps.append(training_sweep(wing.tag + '_' + surface + '_' + str(d_i),conditions,wing.tag,surface,deflections[d_i]))
+    
+    sweep_results = run_training_sweeps(sweeps,settings,vehicle)
+    
+    # --------------------------------------------------------------------------------------------------------------
+    # Alpha
+    # --------------------------------------------------------------------------------------------------------------
+    VLM_results = sweep_results.alpha
     Clift_res        = VLM_results.CLift
     Cdrag_res        = VLM_results.CDrag_induced
     CX_res           = VLM_results.CX
@@ -191,16 +307,7 @@ def train_model(aerodynamics, Mach):
     # --------------------------------------------------------------------------------------------------------------
     # Beta 
     # --------------------------------------------------------------------------------------------------------------
-    Betas         = np.atleast_2d(np.tile(Beta,len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_Beta)).T        
-
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-    conditions.expand_rows(rows= len(Machs))
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.ones_like(Machs)*Betas   
-    
-    VLM_results = VLM(conditions,settings,vehicle)
+    VLM_results = sweep_results.beta
     Clift_res = VLM_results.CLift
     Cdrag_res = VLM_results.CDrag_induced
     CX_res    = VLM_results.CX
@@ -222,15 +329,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------      
     # Velocity u 
     # -------------------------------------------------------
-    u_s     = np.atleast_2d(np.tile(u, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_u)).T                   
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.freestream.mach_number               = Machs + Machs*u_s 
-    
-
-    VLM_results = VLM(conditions,settings,vehicle)
+    VLM_results = sweep_results.u
     Clift_res = VLM_results.CLift
     Cdrag_res = VLM_results.CDrag_induced
     CX_res    = VLM_results.CX
@@ -252,15 +351,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Velocity v 
     # -------------------------------------------------------
-    v_s     = np.atleast_2d(np.tile(v, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_v)).T    
-
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
-    conditions.freestream.mach_number               = Machs
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs)       
-    
-    VLM_results = VLM(conditions,settings,vehicle)
+    VLM_results = sweep_results.v
     Clift_res = VLM_results.CLift
     Cdrag_res = VLM_results.CDrag_induced
     CX_res    = VLM_results.CX
@@ -282,15 +373,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Velocity w 
     # -------------------------------------------------------
-    w_s     = np.atleast_2d(np.tile(w, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_w)).T
-     
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    
-    VLM_results = VLM(conditions,settings,vehicle)
+    VLM_results = sweep_results.w
     Clift_res = VLM_results.CLift
     Cdrag_res = VLM_results.CDrag_induced
     CX_res    = VLM_results.CX
@@ -312,17 +395,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Pitch Rate 
     # -------------------------------------------------------
-    q_s     = np.atleast_2d(np.tile(pitch_rate, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_q)).T
-
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.static_stability.pitch_rate          = np.ones_like(Machs)*q_s     
-    conditions.freestream.velocity                  = Machs * 343 # speed of sound   
-    
-    VLM_results = VLM(conditions,settings,vehicle)
+    VLM_results = sweep_results.pitch_rate
     Clift_res = VLM_results.CLift
     Cdrag_res = VLM_results.CDrag_induced
     CX_res    = VLM_results.CX
@@ -344,16 +417,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Roll  Rate 
     # -------------------------------------------------------    
-    p_s     = np.atleast_2d(np.tile(roll_rate, len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_p)).T
-
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.freestream.mach_number               = Machs  
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.static_stability.roll_rate           = np.ones_like(Machs)*p_s 
-    conditions.freestream.velocity                  = Machs * 343 # speed of sound           
-    VLM_results = VLM(conditions,settings,vehicle)
+    VLM_results = sweep_results.roll_rate
     Clift_res = VLM_results.CLift
     Cdrag_res = VLM_results.CDrag_induced
     CX_res    = VLM_results.CX
@@ -375,17 +439,7 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Yaw Rate 
     # -------------------------------------------------------        
-    r_s     = np.atleast_2d(np.tile(yaw_rate, len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_r)).T
-
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs)*1E-2 
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.freestream.mach_number               = Machs 
-    conditions.static_stability.yaw_rate            = np.ones_like(Machs)*r_s
-    conditions.freestream.velocity                  = Machs * 343
-    
-    VLM_results = VLM(conditions,settings,vehicle)
+    VLM_results = sweep_results.yaw_rate
     Clift_res = VLM_results.CLift
     Cdrag_res = VLM_results.CDrag_induced
     CX_res    = VLM_results.CX
@@ -571,13 +625,7 @@ def train_model(aerodynamics, Mach):
                 CN_d_a         = np.zeros((len_d_a,len_Mach))
                 
                 for a_i in range(len_d_a):    
-                    Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                    conditions.freestream.mach_number               = Machs    
-                    vehicle.wings[wing.tag].control_surfaces.aileron.deflection =  delta_a[a_i]
-                    VLM_results = VLM(conditions,settings,vehicle)
+                    VLM_results = sweep_results[wing.tag + '_aileron_' + str(a_i)]
                     Clift_res = VLM_results.CLift
                     Cdrag_res = VLM_results.CDrag_induced
                     CX_res    = VLM_results.CX
@@ -586,7 +634,6 @@ def train_model(aerodynamics, Mach):
                     CL_res    = VLM_results.CL
                     CM_res    = VLM_results.CM
                     CN_res    = VLM_results.CN
-                    vehicle.wings[wing.tag].control_surfaces.aileron.deflection = 0
                     
                     Clift_d_a[a_i,:] =  -(Clift_res[:,0]  - Clift_alpha_0[0,:])
                     Cdrag_d_a[a_i,:] =  -(Cdrag_res[:,0]  - Cdrag_alpha_0[0,:])                              
@@ -630,14 +677,7 @@ def train_model(aerodynamics, Mach):
                 CN_d_e         = np.zeros((len_d_e,len_Mach))
  
                 for e_i in range(len_d_e): 
-                    Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                    conditions.freestream.mach_number               = Machs     
-                    vehicle.wings[wing.tag].control_surfaces.elevator.deflection =  delta_e[e_i]
-                
-                    VLM_results = VLM(conditions,settings,vehicle)
+                    VLM_results = sweep_results[wing.tag + '_elevator_' + str(e_i)]
                     Clift_res = VLM_results.CLift
                     Cdrag_res = VLM_results.CDrag_induced
                     CX_res    = VLM_results.CX
@@ -647,7 +687,6 @@ def train_model(aerodynamics, Mach):
                     CM_res    = VLM_results.CM
                     CN_res    = VLM_results.CN
                     
-                    vehicle.wings[wing.tag].control_surfaces.elevator.deflection = 0 
                     Clift_d_e[e_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
                     Cdrag_d_e[e_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
                     CX_d_e[e_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
@@ -689,13 +728,7 @@ def train_model(aerodynamics, Mach):
                 CN_d_r         = np.zeros((len_d_r,len_Mach))
               
                 for r_i in range(len_d_r): 
-                    Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                    conditions.freestream.mach_number               = Machs    
-                    vehicle.wings[wing.tag].control_surfaces.rudder.deflection =  delta_r[r_i]
-                    VLM_results = VLM(conditions,settings,vehicle)
+                    VLM_results = sweep_results[wing.tag + '_rudder_' + str(r_i)]
                     Clift_res = VLM_results.CLift
                     Cdrag_res = VLM_results.CDrag_induced
                     CX_res    = VLM_results.CX
@@ -704,7 +737,6 @@ def train_model(aerodynamics, Mach):
                     CL_res    = VLM_results.CL
                     CM_res    = VLM_results.CM
                     CN_res    = VLM_results.CN
-                    vehicle.wings[wing.tag].control_surfaces.rudder.deflection = 0 
                     Clift_d_r[r_i,:] =   -(Clift_res[:,0]  - Clift_alpha_0[0,:])
                     Cdrag_d_r[r_i,:] =   -(Cdrag_res[:,0]  - Cdrag_alpha_0[0,:])                            
                     CX_d_r[r_i,:]    =   -(CX_res[:,0]   - CX_alpha_0[0,:]   )
@@ -745,13 +777,7 @@ def train_model(aerodynamics, Mach):
                 CN_d_f         = np.zeros((len_d_f,len_Mach))
                 
                 for f_i in range(len_d_f): 
-                    Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                    conditions.freestream.mach_number               = Machs    
-                    vehicle.wings[wing.tag].control_surfaces.flap.deflection = delta_f[f_i]
-                    VLM_results = VLM(conditions,settings,vehicle)
+                    VLM_results = sweep_results[wing.tag + '_flap_' + str(f_i)]
                     Clift_res = VLM_results.CLift
                     Cdrag_res = VLM_results.CDrag_induced
                     CX_res    = VLM_results.CX
@@ -760,7 +786,6 @@ def train_model(aerodynamics, Mach):
                     CL_res    = VLM_results.CL
                     CM_res    = VLM_results.CM
                     CN_res    = VLM_results.CN
-                    vehicle.wings[wing.tag].control_surfaces.flap.deflection = 0   
                     Clift_d_f[f_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
                     Cdrag_d_f[f_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
                     CX_d_f[f_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
@@ -801,13 +826,7 @@ def train_model(aerodynamics, Mach):
                 CN_d_s         = np.zeros((len_d_s,len_Mach))
        
                 for s_i in range(len_d_s):
-                    Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                    conditions.freestream.mach_number               = Machs     
-                    vehicle.wings[wing.tag].control_surfaces.slat.deflection = delta_s[s_i]
-                    VLM_results = VLM(conditions,settings,vehicle)
+                    VLM_results = sweep_results[wing.tag + '_slat_' + str(s_i)]
                     Clift_res = VLM_results.CLift
                     Cdrag_res = VLM_results.CDrag_induced
                     CX_res    = VLM_results.CX
@@ -816,7 +835,6 @@ def train_model(aerodynamics, Mach):
                     CL_res    = VLM_results.CL
                     CM_res    = VLM_results.CM
                     CN_res    = VLM_results.CN
-                    vehicle.wings[wing.tag].control_surfaces.slat.deflection = 0 
                     Clift_d_s[s_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
                     Cdrag_d_s[s_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
                     CX_d_s[s_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
@@ -1249,4 +1267,99 @@ def train_trasonic_model(aerodynamics, training_subsonic,training_supersonic,sub
         training.dCN_ddelta_s    =  np.array([training_subsonic.dCN_ddelta_s[-1]    , training_subsonic.dCN_ddelta_s[0]   ])
     training.NP            = 0  
     
-    return training 
\ No newline at end of file
+    return training
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Training sweeps
+# ---------------------------------------------------------------------------------------------------------------------- 
+def training_sweep(tag, conditions, wing = None, control_surface = None, deflection = 0.):
+    """Defines one VLM evaluation of the surrogate training. 
+    
+    Assumptions:
+        The control surface is deflected only for this evaluation
+        
+    Source:
+        None
+
+    Args:
+        tag              : name of the sweep                         [unitless]
+        conditions       : flight conditions of the sweep            [unitless]
+        wing             : tag of the wing holding the control surface [unitless]
+        control_surface  : tag of the deflected control surface      [unitless]
+        deflection       : control surface deflection                [radians]
+        
+    Returns: 
+        sweep            : sweep definition                          [unitless]
+    """      
+    sweep                 = Data()
+    sweep.tag             = tag
+    sweep.conditions      = conditions
+    sweep.wing            = wing
+    sweep.control_surface = control_surface
+    sweep.deflection      = deflection
+    return sweep
+
+def run_training_sweeps(sweeps, settings, vehicle):
+    """Runs the VLM evaluations of the surrogate training, in a process pool if 
+    settings.number_of_training_workers is more than one. 
+    
+    Assumptions:
+        The sweeps are independent. If the process pool cannot be started the sweeps
+        are run serially. Both paths run the same evaluations and give identical results.
+        
+    Source:
+        None
+
+    Args:
+        sweeps           : list of sweep definitions                 [unitless]
+        settings         : VLM settings                              [unitless]
+        vehicle          : vehicle                                   [unitless]
+        
+    Returns: 
+        results          : VLM results of each sweep, by tag         [unitless]
+    """
+    workers = min(settings.number_of_training_workers,len(sweeps))
+    outputs = None
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outputs = list(executor.map(evaluate_training_sweep,sweeps,repeat(settings),repeat(vehicle)))
+        except (OSError,PicklingError,BrokenProcessPool) as error:
+            warnings.warn('VLM training sweeps run serially, the process pool failed: ' + str(error),RuntimeWarning)
+            outputs = None
+    if outputs is None:
+        outputs = [evaluate_training_sweep(sweep,settings,vehicle) for sweep in sweeps]
+    
+    results = Data()
+    for sweep,output in zip(sweeps,outputs):
+        results[sweep.tag] = output
+    return results
+
+def evaluate_training_sweep(sweep, settings, vehicle):
+    """Runs VLM for one sweep and keeps the outputs used by the surrogate training. 
+    
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args:
+        sweep            : sweep definition                          [unitless]
+        settings         : VLM settings                              [unitless]
+        vehicle          : vehicle                                   [unitless]
+        
+    Returns: 
+        results          : VLM results                               [unitless]
+    """
+    if sweep.control_surface is not None:
+        vehicle.wings[sweep.wing].control_surfaces[sweep.control_surface].deflection = sweep.deflection
+    VLM_results = VLM(sweep.conditions,settings,vehicle)
+    if sweep.control_surface is not None:
+        vehicle.wings[sweep.wing].control_surfaces[sweep.control_surface].deflection = 0
+        
+    results = Data()
+    for key in training_outputs:
+        results[key] = VLM_results[key]
+    return results
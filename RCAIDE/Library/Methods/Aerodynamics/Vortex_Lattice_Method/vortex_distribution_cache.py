@@ -0,0 +1,152 @@
+# RCAIDE/Library/Methods/Aerodynamics/Vortex_Lattice_Method/vortex_distribution_cache.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from RCAIDE.Framework.Core                                                              import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.generate_vortex_distribution import generate_vortex_distribution
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM_surrogate_cache      import update_hash
+
+# package imports
+import hashlib
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Cache state
+# ----------------------------------------------------------------------------------------------------------------------
+# postprocessed vortex distributions of the current process, least recently used first
+vortex_distribution_cache                 = Data()
+vortex_distribution_cache.entries         = Data()
+vortex_distribution_cache.maximum_entries = 16
+vortex_distribution_cache.hits            = 0
+vortex_distribution_cache.misses          = 0
+
+# settings that do not change the panelization
+ignored_settings = ['surrogate_cache','vortex_distribution','number_of_training_workers','influence_matrix_memory_budget','cache_vortex_distribution','share_surrogates']
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  get_vortex_distribution
+# ----------------------------------------------------------------------------------------------------------------------
+def get_vortex_distribution(geometry, settings):
+    """Returns the vortex distribution of a vehicle, reusing the one generated by an earlier call with the same
+    wings, control surface deflections, fuselages and settings.
+
+    Assumptions:
+        The panelization only depends on the wings, including their control surfaces, the fuselages and the settings.
+        A cached vortex distribution is shared between calls and should not be modified.
+
+    Source:
+        None
+
+    Args:
+        geometry                            : vehicle                                      [unitless]
+        settings.cache_vortex_distribution  : reuse vortex distributions between calls     [boolean]
+
+    Returns:
+        VD                                  : vehicle vortex distribution                  [unitless]
+    """
+    if not settings.cache_vortex_distribution:
+        return generate_vortex_distribution(geometry,settings)
+
+    key     = compute_vortex_distribution_hash(geometry,settings)
+    entries = vortex_distribution_cache.entries
+    if key in entries:
+        # move the entry to the end to mark it as most recently used
+        VD = entries.pop(key)
+        entries[key] = VD
+        vortex_distribution_cache.hits += 1
+    else:
+        VD = generate_vortex_distribution(geometry,settings)
+        entries[key] = VD
+        vortex_distribution_cache.misses += 1
+        while len(entries) > vortex_distribution_cache.maximum_entries:
+            del entries[next(iter(entries.keys()))]
+
+    # pack VD into geometry, as generate_vortex_distribution does
+    geometry.vortex_distribution = VD
+
+    return VD
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  clear_vortex_distribution_cache
+# ----------------------------------------------------------------------------------------------------------------------
+def clear_vortex_distribution_cache():
+    """Removes every cached vortex distribution. Modified wings or control surfaces are detected by
+    get_vortex_distribution, this frees the memory held by the cache.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    vortex_distribution_cache.entries = Data()
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  vortex_distribution_cache_statistics
+# ----------------------------------------------------------------------------------------------------------------------
+def vortex_distribution_cache_statistics():
+    """Reports the content and activity of the vortex distribution cache of the current process.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        None
+
+    Returns:
+        statistics.
+          entries          : number of cached vortex distributions   [unitless]
+          maximum_entries  : number of vortex distributions kept     [unitless]
+          hits             : calls served from the cache             [unitless]
+          misses           : calls that generated a distribution     [unitless]
+    """
+    statistics                 = Data()
+    statistics.entries         = len(vortex_distribution_cache.entries)
+    statistics.maximum_entries = vortex_distribution_cache.maximum_entries
+    statistics.hits            = vortex_distribution_cache.hits
+    statistics.misses          = vortex_distribution_cache.misses
+    return statistics
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_vortex_distribution_hash
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_vortex_distribution_hash(geometry, settings):
+    """Computes a content hash of everything generate_vortex_distribution depends on.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        geometry           : vehicle               [unitless]
+        settings           : VLM settings          [unitless]
+
+    Returns:
+        key                : hexadecimal sha256 digest                [unitless]
+    """
+    relevant_settings = Data()
+    for key,value in settings.items():
+        if key not in ignored_settings:
+            relevant_settings[key] = value
+
+    h = hashlib.sha256()
+    update_hash(h,geometry.wings,set())
+    update_hash(h,geometry.fuselages,set())
+    update_hash(h,relevant_settings,set())
+    return h.hexdigest()
@@ -13,4 +13,5 @@ from .Geodesics import Geodesic
 from .Geodesics import Distance
 from .Geodesics import Math
 from .Geodesics import Geodesic_Calculate
+from .compute_geodesics import compute_geodesic_inverse, compute_geodesic_direct
 from .compute_point_to_point_geospacial_data import compute_point_to_point_geospacial_data
\ No newline at end of file
@@ -0,0 +1,671 @@
+# RCAIDE/Library/Methods/Geodesics/compute_geodesics.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core                       import Data
+from RCAIDE.Library.Methods.Geodesics.Geodesics  import Geodesic, Constants
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_geodesic_inverse
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_geodesic_inverse(lat1, lon1, lat2, lon2, a = Constants.WGS84_a, f = Constants.WGS84_f):
+    """Computes the shortest geodesics between arrays of points on an ellipsoid. This is an array version of
+    Geodesic.Inverse, every pair of points is solved together and the Newton iterations of the pairs that have
+    converged are masked out. The inputs are broadcast against each other, so that distance matrices are
+    computed from columns and rows of coordinates.
+
+    Assumptions:
+        WGS-84 ellipsoid unless a and f are given
+
+    Source:
+        Karney, C. F., Algorithms for geodesics, J. Geodesy 87, 43-55 (2013), https://doi.org/10.1007/s00190-012-0578-z
+        Karney, C. F., (2022) GeographicLib Python Code [source code]. https://geographiclib.sourceforge.io/
+
+    Args:
+        lat1, lon1   : latitude and longitude of the first points        [degrees]
+        lat2, lon2   : latitude and longitude of the second points       [degrees]
+        a            : equatorial radius of the ellipsoid                [meters]
+        f            : flattening of the ellipsoid                       [unitless]
+
+    Returns:
+        geodesic.
+          distance   : length of the geodesics                           [meters]
+          azimuth_1  : azimuth of the geodesics at the first points      [degrees]
+          azimuth_2  : azimuth of the geodesics at the second points     [degrees]
+          arc_length : arc length on the auxiliary sphere                [degrees]
+    """
+    geod                   = geodesic_constants(a, f)
+    lat1,lon1,lat2,lon2    = np.broadcast_arrays(*[np.asarray(x,dtype=float) for x in (lat1,lon1,lat2,lon2)])
+    shape                  = lat1.shape
+    lat1,lon1,lat2,lon2    = [x.flatten() for x in (lat1,lon1,lat2,lon2)]
+    N                      = lat1.size
+    f1, ep2, n, b          = geod._f1, geod._ep2, geod._n, geod._b
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # longitude difference, positive
+        lon12, lon12s = ang_diff(lon1, lon2)
+        lonsign       = np.where(np.signbit(lon12), -1., 1.)
+        lon12         = lonsign * lon12
+        lon12s        = lonsign * lon12s
+        lam12         = np.radians(lon12)
+        slam12,clam12 = sincosde(lon12, lon12s)
+        lon12s        = (180 - lon12) - lon12s
+
+        # point with the larger absolute latitude first, with a negative latitude
+        lat1  = ang_round(lat_fix(lat1))
+        lat2  = ang_round(lat_fix(lat2))
+        swapp = np.where((np.abs(lat1) < np.abs(lat2)) | np.isnan(lat2), -1., 1.)
+        lonsign             = np.where(swapp < 0, -lonsign, lonsign)
+        lat1, lat2          = np.where(swapp < 0, lat2, lat1), np.where(swapp < 0, lat1, lat2)
+        latsign             = np.where(np.signbit(-lat1), -1., 1.)
+        lat1                = lat1 * latsign
+        lat2                = lat2 * latsign
+
+        sbet1,cbet1 = sincosd(lat1)
+        sbet1,cbet1 = norm(sbet1 * f1, cbet1)
+        cbet1       = np.maximum(Geodesic.tiny_, cbet1)
+        sbet2,cbet2 = sincosd(lat2)
+        sbet2,cbet2 = norm(sbet2 * f1, cbet2)
+        cbet2       = np.maximum(Geodesic.tiny_, cbet2)
+
+        # force bet2 = +/- bet1 when they only differ by roundoff
+        polar       = cbet1 < -sbet1
+        sbet2       = np.where(polar & (cbet2 == cbet1), np.copysign(sbet1, sbet2), sbet2)
+        cbet2       = np.where(~polar & (np.abs(sbet2) == -sbet1), cbet1, cbet2)
+
+        dn1 = np.sqrt(1 + ep2 * sbet1**2)
+        dn2 = np.sqrt(1 + ep2 * sbet2**2)
+
+        sig12 = np.full(N, np.nan)
+        s12x  = np.full(N, np.nan)
+        salp1 = np.full(N, np.nan)
+        calp1 = np.full(N, np.nan)
+        salp2 = np.full(N, np.nan)
+        calp2 = np.full(N, np.nan)
+
+        # ------------------------------------------------------------------------------------------------------------
+        # geodesics along a meridian
+        # ------------------------------------------------------------------------------------------------------------
+        meridian = (lat1 == -90) | (slam12 == 0)
+        if np.any(meridian):
+            i            = np.where(meridian)[0]
+            m_calp1      = clam12[i]
+            m_salp1      = slam12[i]
+            ssig1, csig1 = sbet1[i], m_calp1 * cbet1[i]
+            ssig2, csig2 = sbet2[i], cbet2[i]
+            m_sig12      = np.arctan2(np.maximum(0.0, csig1 * ssig2 - ssig1 * csig2) + 0.0, csig1 * csig2 + ssig1 * ssig2)
+            m_s12x, m12x = lengths(geod, np.full(len(i), n), m_sig12, ssig1, csig1, dn1[i], ssig2, csig2, dn2[i], True)
+
+            # meridional geodesics longer than half a meridian are not the shortest on prolate ellipsoids
+            shortest      = (m_sig12 < 1) | (m12x >= 0)
+            zero          = shortest & ((m_sig12 < 3 * Geodesic.tiny_) | ((m_sig12 < Geodesic.tol0_) & ((m_s12x < 0) | (m12x < 0))))
+            m_sig12       = np.where(zero, 0.0, m_sig12)
+            m_s12x        = np.where(zero, 0.0, m_s12x)
+            i             = i[shortest]
+            sig12[i]      = m_sig12[shortest]
+            s12x[i]       = m_s12x[shortest] * b
+            salp1[i]      = m_salp1[shortest]
+            calp1[i]      = m_calp1[shortest]
+            salp2[i]      = 0.0
+            calp2[i]      = 1.0
+            meridian[:]   = False
+            meridian[i]   = True
+
+        # ------------------------------------------------------------------------------------------------------------
+        # geodesics along the equator
+        # ------------------------------------------------------------------------------------------------------------
+        equator = ~meridian & (sbet1 == 0) & ((geod.f <= 0) | (lon12s >= geod.f * 180))
+        if np.any(equator):
+            i        = np.where(equator)[0]
+            calp1[i] = calp2[i] = 0.0
+            salp1[i] = salp2[i] = 1.0
+            s12x[i]  = geod.a * lam12[i]
+            sig12[i] = lam12[i] / f1
+
+        # ------------------------------------------------------------------------------------------------------------
+        # general geodesics, starting guess then Newton's method
+        # ------------------------------------------------------------------------------------------------------------
+        general = ~meridian & ~equator
+        if np.any(general):
+            i   = np.where(general)[0]
+            g_sig12, g_salp1, g_calp1, g_salp2, g_calp2, dnm = inverse_start(geod, sbet1[i], cbet1[i], dn1[i], sbet2[i], cbet2[i], dn2[i],
+                                                                             lam12[i], slam12[i], clam12[i])
+
+            # short lines are solved by the starting guess
+            short         = g_sig12 >= 0
+            j             = i[short]
+            sig12[j]      = g_sig12[short]
+            s12x[j]       = g_sig12[short] * b * dnm[short]
+            salp1[j]      = g_salp1[short]
+            calp1[j]      = g_calp1[short]
+            salp2[j]      = g_salp2[short]
+            calp2[j]      = g_calp2[short]
+
+            i             = i[~short]
+            if len(i) > 0:
+                newton_salp1 = g_salp1[~short]
+                newton_calp1 = g_calp1[~short]
+                sig12[i], s12x[i], salp1[i], calp1[i], salp2[i], calp2[i] = solve_hybrid(geod, sbet1[i], cbet1[i], dn1[i], sbet2[i], cbet2[i], dn2[i],
+                                                                                         newton_salp1, newton_calp1, slam12[i], clam12[i])
+
+        s12 = 0.0 + s12x
+        a12 = np.degrees(sig12)
+
+        # undo the transformation to the canonical configuration
+        salp1, salp2 = np.where(swapp < 0, salp2, salp1), np.where(swapp < 0, salp1, salp2)
+        calp1, calp2 = np.where(swapp < 0, calp2, calp1), np.where(swapp < 0, calp1, calp2)
+        salp1 = salp1 * swapp * lonsign; calp1 = calp1 * swapp * latsign
+        salp2 = salp2 * swapp * lonsign; calp2 = calp2 * swapp * latsign
+
+    geodesic            = Data()
+    geodesic.distance   = s12.reshape(shape)
+    geodesic.azimuth_1  = atan2d(salp1, calp1).reshape(shape)
+    geodesic.azimuth_2  = atan2d(salp2, calp2).reshape(shape)
+    geodesic.arc_length = a12.reshape(shape)
+    return geodesic
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_geodesic_direct
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_geodesic_direct(lat1, lon1, azi1, s12, a = Constants.WGS84_a, f = Constants.WGS84_f):
+    """Computes the end points of arrays of geodesics given their starting point, azimuth and length on an
+    ellipsoid. The inputs are broadcast against each other.
+
+    Assumptions:
+        WGS-84 ellipsoid unless a and f are given
+
+    Source:
+        Karney, C. F., Algorithms for geodesics, J. Geodesy 87, 43-55 (2013), https://doi.org/10.1007/s00190-012-0578-z
+        Karney, C. F., (2022) GeographicLib Python Code [source code]. https://geographiclib.sourceforge.io/
+
+    Args:
+        lat1, lon1   : latitude and longitude of the first points        [degrees]
+        azi1         : azimuth of the geodesics at the first points      [degrees]
+        s12          : length of the geodesics                           [meters]
+        a            : equatorial radius of the ellipsoid                [meters]
+        f            : flattening of the ellipsoid                       [unitless]
+
+    Returns:
+        geodesic.
+          latitude   : latitude of the second points                     [degrees]
+          longitude  : longitude of the second points                    [degrees]
+          azimuth_2  : azimuth of the geodesics at the second points     [degrees]
+          arc_length : arc length on the auxiliary sphere                [degrees]
+    """
+    geod                = geodesic_constants(a, f)
+    lat1,lon1,azi1,s12  = np.broadcast_arrays(*[np.asarray(x,dtype=float) for x in (lat1,lon1,azi1,s12)])
+    shape               = lat1.shape
+    lat1,lon1,azi1,s12  = [x.flatten() for x in (lat1,lon1,azi1,s12)]
+    f1, ep2, b          = geod._f1, geod._ep2, geod._b
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        salp1,calp1 = sincosd(ang_round(azi1))
+        sbet1,cbet1 = sincosd(ang_round(lat_fix(lat1)))
+        sbet1,cbet1 = norm(sbet1 * f1, cbet1)
+        cbet1       = np.maximum(Geodesic.tiny_, cbet1)
+
+        # the geodesic through the first point
+        salp0 = salp1 * cbet1
+        calp0 = np.hypot(calp1, salp1 * sbet1)
+        ssig1 = sbet1
+        somg1 = salp0 * sbet1
+        csig1 = comg1 = np.where((sbet1 != 0) | (calp1 != 0), cbet1 * calp1, 1.)
+        ssig1,csig1   = norm(ssig1, csig1)
+
+        k2    = calp0**2 * ep2
+        eps   = k2 / (2 * (1 + np.sqrt(1 + k2)) + k2)
+        A1m1  = A1m1f(eps)
+        C1a   = C1f(eps)
+        C1pa  = C1pf(eps)
+        C3a   = C3f(geod, eps)
+        A3c   = -geod.f * salp0 * A3f(geod, eps)
+        B11   = sin_cos_series(True, ssig1, csig1, C1a)
+        B31   = sin_cos_series(True, ssig1, csig1, C3a)
+        s,c   = np.sin(B11), np.cos(B11)
+        stau1 = ssig1 * c + csig1 * s
+        ctau1 = csig1 * c - ssig1 * s
+
+        # arc length on the auxiliary sphere from the distance
+        tau12        = s12 / (b * (1 + A1m1))
+        s,c          = np.sin(tau12), np.cos(tau12)
+        B12          = - sin_cos_series(True, stau1 * c + ctau1 * s, ctau1 * c - stau1 * s, C1pa)
+        sig12        = tau12 - (B12 - B11)
+        ssig12,csig12 = np.sin(sig12), np.cos(sig12)
+        if abs(geod.f) > 0.01:
+            # one Newton step on the distance for eccentric ellipsoids
+            ssig2  = ssig1 * csig12 + csig1 * ssig12
+            csig2  = csig1 * csig12 - ssig1 * ssig12
+            B12    = sin_cos_series(True, ssig2, csig2, C1a)
+            serr   = (1 + A1m1) * (sig12 + (B12 - B11)) - s12 / b
+            sig12  = sig12 - serr / np.sqrt(1 + k2 * ssig2**2)
+            ssig12,csig12 = np.sin(sig12), np.cos(sig12)
+
+        # end point
+        ssig2 = ssig1 * csig12 + csig1 * ssig12
+        csig2 = csig1 * csig12 - ssig1 * ssig12
+        sbet2 = calp0 * ssig2
+        cbet2 = np.hypot(salp0, calp0 * csig2)
+        polar = cbet2 == 0
+        cbet2 = np.where(polar, Geodesic.tiny_, cbet2)
+        csig2 = np.where(polar, Geodesic.tiny_, csig2)
+        salp2 = salp0
+        calp2 = calp0 * csig2
+        somg2 = salp0 * ssig2
+        comg2 = csig2
+
+        omg12 = np.arctan2(somg2 * comg1 - comg2 * somg1, comg2 * comg1 + somg2 * somg1)
+        lam12 = omg12 + A3c * (sig12 + (sin_cos_series(True, ssig2, csig2, C3a) - B31))
+        lon12 = np.degrees(lam12)
+        lon2  = ang_normalize(ang_normalize(lon1) + ang_normalize(lon12))
+        lat2  = atan2d(sbet2, f1 * cbet2)
+
+    geodesic            = Data()
+    geodesic.latitude   = lat2.reshape(shape)
+    geodesic.longitude  = lon2.reshape(shape)
+    geodesic.azimuth_2  = atan2d(salp2, calp2).reshape(shape)
+    geodesic.arc_length = np.degrees(sig12).reshape(shape)
+    return geodesic
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def geodesic_constants(a, f):
+    """ Returns the constants of an ellipsoid, shared with the scalar Geodesic class """
+    if Geodesic.WGS84.a == float(a) and Geodesic.WGS84.f == float(f):
+        return Geodesic.WGS84
+    return Geodesic(a, f)
+
+def norm(x, y):
+    """ Normalizes two-vectors """
+    r = np.hypot(x, y)
+    return x/r, y/r
+
+def sum_error(u, v):
+    """ Error free transformation of sums """
+    s   = u + v
+    up  = s - v
+    vpp = s - up
+    up  = up - u
+    vpp = vpp - v
+    t   = np.where(s == 0, s, 0.0 - (up + vpp))
+    return s, t
+
+def remainder(x):
+    """ Remainder of x/360 in the range [-180, 180], with the tie rule of math.remainder """
+    r = np.fmod(x, 360.)
+    r = np.where(r > 180, r - 360., r)
+    r = np.where(r < -180, r + 360., r)
+    # at +/-180 the quotient is rounded to an even number
+    odd = (np.abs(r) == 180) & (np.fmod((x - r)/360., 2.) != 0)
+    return np.where(odd, -r, r)
+
+def ang_normalize(x):
+    """ Reduces angles to [-180, 180] """
+    y = remainder(x)
+    return np.where(np.abs(y) == 180, np.copysign(180.0, x), y)
+
+def lat_fix(x):
+    """ Replaces latitudes outside [-90, 90] by NaN """
+    return np.where(np.abs(x) > 90, np.nan, x)
+
+def ang_round(x):
+    """ Rounds angles so that small values underflow to zero """
+    z = 1/16.0
+    y = np.abs(x)
+    y = np.where(y < z, z - (z - y), y)
+    return np.copysign(y, x)
+
+def ang_diff(x, y):
+    """ Computes y - x reduced to [-180, 180] accurately """
+    d, t = sum_error(remainder(-x), remainder(y))
+    d, t = sum_error(remainder(d), t)
+    return np.where((d == 0) | (np.abs(d) == 180), np.copysign(d, np.where(t == 0, y - x, -t)), d), t
+
+def quadrant_sincos(r, q, x):
+    """ Sine and cosine of r in radians rotated by q quarter turns """
+    s, c = np.sin(r), np.cos(r)
+    q    = np.mod(q, 4)
+    s, c = (np.select([q == 1, q == 2, q == 3], [c, -s, -c], s),
+            np.select([q == 1, q == 2, q == 3], [-s, -c, s], c))
+    c    = c + 0.0
+    s    = np.where(s == 0, np.copysign(s, x), s)
+    return s, c
+
+def sincosd(x):
+    """ Computes the sine and cosine of angles in degrees """
+    r = np.where(np.isfinite(x), np.fmod(x, 360), np.nan)
+    q = np.where(np.isnan(r), 0, np.round(r / 90)).astype(int)
+    r = np.radians(r - 90 * q)
+    return quadrant_sincos(r, q, x)
+
+def sincosde(x, t):
+    """ Computes the sine and cosine of x + t in degrees with x in [-180, 180] """
+    q = np.where(np.isfinite(x), np.round(x / 90), 0).astype(int)
+    r = np.radians(ang_round((x - 90 * q) + t))
+    return quadrant_sincos(r, q, x)
+
+def atan2d(y, x):
+    """ Computes atan2(y, x) in degrees """
+    swap = np.abs(y) > np.abs(x)
+    x, y = np.where(swap, y, x), np.where(swap, x, y)
+    q    = np.where(swap, 2, 0) + np.where(x < 0, 1, 0)
+    x    = np.where(x < 0, -x, x)
+    ang  = np.degrees(np.arctan2(y, x))
+    return np.select([q == 1, q == 2, q == 3], [np.copysign(180, y) - ang, 90 - ang, -90 + ang], ang)
+
+def polyval(N, p, s, x):
+    """ Evaluates polynomials with Horner's method """
+    y = np.zeros_like(x) + (0 if N < 0 else p[s])
+    while N > 0:
+        N -= 1; s += 1
+        y = y * x + p[s]
+    return y
+
+def sin_cos_series(sinp, sinx, cosx, c):
+    """ Evaluates trigonometric series with Clenshaw summation, see Geodesic._SinCosSeries """
+    k  = len(c)
+    n  = k - sinp
+    ar = 2 * (cosx - sinx) * (cosx + sinx)
+    y1 = 0
+    if n & 1:
+        k -= 1; y0 = c[k]
+    else:
+        y0 = 0
+    n = n // 2
+    while n:
+        n -= 1
+        k -= 1; y1 = ar * y0 - y1 + c[k]
+        k -= 1; y0 = ar * y1 - y0 + c[k]
+    return 2 * sinx * cosx * y0 if sinp else cosx * (y0 - y1)
+
+def series_coefficients(coeff, order, eps):
+    """ Evaluates the coefficients C1, C1p and C2 of the series in eps """
+    eps2 = eps**2
+    d    = eps
+    o    = 0
+    c    = [None]*(order + 1)
+    for l in range(1, order + 1):
+        m    = (order - l) // 2
+        c[l] = d * polyval(m, coeff, o, eps2) / coeff[o + m + 1]
+        o   += m + 2
+        d    = d * eps
+    return c
+
+def A1m1f(eps):
+    """ Returns A1 - 1 """
+    coeff = [1, 4, 64, 0, 256]
+    m     = Geodesic.nA1_//2
+    t     = polyval(m, coeff, 0, eps**2) / coeff[m + 1]
+    return (t + eps) / (1 - eps)
+
+def A2m1f(eps):
+    """ Returns A2 - 1 """
+    coeff = [-11, -28, -192, 0, 256]
+    m     = Geodesic.nA2_//2
+    t     = polyval(m, coeff, 0, eps**2) / coeff[m + 1]
+    return (t - eps) / (1 + eps)
+
+def C1f(eps):
+    """ Returns C1 """
+    coeff = [-1, 6, -16, 32, -9, 64, -128, 2048, 9, -16, 768, 3, -5, 512, -7, 1280, -7, 2048]
+    return series_coefficients(coeff, Geodesic.nC1_, eps)
+
+def C1pf(eps):
+    """ Returns C1p, the coefficients of the inverse of the C1 series """
+    coeff = [205, -432, 768, 1536, 4005, -4736, 3840, 12288, -225, 116, 384, -7173, 2695, 7680, 3467, 7680, 38081, 61440]
+    return series_coefficients(coeff, Geodesic.nC1p_, eps)
+
+def C2f(eps):
+    """ Returns C2 """
+    coeff = [1, 2, 16, 32, 35, 64, 384, 2048, 15, 80, 768, 7, 35, 512, 63, 1280, 77, 2048]
+    return series_coefficients(coeff, Geodesic.nC2_, eps)
+
+def A3f(geod, eps):
+    """ Returns A3 """
+    return polyval(Geodesic.nA3_ - 1, geod._A3x, 0, eps)
+
+def C3f(geod, eps):
+    """ Returns C3 """
+    c    = [None]*Geodesic.nC3_
+    mult = 1
+    o    = 0
+    for l in range(1, Geodesic.nC3_):
+        m    = Geodesic.nC3_ - l - 1
+        mult = mult * eps
+        c[l] = mult * polyval(m, geod._C3x, o, eps)
+        o   += m + 1
+    return c
+
+def lengths(geod, eps, sig12, ssig1, csig1, dn1, ssig2, csig2, dn2, distance):
+    """ Returns the distance (if requested) and the reduced length over b, see Geodesic._Lengths """
+    A1  = A1m1f(eps)
+    C1a = C1f(eps)
+    A2  = A2m1f(eps)
+    C2a = C2f(eps)
+    m0x = A1 - A2
+    A2  = 1 + A2
+    A1  = 1 + A1
+    if distance:
+        B1   = sin_cos_series(True, ssig2, csig2, C1a) - sin_cos_series(True, ssig1, csig1, C1a)
+        s12b = A1 * (sig12 + B1)
+        B2   = sin_cos_series(True, ssig2, csig2, C2a) - sin_cos_series(True, ssig1, csig1, C2a)
+        J12  = m0x * sig12 + (A1 * B1 - A2 * B2)
+    else:
+        s12b = np.nan
+        C2a  = [None] + [A1 * C1a[l] - A2 * C2a[l] for l in range(1, Geodesic.nC2_)]
+        J12  = m0x * sig12 + (sin_cos_series(True, ssig2, csig2, C2a) - sin_cos_series(True, ssig1, csig1, C2a))
+    m12b = dn2 * (csig1 * ssig2) - dn1 * (ssig1 * csig2) - csig1 * csig2 * J12
+    return s12b, m12b
+
+def astroid(x, y):
+    """ Solves the astroid equation for its positive root, see Geodesic._Astroid """
+    p    = x**2
+    q    = y**2
+    r    = (p + q - 1) / 6
+    S    = p * q / 4
+    r2   = r**2
+    r3   = r * r2
+    disc = S * (S + 2 * r3)
+    T3   = S + r3
+    T3   = T3 + np.where(T3 < 0, -np.sqrt(np.maximum(disc, 0)), np.sqrt(np.maximum(disc, 0)))
+    T    = np.cbrt(T3)
+    u_real    = r + T + np.where(T != 0, r2 / T, 0)
+    u_complex = r + 2 * r * np.cos(np.arctan2(np.sqrt(np.maximum(-disc, 0)), -(S + r3)) / 3)
+    u    = np.where(disc >= 0, u_real, u_complex)
+    v    = np.sqrt(u**2 + q)
+    uv   = np.where(u < 0, q / (v - u), u + v)
+    w    = (uv - q) / (2 * v)
+    k    = uv / (np.sqrt(uv + w**2) + w)
+    return np.where((q == 0) & (r <= 0), 0, k)
+
+def inverse_start(geod, sbet1, cbet1, dn1, sbet2, cbet2, dn2, lam12, slam12, clam12):
+    """ Finds the starting point of Newton's method, and solves short lines, see Geodesic._InverseStart """
+    N      = len(sbet1)
+    sig12  = np.full(N, -1.)
+    salp2  = np.full(N, np.nan)
+    calp2  = np.full(N, np.nan)
+    sbet12  = sbet2 * cbet1 - cbet2 * sbet1
+    cbet12  = cbet2 * cbet1 + sbet2 * sbet1
+    sbet12a = sbet2 * cbet1
+    sbet12a = sbet12a + cbet2 * sbet1
+
+    shortline = (cbet12 >= 0) & (sbet12 < 0.5) & (cbet2 * lam12 < 0.5)
+    sbetm2    = (sbet1 + sbet2)**2
+    sbetm2    = sbetm2 / (sbetm2 + (cbet1 + cbet2)**2)
+    dnm       = np.where(shortline, np.sqrt(1 + geod._ep2 * sbetm2), np.nan)
+    omg12     = lam12 / (geod._f1 * dnm)
+    somg12    = np.where(shortline, np.sin(omg12), slam12)
+    comg12    = np.where(shortline, np.cos(omg12), clam12)
+
+    salp1  = cbet2 * somg12
+    calp1  = np.where(comg12 >= 0,
+                      sbet12 + cbet2 * sbet1 * somg12**2 / (1 + comg12),
+                      sbet12a - cbet2 * sbet1 * somg12**2 / (1 - comg12))
+    ssig12 = np.hypot(salp1, calp1)
+    csig12 = sbet1 * sbet2 + cbet1 * cbet2 * comg12
+
+    # really short lines
+    really_short  = shortline & (ssig12 < geod._etol2)
+    s_salp2       = cbet1 * somg12
+    s_calp2       = sbet12 - cbet1 * sbet2 * np.where(comg12 >= 0, somg12**2 / (1 + comg12), 1 - comg12)
+    s_salp2,s_calp2 = norm(s_salp2, s_calp2)
+    salp2         = np.where(really_short, s_salp2, salp2)
+    calp2         = np.where(really_short, s_calp2, calp2)
+    sig12         = np.where(really_short, np.arctan2(ssig12, csig12), sig12)
+
+    # nearly antipodal points, the zeroth order spherical approximation is not good enough
+    antipodal = (~really_short & ~(abs(geod._n) >= 0.1) & ~(csig12 >= 0) &
+                 ~(ssig12 >= 6 * abs(geod._n) * np.pi * cbet1**2))
+    if np.any(antipodal):
+        i      = np.where(antipodal)[0]
+        lam12x = np.arctan2(-slam12[i], -clam12[i])
+        if geod.f >= 0:
+            k2       = sbet1[i]**2 * geod._ep2
+            eps      = k2 / (2 * (1 + np.sqrt(1 + k2)) + k2)
+            lamscale = geod.f * cbet1[i] * A3f(geod, eps) * np.pi
+            betscale = lamscale * cbet1[i]
+            x        = lam12x / lamscale
+            y        = sbet12a[i] / betscale
+        else:
+            cbet12a  = cbet2[i] * cbet1[i] - sbet2[i] * sbet1[i]
+            bet12a   = np.arctan2(sbet12a[i], cbet12a)
+            _, m12b  = lengths(geod, np.full(len(i), geod._n), np.pi + bet12a, sbet1[i], -cbet1[i], dn1[i], sbet2[i], cbet2[i], dn2[i], False)
+            A1       = A1m1f(np.full(len(i), geod._n))
+            A2       = A2m1f(np.full(len(i), geod._n))
+            m0       = A1 - A2
+            x        = -1 + m12b / (cbet1[i] * cbet2[i] * m0 * np.pi)
+            betscale = np.where(x < -0.01, sbet12a[i] / x, -geod.f * cbet1[i]**2 * np.pi)
+            lamscale = betscale / cbet1[i]
+            y        = lam12x / lamscale
+
+        # strip near the cut
+        cut = (y > -Geodesic.tol1_) & (x > -1 - Geodesic.xthresh_)
+        if geod.f >= 0:
+            c_salp1 = np.minimum(1.0, -x)
+            c_calp1 = - np.sqrt(1 - c_salp1**2)
+        else:
+            c_calp1 = np.maximum(np.where(x > -Geodesic.tol1_, 0.0, -1.0), x)
+            c_salp1 = np.sqrt(1 - c_calp1**2)
+
+        # otherwise estimate omg12 from the astroid problem
+        k        = astroid(x, y)
+        omg12a   = lamscale * (-x * k/(1 + k) if geod.f >= 0 else -y * (1 + k)/k)
+        a_somg12 = np.sin(omg12a)
+        a_comg12 = -np.cos(omg12a)
+        a_salp1  = cbet2[i] * a_somg12
+        a_calp1  = sbet12a[i] - cbet2[i] * sbet1[i] * a_somg12**2 / (1 - a_comg12)
+
+        salp1[i] = np.where(cut, c_salp1, a_salp1)
+        calp1[i] = np.where(cut, c_calp1, a_calp1)
+
+    # sanity check on the starting guess, the backwards check lets NaN through
+    valid        = ~(salp1 <= 0)
+    n_salp1,n_calp1 = norm(salp1, calp1)
+    salp1        = np.where(valid, n_salp1, 1.)
+    calp1        = np.where(valid, n_calp1, 0.)
+    return sig12, salp1, calp1, salp2, calp2, dnm
+
+def lambda12(geod, sbet1, cbet1, dn1, sbet2, cbet2, dn2, salp1, calp1, slam120, clam120, diffp):
+    """ Solves the hybrid problem, see Geodesic._Lambda12 """
+    calp1 = np.where((sbet1 == 0) & (calp1 == 0), -Geodesic.tiny_, calp1)
+
+    salp0 = salp1 * cbet1
+    calp0 = np.hypot(calp1, salp1 * sbet1)
+
+    ssig1 = sbet1; somg1 = salp0 * sbet1
+    csig1 = comg1 = calp1 * cbet1
+    ssig1,csig1 = norm(ssig1, csig1)
+
+    salp2 = np.where(cbet2 != cbet1, salp0 / cbet2, salp1)
+    calp2 = np.where((cbet2 != cbet1) | (np.abs(sbet2) != -sbet1),
+                     np.sqrt((calp1 * cbet1)**2 + np.where(cbet1 < -sbet1, (cbet2 - cbet1) * (cbet1 + cbet2),
+                                                            (sbet1 - sbet2) * (sbet1 + sbet2))) / cbet2,
+                     np.abs(calp1))
+    ssig2 = sbet2; somg2 = salp0 * sbet2
+    csig2 = comg2 = calp2 * cbet2
+    ssig2,csig2 = norm(ssig2, csig2)
+
+    sig12  = np.arctan2(np.maximum(0.0, csig1 * ssig2 - ssig1 * csig2) + 0.0, csig1 * csig2 + ssig1 * ssig2)
+    somg12 = np.maximum(0.0, comg1 * somg2 - somg1 * comg2) + 0.0
+    comg12 = comg1 * comg2 + somg1 * somg2
+    eta    = np.arctan2(somg12 * clam120 - comg12 * slam120, comg12 * clam120 + somg12 * slam120)
+
+    k2     = calp0**2 * geod._ep2
+    eps    = k2 / (2 * (1 + np.sqrt(1 + k2)) + k2)
+    C3a    = C3f(geod, eps)
+    B312   = sin_cos_series(True, ssig2, csig2, C3a) - sin_cos_series(True, ssig1, csig1, C3a)
+    domg12 = -geod.f * A3f(geod, eps) * salp0 * (sig12 + B312)
+    lam12  = eta + domg12
+
+    if diffp:
+        _, dlam12 = lengths(geod, eps, sig12, ssig1, csig1, dn1, ssig2, csig2, dn2, False)
+        dlam12    = np.where(calp2 == 0, - 2 * geod._f1 * dn1 / sbet1, dlam12 * geod._f1 / (calp2 * cbet2))
+    else:
+        dlam12 = np.full(len(sbet1), np.nan)
+    return lam12, salp2, calp2, sig12, ssig1, csig1, ssig2, csig2, eps, dlam12
+
+def solve_hybrid(geod, sbet1, cbet1, dn1, sbet2, cbet2, dn2, salp1, calp1, slam12, clam12):
+    """ Newton's method on the azimuth at the first point, with bisection when the Newton step leaves the bracket of
+    the root. All geodesics iterate together and the converged ones are masked out, see Geodesic._GenInverse """
+    N      = len(sbet1)
+    salp1a = np.full(N, Geodesic.tiny_); calp1a = np.full(N, 1.0)
+    salp1b = np.full(N, Geodesic.tiny_); calp1b = np.full(N, -1.0)
+    tripn  = np.zeros(N, dtype=bool)
+    tripb  = np.zeros(N, dtype=bool)
+    salp2, calp2, sig12 = np.zeros(N), np.zeros(N), np.zeros(N)
+    ssig1, csig1, ssig2, csig2, eps = np.zeros(N), np.zeros(N), np.zeros(N), np.zeros(N), np.zeros(N)
+
+    active = np.arange(N)
+    numit  = 0
+    while numit < Geodesic.maxit2_ and len(active) > 0:
+        i = active
+        v, salp2[i], calp2[i], sig12[i], ssig1[i], csig1[i], ssig2[i], csig2[i], eps[i], dv = lambda12(
+            geod, sbet1[i], cbet1[i], dn1[i], sbet2[i], cbet2[i], dn2[i], salp1[i], calp1[i], slam12[i], clam12[i],
+            numit < Geodesic.maxit1_)
+
+        # reversed test to allow escape with NaNs
+        done   = tripb[i] | ~(np.abs(v) >= np.where(tripn[i], 8., 1.) * Geodesic.tol0_)
+        keep   = ~done
+        i, v, dv = i[keep], v[keep], dv[keep]
+        active = i
+        if len(i) == 0:
+            break
+
+        # update the bracket of the root
+        upper = (v > 0) & ((numit > Geodesic.maxit1_) | (calp1[i]/salp1[i] > calp1b[i]/salp1b[i]))
+        lower = ~upper & (v < 0) & ((numit > Geodesic.maxit1_) | (calp1[i]/salp1[i] < calp1a[i]/salp1a[i]))
+        salp1b[i] = np.where(upper, salp1[i], salp1b[i]); calp1b[i] = np.where(upper, calp1[i], calp1b[i])
+        salp1a[i] = np.where(lower, salp1[i], salp1a[i]); calp1a[i] = np.where(lower, calp1[i], calp1a[i])
+
+        numit += 1
+        # Newton step
+        newton = np.zeros(len(i), dtype=bool)
+        if numit < Geodesic.maxit1_:
+            dalp1  = -v/dv
+            sdalp1 = np.sin(dalp1); cdalp1 = np.cos(dalp1)
+            nsalp1 = salp1[i] * cdalp1 + calp1[i] * sdalp1
+            newton = (dv > 0) & (nsalp1 > 0) & (np.abs(dalp1) < np.pi)
+            n_calp1 = calp1[i] * cdalp1 - salp1[i] * sdalp1
+            n_salp1, n_calp1 = norm(nsalp1, n_calp1)
+
+        # bisection
+        b_salp1, b_calp1 = norm((salp1a[i] + salp1b[i])/2, (calp1a[i] + calp1b[i])/2)
+        if numit < Geodesic.maxit1_:
+            salp1[i] = np.where(newton, n_salp1, b_salp1)
+            calp1[i] = np.where(newton, n_calp1, b_calp1)
+        else:
+            salp1[i], calp1[i] = b_salp1, b_calp1
+        tripn[i] = newton & (np.abs(v) <= 16 * Geodesic.tol0_)
+        tripb[i] = ~newton & ((np.abs(salp1a[i] - salp1[i]) + (calp1a[i] - calp1[i]) < Geodesic.tolb_) |
+                              (np.abs(salp1[i] - salp1b[i]) + (calp1[i] - calp1b[i]) < Geodesic.tolb_))
+
+    s12x, _ = lengths(geod, eps, sig12, ssig1, csig1, dn1, ssig2, csig2, dn2, True)
+    return sig12, s12x * geod._b, salp1, calp1, salp2, calp2
@@ -65,10 +65,10 @@ def compute_point_to_point_geospacial_data(settings):
     x1_coord                 = np.array([des_lat,y_min_coord])
     y1_coord                 = np.array([x_min_coord,des_long])  
     
-    x0 = RCAIDE.Framework.Analyses.Geodesics.Geodesics.Calculate_Distance(x0_coord,bottom_left_map_coords) * Units.kilometers
-    y0 = RCAIDE.Framework.Analyses.Geodesics.Geodesics.Calculate_Distance(y0_coord,bottom_left_map_coords) * Units.kilometers
-    x1 = RCAIDE.Framework.Analyses.Geodesics.Geodesics.Calculate_Distance(x1_coord,bottom_left_map_coords) * Units.kilometers
-    y1 = RCAIDE.Framework.Analyses.Geodesics.Geodesics.Calculate_Distance(y1_coord,bottom_left_map_coords) * Units.kilometers
+    # the four distances are computed together 
+    map_coords  = np.stack([x0_coord,y0_coord,x1_coord,y1_coord])
+    distances   = RCAIDE.Framework.Analyses.Geodesics.Geodesics.Calculate_Distance(map_coords,bottom_left_map_coords) * Units.kilometers
+    x0,y0,x1,y1 = distances
     
     lat_flag             = np.where(origin_coordinates<0)[0]
     origin_coordinates[lat_flag]  = origin_coordinates[lat_flag] + 360 
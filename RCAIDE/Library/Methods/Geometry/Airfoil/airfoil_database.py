@@ -0,0 +1,295 @@
+# RCAIDE/Library/Methods/Geometry/Airfoil/airfoil_database.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+
+# package imports
+import numpy  as np
+import hashlib
+import shutil
+import os
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Database state
+# ----------------------------------------------------------------------------------------------------------------------
+# settings of the airfoil database of the current process
+airfoil_database_settings                 = Data()
+airfoil_database_settings.enabled         = False
+airfoil_database_settings.directory       = None   # defaults to ~/.cache/RCAIDE/airfoil_database
+airfoil_database_settings.maximum_entries = 256
+
+# bump when the layout of the stored airfoil properties changes
+database_format_version = 1
+
+# counters of the current process
+database_counters           = Data()
+database_counters.hits      = 0
+database_counters.misses    = 0
+database_counters.writes    = 0
+database_counters.evictions = 0
+
+# arrays of compute_airfoil_properties stored in an entry, one memory-mappable .npy file each
+stored_arrays = ['aoa_from_polar','re_from_polar','lift_coefficients','drag_coefficients','cm',
+                 'lift_distribution','drag_distribution','reynolds_numbers','angle_of_attacks']
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_airfoil_properties_hash
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_airfoil_properties_hash(airfoil_geometry, airfoil_polar_files = None, use_pre_stall_data = True):
+    """Computes a content hash of everything compute_airfoil_properties depends on.
+
+    Assumptions:
+        The geometry holds the coordinates read from the coordinate file, the polar files are hashed by content
+        so that renamed or moved files still hit the database
+
+    Source:
+        None
+
+    Args:
+        airfoil_geometry      : airfoil geometry, None for the NACA 0012        [unitless]
+        airfoil_polar_files   : polar files                                     [unitless]
+        use_pre_stall_data    : flag to apply the polar data before stall       [boolean]
+
+    Returns:
+        key                   : hexadecimal sha256 digest                       [unitless]
+    """
+    h = hashlib.sha256()
+    h.update(repr([database_format_version,RCAIDE.__version__,bool(use_pre_stall_data)]).encode())
+    if airfoil_geometry is None:
+        h.update(b'NACA 0012')
+    else:
+        for name,value in airfoil_geometry.items():
+            value = np.ascontiguousarray(value)
+            if value.dtype.hasobject:
+                value = np.array(repr(value.tolist()))
+            h.update((name + value.dtype.str + repr(value.shape)).encode())
+            h.update(value.tobytes())
+    if airfoil_polar_files is None:
+        h.update(b'panel method polars')
+    else:
+        for polar_file in airfoil_polar_files:
+            with open(polar_file,'rb') as f:
+                h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  load_airfoil_properties
+# ----------------------------------------------------------------------------------------------------------------------
+def load_airfoil_properties(key):
+    """Loads the arrays of previously computed airfoil properties from the database. The arrays are memory-mapped
+    copy-on-write, so they are only read from disk when used and can be modified without changing the entry.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        key                 : airfoil properties hash                       [unitless]
+
+    Returns:
+        Airfoil_Data        : airfoil properties without the interpolators, None if not stored   [unitless]
+    """
+    entry = entry_directory(key)
+    if not os.path.isdir(entry):
+        database_counters.misses += 1
+        return None
+
+    try:
+        arrays = Data()
+        for name in stored_arrays + ['boundary_layer_angle_of_attacks','boundary_layer_reynolds_numbers']:
+            arrays[name] = np.load(os.path.join(entry,name + '.npy'),mmap_mode='c',allow_pickle=False)
+    except (OSError,ValueError):
+        # incomplete entries are dropped and recomputed
+        shutil.rmtree(entry,ignore_errors=True)
+        database_counters.misses += 1
+        return None
+
+    Airfoil_Data                                 = Data()
+    Airfoil_Data.aoa_from_polar                  = arrays.aoa_from_polar
+    Airfoil_Data.re_from_polar                   = arrays.re_from_polar
+    Airfoil_Data.lift_coefficients               = arrays.lift_coefficients
+    Airfoil_Data.drag_coefficients               = arrays.drag_coefficients
+    Airfoil_Data.cm                              = arrays.cm
+    Airfoil_Data.boundary_layer                  = Data()
+    Airfoil_Data.boundary_layer.angle_of_attacks = arrays.boundary_layer_angle_of_attacks
+    Airfoil_Data.boundary_layer.reynolds_numbers = arrays.boundary_layer_reynolds_numbers
+    Airfoil_Data.lift_distribution_func          = None  # rebuilt by compute_airfoil_properties
+    Airfoil_Data.drag_distribution_func          = None
+    Airfoil_Data.lift_distribution               = arrays.lift_distribution
+    Airfoil_Data.drag_distribution               = arrays.drag_distribution
+    Airfoil_Data.reynolds_numbers                = arrays.reynolds_numbers
+    Airfoil_Data.angle_of_attacks                = arrays.angle_of_attacks
+
+    # mark the entry as recently used for the eviction policy
+    os.utime(entry)
+    database_counters.hits += 1
+    return Airfoil_Data
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  save_airfoil_properties
+# ----------------------------------------------------------------------------------------------------------------------
+def save_airfoil_properties(key, Airfoil_Data):
+    """Stores the arrays of computed airfoil properties in the database and evicts the least recently used entries
+    beyond the database limit.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        key                 : airfoil properties hash                       [unitless]
+        Airfoil_Data        : output of compute_airfoil_properties          [unitless]
+
+    Returns:
+        None
+    """
+    arrays = Data()
+    for name in stored_arrays:
+        arrays[name] = Airfoil_Data[name]
+    arrays.boundary_layer_angle_of_attacks = Airfoil_Data.boundary_layer.angle_of_attacks
+    arrays.boundary_layer_reynolds_numbers = Airfoil_Data.boundary_layer.reynolds_numbers
+
+    # write to a temporary directory first so concurrent jobs never read a partial entry
+    entry     = entry_directory(key)
+    temporary = entry + '.' + str(os.getpid()) + '.tmp'
+    os.makedirs(temporary,exist_ok=True)
+    for name in arrays.keys():
+        np.save(os.path.join(temporary,name + '.npy'),np.asarray(arrays[name]),allow_pickle=False)
+    try:
+        os.rename(temporary,entry)
+    except OSError:
+        # another job stored the same entry first
+        shutil.rmtree(temporary,ignore_errors=True)
+        return
+    database_counters.writes += 1
+
+    evict_airfoil_database(airfoil_database_settings.directory,airfoil_database_settings.maximum_entries)
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  evict_airfoil_database
+# ----------------------------------------------------------------------------------------------------------------------
+def evict_airfoil_database(directory=None, maximum_entries=None):
+    """Removes the least recently used entries until the database holds at most maximum_entries entries.
+
+    Assumptions:
+        Loading an entry refreshes its modification time
+
+    Source:
+        None
+
+    Args:
+        directory          : database directory, None for the default   [unitless]
+        maximum_entries    : number of entries kept, None for no limit   [unitless]
+
+    Returns:
+        evicted            : number of removed entries                  [unitless]
+    """
+    entries = database_entries(directory)
+    entries.sort(key=lambda entry: entry[1])
+
+    evicted = 0
+    if maximum_entries is not None:
+        for entry,_,_ in entries[:max(len(entries) - maximum_entries,0)]:
+            shutil.rmtree(entry,ignore_errors=True)
+            evicted += 1
+
+    database_counters.evictions += evicted
+    return evicted
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  clear_airfoil_database
+# ----------------------------------------------------------------------------------------------------------------------
+def clear_airfoil_database(directory=None):
+    """Removes every entry of the airfoil database.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        directory          : database directory, None for the default   [unitless]
+
+    Returns:
+        evicted            : number of removed entries                  [unitless]
+    """
+    return evict_airfoil_database(directory,maximum_entries=0)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  airfoil_database_statistics
+# ----------------------------------------------------------------------------------------------------------------------
+def airfoil_database_statistics(directory=None):
+    """Reports the content of the airfoil database and the database activity of the current process.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        directory          : database directory, None for the default   [unitless]
+
+    Returns:
+        statistics.
+          directory        : database directory                         [unitless]
+          entries          : number of stored airfoils                  [unitless]
+          size             : bytes on disk                              [bytes]
+          hits             : airfoils loaded from the database          [unitless]
+          misses           : airfoils not found in the database         [unitless]
+          writes           : airfoils stored in the database            [unitless]
+          evictions        : entries removed by the eviction policy     [unitless]
+    """
+    entries = database_entries(directory)
+
+    statistics           = Data()
+    statistics.directory = database_directory(directory)
+    statistics.entries   = len(entries)
+    statistics.size      = sum(entry[2] for entry in entries)
+    statistics.hits      = database_counters.hits
+    statistics.misses    = database_counters.misses
+    statistics.writes    = database_counters.writes
+    statistics.evictions = database_counters.evictions
+    return statistics
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def database_directory(directory):
+    """ Returns the database directory, defaulting to the settings then to ~/.cache/RCAIDE/airfoil_database """
+    if directory is None:
+        directory = airfoil_database_settings.directory
+    if directory is None:
+        directory = os.path.join(os.path.expanduser('~'),'.cache','RCAIDE','airfoil_database')
+    return directory
+
+def entry_directory(key):
+    """ Returns the directory of the entry of an airfoil """
+    return os.path.join(database_directory(None),key)
+
+def database_entries(directory):
+    """ Lists the (entry directory, modification time, size) of every database entry """
+    directory = database_directory(directory)
+    entries   = []
+    if not os.path.isdir(directory):
+        return entries
+    for name in os.listdir(directory):
+        entry = os.path.join(directory,name)
+        if name.endswith('.tmp') or not os.path.isdir(entry):
+            continue
+        size = sum(os.path.getsize(os.path.join(entry,f)) for f in os.listdir(entry))
+        entries.append((entry,os.stat(entry).st_mtime,size))
+    return entries
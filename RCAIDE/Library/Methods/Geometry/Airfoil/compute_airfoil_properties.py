@@ -15,6 +15,7 @@ from RCAIDE.Library.Methods.Geometry.Airfoil.import_airfoil_polars
 from RCAIDE.Library.Methods.Geometry.Airfoil.compute_naca_4series                   import compute_naca_4series  
 from RCAIDE.Library.Methods.Aerodynamics.AERODAS.pre_stall_coefficients             import pre_stall_coefficients
 from RCAIDE.Library.Methods.Aerodynamics.AERODAS.post_stall_coefficients            import post_stall_coefficients
+from RCAIDE.Library.Methods.Geometry.Airfoil.airfoil_database                       import airfoil_database_settings, compute_airfoil_properties_hash, load_airfoil_properties, save_airfoil_properties
 
 # numpy imports 
 import numpy as np
@@ -28,7 +29,9 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     """This computes the aerodynamic properties and coefficients of an airfoil in stall regimes using pre-stall
     characterstics and AERODAS formation for post stall characteristics. This is useful for 
     obtaining a more accurate prediction of wing and blade loading as well as aeroacoustics. Pre stall characteristics 
-    are obtained in the form of a text file of airfoil polar data obtained from airfoiltools.com
+    are obtained in the form of a text file of airfoil polar data obtained from airfoiltools.com. When the airfoil
+    database is enabled, the properties of an airfoil geometry and set of polar files computed before are loaded
+    from disk.
     
     Assumptions:
         None 
@@ -51,6 +54,18 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     Properties Used:
     N/A
     """     
+    # ----------------------------------------------------------------------------------------
+    # Load the airfoil properties from the airfoil database 
+    # ----------------------------------------------------------------------------------------   
+    if airfoil_database_settings.enabled:
+        key          = compute_airfoil_properties_hash(airfoil_geometry,airfoil_polar_files,use_pre_stall_data)
+        Airfoil_Data = load_airfoil_properties(key)
+        if Airfoil_Data is not None:
+            bl = Airfoil_Data.boundary_layer
+            Airfoil_Data.lift_distribution_func, Airfoil_Data.drag_distribution_func = distribution_functions(bl.angle_of_attacks,bl.reynolds_numbers,
+                                                                                                              Airfoil_Data.lift_distribution,Airfoil_Data.drag_distribution)
+            return Airfoil_Data
+    
     Airfoil_Data   = Data()  
    
     # ----------------------------------------------------------------------------------------
@@ -104,6 +119,9 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     Airfoil_Data.angle_of_attacks    = AoA_sweep_rad 
     Airfoil_Data.lift_coefficients   = CL 
     Airfoil_Data.drag_coefficients   = CD    
+    
+    if airfoil_database_settings.enabled:
+        save_airfoil_properties(key,Airfoil_Data)
         
     return Airfoil_Data
  
@@ -291,9 +309,35 @@ def compute_boundary_layer_properties(airfoil_geometry,Airfoil_Data):
     Airfoil_Data.boundary_layer.reynolds_numbers                    = Re_sweep
     fL                                                              = np.transpose(af_res.fL, axes=[1,2,0])
     fD                                                              = np.transpose(af_res.fD, axes=[1,2,0]) 
-    Airfoil_Data.lift_distribution_func                             = RegularGridInterpolator((AoA_sweep,Re_sweep),fL,method = 'linear',   bounds_error=False, fill_value=None)
-    Airfoil_Data.drag_distribution_func                             = RegularGridInterpolator((AoA_sweep,Re_sweep),fD,method = 'linear',   bounds_error=False, fill_value=None)
+    Airfoil_Data.lift_distribution_func, Airfoil_Data.drag_distribution_func = distribution_functions(AoA_sweep,Re_sweep,fL,fD)
     Airfoil_Data.lift_distribution                                  = fL 
     Airfoil_Data.drag_distribution                                  = fD  
     
-    return Airfoil_Data
\ No newline at end of file
+    return Airfoil_Data
+
+def distribution_functions(AoA_sweep,Re_sweep,fL,fD): 
+    '''Builds the interpolators of the lift and drag distributions over the boundary layer sweep of 
+    angle of attacks and Reynolds numbers
+    
+    Source:
+    None
+    
+    Assumptions:
+    None 
+    
+    Inputs:
+    AoA_sweep          [radians]
+    Re_sweep           [unitless]
+    fL                 [unitless]
+    fD                 [unitless]
+    
+    Outputs:
+    lift_distribution_func  <RegularGridInterpolator>
+    drag_distribution_func  <RegularGridInterpolator>
+    
+    Properties Used:
+    N/A
+    '''
+    lift_distribution_func = RegularGridInterpolator((AoA_sweep,Re_sweep),fL,method = 'linear',   bounds_error=False, fill_value=None)
+    drag_distribution_func = RegularGridInterpolator((AoA_sweep,Re_sweep),fD,method = 'linear',   bounds_error=False, fill_value=None)
+    return lift_distribution_func, drag_distribution_func
@@ -13,8 +13,10 @@ from .background_noise                                   import background_noise
 from .decibel_arithmetic                                 import pressure_ratio_to_SPL_arithmetic
 from .decibel_arithmetic                                 import SPL_arithmetic
 from .convert_to_third_octave_band                       import convert_to_third_octave_band 
+from .microphone_chunks                                  import microphone_chunks
 from .compute_noise_source_coordinates                   import compute_rotor_point_source_coordinates
 from .generate_zero_elevation_microphone_locations       import generate_zero_elevation_microphone_locations
 from .generate_terrain_microphone_locations              import generate_terrain_microphone_locations
 from .generate_hemisphere_microphone_locations           import generate_hemisphere_microphone_locations
-from .compute_relative_noise_evaluation_locations        import compute_relative_noise_evaluation_locations 
\ No newline at end of file
+from .compute_relative_noise_evaluation_locations        import compute_relative_noise_evaluation_locations
+from .compute_nearest_noise_evaluation_locations         import compute_nearest_noise_evaluation_locations, microphone_spatial_index 
\ No newline at end of file
@@ -0,0 +1,101 @@
+# RCAIDE/Methods/Noise/Common/compute_nearest_noise_evaluation_locations.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Library.Methods.Noise.Common.compute_relative_noise_evaluation_locations import compute_noise_evaluation_times, relative_microphone_locations
+
+# Python package imports
+import numpy as np
+from scipy.spatial import cKDTree
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Microphone Spatial Index
+# ----------------------------------------------------------------------------------------------------------------------
+def microphone_spatial_index(microphone_locations,mean_sea_level_altitude):
+    """This builds a k-d tree of the ground microphones so that the microphones closest to the aircraft are found
+    without computing the distance to every microphone
+
+    Assumptions:
+        The elevation of the microphones is only used when the altitude is measured from mean sea level
+
+    Source:
+        None
+
+    Inputs:
+        microphone_locations      - array of microphone locations on the ground                 [meters]
+        mean_sea_level_altitude   - flag to use the elevation of the microphones                [boolean]
+
+    Outputs:
+        spatial_index             - k-d tree of the microphones                                 [None]
+
+    Properties Used:
+        N/A
+    """
+    points = np.array(microphone_locations,dtype=float)
+    if not mean_sea_level_altitude:
+        points[:,2] = 0.
+    return cKDTree(points)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Nearest Noise Evaluation Locations
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_nearest_noise_evaluation_locations(settings,microphone_locations,segment,n,spatial_index=None):
+    """This computes the relative locations of the n microphones closest to the aircraft at each noise evaluation
+    time. Vectors point from observer/microphone to aircraft/source
+
+    Assumptions:
+        Acoustic scattering is not modeled. Microphones at the same distance are ordered by their index
+
+    Source:
+        N/A
+
+    Inputs:
+        settings.noise_times_steps                          - number of noise evaluation times          [unitless]
+        settings.mean_sea_level_altitude                    - flag to use the microphone elevation      [boolean]
+        settings.aircraft_origin_location                   - location of the aircraft origin           [meters]
+        microphone_locations                                - array of microphone locations             [meters]
+        segment.conditions.frames.inertial.position_vector  - position of aircraft                      [meters]
+        n                                                   - number of microphones in the stencil      [unitless]
+        spatial_index                                       - output of microphone_spatial_index        [None]
+
+    Outputs:
+        noise_time - noise evaluation times                                                             [s]
+        noise_pos  - aircraft position at the noise evaluation times                                    [meters]
+        locs       - indices of the closest microphones, ordered by distance                           [unitless]
+        RML        - relative locations of the closest microphones                                      [meters]
+        PHI        - polar angle of the aircraft seen from the closest microphones                      [radians]
+        THETA      - azimuthal angle of the aircraft seen from the closest microphones                  [radians]
+
+    Properties Used:
+        N/A
+    """
+    noise_time,noise_pos = compute_noise_evaluation_times(settings,segment)
+    if spatial_index is None:
+        spatial_index = microphone_spatial_index(microphone_locations,settings.mean_sea_level_altitude)
+
+    # aircraft positions in the frame of the spatial index
+    query       = np.zeros_like(noise_pos)
+    query[:,0]  = settings.aircraft_origin_location[0] + noise_pos[:,0]
+    query[:,1]  = settings.aircraft_origin_location[1] + noise_pos[:,1]
+    query[:,2]  = -noise_pos[:,2]
+
+    # the candidates include every microphone tied with the n-th closest one
+    k          = min(n,len(microphone_locations))
+    distance,_ = spatial_index.query(query,k=k)
+    radius     = np.atleast_2d(distance.T).T[:,-1]
+    candidates = spatial_index.query_ball_point(query,radius*(1 + 1E-9) + 1E-9)
+
+    locs = np.zeros((len(noise_time),k),dtype=int)
+    for i in range(len(noise_time)):
+        candidate   = np.array(candidates[i],dtype=int)
+        RML,_,_     = relative_microphone_locations(settings,microphone_locations[candidate],noise_pos[i])
+        R           = np.linalg.norm(RML,axis=1)
+        locs[i]     = candidate[np.lexsort((candidate,R))[:k]]
+
+    RML,PHI,THETA = relative_microphone_locations(settings,microphone_locations[locs],noise_pos[:,None,:])
+    return noise_time,noise_pos,locs,RML,PHI,THETA
@@ -36,36 +36,38 @@ def compute_relative_noise_evaluation_locations(settings,microphone_locations, s
     Properties Used:
         N/A       
     """       
-  
-    MSL_altitude      = settings.mean_sea_level_altitude
+    noise_time,noise_pos = compute_noise_evaluation_times(settings,segment)
+    num_gm_mic           = len(microphone_locations)  
+    RML,PHI,THETA        = relative_microphone_locations(settings,microphone_locations[None,:,:],noise_pos[:,None,:])
+    
+    return noise_time,noise_pos,RML,PHI,THETA,num_gm_mic 
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ---------------------------------------------------------------------------------------------------------------------- 
+def compute_noise_evaluation_times(settings,segment):
+    """ Rediscretizes the time and aircraft position of a segment to get finer resolution """
     N                 = settings.noise_times_steps
     pos               = segment.state.conditions.frames.inertial.position_vector
-    
-    # rediscretize time and aircraft position to get finer resolution 
     time              = segment.state.conditions.frames.inertial.time[:,0]
     noise_time        = np.linspace(time[0], time[-1], N) 
     noise_pos         = np.zeros((N,3)) 
     noise_pos[:,0]    = np.interp(noise_time,time,pos[:,0])
     noise_pos[:,1]    = np.interp(noise_time,time,pos[:,1])
     noise_pos[:,2]    = np.interp(noise_time,time,pos[:,2])
-    
-    num_gm_mic        = len(microphone_locations)  
-    RML               = np.zeros((N,num_gm_mic,3)) 
-    PHI               = np.zeros((N,num_gm_mic))
-    THETA             = np.zeros((N,num_gm_mic)) 
-    
-    for cpt in range(N):  
-        relative_locations         = np.zeros((num_gm_mic,3))
-        relative_locations[:,0]    = microphone_locations[:,0] - (settings.aircraft_origin_location[0] + noise_pos[cpt,0])    
-        relative_locations[:,1]    = microphone_locations[:,1] - (settings.aircraft_origin_location[1] + noise_pos[cpt,1]) 
-        if MSL_altitude:
-            relative_locations[:,2]    = -(noise_pos[cpt,2])  - microphone_locations[:,2] 
-        else:
-            relative_locations[:,2]    = -(noise_pos[cpt,2])
-            
-        RML[cpt,:,:]   = relative_locations 
-        PHI[cpt,:]     =  np.arctan2(np.sqrt(np.square(relative_locations[:, 0]) + np.square(relative_locations[:, 1])),  relative_locations[:, 2])  
-        THETA[cpt,:]   =  np.arctan2(relative_locations[:, 1], relative_locations[:, 0]) 
-    
-    return noise_time,noise_pos,RML,PHI,THETA,num_gm_mic 
- 
\ No newline at end of file
+    return noise_time,noise_pos
+
+def relative_microphone_locations(settings,microphone_locations,noise_pos):
+    """ Computes the vectors from the microphones to the aircraft and their angles, broadcasting the microphone
+    locations (...,3) against the aircraft positions (...,3) """
+    shape                      = np.broadcast_shapes(microphone_locations.shape,noise_pos.shape)
+    relative_locations         = np.zeros(shape)
+    relative_locations[...,0]  = microphone_locations[...,0] - (settings.aircraft_origin_location[0] + noise_pos[...,0])    
+    relative_locations[...,1]  = microphone_locations[...,1] - (settings.aircraft_origin_location[1] + noise_pos[...,1]) 
+    if settings.mean_sea_level_altitude:
+        relative_locations[...,2]  = -(noise_pos[...,2])  - microphone_locations[...,2] 
+    else:
+        relative_locations[...,2]  = -(noise_pos[...,2])
+    PHI   = np.arctan2(np.sqrt(np.square(relative_locations[...,0]) + np.square(relative_locations[...,1])),  relative_locations[...,2])  
+    THETA = np.arctan2(relative_locations[...,1], relative_locations[...,0]) 
+    return relative_locations,PHI,THETA
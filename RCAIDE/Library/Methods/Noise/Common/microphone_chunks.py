@@ -0,0 +1,39 @@
+# RCAIDE/Methods/Noise/Common/microphone_chunks.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# Python package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Microphone Chunks
+# ----------------------------------------------------------------------------------------------------------------------
+def microphone_chunks(num_mic,bytes_per_microphone,memory_budget):
+    """This splits the microphones into consecutive chunks whose working arrays fit in a memory budget
+
+    Assumptions:
+        The memory used by a chunk is proportional to its number of microphones
+
+    Source:
+        None
+
+    Inputs:
+        num_mic                - number of microphones                                    [unitless]
+        bytes_per_microphone   - memory used per microphone                               [bytes]
+        memory_budget          - memory available to a chunk, None for a single chunk     [bytes]
+
+    Outputs:
+        chunks                 - slices of the microphones of each chunk                  [unitless]
+
+    Properties Used:
+        N/A
+    """
+    if memory_budget is None:
+        chunk_size = max(num_mic,1)
+    else:
+        chunk_size = int(max(memory_budget // max(bytes_per_microphone,1),1))
+    return [slice(start,min(start + chunk_size,num_mic)) for start in range(0,num_mic,chunk_size)]
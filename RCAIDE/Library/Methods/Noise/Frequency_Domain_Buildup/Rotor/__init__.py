@@ -1,20 +1,22 @@
-# RCAIDE/Methods/Noise/Frequency_Domain_Buildup/Rotor/__init__.py
-# 
-
-""" RCAIDE Package Setup
-"""
-
-# ----------------------------------------------------------------------------------------------------------------------
-#  IMPORT
-# ----------------------------------------------------------------------------------------------------------------------
-  
-from .compute_rotor_noise           import compute_rotor_noise 
-from .broadband_noise               import broadband_noise
-from .harmonic_noise_line           import harmonic_noise_line
-from .harmonic_noise_plane          import harmonic_noise_plane
-from .harmonic_noise_point          import harmonic_noise_point          
-from .BPM_boundary_layer_properties import BPM_boundary_layer_properties 
-from .LBL_VS_broadband_noise        import LBL_VS_broadband_noise       
-from .TBL_TE_broadband_noise        import TBL_TE_broadband_noise       
-from .TIP_broadband_noise           import TIP_broadband_noise          
+# RCAIDE/Methods/Noise/Frequency_Domain_Buildup/Rotor/__init__.py
+# 
+
+""" RCAIDE Package Setup
+"""
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+  
+from .compute_rotor_noise           import compute_rotor_noise, prepare_rotor_noise, compute_rotor_noise_control_points
+from .compute_rotor_noise_tasks     import compute_rotor_noise_tasks
+from .compute_rotor_blade_loading   import compute_rotor_blade_loading, clear_blade_loading_cache, blade_loading_cache_statistics
+from .broadband_noise               import broadband_noise
+from .harmonic_noise_line           import harmonic_noise_line
+from .harmonic_noise_plane          import harmonic_noise_plane
+from .harmonic_noise_point          import harmonic_noise_point          
+from .BPM_boundary_layer_properties import BPM_boundary_layer_properties 
+from .LBL_VS_broadband_noise        import LBL_VS_broadband_noise       
+from .TBL_TE_broadband_noise        import TBL_TE_broadband_noise       
+from .TIP_broadband_noise           import TIP_broadband_noise          
 from .noise_directivities           import noise_directivities          
\ No newline at end of file
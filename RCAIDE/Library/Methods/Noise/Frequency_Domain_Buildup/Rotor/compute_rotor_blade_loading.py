@@ -0,0 +1,241 @@
+# RCAIDE/Methods/Noise/Frequency_Domain_Buildup/Rotor/compute_rotor_blade_loading.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE Imports
+from RCAIDE.Framework.Core                                                   import Data, interp2d
+from RCAIDE.Library.Methods.Geometry.Airfoil.import_airfoil_geometry         import import_airfoil_geometry
+from RCAIDE.Library.Methods.Geometry.Airfoil.airfoil_database                import compute_airfoil_properties_hash
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis import airfoil_analysis
+
+# Python package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Cache state
+# ----------------------------------------------------------------------------------------------------------------------
+# blade loading computed by the panel method in the current process, per airfoil, least recently used first
+blade_loading_cache                 = Data()
+blade_loading_cache.entries         = Data()
+blade_loading_cache.maximum_entries = 16
+blade_loading_cache.hits            = 0
+blade_loading_cache.misses          = 0
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_rotor_blade_loading
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_rotor_blade_loading(rotor,aeroacoustic_data,settings):
+    ''' Computes the chordwise lift and drag distributions, the lift and drag coefficients and the surfaces of the
+    blade sections of a rotor at every control point and azimuthal station of a segment, for the plane source
+    harmonic noise. The airfoils are evaluated for all control points in one batch, either from the surrogates of
+    the airfoil polars or with the panel method. Panel method results are kept per airfoil, angle of attack and
+    Reynolds number so that repeated sections, identical rotors and later segments reuse them.
+
+    Assumptions:
+    The blade loading of a section only depends on its airfoil geometry, angle of attack and Reynolds number
+
+    Source:
+    None
+
+    Inputs:
+        rotor                                  - rotor data structure                                   [None]
+        aeroacoustic_data                      - rotor operating conditions of the segment              [None]
+        settings.use_plane_loading_surrogate   - evaluates the surrogates of the airfoil polars         [boolean]
+        settings.share_blade_loading           - reuses the panel method results of the process         [boolean]
+
+    Outputs:
+        aeroacoustic_data.
+            disc_lift_distribution             - chordwise lift distribution                            [unitless]
+            disc_drag_distribution             - chordwise drag distribution                            [unitless]
+            disc_lift_coefficient              - section lift coefficient                               [unitless]
+            disc_drag_coefficient              - section drag coefficient                               [unitless]
+            blade_upper_surface                - upper surface of the section airfoils                  [unitless]
+            blade_lower_surface                - lower surface of the section airfoils                  [unitless]
+
+    Properties Used:
+        N/A
+    '''
+    Re          = aeroacoustic_data.disc_reynolds_number
+    AOA_sec     = aeroacoustic_data.disc_effective_angle_of_attack
+    a_loc       = np.array(rotor.airfoil_polar_stations)
+    num_cpt     = len(Re)
+    num_az      = aeroacoustic_data.number_azimuthal_stations
+    airfoils    = rotor.airfoils
+    for jj,airfoil in enumerate(airfoils):
+        airfoil_points      = airfoil.number_of_points
+    chord_coord             = int(np.floor(airfoil_points/2))
+
+    # Lift and Drag - coefficients and distributions
+    fL      = np.zeros(np.shape(Re) + (chord_coord,))
+    fD      = np.zeros_like(fL)
+    CL      = np.zeros_like(Re)
+    CD      = np.zeros_like(Re)
+    y_up    = np.zeros_like(fL)
+    y_low   = np.zeros_like(fL)
+
+    for jj,airfoil in enumerate(airfoils):
+        locs                  = np.where(a_loc == jj)[0]
+        num_locs              = len(locs)
+        alpha_azi             = np.atleast_2d(AOA_sec[:,locs,:].flatten())
+        Re_azi                = np.atleast_2d(Re[:,locs,:].flatten())
+        if settings.use_plane_loading_surrogate:
+            pd                    = airfoil.polars
+            fL[:,locs,:,:]        = pd.lift_distribution_func((alpha_azi,Re_azi)).reshape(num_cpt,num_locs,num_az,chord_coord)
+            fD[:,locs,:,:]        = pd.drag_distribution_func((alpha_azi,Re_azi)).reshape(num_cpt,num_locs,num_az,chord_coord)
+            cl_invisc             = interp2d(Re_azi,alpha_azi,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
+            cd_visc               = interp2d(Re_azi,alpha_azi,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
+            CL[:,locs,:]          = cl_invisc.reshape(num_cpt,num_locs,num_az)
+            CD[:,locs,:]          = cd_visc.reshape(num_cpt,num_locs,num_az)
+        else:
+            airfoil_geometry      = import_airfoil_geometry(airfoil.coordinate_file,airfoil_points)
+            fL_azi,fD_azi,cl_azi,cd_azi = airfoil_blade_loading(airfoil_geometry,alpha_azi[0],Re_azi[0],settings.share_blade_loading)
+            fL[:,locs,:,:]        = fL_azi.reshape(num_cpt,num_locs,num_az,chord_coord)
+            fD[:,locs,:,:]        = fD_azi.reshape(num_cpt,num_locs,num_az,chord_coord)
+            CL[:,locs,:]          = cl_azi.reshape(num_cpt,num_locs,num_az)
+            CD[:,locs,:]          = cd_azi.reshape(num_cpt,num_locs,num_az)
+
+        y_up[:,locs,:,:]      = airfoil.geometry.y_upper_surface
+        y_low[:,locs,:,:]     = airfoil.geometry.y_lower_surface
+
+    aeroacoustic_data.disc_lift_distribution = fL
+    aeroacoustic_data.disc_drag_distribution = fD
+    aeroacoustic_data.disc_lift_coefficient  = CL
+    aeroacoustic_data.disc_drag_coefficient  = CD
+    aeroacoustic_data.blade_upper_surface    = y_up
+    aeroacoustic_data.blade_lower_surface    = y_low
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  airfoil_blade_loading
+# ----------------------------------------------------------------------------------------------------------------------
+def airfoil_blade_loading(airfoil_geometry,alpha,Re,share_blade_loading = True):
+    ''' Computes the blade loading of an airfoil at a set of angles of attack and Reynolds numbers with the panel
+    method. Each distinct angle of attack and Reynolds number is computed once, and the results kept in the cache
+    of the airfoil are reused when share_blade_loading is set.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+        airfoil_geometry       - airfoil geometry                                       [None]
+        alpha                  - angles of attack (n)                                   [radians]
+        Re                     - Reynolds numbers (n)                                   [unitless]
+        share_blade_loading    - reuses the panel method results of the process         [boolean]
+
+    Outputs:
+        fL                     - chordwise lift distribution (n,chord_coord)            [unitless]
+        fD                     - chordwise drag distribution (n,chord_coord)            [unitless]
+        CL                     - inviscid lift coefficient (n)                          [unitless]
+        CD                     - viscous drag coefficient (n)                           [unitless]
+
+    Properties Used:
+        N/A
+    '''
+    pairs,inverse = np.unique(np.stack((alpha,Re),axis=1),axis=0,return_inverse=True)
+    inverse       = inverse.flatten()
+
+    entries = blade_loading_cache.entries
+    key     = compute_airfoil_properties_hash(airfoil_geometry)
+    if share_blade_loading and key in entries:
+        # move the entry to the end to mark it as most recently used
+        entry = entries.pop(key)
+    else:
+        entry       = Data()
+        entry.index = {}
+        entry.fL    = None
+
+    rows    = np.array([entry.index.get(pair,-1) for pair in map(tuple,pairs)],dtype=int)
+    missing = np.where(rows < 0)[0]
+    if len(missing) > 0:
+        airfoil_properties = airfoil_analysis(airfoil_geometry,np.atleast_2d(pairs[missing,0]),np.atleast_2d(pairs[missing,1]))
+        fL      = airfoil_properties.fL[:,:,0].T
+        fD      = airfoil_properties.fD[:,:,0].T
+        CL      = airfoil_properties.cl_invisc[0]
+        CD      = airfoil_properties.cd_visc[0]
+        start   = 0 if entry.fL is None else len(entry.CL)
+        if entry.fL is None:
+            entry.fL, entry.fD, entry.CL, entry.CD = fL, fD, CL, CD
+        else:
+            entry.fL = np.concatenate((entry.fL,fL))
+            entry.fD = np.concatenate((entry.fD,fD))
+            entry.CL = np.concatenate((entry.CL,CL))
+            entry.CD = np.concatenate((entry.CD,CD))
+        rows[missing] = start + np.arange(len(missing))
+        for pair,row in zip(map(tuple,pairs[missing]),rows[missing]):
+            entry.index[pair] = row
+
+    if share_blade_loading:
+        blade_loading_cache.hits   += len(pairs) - len(missing)
+        blade_loading_cache.misses += len(missing)
+        entries[key] = entry
+        while len(entries) > blade_loading_cache.maximum_entries:
+            del entries[next(iter(entries.keys()))]
+
+    rows = rows[inverse]
+    return entry.fL[rows], entry.fD[rows], entry.CL[rows], entry.CD[rows]
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  clear_blade_loading_cache
+# ----------------------------------------------------------------------------------------------------------------------
+def clear_blade_loading_cache():
+    ''' Removes the blade loading kept by the cache, which frees its memory.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    '''
+    blade_loading_cache.entries = Data()
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  blade_loading_cache_statistics
+# ----------------------------------------------------------------------------------------------------------------------
+def blade_loading_cache_statistics():
+    ''' Reports the content and activity of the blade loading cache of the current process.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    statistics.
+      entries          - number of airfoils in the cache                                     [unitless]
+      sections         - number of angles of attack and Reynolds numbers in the cache        [unitless]
+      maximum_entries  - number of airfoils kept                                             [unitless]
+      hits             - sections served from the cache                                      [unitless]
+      misses           - sections computed by the panel method                               [unitless]
+
+    Properties Used:
+    N/A
+    '''
+    statistics                 = Data()
+    statistics.entries         = len(blade_loading_cache.entries)
+    statistics.sections        = sum(len(entry.index) for entry in blade_loading_cache.entries.values())
+    statistics.maximum_entries = blade_loading_cache.maximum_entries
+    statistics.hits            = blade_loading_cache.hits
+    statistics.misses          = blade_loading_cache.misses
+    return statistics
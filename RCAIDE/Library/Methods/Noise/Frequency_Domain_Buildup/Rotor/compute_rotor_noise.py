@@ -17,12 +17,10 @@ from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor.harmonic_noise_
 from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor.broadband_noise           import broadband_noise
 from RCAIDE.Library.Methods.Noise.Common                                                   import atmospheric_attenuation
 from RCAIDE.Library.Methods.Noise.Metrics.A_weighting_metric                               import A_weighting_metric  
-from RCAIDE.Library.Methods.Geometry.Airfoil.import_airfoil_geometry                       import import_airfoil_geometry
-from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis             import airfoil_analysis
+from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor.compute_rotor_blade_loading import compute_rotor_blade_loading
 
 # Python package imports   
 import numpy as np    
-from RCAIDE.Framework.Core import interp2d 
 
 # ----------------------------------------------------------------------------------------------------------------------    
 #  Rotor Noise 
@@ -62,13 +60,91 @@ def compute_rotor_noise(microphone_locations,rotor,segment,settings, rotor_index
         N/A   
     '''
  
+    conditions = segment.state.conditions
+    prepare_rotor_noise(rotor,conditions,settings,rotor_index,previous_rotor_tag,identical_propulsors)
+    conditions.noise.converters[rotor.tag] = compute_rotor_noise_control_points(microphone_locations,rotor,conditions,settings)
+    return rotor.tag
+
+# ----------------------------------------------------------------------------------------------------------------------    
+#  Rotor Noise Preparation
+# ----------------------------------------------------------------------------------------------------------------------    
+def prepare_rotor_noise(rotor,conditions,settings, rotor_index = 0, previous_rotor_tag = None, identical_propulsors=True):
+    ''' Computes the quantities the noise of a rotor needs at every control point before the noise of the control 
+    points is evaluated, i.e. the blade loading of the harmonic noise with planar load distribution 
+        
+    Assumptions:
+    None
+
+    Source:
+    None
+    
+    Inputs:
+        rotor                   - rotor data structure                                [None]
+        conditions              - flight segment conditions                           [None] 
+        settings                - accoustic settings                                  [None]
+        rotor_index             - index of the rotor in the vehicle                   [unitless]
+        previous_rotor_tag      - tag of the previous rotor                           [unitless]
+        identical_propulsors    - flag of networks with identical propulsors          [boolean]
+                               
+    Outputs:
+        conditions.energy.converters[rotor.tag]. 
+            disc_lift_distribution, disc_drag_distribution, disc_lift_coefficient, 
+            disc_drag_coefficient, blade_upper_surface, blade_lower_surface           [unitless]
+     
+    Properties Used:
+        N/A   
+    '''
+    # blade loading of every control point for the harmonic noise with planar load distribution
+    if settings.fidelity == 'plane_source': 
+        aeroacoustic_data = conditions.energy.converters[rotor.tag]       
+        if (identical_propulsors == False) and rotor_index !=0: 
+            prev_aeroacoustic_data                   = conditions.energy.converters[previous_rotor_tag]                 
+            prev_aeroacoustic_data                   = conditions.energy.converters[rotor.tag]  
+            aeroacoustic_data.disc_lift_distribution = prev_aeroacoustic_data.disc_lift_distribution
+            aeroacoustic_data.disc_drag_distribution = prev_aeroacoustic_data.disc_lift_distribution
+            aeroacoustic_data.disc_lift_coefficient  = prev_aeroacoustic_data.disc_lift_coefficient 
+            aeroacoustic_data.disc_drag_coefficient  = prev_aeroacoustic_data.disc_drag_coefficient  
+            aeroacoustic_data.blade_upper_surface    = prev_aeroacoustic_data.blade_upper_surface
+            aeroacoustic_data.blade_lower_surface    = prev_aeroacoustic_data.blade_lower_surface
+        else: 
+            compute_rotor_blade_loading(rotor,aeroacoustic_data,settings)
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------    
+#  Rotor Noise of Control Points
+# ----------------------------------------------------------------------------------------------------------------------    
+def compute_rotor_noise_control_points(microphone_locations,rotor,conditions,settings,control_points = None):
+    ''' Computes the noise of a rotor at a set of control points of a segment. The control points are independent,
+    so sets of control points can be evaluated concurrently once prepare_rotor_noise has run.
+        
+    Assumptions:
+    Only reads the conditions
+
+    Source:
+    None
+    
+    Inputs:
+        microphone_locations    - microphone locations                                [m]
+        rotor                   - rotor data structure                                [None]
+        conditions              - flight segment conditions                           [None] 
+        settings                - accoustic settings                                  [None]
+        control_points          - indices of the control points, None for all         [unitless]
+                               
+    Outputs:
+        Results                 - acoustic data of the control points, see compute_rotor_noise [None]
+     
+    Properties Used:
+        N/A   
+    '''
+ 
     # unpack 
-    conditions           = segment.state.conditions
     harmonics_blade      = settings.harmonics
     harmonics_load       = np.linspace(0,5,6).astype(int)  
     num_mic              = len(microphone_locations[:,0]) 
-    num_cpt              = conditions._size
     num_f                = len(settings.center_frequencies)
+    if control_points is None:
+        control_points   = np.arange(conditions._size)
+    num_cpt              = len(control_points)
       
     # create data structures for computation
     Noise   = Data()  
@@ -93,71 +169,12 @@ def compute_rotor_noise(microphone_locations,rotor,segment,settings, rotor_index
     # compute position vector from point source (or should it be origin) at rotor hub to microphones 
     coordinates   = compute_rotor_point_source_coordinates(rotor,conditions,microphone_locations,settings)        
 
-    for cpt in range(num_cpt): 
+    for row,cpt in enumerate(control_points): 
         # ----------------------------------------------------------------------------------
         # Harmonic Noise
         # ---------------------------------------------------------------------------------- 
         # harmonic noise with planar load distribution
         if settings.fidelity == 'plane_source': 
-            aeroacoustic_data = segment.state.conditions.energy.converters[rotor.tag]       
-            Re                = aeroacoustic_data.disc_reynolds_number
-            AOA_sec           = aeroacoustic_data.disc_effective_angle_of_attack  
-            a_loc             = rotor.airfoil_polar_stations
-            num_az            = aeroacoustic_data.number_azimuthal_stations     
-            airfoils          = rotor.airfoils         
-            for jj,airfoil in enumerate(airfoils):
-                airfoil_points      = airfoil.number_of_points 
-            chord_coord             = int(np.floor(airfoil_points/2))       
-                
-            if (identical_propulsors == False) and rotor_index !=0: 
-                prev_aeroacoustic_data                   = segment.state.conditions.energy.converters[previous_rotor_tag]                 
-                prev_aeroacoustic_data                   = segment.state.conditions.energy.converters[rotor.tag]  
-                aeroacoustic_data.disc_lift_distribution = prev_aeroacoustic_data.disc_lift_distribution
-                aeroacoustic_data.disc_drag_distribution = prev_aeroacoustic_data.disc_lift_distribution
-                aeroacoustic_data.disc_lift_coefficient  = prev_aeroacoustic_data.disc_lift_coefficient 
-                aeroacoustic_data.disc_drag_coefficient  = prev_aeroacoustic_data.disc_drag_coefficient  
-                aeroacoustic_data.blade_upper_surface    = prev_aeroacoustic_data.blade_upper_surface
-                aeroacoustic_data.blade_lower_surface    = prev_aeroacoustic_data.blade_lower_surface
-            else: 
-                # Lift and Drag - coefficients and distributions 
-                fL      = np.tile(np.zeros_like(Re)[:,:,:,None],(1,1,1,chord_coord))
-                fD      = np.zeros_like(fL)
-                CL      = np.zeros_like(Re)
-                CD      = np.zeros_like(Re) 
-                y_up    = np.zeros_like(fL)
-                y_low   = np.zeros_like(fL)
-                                  
-                for jj,airfoil in enumerate(airfoils):    
-                    locs                  = np.where(np.array(a_loc) == jj ) 
-                    alpha_azi             = np.atleast_2d(AOA_sec[cpt,locs,:].flatten())
-                    Re_azi                = np.atleast_2d(Re[cpt,locs,:].flatten())      
-                    pd                    = airfoil.polars 
-                    if settings.use_plane_loading_surrogate: 
-                        fL[cpt,locs,:,:]      = pd.lift_distribution_func((alpha_azi,Re_azi)).reshape(1,len(a_loc), num_az,chord_coord) 
-                        fD[cpt,locs,:,:]      = pd.drag_distribution_func((alpha_azi,Re_azi)).reshape(1,len(a_loc), num_az,chord_coord)  
-                        cl_invisc             = interp2d(Re_azi,alpha_azi,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
-                        cd_visc               = interp2d(Re_azi,alpha_azi,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)   
-                        CL[cpt,locs,:]        = cl_invisc.reshape(1, len(a_loc), num_az) 
-                        CD[cpt,locs,:]        = cd_visc.reshape(1, len(a_loc), num_az)                             
-                    
-                    else : 
-                        airfoil_geometry      = import_airfoil_geometry(airfoil.coordinate_file,airfoil_points)
-                        airfoil_properties    = airfoil_analysis(airfoil_geometry,alpha_azi,Re_azi)
-                        fL[cpt,locs,:,:]      = airfoil_properties.fL.reshape(chord_coord, len(a_loc), num_az,1).swapaxes(0, 3)
-                        fD[cpt,locs,:,:]      = airfoil_properties.fD.reshape(chord_coord, len(a_loc), num_az,1).swapaxes(0, 3)
-                        CL[cpt,locs,:]        = airfoil_properties.cl_invisc.reshape(1, len(a_loc), num_az) 
-                        CD[cpt,locs,:]        = airfoil_properties.cd_visc.reshape(1, len(a_loc), num_az) 
-                        
-                    y_up[cpt,locs,:,:]    = airfoil.geometry.y_upper_surface
-                    y_low[cpt,locs,:,:]   = airfoil.geometry.y_lower_surface
-                        
-                aeroacoustic_data.disc_lift_distribution = fL
-                aeroacoustic_data.disc_drag_distribution = fD
-                aeroacoustic_data.disc_lift_coefficient  = CL
-                aeroacoustic_data.disc_drag_coefficient  = CD 
-                aeroacoustic_data.blade_upper_surface    = y_up
-                aeroacoustic_data.blade_lower_surface    = y_low                        
-                        
             harmonic_noise_plane(harmonics_blade,harmonics_load,conditions,coordinates,rotor,settings,Noise,cpt)
         elif settings.fidelity == 'line_source': 
             harmonic_noise_line(harmonics_blade,harmonics_load,conditions,coordinates,rotor,settings,Noise,cpt)
@@ -184,24 +201,22 @@ def compute_rotor_noise(microphone_locations,rotor,segment,settings, rotor_index
         # ----------------------------------------------------------------------------------
         # Summation of spectra from propellers into one SPL and store results
         # ----------------------------------------------------------------------------------
-        Results.SPL[cpt,:]                                 = SPL_arithmetic(SPL_total_1_3_spectrum[0], sum_axis=1) 
-        Results.SPL_dBA[cpt,:]                             = SPL_arithmetic(A_weighting_metric(SPL_total_1_3_spectrum[0],settings.center_frequencies), sum_axis=1) 
-        Results.SPL_harmonic[cpt,:]                        = SPL_arithmetic(Noise.SPL_prop_harmonic_1_3_spectrum[0], sum_axis=1)
-        Results.SPL_broadband[cpt,:]                       = SPL_arithmetic(Noise.SPL_prop_broadband_1_3_spectrum[0], sum_axis=1) 
+        Results.SPL[row,:]                                 = SPL_arithmetic(SPL_total_1_3_spectrum[0], sum_axis=1) 
+        Results.SPL_dBA[row,:]                             = SPL_arithmetic(A_weighting_metric(SPL_total_1_3_spectrum[0],settings.center_frequencies), sum_axis=1) 
+        Results.SPL_harmonic[row,:]                        = SPL_arithmetic(Noise.SPL_prop_harmonic_1_3_spectrum[0], sum_axis=1)
+        Results.SPL_broadband[row,:]                       = SPL_arithmetic(Noise.SPL_prop_broadband_1_3_spectrum[0], sum_axis=1) 
           
         # blade passing frequency   
         Results.blade_passing_frequencies                  = Noise.f          
-        Results.SPL_harmonic_bpf_spectrum[cpt,:,:]         = Noise.SPL_prop_harmonic_bpf_spectrum 
-        Results.SPL_harmonic_bpf_spectrum_dBA[cpt,:,:]     = A_weighting_metric(Results.SPL_harmonic_bpf_spectrum[cpt,:,:],Noise.f) 
+        Results.SPL_harmonic_bpf_spectrum[row,:,:]         = Noise.SPL_prop_harmonic_bpf_spectrum 
+        Results.SPL_harmonic_bpf_spectrum_dBA[row,:,:]     = A_weighting_metric(Results.SPL_harmonic_bpf_spectrum[row,:,:],Noise.f) 
           
         # 1/3 octave band   
-        Results.SPL_1_3_spectrum[cpt,:,:]                  = SPL_total_1_3_spectrum 
-        Results.SPL_1_3_spectrum_dBA[cpt,:,:]              = A_weighting_metric(Results.SPL_1_3_spectrum[cpt,:,:],settings.center_frequencies)      
-        Results.SPL_harmonic_1_3_spectrum[cpt,:,:]         = Noise.SPL_prop_harmonic_1_3_spectrum 
-        Results.SPL_harmonic_1_3_spectrum_dBA[cpt,:,:]     = A_weighting_metric(Results.SPL_harmonic_1_3_spectrum[cpt,:,:],settings.center_frequencies) 
-        Results.SPL_broadband_1_3_spectrum[cpt,:,:]        = Noise.SPL_prop_broadband_1_3_spectrum 
-        Results.SPL_broadband_1_3_spectrum_dBA[cpt,:,:]    = A_weighting_metric(Results.SPL_broadband_1_3_spectrum[cpt,:,:],settings.center_frequencies) 
+        Results.SPL_1_3_spectrum[row,:,:]                  = SPL_total_1_3_spectrum 
+        Results.SPL_1_3_spectrum_dBA[row,:,:]              = A_weighting_metric(Results.SPL_1_3_spectrum[row,:,:],settings.center_frequencies)      
+        Results.SPL_harmonic_1_3_spectrum[row,:,:]         = Noise.SPL_prop_harmonic_1_3_spectrum 
+        Results.SPL_harmonic_1_3_spectrum_dBA[row,:,:]     = A_weighting_metric(Results.SPL_harmonic_1_3_spectrum[row,:,:],settings.center_frequencies) 
+        Results.SPL_broadband_1_3_spectrum[row,:,:]        = Noise.SPL_prop_broadband_1_3_spectrum 
+        Results.SPL_broadband_1_3_spectrum_dBA[row,:,:]    = A_weighting_metric(Results.SPL_broadband_1_3_spectrum[row,:,:],settings.center_frequencies) 
     
-    # A-weighted
-    conditions.noise.converters[rotor.tag] = Results 
-    return rotor.tag 
+    return Results 
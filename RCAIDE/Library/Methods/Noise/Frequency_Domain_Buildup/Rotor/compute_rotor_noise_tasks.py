@@ -0,0 +1,97 @@
+# RCAIDE/Methods/Noise/Frequency_Domain_Buildup/Rotor/compute_rotor_noise_tasks.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE Imports
+from RCAIDE.Framework.Core                                                        import Data
+from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor.compute_rotor_noise import compute_rotor_noise_control_points
+
+# Python package imports
+import numpy as np
+import warnings
+from concurrent.futures         import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools                  import repeat
+from pickle                     import PicklingError
+
+# acoustic data that does not vary with the control point
+control_point_independent_results = ['blade_passing_frequencies','one_third_frequency_spectrum']
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_rotor_noise_tasks
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_rotor_noise_tasks(microphone_locations,rotors,conditions,settings):
+    ''' Computes the noise of a set of rotors at every control point of a segment. Each rotor and block of control
+    points is an independent task. The tasks run in a pool of settings.number_of_noise_workers threads or processes
+    when it is more than one, and serially otherwise. The results are assembled in the order of the rotors and
+    control points, so they do not depend on the pool or on the order in which the tasks finish.
+
+    Assumptions:
+    prepare_rotor_noise has run for every rotor. If the process pool cannot be started the tasks run serially.
+
+    Source:
+    None
+
+    Inputs:
+        microphone_locations             - microphone locations                                   [m]
+        rotors                           - list of rotors                                         [None]
+        conditions                       - flight segment conditions                              [None]
+        settings.number_of_noise_workers - number of threads or processes                         [unitless]
+        settings.noise_executor          - 'thread' or 'process' pool                             [unitless]
+
+    Outputs:
+        rotor_results                    - acoustic data of each rotor, see compute_rotor_noise   [None]
+
+    Properties Used:
+        N/A
+    '''
+    num_cpt    = conditions._size
+    workers    = settings.number_of_noise_workers
+
+    # split the control points of each rotor so that the pool has at least one task per worker
+    num_blocks = int(min(max(np.ceil(workers/max(len(rotors),1)),1),num_cpt))
+    blocks     = np.array_split(np.arange(num_cpt),num_blocks)
+    tasks      = [(rotor,block) for rotor in rotors for block in blocks]
+
+    workers = min(workers,len(tasks))
+    outputs = None
+    if workers > 1:
+        if settings.noise_executor == 'process':
+            Executor = ProcessPoolExecutor
+        elif settings.noise_executor == 'thread':
+            Executor = ThreadPoolExecutor
+        else:
+            raise ValueError("noise_executor must be 'thread' or 'process', not " + str(settings.noise_executor))
+        try:
+            with Executor(max_workers=workers) as executor:
+                outputs = list(executor.map(compute_rotor_noise_control_points,repeat(microphone_locations),
+                                            [task[0] for task in tasks],repeat(conditions),repeat(settings),
+                                            [task[1] for task in tasks]))
+        except (OSError,PicklingError,BrokenProcessPool) as error:
+            warnings.warn('Rotor noise tasks run serially, the process pool failed: ' + str(error),RuntimeWarning)
+            outputs = None
+    if outputs is None:
+        outputs = [compute_rotor_noise_control_points(microphone_locations,rotor,conditions,settings,block) for rotor,block in tasks]
+
+    rotor_results = []
+    for i in range(len(rotors)):
+        rotor_results.append(merge_control_point_results(outputs[i*num_blocks:(i+1)*num_blocks]))
+    return rotor_results
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def merge_control_point_results(block_results):
+    """ Joins the acoustic data of consecutive blocks of control points of a rotor """
+    Results = Data()
+    for name in block_results[-1].keys():
+        if name in control_point_independent_results:
+            Results[name] = block_results[-1][name]
+        else:
+            Results[name] = np.concatenate([block[name] for block in block_results],axis=0)
+    return Results
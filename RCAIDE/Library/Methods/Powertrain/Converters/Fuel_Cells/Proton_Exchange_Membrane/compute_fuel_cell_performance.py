@@ -5,8 +5,23 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Framework.Core import Data
+
+# package imports 
 import  numpy as  np
-from scipy.optimize import minimize_scalar
+from scipy.optimize import minimize_scalar, brentq
+import  hashlib
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Polarization Curve Cache
+# ----------------------------------------------------------------------------------------------------------------------
+# net power of the cells on a table of current densities, per stack state  
+polarization_curve_cache                 = Data()
+polarization_curve_cache.enabled         = False  # flag to reuse the tables of previously evaluated stack states
+polarization_curve_cache.maximum_entries = 10000  # number of tables kept before the cache is cleared 
+polarization_curve_cache.entries         = Data()
+polarization_curve_cache.hits            = 0
+polarization_curve_cache.misses          = 0
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Model to Compute Fuel Cell Performance
@@ -40,8 +55,8 @@ def compute_fuel_cell_performance(fuel_cell_stack, state, bus, coolant_lines, t_
     Notes
     -----
     This function implements a detailed electrochemical model for PEM fuel cells that accounts
-    for activation losses, ohmic losses, and concentration losses. It iteratively determines
-    the current density required to match the power demand from the electric bus.
+    for activation losses, ohmic losses, and concentration losses. The current density required
+    to match the power demand from the electric bus is found by compute_fuel_cell_current_density.
     
     The function also models the compressor-expander module (CEM) that supplies air to the
     fuel cell, accounting for parasitic power losses.
@@ -121,14 +136,9 @@ def compute_fuel_cell_performance(fuel_cell_stack, state, bus, coolant_lines, t_
     fuel_cell_stack_conditions.fuel_cell.stagnation_temperature[t_idx] = stagnation_temperature[t_idx]
     fuel_cell_stack_conditions.fuel_cell.stagnation_pressure[t_idx]    = stagnation_pressure[t_idx]
     
-    i      = 1
-    diff_P =  10
-    alpha  =  0.05
-    while  abs(diff_P) > 1E-8: 
-        fuel_cell_stack_conditions.fuel_cell.current_density[t_idx] = i
-        m_dot_H2, V_fuel_cell, P_fuel_cell, gross_power, gross_heat, compressor_power, mdot_air_in, mdot_air_out, expander_power =  evaluate_PEM(fuel_cell_stack,fuel_cell_stack_conditions, t_idx) 
-        diff_P =  P_cell - P_fuel_cell
-        i += diff_P*alpha
+    # current density at which the net power of the cell meets the demand 
+    fuel_cell_stack_conditions.fuel_cell.current_density[t_idx] = compute_fuel_cell_current_density(fuel_cell_stack,fuel_cell_stack_conditions,t_idx,P_cell[0])
+    m_dot_H2, V_fuel_cell, P_fuel_cell, gross_power, gross_heat, compressor_power, mdot_air_in, mdot_air_out, expander_power =  evaluate_PEM(fuel_cell_stack,fuel_cell_stack_conditions, t_idx) 
         
     # ---------------------------------------------------------------------------------------------------     
     # Future State 
@@ -164,6 +174,251 @@ def compute_fuel_cell_performance(fuel_cell_stack, state, bus, coolant_lines, t_
 
     return  stored_results_flag, stored_fuel_cell_stack_tag
 
+def compute_fuel_cell_current_density(fuel_cell_stack, fuel_cell_conditions, t_idx, P_cell):
+    """
+    Computes the current density at which the net power of a PEM fuel cell meets a power demand.
+    
+    Parameters
+    ----------
+    fuel_cell_stack : RCAIDE.Components.Energy.Converters.Fuel_Cell_Stack
+        The fuel cell stack object containing cell properties and configuration
+    fuel_cell_conditions : Data
+        Conditions of the fuel cell stack, the stack temperature, degradation and stagnation
+        conditions at t_idx are used
+    t_idx : int
+        Current time index in the simulation
+    P_cell : float
+        Net power demanded from one cell [W]
+         
+    Returns
+    -------
+    i : float
+        Current density of the cell [A/cm^2]
+    
+    Notes
+    -----
+    The net power of the cell is first evaluated on a table of current densities between zero and
+    the limiting current density, see compute_polarization_curve. The first interval of the table
+    in which the net power reaches the demand brackets the operating point on the rising side of the
+    polarization curve, which is then found with Brent's method. The number of evaluations of the cell
+    model is bounded and does not depend on the magnitude of the demand.
+    
+    **Major Assumptions**
+        * A demand above the maximum net power of the cell is handled by compute_overloaded_current_density
+        * A demand that is met at a billionth of the smallest current density of the table returns that current density
+        * A stack state at which the net power is not defined returns 1 A/cm^2
+    
+    See Also
+    --------
+    RCAIDE.Library.Methods.Powertrain.Converters.Fuel_Cells.Proton_Exchange_Membrane.compute_polarization_curve
+    RCAIDE.Library.Methods.Powertrain.Converters.Fuel_Cells.Proton_Exchange_Membrane.compute_overloaded_current_density
+    """
+    i_table, P_table = compute_polarization_curve(fuel_cell_stack, fuel_cell_conditions, t_idx)
+    stack_state      = polarization_curve_state(fuel_cell_conditions, t_idx)
+    net_power        = lambda i: compute_fuel_cell_net_power(fuel_cell_stack, i, *stack_state) - P_cell
+    
+    # the cell model is not defined at the stack state, e.g. the vapour pressure exceeds the air pressure 
+    if np.all(np.isnan(P_table)):
+        return 1.
+    
+    # maximum net power of the cell, refined between the neighbours of the largest entry of the table  
+    k_max = np.nanargmax(P_table)
+    if not P_cell < P_table[k_max]: 
+        i_lower = i_table[k_max-1] if k_max > 0 else 0.
+        i_upper = i_table[k_max+1] if k_max < len(i_table)-1 else i_table[-1]
+        res     = minimize_scalar(lambda i: -net_power(i), bounds = (i_lower, i_upper), method = 'bounded', options = {'xatol': 1E-12})
+        if res.fun >= 0 or res.x <= i_table[0]: 
+            return compute_overloaded_current_density(net_power, res.x)
+        i_lower = i_table[k_max] if res.x > i_table[k_max] else i_table[k_max-1]
+        i_upper = res.x
+    else:
+        # first entry of the table above the demand, on the rising side of the curve
+        k = np.argmax(P_table[:k_max+1] > P_cell)
+        if k == 0:
+            i_lower = 1E-9 * i_table[0]
+            if not net_power(i_lower) < 0:
+                return i_lower
+        else:
+            i_lower = i_table[k-1]
+        i_upper = i_table[k]
+    return brentq(net_power, i_lower, i_upper, xtol = 1E-15)
+
+def compute_overloaded_current_density(net_power, i_max, maximum_iterations = 1000):
+    """
+    Computes the current density of a PEM fuel cell whose power demand exceeds its maximum net power.
+    
+    Parameters
+    ----------
+    net_power : function
+        Difference between the net power of the cell at a current density and the demand [W]
+    i_max : float
+        Current density of the maximum net power of the cell [A/cm^2]
+    maximum_iterations : int
+        Number of fixed steps taken before the current density of the maximum net power is returned
+         
+    Returns
+    -------
+    i : float
+        Current density of the cell [A/cm^2]
+    
+    Notes
+    -----
+    No current density meets the demand. The fixed step update of the previous solver, starting
+    from 1 A/cm^2 with a step of 0.05 times the power deficit, is kept so that overloaded stacks
+    return the same operating point as before. The update leaves the polarization curve beyond
+    the limiting current density, where the net power is not defined, and stops after a few steps.
+    
+    **Major Assumptions**
+        * The current density of the maximum net power is returned if the update does not stop
+    """
+    i     = 1.
+    alpha = 0.05
+    for _ in range(maximum_iterations):
+        diff_P = -net_power(i)
+        if not abs(diff_P) > 1E-8:
+            return i
+        i += diff_P*alpha
+    return i_max
+
+def compute_polarization_curve(fuel_cell_stack, fuel_cell_conditions, t_idx, number_of_points = 32):
+    """
+    Computes the net power of a PEM fuel cell on a table of current densities at the stack state of a control point.
+    
+    Parameters
+    ----------
+    fuel_cell_stack : RCAIDE.Components.Energy.Converters.Fuel_Cell_Stack
+        The fuel cell stack object containing cell properties and configuration
+    fuel_cell_conditions : Data
+        Conditions of the fuel cell stack
+    t_idx : int
+        Current time index in the simulation
+    number_of_points : int
+        Number of current densities of the table
+         
+    Returns
+    -------
+    i_table : numpy.ndarray
+        Current densities, evenly spaced below the limiting current density [A/cm^2]
+    P_table : numpy.ndarray
+        Net power of the cell at the current densities [W]
+    
+    Notes
+    -----
+    The table is evaluated with one call of the cell model on all current densities. When
+    polarization_curve_cache.enabled is set, the tables are kept per stack state and fuel cell
+    properties and reused by later control points and mission iterations with the same state.
+    """
+    fuel_cell   = fuel_cell_stack.fuel_cell
+    stack_state = polarization_curve_state(fuel_cell_conditions, t_idx)
+    if polarization_curve_cache.enabled: 
+        key = polarization_curve_key(fuel_cell, stack_state, number_of_points)
+        if key in polarization_curve_cache.entries:
+            polarization_curve_cache.hits += 1
+            entry = polarization_curve_cache.entries[key]
+            return entry.current_density, entry.net_power
+        polarization_curve_cache.misses += 1
+        
+    # the limiting current density does not depend on the current density and the pressure drop 
+    stack_temperature = stack_state[0]
+    P_O2              = calculate_P_O2(fuel_cell_stack, fuel_cell.rated_air_pressure, stack_temperature, fuel_cell.oxygen_relative_humidity, fuel_cell.air_excess_ratio, 0, 0)
+    if fuel_cell.type == "LT":
+        i_lim = calculate_limiting_current_density_LT(fuel_cell_stack, stack_temperature, P_O2, fuel_cell.oxygen_relative_humidity, fuel_cell.air_excess_ratio, 0, 0)
+    elif fuel_cell.type == "HT":
+        i_lim = calculate_limiting_current_density_HT(fuel_cell_stack, stack_temperature, P_O2, fuel_cell.oxygen_relative_humidity, fuel_cell.air_excess_ratio, 0, 0)
+        
+    i_table = i_lim * np.arange(1, number_of_points + 1) / (number_of_points + 1)
+    P_table = compute_fuel_cell_net_power(fuel_cell_stack, i_table, *stack_state)
+    
+    if polarization_curve_cache.enabled: 
+        if len(polarization_curve_cache.entries) >= polarization_curve_cache.maximum_entries:
+            polarization_curve_cache.entries = Data()
+        entry                 = Data()
+        entry.current_density = i_table
+        entry.net_power       = P_table
+        polarization_curve_cache.entries[key] = entry 
+    return i_table, P_table
+
+def compute_fuel_cell_net_power(fuel_cell_stack, i, stack_temperature, degradation, Tt_in, Pt_in):
+    """
+    Computes the net power of a PEM fuel cell, see evaluate_PEM, without storing the conditions of the cell.
+    
+    Parameters
+    ----------
+    fuel_cell_stack : RCAIDE.Components.Energy.Converters.Fuel_Cell_Stack
+        The fuel cell stack object containing cell properties and configuration
+    i : float or numpy.ndarray
+        Current densities of the cell [A/cm^2]
+    stack_temperature : float
+        Temperature of the fuel cell [K]
+    degradation : float
+        The percent of maximumm degradation to evaluate divided by 100
+    Tt_in : float
+        Stagnation temperature of the air entering the compressor [K]
+    Pt_in : float
+        Stagnation pressure of the air entering the compressor
+         
+    Returns
+    -------
+    net_power : float or numpy.ndarray
+        Net power of the cell [W]
+    """
+    fuel_cell        = fuel_cell_stack.fuel_cell 
+    pressure_drop    = calculate_P_drop_stack(fuel_cell_stack,i)
+    if fuel_cell.type == "LT":
+        p_drop_hum   = calculate_P_drop_hum(fuel_cell_stack,i) 
+    else: 
+        p_drop_hum   = 0 
+    mdot_air_in      = i * fuel_cell.interface_area * fuel_cell.O2_molar_mass / (4 * fuel_cell.Faraday_constant * fuel_cell.O2_mass_frac) * fuel_cell.air_excess_ratio
+    voltage, _       = calculate_cell_voltage(i, fuel_cell_stack, stack_temperature, pressure_drop, degradation)
+    gross_power      = voltage * i * fuel_cell.interface_area
+    compressor_power = calculate_CEM_power(fuel_cell_stack, Tt_in, Pt_in, mdot_air_in, p_drop_hum, pressure_drop)[-1]
+    parasitic_power  = fuel_cell.gamma_para * gross_power
+    net_power        = gross_power - compressor_power - parasitic_power
+    return net_power
+
+def clear_polarization_curve_cache():
+    """
+    Removes the polarization curves kept by the cache of the current process.
+    
+    Returns
+    -------
+    None
+    """
+    polarization_curve_cache.entries = Data()
+    return
+
+def polarization_curve_cache_statistics():
+    """
+    Reports the content and activity of the polarization curve cache of the current process.
+    
+    Returns
+    -------
+    statistics : Data
+        - entries : int
+            Number of stack states in the cache
+        - hits : int
+            Polarization curves served from the cache
+        - misses : int
+            Polarization curves evaluated by the cell model while the cache is enabled
+    """
+    statistics         = Data()
+    statistics.entries = len(polarization_curve_cache.entries)
+    statistics.hits    = polarization_curve_cache.hits
+    statistics.misses  = polarization_curve_cache.misses
+    return statistics
+
+def polarization_curve_state(fuel_cell_conditions, t_idx):
+    """ Returns the stack temperature, degradation and stagnation temperature and pressure at a control point """
+    fuel_cell = fuel_cell_conditions.fuel_cell
+    return (fuel_cell.stack_temperature[t_idx, 0], fuel_cell.degradation[t_idx, 0],
+            fuel_cell.stagnation_temperature[t_idx, 0], fuel_cell.stagnation_pressure[t_idx, 0])
+
+def polarization_curve_key(fuel_cell, stack_state, number_of_points):
+    """ Returns the key of a stack state and of the scalar properties of the fuel cell in the polarization curve cache """
+    properties = [(tag, item) for tag, item in sorted(fuel_cell.items()) if isinstance(item, (int, float, str))]
+    properties.append(sorted(fuel_cell.compressor_expander_module.items()))
+    return hashlib.sha1(repr((properties, [float(x) for x in stack_state], number_of_points)).encode()).hexdigest()
+
 def evaluate_PEM(fuel_cell_stack,fuel_cell_conditions,t_idx):
     """
     Determines the fuel cell state of the PEM fuel cell 
@@ -251,28 +506,15 @@ def evaluate_CEM(fuel_cell_stack,fuel_cell_conditions,t_idx):
     float: 
         The power required to run the CEM at the given operating conditions (W)
     """
-    Cp                = 1004
-    gam               = 1.4
-    
-    fuel_cell         = fuel_cell_stack.fuel_cell 
-    CEM               = fuel_cell.compressor_expander_module 
     Tt_in             = fuel_cell_conditions.fuel_cell.stagnation_temperature[t_idx, 0] 
     Pt_in             = fuel_cell_conditions.fuel_cell.stagnation_pressure[t_idx, 0]  
     mdot_air_in       = fuel_cell_conditions.fuel_cell.inlet_air_mass_flow_rate[t_idx, 0]
     p_drop_hum        = fuel_cell_conditions.fuel_cell.humidifier.pressure_drop[t_idx, 0]
     pressure_drop     = fuel_cell_conditions.fuel_cell.pressure_drop[t_idx, 0]
-    FC_air_p          = fuel_cell.rated_air_pressure  
-    air_excess_ratio  = fuel_cell.air_excess_ratio 
-    
+    FC_air_p          = fuel_cell_stack.fuel_cell.rated_air_pressure  
     p_air_FC          = FC_air_p  + p_drop_hum
-    comp_p_req        = mdot_air_in * Cp* Tt_in * ( ((p_air_FC + p_drop_hum) / Pt_in) **((gam - 1) / gam)   - 1) / CEM.compressor_efficiency
-    input_p           = comp_p_req / CEM.motor_efficiency 
-    p_exp             = p_air_FC - pressure_drop -p_drop_hum
-    Tt_exp            = Tt_in * (p_exp / Pt_in) ** ((gam - 1) / gam)
-    mdot_air_out      = mdot_air_in -  mdot_air_in /air_excess_ratio * 0.233
-    exp_p_ext         = mdot_air_out * Cp * Tt_exp * (1 - (Pt_in / p_exp) ** ((gam - 1) / gam)) * CEM.expander_efficiency
-    output_p          = exp_p_ext * CEM.generator_efficiency
-    p_req             = input_p - output_p
+    
+    comp_p_req, input_p, p_exp, mdot_air_out, exp_p_ext, output_p, p_req = calculate_CEM_power(fuel_cell_stack, Tt_in, Pt_in, mdot_air_in, p_drop_hum, pressure_drop)
 
     fuel_cell_conditions.fuel_cell.outlet_air_pressure[t_idx]              = FC_air_p  + p_drop_hum     
     fuel_cell_conditions.fuel_cell.compressor_inlet_pressure[t_idx]        = Pt_in 
@@ -289,6 +531,48 @@ def evaluate_CEM(fuel_cell_stack,fuel_cell_conditions,t_idx):
        
     return p_req, mdot_air_out, exp_p_ext 
  
+def calculate_CEM_power(fuel_cell_stack, Tt_in, Pt_in, mdot_air_in, p_drop_hum, pressure_drop):
+    """
+    Calculates the power required by the CEM (compressor-expander module)
+
+    Parameters: 
+    ----------
+    Tt_in: float 
+        Stagnation temperature of the air entering the compressor (K)
+    Pt_in: float 
+        Stagnation pressure of the air entering the compressor
+    mdot_air_in: float 
+        Mass flow of air entering the fuel cell and compressor (kg/s)
+    p_drop_hum: float 
+        The pressure drop (bar) through the humidifier 
+    pressure_drop: float 
+        The pressure drop (bar) through the fuel cell
+
+    Returns: 
+    ----------
+    float: 
+        Compressor power (W), motor power (W), expander inlet pressure, outlet air mass flow (kg/s), 
+        expander power (W), generator power (W) and the power required to run the CEM (W)
+    """
+    Cp                = 1004
+    gam               = 1.4
+    
+    fuel_cell         = fuel_cell_stack.fuel_cell 
+    CEM               = fuel_cell.compressor_expander_module 
+    FC_air_p          = fuel_cell.rated_air_pressure  
+    air_excess_ratio  = fuel_cell.air_excess_ratio 
+    
+    p_air_FC          = FC_air_p  + p_drop_hum
+    comp_p_req        = mdot_air_in * Cp* Tt_in * ( ((p_air_FC + p_drop_hum) / Pt_in) **((gam - 1) / gam)   - 1) / CEM.compressor_efficiency
+    input_p           = comp_p_req / CEM.motor_efficiency 
+    p_exp             = p_air_FC - pressure_drop -p_drop_hum
+    Tt_exp            = Tt_in * (p_exp / Pt_in) ** ((gam - 1) / gam)
+    mdot_air_out      = mdot_air_in -  mdot_air_in /air_excess_ratio * 0.233
+    exp_p_ext         = mdot_air_out * Cp * Tt_exp * (1 - (Pt_in / p_exp) ** ((gam - 1) / gam)) * CEM.expander_efficiency
+    output_p          = exp_p_ext * CEM.generator_efficiency
+    p_req             = input_p - output_p
+    return comp_p_req, input_p, p_exp, mdot_air_out, exp_p_ext, output_p, p_req
+ 
 def calculate_voltage(i, fuel_cell_stack,fuel_cell_conditions,t_idx):
     """
     Calculates the output voltage of the fuel cell by subtracting the activation,
@@ -319,16 +603,41 @@ def calculate_voltage(i, fuel_cell_stack,fuel_cell_conditions,t_idx):
     float: 
         Output voltage of the fuel cell (V)
     """
+    stack_temperature  = fuel_cell_conditions.fuel_cell.stack_temperature[t_idx, 0]      
+    pressure_drop      = fuel_cell_conditions.fuel_cell.pressure_drop[t_idx, 0]      
+    degradation        = fuel_cell_conditions.fuel_cell.degradation[t_idx, 0]    
+    return calculate_cell_voltage(i, fuel_cell_stack, stack_temperature, pressure_drop, degradation)
+
+def calculate_cell_voltage(i, fuel_cell_stack, stack_temperature, pressure_drop, degradation):
+    """
+    Calculates the output voltage and the voltage losses of the fuel cell at a stack state, see calculate_voltage.
+    The current density and the pressure drop may be arrays of the same shape.
+
+    Parameters:
+    ----------
+    i: float 
+        The current density to evaluate the cell voltage at (A/cm^2)
+    stack_temperature: float 
+        Temperature of the fuel cell (K)
+    pressure_drop: float 
+        Pressure drop of the fuel cell (bar)
+    degradation: float 
+        The percent of maximumm degradation to evaluate divided by 100
+
+    Returns:
+    ----------
+    float: 
+        Output voltage of the fuel cell (V)
+    float: 
+        Voltage losses of the fuel cell (V)
+    """
     
     # unpack
     fuel_cell          = fuel_cell_stack.fuel_cell 
-    stack_temperature  = fuel_cell_conditions.fuel_cell.stack_temperature[t_idx, 0]      
     P_H2_input         = fuel_cell.rated_H2_pressure   
     P_air              = fuel_cell.rated_air_pressure
     RH                 = fuel_cell.oxygen_relative_humidity 
     air_excess_ratio   = fuel_cell.air_excess_ratio 
-    pressure_drop      = fuel_cell_conditions.fuel_cell.pressure_drop[t_idx, 0]      
-    degradation        = fuel_cell_conditions.fuel_cell.degradation[t_idx, 0]    
     
     P_O2   = calculate_P_O2(fuel_cell_stack,P_air, stack_temperature, RH, air_excess_ratio, pressure_drop, i)
     P_H2   = calculate_P_H2(fuel_cell_stack,P_H2_input, stack_temperature, RH, i)
@@ -584,11 +893,10 @@ def calculate_concentration_losses_LT(fuel_cell_stack, stack_temperature, P_O2,
     """
     fuel_cell =  fuel_cell_stack.fuel_cell
     i_lim =  calculate_limiting_current_density_LT(fuel_cell_stack, stack_temperature, P_O2, RH, air_excess_ratio, P_drop, i)
-    if i >= i_lim: 
-        return 10
-    else: 
+    with np.errstate(divide='ignore', invalid='ignore'): 
         eta_conc = (1 + 1 / fuel_cell.alpha) * fuel_cell.Universal_gas_constant * stack_temperature / (2 * fuel_cell.Faraday_constant) * np.log(i_lim / (i_lim - i)) 
-        return eta_conc
+    eta_conc = np.where(i >= i_lim, 10, eta_conc) # the cell does not operate above the limiting current density
+    return eta_conc
     
 def calculate_limiting_current_density_LT(fuel_cell_stack, stack_temperature, P_O2, RH, air_excess_ratio, P_drop, i, **kwargs): 
     """
@@ -646,11 +954,10 @@ def calculate_concentration_losses_HT(fuel_cell_stack, stack_temperature, P_O2,
     """
     fuel_cell = fuel_cell_stack.fuel_cell
     i_lim = calculate_limiting_current_density_HT(fuel_cell_stack,stack_temperature, P_O2, RH, air_excess_ratio, P_drop, i)
-    if i >= i_lim: 
-        return 10
-    else: 
+    with np.errstate(divide='ignore', invalid='ignore'): 
         eta_conc = (1 + 1.8/fuel_cell.alpha) * fuel_cell.Universal_gas_constant * stack_temperature / (2* fuel_cell.Faraday_constant) * np.log(i_lim / (i_lim - i)) 
-        return eta_conc
+    eta_conc = np.where(i >= i_lim, 10, eta_conc) # the cell does not operate above the limiting current density
+    return eta_conc
 
 def calculate_limiting_current_density_HT(fuel_cell_stack, stack_temperature, P_O2, RH, air_excess_ratio, P_drop, i): 
     """
@@ -329,7 +329,7 @@ def BEMT_Helmholtz_performance(rotor, conditions):
     wake_inputs.speed_of_sounds       = a
     wake_inputs.dynamic_viscosities   = nu
      
-    va, vt = RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake.wake_model.evaluate_wake(rotor,wake_inputs,conditions)
+    va, vt, convergence = RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake.wake_model.evaluate_wake(rotor,wake_inputs,conditions)
     
     # compute new blade velocities
     Wa   = va + Ua
@@ -508,6 +508,7 @@ def BEMT_Helmholtz_performance(rotor, conditions):
                 power_loading                     = power_loading,      
                 omega                             = omega,
                 disc_circulation                  = blade_Gamma_2d,
+                inflow_convergence                = convergence,
                 blade_dT_dr                       = blade_dT_dr,
                 disc_dT_dr                        = blade_dT_dr_2d,
                 blade_thrust_distribution         = blade_T_distribution,
@@ -6,6 +6,7 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
+from RCAIDE.Framework.Core import Data
 from RCAIDE.Library.Components import Wings 
 from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.extract_wing_collocation_points import extract_wing_collocation_points
 from RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake  import compute_wake_induced_velocity
@@ -68,6 +69,8 @@ def evaluate_wake(rotor,wake_inputs,conditions):
         Axially-induced velocity from rotor wake [m/s]
     vt : array_like
         Tangentially-induced velocity from rotor wake [m/s]
+    convergence : Data
+        Per-station convergence of the inflow angle, see solve_inflow_angle
     
     Notes
     -----
@@ -77,7 +80,7 @@ def evaluate_wake(rotor,wake_inputs,conditions):
     
     The computation follows these steps:
         1. Initialize the inflow angle (PSI) array
-        2. Solve for the inflow angle using a nonlinear equation solver
+        2. Solve for the inflow angle of every station with a vectorized Newton iteration
         3. Calculate the axial and tangential induced velocities from the converged solution
     
     **Major Assumptions**
@@ -119,9 +122,9 @@ def evaluate_wake(rotor,wake_inputs,conditions):
     RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake.BEMT_Helmholtz_performance
     """
     
-    va, vt = wake_convergence(rotor, wake_inputs)
+    va, vt, convergence = wake_convergence(rotor, wake_inputs)
         
-    return va, vt
+    return va, vt, convergence
 
 def evaluate_slipstream(rotor,rotor_conditions,geometry,ctrl_pts,wing_instance=None):
     """
@@ -229,8 +232,9 @@ def wake_convergence(rotor,wake_inputs):
        
        
     Outputs:
-       va  - axially-induced velocity from rotor wake
-       vt  - tangentially-induced velocity from rotor wake
+       va          - axially-induced velocity from rotor wake
+       vt          - tangentially-induced velocity from rotor wake
+       convergence - per-station convergence of the inflow angle
     
     Properties Used:
     None
@@ -247,13 +251,111 @@ def wake_convergence(rotor,wake_inputs):
     else:
         PSI    = np.ones((ctrl_pts,Nr))
 
-    PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
+    PSI_final, convergence = solve_inflow_angle(PSI,wake_inputs,rotor)
     
     # Calculate the velocities given PSI
     va, vt = va_vt(PSI_final, wake_inputs, rotor)
 
     
-    return va, vt
+    return va, vt, convergence
+
+def solve_inflow_angle(PSI, wake_inputs, rotor, maximum_iterations = 50, maximum_step = 0.2):
+    """
+    Solves the circulation residual for the inflow angle of every blade station at once.
+
+    Assumptions:
+    The residual at a station only depends on the inflow angle at that station, so the
+    Jacobian is diagonal. Its diagonal is found by perturbing every station together.
+
+    Source:
+    N/A
+
+    Inputs:
+       PSI                  initial inflow angle, shape (ctrl_pts,Nr) or (ctrl_pts,Nr,Na)     [rad]
+       wake_inputs          see wake_convergence                                              [-]
+       rotor.sol_tolerance  relative tolerance on the inflow angle                            [-]
+       maximum_iterations   Newton iterations before falling back to fsolve                   [-]
+       maximum_step         largest change of the inflow angle in one iteration               [rad]
+
+    Outputs:
+       PSI                  converged inflow angle                                            [rad]
+       convergence.
+          converged         stations that met the tolerance                                   [-]
+          iterations        Newton iterations spent on each station                           [-]
+          residual          circulation residual at the solution                              [m^2/s]
+          evaluations       residual evaluations                                              [-]
+          fallback          True if fsolve was needed for stations that did not converge      [-]
+
+    Properties Used:
+    N/A
+    """
+    shape      = np.shape(PSI)
+    tol        = rotor.sol_tolerance
+    residual   = lambda psi: np.reshape(iteration(psi,wake_inputs,rotor),shape)
+
+    PSI        = np.array(PSI,dtype=float)
+    R          = residual(PSI)
+    active     = np.ones(shape,dtype=bool)
+    iterations = np.zeros(shape,dtype=int)
+    evaluations = 1
+
+    # stations where the residual changed sign are bracketed by [lo,hi], with R_lo the residual at lo
+    lo         = np.full(shape,np.nan)
+    hi         = np.full(shape,np.nan)
+    R_lo       = np.full(shape,np.nan)
+
+    for _ in range(maximum_iterations):
+        # diagonal of the Jacobian from a simultaneous forward difference of the active stations
+        h          = np.sqrt(np.finfo(float).eps)*np.maximum(np.abs(PSI),1.)*active
+        dR_dpsi    = (residual(PSI + h) - R)/np.where(active,h,1.)
+        valid      = np.isfinite(dR_dpsi) & (dR_dpsi != 0.)
+
+        # safeguarded Newton step, replaced by bisection when it leaves the bracket
+        step       = np.clip(-R/np.where(valid,dR_dpsi,1.),-maximum_step,maximum_step)
+        step[~valid | ~np.isfinite(step)] = 0.
+        PSI_new    = PSI + step
+        bracketed  = np.isfinite(lo)
+        outside    = bracketed & ((PSI_new <= np.minimum(lo,hi)) | (PSI_new >= np.maximum(lo,hi)))
+        PSI_new    = np.where(outside,0.5*(lo + hi),PSI_new)
+        PSI_new    = np.where(active,PSI_new,PSI)
+        R_new      = residual(PSI_new)
+        evaluations += 2
+
+        # update the brackets
+        crossed    = active & ~bracketed & (np.sign(R_new) != np.sign(R))
+        lo         = np.where(crossed,PSI,lo)
+        R_lo       = np.where(crossed,R,R_lo)
+        hi         = np.where(crossed,PSI_new,hi)
+        inside     = active & bracketed
+        same_lo    = np.sign(R_new) == np.sign(R_lo)
+        lo         = np.where(inside & same_lo,PSI_new,lo)
+        R_lo       = np.where(inside & same_lo,R_new,R_lo)
+        hi         = np.where(inside & ~same_lo,PSI_new,hi)
+
+        converged  = (valid | (R_new == 0.)) & (np.abs(PSI_new - PSI) <= tol*(np.abs(PSI_new) + tol))
+        iterations = iterations + active
+        PSI        = PSI_new
+        R          = np.where(active,R_new,R)
+        active     = active & ~converged
+        if not np.any(active):
+            break
+
+    convergence             = Data()
+    convergence.fallback    = bool(np.any(active))
+    if convergence.fallback:
+        # hand the remaining stations to the general solver, starting from the Newton iterate
+        PSI,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=tol,full_output = 1,band=(1,0))
+        PSI          = np.reshape(PSI,shape)
+        R            = residual(PSI)
+        evaluations += infodict['nfev'] + 1
+        active       = active & (ier != 1)
+
+    convergence.converged   = ~active
+    convergence.iterations  = iterations
+    convergence.residual    = R
+    convergence.evaluations = evaluations
+
+    return PSI, convergence
 
 def iteration(PSI, wake_inputs, rotor):
     """
@@ -15,4 +15,5 @@ RCAIDE.Library.Methods.Powertrain.Distributors
 # ----------------------------------------------------------------------------------------------------------------------
 from .append_bus_conditions     import *
 from .compute_bus_conditions    import compute_bus_conditions
+from .compute_bus_battery_performance import compute_bus_battery_performance, supports_bus_battery_time_marching
 from .initialize_bus_properties import initialize_bus_properties
\ No newline at end of file
@@ -0,0 +1,245 @@
+# RCAIDE/Library/Methods/Powertrain/Distributors/Electrical_Bus/compute_bus_battery_performance.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Framework.Core                                                import Units, Data
+from RCAIDE.Library.Methods.Powertrain.Sources.Batteries.Lithium_Ion_NMC import compute_nmc_cell_heat_generation, limit_nmc_cell_temperature, compute_nmc_cell_voltages
+from RCAIDE.Library.Methods.Powertrain.Sources.Batteries.Lithium_Ion_LFP import compute_lfp_cell_heat_generation, compute_lfp_cell_voltages
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Cell models
+# ----------------------------------------------------------------------------------------------------------------------
+# cell chemistries marched by compute_bus_battery_performance, see compute_nmc_cell_performance and compute_lfp_cell_performance
+cell_models                                 = Data()
+cell_models.LiNiMnCoO2                      = Data()
+cell_models.LiNiMnCoO2.heat_generation      = lambda SOC,T,I,cells: compute_nmc_cell_heat_generation(SOC,T,I,cells.electrode_area,cells.surface_area,cells.resistance_growth_factor)
+cell_models.LiNiMnCoO2.limit_temperature    = limit_nmc_cell_temperature
+cell_models.LiNiMnCoO2.single_precision     = False
+cell_models.LiNiMnCoO2.voltages             = compute_nmc_cell_voltages
+cell_models.LiFePO4                         = Data()
+cell_models.LiFePO4.heat_generation         = lambda SOC,T,I,cells: compute_lfp_cell_heat_generation(SOC,I,cells.electrode_area,cells.surface_area)
+cell_models.LiFePO4.limit_temperature       = None
+cell_models.LiFePO4.single_precision        = True
+cell_models.LiFePO4.voltages                = compute_lfp_cell_voltages
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_bus_battery_performance
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_bus_battery_performance(bus, state, delta_t):
+    """
+    Computes the battery modules and the conditions of a bus over every control point of a segment.
+
+    Parameters
+    ----------
+    bus : ElectricalBus
+        The electrical bus component with the following attributes:
+            - tag : str
+                Identifier for the bus
+            - battery_modules : list
+                Lithium-ion battery modules connected to the bus
+            - identical_battery_modules : bool
+                Computes the first battery module only and copies it to the others
+            - battery_module_electric_configuration : str
+                Configuration of battery modules ('Series' or 'Parallel')
+    state : State
+        Current system state containing conditions for all components
+    delta_t : numpy.ndarray
+        Time steps between the control points [s]
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    This replaces the calls of energy_calc and compute_bus_conditions at each control point for buses that pass
+    supports_bus_battery_time_marching. The state of charge, temperature, energy and charge throughput of every
+    battery module are advanced together, one control point at a time, with the explicit recurrence of the cell
+    models. The state of the modules is kept in arrays of control points by modules. The under-load voltages, which
+    do not feed back into the recurrence, are evaluated afterwards from the look-up tables at all control points at
+    once, and the bus sums are formed over whole arrays. The results match the per control point computation.
+
+    **Major Assumptions**
+        * No battery module is cooled by a thermal management system and the bus has no fuel cell stacks
+
+    See Also
+    --------
+    RCAIDE.Library.Methods.Powertrain.Sources.Batteries.Lithium_Ion_NMC.compute_nmc_cell_performance
+    RCAIDE.Library.Methods.Powertrain.Sources.Batteries.Lithium_Ion_LFP.compute_lfp_cell_performance
+    RCAIDE.Library.Methods.Powertrain.Distributors.Electrical_Bus.compute_bus_conditions
+    """
+    bus_conditions   = state.conditions.energy[bus.tag]
+    modules          = list(bus.battery_modules)
+    no_modules       = len(modules)
+    num_ctrl_pts     = state.numerics.number_of_control_points
+    phi              = state.conditions.energy.hybrid_power_split_ratio
+    psi              = state.conditions.energy.battery_fuel_cell_power_split_ratio
+    recharging       = state.conditions.energy.recharging
+
+    # identical battery modules are computed once and copied
+    marched          = modules[:1] if bus.identical_battery_modules else modules
+    conditions       = [bus_conditions.battery_modules[module.tag] for module in marched]
+    K                = len(marched)
+
+    # bus temperatures are averaged from the module temperatures before they are advanced
+    previous_T       = [np.copy(bus_conditions.battery_modules[module.tag].temperature) for module in modules]
+    if bus.identical_battery_modules:
+        previous_T   = [previous_T[0]]*no_modules
+
+    # cell and module properties, one column per marched module
+    mass_Cp        = np.array([module.cell.mass*module.cell.specific_heat_capacity for module in marched],dtype=float).reshape(K)
+    n_parallel     = np.array([module.electrical_configuration.parallel for module in marched])
+    n_total        = np.array([module.electrical_configuration.series*module.electrical_configuration.parallel for module in marched])
+    E_max          = np.array([module.maximum_energy*c.cell.capacity_fade_factor for module,c in zip(marched,conditions)],dtype=float).reshape(K)
+    E_max_32       = np.float32(E_max).astype(float)
+
+    # battery modules of the same chemistry are computed together
+    groups = []
+    for chemistry in dict.fromkeys(module.cell.chemistry for module in marched):
+        index                          = np.array([k for k,module in enumerate(marched) if module.cell.chemistry == chemistry])
+        cells                          = Data()
+        cells.electrode_area           = np.array([marched[k].cell.electrode_area for k in index],dtype=float).reshape(len(index))
+        cells.surface_area             = np.array([marched[k].cell.surface_area for k in index],dtype=float).reshape(len(index))
+        cells.resistance_growth_factor = np.array([conditions[k].cell.resistance_growth_factor for k in index],dtype=float).reshape(len(index))
+        groups.append((cell_models[chemistry],index,cells))
+
+    # state of the marched modules, control points by modules
+    SOC            = np.stack([c.cell.state_of_charge[:,0] for c in conditions],axis=1)
+    T              = np.stack([c.cell.temperature[:,0] for c in conditions],axis=1)
+    Q_throughput   = np.stack([c.cell.charge_throughput[:,0] for c in conditions],axis=1)
+    E_module       = np.zeros((num_ctrl_pts,K))
+    I_cell         = np.zeros((num_ctrl_pts,K))
+    Q_heat_cell    = np.zeros((num_ctrl_pts,K))
+    P_module       = np.zeros((num_ctrl_pts,K))
+
+    E_bus          = bus_conditions.energy[:,0]
+    SOC_bus        = bus_conditions.state_of_charge[:,0]
+    power_draw     = bus_conditions.power_draw[:,0]
+    current_draw   = bus_conditions.current_draw[:,0]
+    if bus.battery_module_electric_configuration == 'Series':
+        module_share = 1
+    else:
+        module_share = no_modules
+
+    for t_idx in range(num_ctrl_pts):
+        P_bus  = power_draw[t_idx]*phi[t_idx,0] * psi[t_idx,0]
+        I_bus  = current_draw[t_idx]*phi[t_idx,0] * psi[t_idx,0]
+
+        # current state
+        I_cell[t_idx] = (I_bus / module_share) / n_parallel
+        for model,index,cells in groups:
+            Q_heat_cell[t_idx,index] = model.heat_generation(SOC[t_idx,index],T[t_idx,index],I_cell[t_idx,index],cells)
+            if model.limit_temperature is not None:
+                T_t = T[t_idx,index]
+                model.limit_temperature(T_t)
+                T[t_idx,index] = T_t
+        P_module[t_idx] = P_bus /no_modules  - np.abs(Q_heat_cell[t_idx]*n_total)
+        E_module[t_idx] = E_bus[t_idx]/no_modules
+
+        # future state
+        if t_idx != num_ctrl_pts-1:
+            T[t_idx+1]      = T[t_idx] + Q_heat_cell[t_idx]/(mass_Cp)*delta_t[t_idx]
+            E               = (E_module[t_idx]) -P_module[t_idx]*delta_t[t_idx]
+            for model,index,cells in groups:
+                if model.single_precision:
+                    E[index] = np.float32(E[index])
+            E               = np.where(E > E_max,E_max_32,E)
+            SOC_next        = E/E_max
+            SOC_next[SOC_next>1] = 1.
+            SOC_next[SOC_next<0] = 0.
+            SOC[t_idx+1]          = SOC_next
+            Q_throughput[t_idx+1] = Q_throughput[t_idx] + abs(I_cell[t_idx])*delta_t[t_idx]/Units.hr
+
+            # bus state, summed in the order of the battery modules
+            E_bus[t_idx+1]   = sum(E[0] for _ in range(no_modules)) if bus.identical_battery_modules else sum(E)
+            SOC_bus[t_idx+1] = SOC_next[-1]
+
+            # handle fully charged state
+            if recharging and np.float16(SOC_bus[t_idx+1]) == 1:
+                bus_conditions.charging_current[t_idx+1] = 0
+                power_draw[t_idx+1]                      = 0
+                current_draw[t_idx+1]                    = 0
+
+    # store the battery module conditions
+    I_module = (current_draw*phi[:,0] * psi[:,0]) / module_share
+    for k,(module,c) in enumerate(zip(marched,conditions)):
+        n_module                             = module.electrical_configuration.series*module.electrical_configuration.parallel
+        c.current[:,0]                       = I_module
+        c.cell.current[:,0]                  = I_cell[:,k]
+        c.cell.heat_energy_generated[:,0]    = Q_heat_cell[:,k]
+        c.heat_energy_generated[:,0]         = Q_heat_cell[:,k]*n_module
+        c.power[:,0]                         = P_module[:,k]
+        c.cell.power[:,0]                    = P_module[:,k]/n_module
+        c.temperature[:,0]                   = T[:,k]
+        c.cell.temperature[:,0]              = T[:,k]
+        c.energy[:,0]                        = E_module[:,k]
+        c.cell.energy[:,0]                   = E_module[:,k]/n_module
+        c.cell.state_of_charge[1:,0]         = SOC[1:,k]
+        c.cell.depth_of_discharge[1:,0]      = 1 - SOC[1:,k]
+        c.state_of_charge[1:,0]              = SOC[1:,k]
+        c.cell.charge_throughput[1:,0]       = Q_throughput[1:,k]
+        cell_models[module.cell.chemistry].voltages(module,c)
+
+    if bus.identical_battery_modules:
+        for module in modules[1:]:
+            module.reuse_stored_data(state,bus,True,modules[0].tag)
+
+    # bus conditions at every control point, see compute_bus_conditions
+    bm_conditions = [bus_conditions.battery_modules[module.tag] for module in modules]
+    bus_conditions.heat_energy_generated[:] = sum(bm.heat_energy_generated for bm in bm_conditions)
+    if bus.battery_module_electric_configuration == 'Series':
+        bus_conditions.voltage_open_circuit[:] = sum(bm.voltage_open_circuit for bm in bm_conditions)
+        bus_conditions.voltage_under_load[:]   = sum(bm.voltage_under_load for bm in bm_conditions)
+    else:
+        bus_conditions.voltage_open_circuit[:] = bm_conditions[-1].voltage_open_circuit
+        bus_conditions.voltage_under_load[:]   = bm_conditions[-1].voltage_under_load
+    bus_conditions.efficiency[:]      = (bus_conditions.power_draw*phi + bus_conditions.heat_energy_generated)/(bus_conditions.power_draw*phi)
+    bus_conditions.temperature[1:]    = sum(T_module[1:] for T_module in previous_T)/no_modules
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  supports_bus_battery_time_marching
+# ----------------------------------------------------------------------------------------------------------------------
+def supports_bus_battery_time_marching(bus, coolant_lines):
+    """
+    Checks whether the battery modules of a bus can be computed over a whole segment by compute_bus_battery_performance.
+
+    Parameters
+    ----------
+    bus : ElectricalBus
+        The electrical bus component
+    coolant_lines : list
+        Coolant lines of the network
+
+    Returns
+    -------
+    supported : bool
+        True if every battery module has a cell model in cell_models, the bus has no fuel cell stacks and the
+        coolant lines do not compute any heat exchanger, reservoir or battery thermal management system
+
+    Notes
+    -----
+    The thermal management systems and the fuel cell stacks couple the control points through the coolant lines, so
+    these buses are computed one control point at a time by the network.
+    """
+    if not bus.vectorized_battery_time_marching or len(bus.battery_modules) == 0 or len(bus.fuel_cell_stacks) != 0:
+        return False
+    if bus.battery_module_electric_configuration not in ['Series','Parallel']:
+        return False
+    for module in bus.battery_modules:
+        if module.cell.chemistry not in cell_models:
+            return False
+    for coolant_line in coolant_lines:
+        if len(coolant_line.heat_exchangers) != 0 or len(coolant_line.reservoirs) != 0:
+            return False
+        for tag, item in coolant_line.items():
+            if tag == 'battery_modules' and len(item) != 0:
+                return False
+    return True
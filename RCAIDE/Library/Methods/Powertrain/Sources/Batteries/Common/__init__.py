@@ -9,6 +9,7 @@ The module contains functions for:
     - Calculating power and energy characteristics
     - Computing mass changes for metal-air batteries
     - Sizing battery modules based on mass or energy/power requirements
+    - Sharing the processed cell data of each chemistry across battery modules
 
 See Also
 --------
@@ -28,4 +29,5 @@ from .find_mass_gain_rate                     import find_mass_gain_rate
 from .find_total_mass_gain                    import find_total_mass_gain
 from .size_module_from_mass                   import size_module_from_mass
 from .size_module_from_energy_and_power       import size_module_from_energy_and_power
-from .compute_module_properties               import compute_module_properties 
\ No newline at end of file
+from .compute_module_properties               import compute_module_properties
+from .cell_data_cache                         import load_cell_data, clear_cell_data_cache, cell_data_cache_statistics
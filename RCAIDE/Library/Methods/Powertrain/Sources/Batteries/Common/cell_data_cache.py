@@ -0,0 +1,169 @@
+# RCAIDE/Library/Methods/Powertrain/Sources/Batteries/Common/cell_data_cache.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+
+# package imports
+import numpy as np
+import hashlib
+import os
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Cache state
+# ----------------------------------------------------------------------------------------------------------------------
+# bump when the layout of the processed cell data changes
+cell_data_format_version = 1
+
+# processed cell data and discharge performance maps of the current process, per raw data file
+cell_data_cache           = Data()
+cell_data_cache.entries   = Data()
+cell_data_cache.hits      = 0
+cell_data_cache.misses    = 0
+
+# directory of precompiled processed cell data, None keeps the cache in memory only
+cell_data_cache.directory = None
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  load_cell_data
+# ----------------------------------------------------------------------------------------------------------------------
+def load_cell_data(raw_data_file, process_raw_data, build_performance_map):
+    """
+    Returns the discharge performance map of a cell chemistry, shared by every battery module of the process.
+
+    Parameters
+    ----------
+    raw_data_file : str
+        Experimental raw data of the cell, read with RCAIDE.load
+    process_raw_data : function
+        Reduces the raw data to a Data of arrays
+    build_performance_map : function
+        Builds the discharge performance map from the processed arrays
+
+    Returns
+    -------
+    performance_map : Data or interpolator
+        Discharge performance map of the cell
+
+    Notes
+    -----
+    The raw data is read and processed once per process, on the first battery module of each chemistry. Later
+    modules receive the same performance map, so constructing a battery module does not read or allocate the
+    chemistry tables. The processed arrays are read-only and the performance map must not be modified in place.
+
+    When cell_data_cache.directory is set, the processed arrays are also stored in a compressed .npz file of that
+    directory, which later processes load instead of the raw data.
+
+    **Major Assumptions**
+        * The raw data files do not change while a process runs
+
+    See Also
+    --------
+    clear_cell_data_cache
+    cell_data_cache_statistics
+    """
+    key     = hashlib.sha1(os.path.abspath(raw_data_file).encode()).hexdigest()
+    entries = cell_data_cache.entries
+    if key in entries:
+        cell_data_cache.hits += 1
+        return entries[key].performance_map
+    cell_data_cache.misses += 1
+
+    processed_data = load_precompiled_cell_data(raw_data_file)
+    if processed_data is None:
+        processed_data = process_raw_data(RCAIDE.load(raw_data_file))
+        save_precompiled_cell_data(raw_data_file,processed_data)
+    for array in processed_data.values():
+        array.setflags(write=False)
+
+    entry                 = Data()
+    entry.processed_data  = processed_data
+    entry.performance_map = build_performance_map(processed_data)
+    entries[key]          = entry
+    return entry.performance_map
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  clear_cell_data_cache
+# ----------------------------------------------------------------------------------------------------------------------
+def clear_cell_data_cache():
+    """
+    Removes the cell data kept by the cache of the current process, the precompiled files are kept.
+
+    Returns
+    -------
+    None
+    """
+    cell_data_cache.entries = Data()
+    return
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  cell_data_cache_statistics
+# ----------------------------------------------------------------------------------------------------------------------
+def cell_data_cache_statistics():
+    """
+    Reports the content and activity of the cell data cache of the current process.
+
+    Returns
+    -------
+    statistics : Data
+        - entries : int
+            Number of cell chemistries in the cache
+        - hits : int
+            Battery modules served from the cache
+        - misses : int
+            Battery modules that loaded the cell data
+        - directory : str
+            Directory of the precompiled cell data, None when it is not used
+    """
+    statistics           = Data()
+    statistics.entries   = len(cell_data_cache.entries)
+    statistics.hits      = cell_data_cache.hits
+    statistics.misses    = cell_data_cache.misses
+    statistics.directory = cell_data_cache.directory
+    return statistics
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def precompiled_cell_data_file(raw_data_file):
+    """ Returns the precompiled file of a raw data file, named after its name, size and modification time """
+    stat = os.stat(raw_data_file)
+    name = os.path.splitext(os.path.basename(raw_data_file))[0]
+    name = '{}_v{}_{}_{}.npz'.format(name,cell_data_format_version,stat.st_size,int(stat.st_mtime))
+    return os.path.join(cell_data_cache.directory,name)
+
+def load_precompiled_cell_data(raw_data_file):
+    """ Loads the processed arrays of a raw data file, None if they were not precompiled """
+    if cell_data_cache.directory is None:
+        return None
+    filename = precompiled_cell_data_file(raw_data_file)
+    if not os.path.isfile(filename):
+        return None
+    try:
+        with np.load(filename,allow_pickle=False) as archive:
+            processed_data = Data()
+            for name in archive.files:
+                processed_data[name] = archive[name]
+    except (OSError,ValueError):
+        # unreadable files are processed again
+        return None
+    return processed_data
+
+def save_precompiled_cell_data(raw_data_file,processed_data):
+    """ Stores the processed arrays of a raw data file when a directory is set """
+    if cell_data_cache.directory is None:
+        return
+    filename = precompiled_cell_data_file(raw_data_file)
+    os.makedirs(cell_data_cache.directory,exist_ok=True)
+
+    # write to a temporary file first so concurrent jobs never read a partial file
+    temporary = filename + '.' + str(os.getpid()) + '.tmp'
+    with open(temporary,'wb') as f:
+        np.savez_compressed(f,**processed_data)
+    os.replace(temporary,filename)
+    return
@@ -179,11 +179,7 @@ def compute_lfp_cell_performance(battery_module, state, bus, coolant_lines, t_id
     # Compute battery_module cell temperature 
     # ---------------------------------------------------------------------------------
     # Determine temperature increase         
-    sigma                 =  130  
-    i_cell                = I_cell[t_idx]/electrode_area # current intensity (A/m²)
-    q_dot_entropy         = (4.6810 * SOC_cell[t_idx]**4 + (-8.3729) * SOC_cell[t_idx]**3 + 3.7197 * SOC_cell[t_idx]**2 + 0.4356 * SOC_cell[t_idx]+ (-0.3027)) # Obtained from curve fitting the dUdt curve  
-    q_dot_joule           = (i_cell**2)/(sigma)          
-    Q_heat_cell[t_idx]    = (q_dot_joule + q_dot_entropy)*As_cell 
+    Q_heat_cell[t_idx]    = compute_lfp_cell_heat_generation(SOC_cell[t_idx],I_cell[t_idx],electrode_area,As_cell)
     Q_heat_module[t_idx]  = Q_heat_cell[t_idx]*n_total  
     V_ul_cell[t_idx]      = compute_lfp_cell_state(battery_module,battery_module_data,SOC_cell[t_idx],T_cell[t_idx],abs(I_cell[t_idx])) 
  
@@ -299,4 +295,63 @@ def compute_lfp_cell_state(battery_module, battery_module_data, SOC, T, I):
 
     V_ul  = battery_module_data(C_rate, T, discharge_capacity)
     
-    return V_ul
\ No newline at end of file
+    return V_ul
+
+def compute_lfp_cell_heat_generation(SOC, I_cell, electrode_area, surface_area):
+    """
+    Computes the heat generated by lithium iron phosphate (LFP) battery cells.
+
+    Parameters
+    ----------
+    SOC : numpy.ndarray
+        State of charge of the cells [unitless, 0-1]
+    I_cell : numpy.ndarray
+        Current of the cells [A]
+    electrode_area : float or numpy.ndarray
+        Area of the electrodes [m²]
+    surface_area : float or numpy.ndarray
+        Surface area of the cells [m²]
+
+    Returns
+    -------
+    Q_heat_cell : numpy.ndarray
+        Heat generated by the cells [W]
+
+    Notes
+    -----
+    The inputs are either the conditions of one control point or the cells of several battery modules, see
+    compute_lfp_cell_performance.
+    """
+    sigma                 =  130  
+    i_cell                = I_cell/electrode_area # current intensity (A/m²)
+    q_dot_entropy         = (4.6810 * SOC**4 + (-8.3729) * SOC**3 + 3.7197 * SOC**2 + 0.4356 * SOC+ (-0.3027)) # Obtained from curve fitting the dUdt curve  
+    q_dot_joule           = (i_cell**2)/(sigma)          
+    Q_heat_cell           = (q_dot_joule + q_dot_entropy)*surface_area 
+    return Q_heat_cell
+
+def compute_lfp_cell_voltages(battery_module, battery_module_conditions):
+    """
+    Computes the voltages of a lithium iron phosphate (LFP) battery module at every control point, once its state of
+    charge, temperature and current are known.
+
+    Parameters
+    ----------
+    battery_module : RCAIDE.Library.Components.Sources.Battery_Modules.Lithium_Ion_LFP
+        Battery module component
+    battery_module_conditions : Data
+        Conditions of the battery module, see compute_lfp_cell_performance
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The look-up table of all control points is evaluated in one call, see compute_nmc_cell_voltages.
+    """
+    cell      = battery_module_conditions.cell
+    n_series  = battery_module.electrical_configuration.series
+    V_ul_cell = compute_lfp_cell_state(battery_module,battery_module.cell.discharge_performance_map,cell.state_of_charge,cell.temperature,abs(cell.current))
+    cell.voltage_under_load[:]                      = V_ul_cell
+    battery_module_conditions.voltage_under_load[:] = cell.voltage_under_load*n_series  
+    return
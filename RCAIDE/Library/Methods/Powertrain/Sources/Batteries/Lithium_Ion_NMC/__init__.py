@@ -14,5 +14,5 @@ RCAIDE.Library.Methods.Powertrain.Sources.Batteries.Lithium_Ion_LFP
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
-from .compute_nmc_cell_performance   import compute_nmc_cell_performance, reuse_stored_nmc_cell_data
+from .compute_nmc_cell_performance   import compute_nmc_cell_performance, reuse_stored_nmc_cell_data, compute_nmc_cell_heat_generation, limit_nmc_cell_temperature, compute_nmc_cell_voltages
 from .update_nmc_cell_age            import update_nmc_cell_age
\ No newline at end of file
@@ -246,16 +246,8 @@ def compute_nmc_cell_performance(battery_module, state, bus, coolant_lines, t_id
     R_0_cell[t_idx][R_0_cell[t_idx]<0]  = 0. 
 
     # Determine temperature increase         
-    sigma                 = 139 # Electrical conductivity
-    n                     = 1
-    F                     = 96485 # C/mol Faraday constant    
-    delta_S               = -496.66*(SOC_cell[t_idx])**6 +  1729.4*(SOC_cell[t_idx])**5 + -2278 *(SOC_cell[t_idx])**4 +  1382.2 *(SOC_cell[t_idx])**3 + \
-                            -380.47*(SOC_cell[t_idx])**2 +  46.508*(SOC_cell[t_idx])  + -10.692  
-
-    i_cell                = I_cell[t_idx]/electrode_area # current intensity
-    q_dot_entropy         = -(T_cell[t_idx])*delta_S*i_cell/(n*F)       
-    q_dot_joule           = (i_cell**2)*(battery_module_conditions.cell.resistance_growth_factor)/(sigma)          
-    Q_heat_cell[t_idx]    = (q_dot_joule + q_dot_entropy)*As_cell 
+    Q_heat_cell[t_idx]    = compute_nmc_cell_heat_generation(SOC_cell[t_idx],T_cell[t_idx],I_cell[t_idx],electrode_area,As_cell,
+                                                             battery_module_conditions.cell.resistance_growth_factor)
     Q_heat_module[t_idx]  = Q_heat_cell[t_idx]*n_total  
 
     V_ul_cell[t_idx]      = compute_nmc_cell_state(battery_module_data,SOC_cell[t_idx],T_cell[t_idx],abs(I_cell[t_idx])) 
@@ -376,9 +368,7 @@ def compute_nmc_cell_state(battery_module_data, SOC, T, I):
     SOC[SOC > 1.]   = 1.    
     DOD             = 1 - SOC 
     
-    T[np.isnan(T)] = 302.65
-    T[T<272.65]    = 272.65 # model does not fit for below 0  degrees
-    T[T>322.65]    = 322.65 # model does not fit for above 50 degrees
+    limit_nmc_cell_temperature(T)
      
     I[I<0.0]       = 0.0
     I[I>8.0]       = 8.0   
@@ -386,4 +376,107 @@ def compute_nmc_cell_state(battery_module_data, SOC, T, I):
     pts            = np.hstack((np.hstack((I, T)),DOD  )) # amps, temp, SOC   
     V_ul           = np.atleast_2d(battery_module_data.Voltage(pts)[:,1]).T  
     
-    return V_ul
\ No newline at end of file
+    return V_ul
+
+def compute_nmc_cell_heat_generation(SOC, T, I_cell, electrode_area, surface_area, resistance_growth_factor):
+    """
+    Computes the heat generated by lithium-nickel-manganese-cobalt-oxide (NMC) battery cells.
+
+    Parameters
+    ----------
+    SOC : numpy.ndarray
+        State of charge of the cells [unitless, 0-1]
+    T : numpy.ndarray
+        Temperature of the cells [K]
+    I_cell : numpy.ndarray
+        Current of the cells [A]
+    electrode_area : float or numpy.ndarray
+        Area of the electrodes [m²]
+    surface_area : float or numpy.ndarray
+        Surface area of the cells [m²]
+    resistance_growth_factor : float or numpy.ndarray
+        Growth of the internal resistance with age [unitless]
+
+    Returns
+    -------
+    Q_heat_cell : numpy.ndarray
+        Heat generated by the cells [W]
+
+    Notes
+    -----
+    The Joule heating and the entropy change are evaluated elementwise, so the inputs are either the conditions of
+    one control point or the cells of several battery modules, see compute_nmc_cell_performance.
+    """
+    sigma                 = 139 # Electrical conductivity
+    n                     = 1
+    F                     = 96485 # C/mol Faraday constant    
+    delta_S               = -496.66*(SOC)**6 +  1729.4*(SOC)**5 + -2278 *(SOC)**4 +  1382.2 *(SOC)**3 + \
+                            -380.47*(SOC)**2 +  46.508*(SOC)  + -10.692  
+
+    i_cell                = I_cell/electrode_area # current intensity
+    q_dot_entropy         = -(T)*delta_S*i_cell/(n*F)       
+    q_dot_joule           = (i_cell**2)*(resistance_growth_factor)/(sigma)          
+    Q_heat_cell           = (q_dot_joule + q_dot_entropy)*surface_area 
+    return Q_heat_cell
+
+def limit_nmc_cell_temperature(T):
+    """
+    Limits the temperature of lithium-nickel-manganese-cobalt-oxide (NMC) battery cells, in place, to the range of the
+    look-up tables of compute_nmc_cell_state.
+
+    Parameters
+    ----------
+    T : numpy.ndarray
+        Temperature of the cells [K]
+
+    Returns
+    -------
+    None
+    """
+    T[np.isnan(T)] = 302.65
+    T[T<272.65]    = 272.65 # model does not fit for below 0  degrees
+    T[T>322.65]    = 322.65 # model does not fit for above 50 degrees
+    return
+
+def compute_nmc_cell_voltages(battery_module, battery_module_conditions):
+    """
+    Computes the internal resistance and the voltages of a lithium-nickel-manganese-cobalt-oxide (NMC) battery module
+    at every control point, once its state of charge, temperature and current are known.
+
+    Parameters
+    ----------
+    battery_module : RCAIDE.Library.Components.Sources.Battery_Modules.Lithium_Ion_NMC
+        Battery module component
+    battery_module_conditions : Data
+        Conditions of the battery module, see compute_nmc_cell_performance
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The state of charge, temperature and current do not depend on the voltages, so a segment marched by
+    compute_bus_battery_performance evaluates the look-up tables of all control points in one call. The results
+    match compute_nmc_cell_performance evaluated at each control point.
+
+    See Also
+    --------
+    RCAIDE.Library.Methods.Powertrain.Distributors.Electrical_Bus.compute_bus_battery_performance
+    """
+    cell        = battery_module_conditions.cell
+    n_series    = battery_module.electrical_configuration.series
+    SOC_cell    = cell.state_of_charge
+    I_cell      = cell.current
+
+    R_0_cell                 = (0.01483*(SOC_cell**2) - 0.02518*SOC_cell + 0.1036) *cell.resistance_growth_factor  
+    R_0_cell[R_0_cell<0]     = 0. 
+    cell.internal_resistance[:] = R_0_cell
+
+    V_ul_cell                = compute_nmc_cell_state(battery_module.cell.discharge_performance_map,SOC_cell,cell.temperature,abs(I_cell))
+    cell.voltage_under_load[:]   = V_ul_cell
+    cell.voltage_open_circuit[:] = V_ul_cell + (abs(I_cell) * R_0_cell)
+
+    battery_module_conditions.voltage_open_circuit[:] = cell.voltage_open_circuit*n_series 
+    battery_module_conditions.voltage_under_load[:]   = cell.voltage_under_load*n_series  
+    return
@@ -10,4 +10,5 @@
  
 from .converge      import * 
 from .expand_state  import expand_state 
+from .jacobian      import build_jacobian_coloring, colored_jacobian 
  
\ No newline at end of file
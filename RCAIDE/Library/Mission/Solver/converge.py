@@ -11,6 +11,7 @@ from RCAIDE.Framework.Core import  Units, Data
 from RCAIDE.Framework.Optimization.Packages.scipy import scipy_setup
 from RCAIDE.Framework.Optimization.Common         import Nexus
 from RCAIDE.Framework.Analyses.Process            import Process
+from .jacobian                                    import build_jacobian_coloring, colored_jacobian
 
 import scipy 
 import scipy.optimize
@@ -68,15 +69,29 @@ def converge(segment):
      
     elif segment.state.numerics.solver.type  == "root_finder": 
         unknowns = segment.state.unknowns.pack_array() 
+        
+        # use a colored finite difference Jacobian if the residuals allow it
+        jacobian = None 
+        if segment.state.numerics.solver.jacobian == "colored":
+            coloring = build_jacobian_coloring(segment)
+            if not coloring.coupled:
+                jacobian = lambda x, seg: colored_jacobian(x,seg,coloring) 
+        elif segment.state.numerics.solver.jacobian != "finite_difference":
+            raise Exception('undefined mission solver jacobian')
          
         unknowns,infodict,ier,error_message = scipy.optimize.fsolve(iterate_root_finder,
                                              unknowns,
                                              args   = segment,
+                                             fprime = jacobian,
                                              xtol   = segment.state.numerics.solver.tolerance_solution,
                                              maxfev = segment.state.numerics.solver.max_evaluations,
                                              epsfcn = segment.state.numerics.solver.step_size,
                                              full_output = 1)
         
+        # the last Jacobian evaluation may have left the segment at a perturbed state
+        if jacobian is not None:
+            iterate_root_finder(unknowns,segment)
+        
         if ier !=1:
             mission_converge = False
         else:
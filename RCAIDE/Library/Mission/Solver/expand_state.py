@@ -19,6 +19,8 @@ def expand_state(segment):
                 numerics:
                     number_of_control_points : int
                         Number of discretization points [-]
+                    freeze_conditions : bool
+                        Store the conditions as views into one block [-]
                 expand_rows : function
                     Method to expand state containers
 
@@ -38,6 +40,7 @@ def expand_state(segment):
             - unknowns
             - residuals
             - differentials
+        3. Optionally move the conditions into one contiguous block
 
     **Major Assumptions**
         * All state vectors should have same length
@@ -54,5 +57,8 @@ def expand_state(segment):
     
     segment.state.expand_rows(n_points)
     
+    if segment.state.numerics.freeze_conditions:
+        segment.state.conditions.freeze()
+    
     return
     
\ No newline at end of file
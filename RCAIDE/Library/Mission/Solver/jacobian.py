@@ -0,0 +1,245 @@
+# RCAIDE/Library/Missions/Solver/jacobian.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Framework.Core import Data
+
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  build_jacobian_coloring
+# ----------------------------------------------------------------------------------------------------------------------
+def build_jacobian_coloring(segment):
+    """
+    Groups the segment unknowns into colors that can be perturbed together when finite differencing the residuals
+
+    Parameters
+    ----------
+    segment : Segment
+        The mission segment being analyzed
+            - state.unknowns : Unknowns
+            - state.residuals : Residuals
+            - state.numerics.number_of_control_points : int
+
+    Returns
+    -------
+    coloring : Data
+        Column grouping of the residual Jacobian
+            - colors : list of arrays
+                Unknown indices perturbed in each process evaluation
+            - rows : list of arrays
+                Residual indices recovered from each color
+            - columns : list of arrays
+                Unknown index owning each recovered residual
+            - coupled : bool
+                True if the block-diagonal assumption does not hold
+            - verified : bool
+                True once the coloring has been checked against a directional derivative
+            - evaluations : int
+                Number of process evaluations spent on Jacobians
+
+    Notes
+    -----
+    Most segment residuals at a control point only depend on the unknowns at
+    that same control point, making the Jacobian block-diagonal. Unknowns that
+    belong to different control points can then be perturbed in the same
+    process evaluation, so a Jacobian costs one evaluation per unknown variable
+    rather than one per unknown value.
+
+    **Major Assumptions**
+        * Unknown and residual arrays with one row per control point are local to that control point
+        * Any other unknown is perturbed on its own
+        * Any other residual couples all unknowns, in which case the coloring is dense
+
+    See Also
+    --------
+    RCAIDE.Library.Mission.Solver.colored_jacobian
+    """
+
+    n_cp = segment.state.numerics.number_of_control_points
+
+    column_points = control_point_index(segment.state.unknowns,n_cp)
+    row_points    = control_point_index(segment.state.residuals,n_cp)
+    n_unknowns    = len(column_points)
+
+    coloring             = Data()
+    coloring.colors      = []
+    coloring.rows        = []
+    coloring.columns     = []
+    coloring.coupled     = False
+    coloring.verified    = False
+    coloring.evaluations = 0
+
+    # residuals that are not tied to a control point make the Jacobian dense
+    if np.any(row_points < 0) or n_cp == 1:
+        coloring.coupled  = True
+        coloring.verified = True
+        return coloring
+
+    # local unknowns are colored by their position within their control point
+    local   = np.where(column_points >= 0)[0]
+    rank    = np.zeros(n_unknowns,dtype=int)
+    counter = np.zeros(n_cp,dtype=int)
+    for j in local:
+        rank[j]                    = counter[column_points[j]]
+        counter[column_points[j]] += 1
+
+    for c in range(np.max(counter,initial=0)):
+        cols            = local[rank[local] == c]
+        lookup          = -np.ones(n_cp,dtype=int)
+        lookup[column_points[cols]] = cols
+        owner           = lookup[row_points]
+        rows            = np.where(owner >= 0)[0]
+        coloring.colors.append(cols)
+        coloring.rows.append(rows)
+        coloring.columns.append(owner[rows])
+
+    # global unknowns couple every residual
+    for j in np.where(column_points < 0)[0]:
+        coloring.colors.append(np.array([j]))
+        coloring.rows.append(np.arange(len(row_points)))
+        coloring.columns.append(np.full(len(row_points),j))
+
+    # no savings, let the solver do it
+    if len(coloring.colors) >= n_unknowns:
+        coloring.coupled  = True
+        coloring.verified = True
+
+    return coloring
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  colored_jacobian
+# ----------------------------------------------------------------------------------------------------------------------
+def colored_jacobian(unknowns, segment, coloring, coupling_tolerance = 1E-1):
+    """
+    Computes the Jacobian of the segment residuals with respect to the unknowns using colored finite differences
+
+    Parameters
+    ----------
+    unknowns : array
+        Packed segment unknowns
+    segment : Segment
+        The mission segment being analyzed
+            - state.numerics.solver.step_size : float
+    coloring : Data
+        Column grouping from build_jacobian_coloring, updated in place
+    coupling_tolerance : float, optional
+        Relative error allowed between a colored directional derivative and a
+        finite differenced one before the segment is declared coupled
+
+    Returns
+    -------
+    jacobian : array
+        Derivative of residual i with respect to unknown j in entry [i,j]
+
+    Notes
+    -----
+    The step size follows the forward difference used by MINPACK so the
+    colored and dense Jacobians are interchangeable. On the first call the
+    colored Jacobian is checked against a finite difference along a random
+    direction. If they disagree, the residuals couple control points and this
+    and every following call differences one unknown at a time.
+
+    **Major Assumptions**
+        * Segment residuals have the same length as the unknowns
+
+    See Also
+    --------
+    RCAIDE.Library.Mission.Solver.build_jacobian_coloring
+    """
+
+    x     = np.array(unknowns,dtype=float)
+    eps   = np.sqrt(max(segment.state.numerics.solver.step_size,np.finfo(float).eps))
+    h     = eps*np.abs(x)
+    h[h == 0.] = eps
+
+    F0    = evaluate_residuals(x,segment)
+    coloring.evaluations += 1
+    J     = np.zeros((len(F0),len(x)))
+
+    if not coloring.coupled:
+        for cols,rows,owner in zip(coloring.colors,coloring.rows,coloring.columns):
+            xp        = x.copy()
+            xp[cols] += h[cols]
+            dF        = evaluate_residuals(xp,segment) - F0
+            J[rows,owner] = dF[rows]/h[owner]
+        coloring.evaluations += len(coloring.colors)
+
+        # compare against a directional derivative to detect coupling between control points
+        if not coloring.verified:
+            rng       = np.random.default_rng(0)
+            d         = h*rng.choice([-1.,1.],size=len(x))
+            dF        = evaluate_residuals(x + d,segment) - F0
+            coloring.evaluations += 1
+            error     = np.linalg.norm(dF - np.dot(J,d))
+            scale     = max(np.linalg.norm(dF),np.finfo(float).tiny)
+            coloring.coupled  = not (error <= coupling_tolerance*scale)
+            coloring.verified = True
+
+    if coloring.coupled:
+        for j in range(len(x)):
+            xp      = x.copy()
+            xp[j]  += h[j]
+            J[:,j]  = (evaluate_residuals(xp,segment) - F0)/h[j]
+        coloring.evaluations += len(x)
+
+    return J
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------------------------------------------------------
+def evaluate_residuals(unknowns, segment):
+    """ Runs one iteration of the segment and returns the packed residuals
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        unknowns                      [array]
+        segment.process.iterate       [Data]
+
+        Outputs:
+        residuals                     [array]
+
+        Properties Used:
+        N/A
+    """
+    segment.state.unknowns.unpack_array(unknowns)
+    segment.process.iterate(segment)
+    return segment.state.residuals.pack_array()
+
+def control_point_index(data, n_cp):
+    """ Maps each entry of a packed Data vector to the control point it belongs to, following the pack plan of the
+        data. Entries that are not tied to a single control point are marked with -1.
+
+        Assumptions:
+        Arrays with n_cp rows are indexed by control point
+
+        Source:
+        N/A
+
+        Inputs:
+        data          [Data]
+        n_cp          [int]
+
+        Outputs:
+        index         [array]
+
+        Properties Used:
+        N/A
+    """
+    index = -np.ones(data.get_pack_plan().buffer.shape[0],dtype=int)
+
+    for D,k,start,shape,view in data.get_pack_plan().entries:
+        if shape and shape[0] == n_cp:
+            m = shape[1] if len(shape) == 2 else 1
+            index[start:start + n_cp*m] = np.tile(np.arange(n_cp),m)
+
+    return index
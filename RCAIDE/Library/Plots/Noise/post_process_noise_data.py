@@ -15,7 +15,7 @@ from RCAIDE.Library.Methods.Noise.Metrics.EPNL_noise_metric
 from RCAIDE.Library.Methods.Noise.Metrics.Equivalent_SENEL_SEL_noise_metrics          import Equivalent_SENEL_SEL_noise_metrics
 from RCAIDE.Library.Methods.Noise.Common.generate_zero_elevation_microphone_locations import generate_zero_elevation_microphone_locations 
 from RCAIDE.Library.Methods.Noise.Common.generate_terrain_microphone_locations        import generate_terrain_microphone_locations     
-from RCAIDE.Library.Methods.Noise.Common.compute_relative_noise_evaluation_locations  import compute_relative_noise_evaluation_locations
+from RCAIDE.Library.Methods.Noise.Common.compute_nearest_noise_evaluation_locations   import compute_nearest_noise_evaluation_locations, microphone_spatial_index
 from RCAIDE.Library.Methods.Geodesics.compute_point_to_point_geospacial_data          import compute_point_to_point_geospacial_data
 
 # package imports
@@ -150,6 +150,7 @@ def post_process_noise_data(results,
     mic_locs              = np.zeros((N_ctrl_pts,n))   
  
     idx =  0
+    spatial_indices = {}
     
     # Step 5: loop through segments and store noise 
     for seg in range(N_segs):  
@@ -160,69 +161,61 @@ def post_process_noise_data(results,
         conditions = segment.state.conditions  
         time       = conditions.frames.inertial.time[:,0]
         
-        # Step 5.1 : Compute relative microhpone locations 
-        noise_time,noise_pos,RML,PHI,THETA,num_gm_mic  = compute_relative_noise_evaluation_locations(settings, microphone_locations,segment) 
+        # Step 5.1 : Compute relative locations of the microphones closest to the aircraft 
+        MSL_altitude = bool(settings.mean_sea_level_altitude)
+        if MSL_altitude not in spatial_indices:
+            spatial_indices[MSL_altitude] = microphone_spatial_index(microphone_locations,MSL_altitude)
+        noise_time,noise_pos,locs,RML,PHI,THETA = compute_nearest_noise_evaluation_locations(settings,microphone_locations,segment,n,spatial_indices[MSL_altitude]) 
          
         # Step 5.2: Compute aircraft position and npose at interpolated hemisphere locations
-        cpt   = 0 
         if seg == (N_segs - 1):
             noise_time_ = noise_time 
         else:
             noise_time_ = noise_time[:-1]
+        N_steps      = len(noise_time_)
              
         Aircraft_pos = np.vstack((Aircraft_pos,noise_pos))
         Time         = np.hstack((Time,noise_time_))
         
-        for i in range(len(noise_time_)):
-            # Step 5.2.1 :Noise interpolation 
-            delta_t         = (noise_time[i] -time[cpt]) / (time[cpt+1] - time[cpt])
-            SPL_lower       = conditions.noise.hemisphere_SPL_dBA[cpt].reshape(len(phi),len(theta))
-            SPL_uppper      = conditions.noise.hemisphere_SPL_dBA[cpt+1].reshape(len(phi),len(theta))
-            SPL_gradient    = SPL_uppper -  SPL_lower
-            SPL_interp      = SPL_lower + SPL_gradient *delta_t
-            
-
-            SPL_lower_1_3_spectrum       = conditions.noise.hemisphere_SPL_1_3_spectrum_dBA[cpt].reshape(len(phi),len(theta),num_f)
-            SPL_uppper_1_3_spectrum      = conditions.noise.hemisphere_SPL_1_3_spectrum_dBA[cpt+1].reshape(len(phi),len(theta),num_f)
-            SPL_gradient_1_3_spectrum    = SPL_uppper_1_3_spectrum -  SPL_lower_1_3_spectrum
-            SPL_interp_1_3_spectrum      = SPL_lower_1_3_spectrum + SPL_gradient_1_3_spectrum *delta_t
-            
-     
-            #  Step 5.2.2 Create surrogate   
-            SPL_dBA_surrogate              = RegularGridInterpolator((phi, theta),SPL_interp  ,method = 'linear',   bounds_error=False, fill_value=None) 
-            SPL_dBA_1_3_spectrum_surrogate = RegularGridInterpolator((phi, theta),SPL_interp_1_3_spectrum  ,method = 'linear',   bounds_error=False, fill_value=None)       
-            
-            #  Step 5.2.3 Query surrogate
-            R                              = np.linalg.norm(RML[i], axis=1) 
-            locs                           = np.argsort(R)[:n]
-            pts                            = (PHI[i][locs],THETA[i][locs]) 
-            SPL_dBA_unscaled               = SPL_dBA_surrogate(pts) 
-            SPL_dBA_1_3_spectrum_unscaled  = SPL_dBA_1_3_spectrum_surrogate(pts) 
-            
-            #  Step 5.2.4 Scale data using radius  
-            R_ref                          = settings.noise_hemisphere_radius  
-            SPL_dBA_scaled                 = SPL_dBA_unscaled - 20*np.log10(R[locs]/R_ref)
-            SPL_dBA_1_3_spectrum_scaled    = SPL_dBA_1_3_spectrum_unscaled -  np.tile(20*np.log10(R[locs]/R_ref)[:, None], (1, num_f))
+        # Step 5.2.1 : Control points bounding each noise time, the control point advances after it is used 
+        cpts = np.zeros(N_steps,dtype=int)
+        cpt  = 0 
+        for i in range(N_steps):
+            cpts[i] = cpt
+            if noise_time[i] >= time[cpt+1]:
+                cpt += 1
+        delta_t = (noise_time_ -time[cpts]) / (time[cpts+1] - time[cpts])
             
-            # insert noise incorrect mic locations 
-            SPL_dBA_temp         = SPL_dBA[idx].flatten()
-            SPL_dBA_temp[locs]   = SPL_dBA_scaled
-            SPL_dBA[idx]         = SPL_dBA_temp.reshape(N_gm_x,N_gm_y) 
-
-            SPL_dBA_1_3_spectrum_temp         = SPL_dBA_1_3_spectrum[idx].reshape(N_gm_x*N_gm_y,num_f)
-            SPL_dBA_1_3_spectrum_temp[locs]   = SPL_dBA_1_3_spectrum_scaled
-            SPL_dBA_1_3_spectrum[idx]         = SPL_dBA_1_3_spectrum_temp.reshape(N_gm_x,N_gm_y,num_f) 
-
-            mic_locs[idx]        = locs 
-            idx += 1
+        #  Step 5.2.2 Query one hemisphere surrogate per control point, the dBA and spectrum levels are interpolated together 
+        hemisphere     = np.concatenate((conditions.noise.hemisphere_SPL_dBA[:,:,None],conditions.noise.hemisphere_SPL_1_3_spectrum_dBA),axis=2)
+        surrogates     = {}
+        SPL_unscaled   = np.zeros((N_steps,locs.shape[1],num_f+1))
+        for c in np.unique(cpts):
+            steps = np.where(cpts == c)[0]
+            pts   = (PHI[steps].ravel(),THETA[steps].ravel())
+            for ctrl_pt in [c,c+1]:
+                if ctrl_pt not in surrogates:
+                    surrogates[ctrl_pt] = RegularGridInterpolator((phi, theta),hemisphere[ctrl_pt].reshape(len(phi),len(theta),num_f+1),method = 'linear',   bounds_error=False, fill_value=None)
+            SPL_lower           = surrogates[c](pts).reshape(len(steps),-1,num_f+1)
+            SPL_uppper          = surrogates[c+1](pts).reshape(len(steps),-1,num_f+1)
+            SPL_unscaled[steps] = SPL_lower + (SPL_uppper - SPL_lower)*delta_t[steps,None,None]
+        
+        #  Step 5.2.3 Scale data using radius  
+        R_ref                          = settings.noise_hemisphere_radius  
+        R                              = np.linalg.norm(RML[:N_steps], axis=2)
+        SPL_scaled                     = SPL_unscaled - 20*np.log10(R/R_ref)[:,:,None]
             
-            if noise_time[i] >= time[cpt+1]:
-                cpt += 1             
+        # insert noise incorrect mic locations 
+        rows                                                         = np.arange(idx,idx + N_steps)[:,None]
+        SPL_dBA.reshape(N_ctrl_pts,num_gm_mic)[rows,locs[:N_steps]]  = SPL_scaled[:,:,0]
+        SPL_dBA_1_3_spectrum.reshape(N_ctrl_pts,num_gm_mic,num_f)[rows,locs[:N_steps]] = SPL_scaled[:,:,1:]
+        mic_locs[idx:idx + N_steps,:locs.shape[1]]                   = locs[:N_steps]
+        idx += N_steps
                 
     # Step 6: Make any readings less that background noise equal to background noise
-    SPL_dBA                             = np.nan_to_num(SPL_dBA) 
+    SPL_dBA                             = np.nan_to_num(SPL_dBA,copy=False) 
     SPL_dBA[SPL_dBA<background_noise()] = background_noise() 
-    SPL_dBA_1_3_spectrum                             = np.nan_to_num(SPL_dBA_1_3_spectrum) 
+    SPL_dBA_1_3_spectrum                             = np.nan_to_num(SPL_dBA_1_3_spectrum,copy=False) 
     SPL_dBA_1_3_spectrum[SPL_dBA_1_3_spectrum<background_noise()] = background_noise()
     
      
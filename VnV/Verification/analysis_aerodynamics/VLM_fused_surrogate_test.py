@@ -0,0 +1,75 @@
+# VLM_fused_surrogate_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the stacked VLM surrogate tables give the same coefficients as the individual interpolators
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                      import Data, Units
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method  import evaluate_fused_surrogate
+
+from scipy.interpolate import RegularGridInterpolator, interp1d
+import sys
+import os
+import numpy as np
+
+# import vehicle file
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737  import vehicle_setup   as b737_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    aerodynamics = get_analysis(b737_setup())
+    aerodynamics.initialize()
+
+    # query points inside and outside of the training grids
+    n     = 25
+    rng   = np.random.default_rng(0)
+    Mach  = np.atleast_2d(rng.uniform(0.05, 2.5, n)).T
+    perturbations = Data()
+    for perturbation in ['alpha','beta','u','v','w','p','q','r','delta_a','delta_e','delta_r','delta_f','delta_s']:
+        perturbations[perturbation] = np.atleast_2d(rng.uniform(-0.5, 0.5, n)).T
+    perturbations.alpha[0] = 80. * Units.degrees
+
+    for regime in ['subsonic','transonic','supersonic']:
+        surrogates = aerodynamics.surrogates[regime]
+        values     = evaluate_fused_surrogate(surrogates.fused, Mach, perturbations)
+        count      = 0
+        for name, interpolator in surrogates.items():
+            if isinstance(interpolator, RegularGridInterpolator):
+                points = np.hstack((perturbations[name.split('_',1)[1]], Mach))
+                compare(values[name], interpolator(points), name)
+                count += 1
+            elif isinstance(interpolator, interp1d):
+                compare(values[name], interpolator(Mach), name)
+                count += 1
+        for name in ['Clift_wing_alpha','Cdrag_wing_alpha']:
+            for tag, interpolator in surrogates[name].items():
+                points = np.hstack((perturbations.alpha, Mach))
+                compare(values[name][tag], interpolator(points), name + ' ' + tag)
+                count += 1
+        print('{} : {} tables checked'.format(regime, count))
+        assert count > 100
+    return
+
+def compare(fused, reference, name):
+    reference = np.reshape(reference, np.shape(fused))
+    error     = np.max(np.abs(fused - reference)/np.maximum(np.abs(reference), 1.))
+    assert error < 1e-12, 'Failed at {} test'.format(name)
+    return
+
+def get_analysis(vehicle):
+    aerodynamics                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                               = vehicle
+    aerodynamics.settings.number_of_spanwise_vortices  = 5
+    aerodynamics.settings.number_of_chordwise_vortices = 2
+    aerodynamics.training.Mach                         = np.array([0.1, 0.5, 0.9, 1.3, 1.5, 2.0])
+    return aerodynamics
+
+if __name__ == '__main__':
+    main()
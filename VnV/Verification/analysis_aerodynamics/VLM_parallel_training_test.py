@@ -0,0 +1,65 @@
+# VLM_parallel_training_test.py
+# 
+# Created:  Oct 2026, RCAIDE Team
+# 
+# File to test that VLM surrogate training sweeps give the same results in a process pool as serially
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                      import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method  import train_VLM_surrogates
+
+import sys
+import os
+import time
+import numpy as np
+
+# import vehicle file
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737  import vehicle_setup   as b737_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    vehicle  = b737_setup()
+    
+    serial   = get_analysis(vehicle, 1)
+    t0       = time.time()
+    train_VLM_surrogates(serial)
+    t1       = time.time()
+    
+    parallel = get_analysis(vehicle, 3)
+    train_VLM_surrogates(parallel)
+    t2       = time.time()
+    
+    print('serial training time   : {:.3f} s'.format(t1 - t0))
+    print('parallel training time : {:.3f} s'.format(t2 - t1))
+    
+    for regime in ['subsonic','supersonic','transonic']:
+        compare(serial.training[regime], parallel.training[regime], regime)
+    compare(serial.reference_values, parallel.reference_values, 'reference_values')
+    return
+
+def get_analysis(vehicle, workers):
+    aerodynamics                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                               = vehicle
+    aerodynamics.settings.number_of_training_workers   = workers
+    aerodynamics.settings.number_of_spanwise_vortices  = 5
+    aerodynamics.settings.number_of_chordwise_vortices = 2 
+    return aerodynamics
+
+def compare(a, b, path):
+    assert list(a.keys()) == list(b.keys()), path
+    for key in a.keys():
+        if isinstance(a[key], Data):
+            compare(a[key], b[key], path + '.' + key)
+        else:
+            # the process pool must reproduce the serial results bit for bit
+            assert np.array_equal(a[key], b[key], equal_nan=True), 'Failed at ' + path + '.' + key
+    return
+
+if __name__ == '__main__':
+    main()
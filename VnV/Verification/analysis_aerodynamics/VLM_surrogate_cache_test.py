@@ -0,0 +1,95 @@
+# VLM_surrogate_cache_test.py
+# 
+# Created:  Oct 2026, RCAIDE Team
+# 
+# File to test the on-disk cache of the VLM surrogate training data
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                      import Data, Units
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method  import VLM_surrogate_cache_statistics, compute_VLM_training_hash, clear_VLM_surrogate_cache
+
+import sys
+import os
+import time
+import tempfile
+import numpy as np
+
+# import vehicle file
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737  import vehicle_setup   as b737_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    directory = tempfile.mkdtemp()
+    vehicle   = b737_setup()
+
+    # first initialization trains and stores the surrogate data
+    aerodynamics = get_analysis(vehicle, directory)
+    key          = compute_VLM_training_hash(aerodynamics)
+    t0           = time.time()
+    aerodynamics.initialize()
+    t1           = time.time()
+    assert compute_VLM_training_hash(aerodynamics) == key, 'Training changed the cache key'
+
+    stats = VLM_surrogate_cache_statistics(directory)
+    assert stats.entries == 1 and stats.writes == 1 and stats.hits == 0 
+
+    # an identical analysis loads the stored data
+    cached = get_analysis(vehicle, directory)
+    t2     = time.time()
+    cached.initialize()
+    t3     = time.time()
+    
+    stats = VLM_surrogate_cache_statistics(directory)
+    assert stats.hits == 1 and stats.entries == 1 
+    print('training time : {:.3f} s'.format(t1 - t0))
+    print('cached time   : {:.3f} s'.format(t3 - t2))
+
+    compare(aerodynamics.training.subsonic, cached.training.subsonic)
+    compare(aerodynamics.reference_values, cached.reference_values)
+    for flag in ['aileron_flag','elevator_flag','rudder_flag','slat_flag','flap_flag']:
+        assert aerodynamics[flag] == cached[flag]
+        
+    # a geometry change is a miss, and the eviction policy keeps the most recent entry
+    vehicle.wings.main_wing.spans.projected *= 1.01
+    modified = get_analysis(vehicle, directory)
+    modified.settings.surrogate_cache.maximum_entries = 1
+    assert compute_VLM_training_hash(modified) != key
+    modified.initialize()
+    
+    stats = VLM_surrogate_cache_statistics(directory)
+    assert stats.entries == 1 and stats.evictions == 1 and stats.writes == 2 
+    assert os.path.isfile(os.path.join(directory, compute_VLM_training_hash(modified) + '.npz'))
+
+    assert clear_VLM_surrogate_cache(directory) == 1
+    assert VLM_surrogate_cache_statistics(directory).entries == 0
+    os.rmdir(directory)
+    return
+
+def get_analysis(vehicle, directory):
+    aerodynamics                                  = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                          = vehicle
+    aerodynamics.settings.surrogate_cache.enabled   = True
+    aerodynamics.settings.surrogate_cache.directory = directory
+    aerodynamics.settings.share_surrogates        = False  # test the on-disk cache rather than the surrogate registry
+    aerodynamics.settings.number_of_spanwise_vortices  = 5
+    aerodynamics.settings.number_of_chordwise_vortices = 2
+    aerodynamics.training.Mach                    = np.array([0.1, 0.3, 0.5, 0.7])
+    return aerodynamics
+
+def compare(a, b):
+    assert list(a.keys()) == list(b.keys())
+    for key in a.keys():
+        if isinstance(a[key], Data):
+            compare(a[key], b[key])
+        else:
+            assert np.array_equal(a[key], b[key]), key
+    return
+
+if __name__ == '__main__':
+    main()
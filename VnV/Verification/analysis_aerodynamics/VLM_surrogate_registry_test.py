@@ -0,0 +1,82 @@
+# VLM_surrogate_registry_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the aerodynamics and stability analyses of identical vehicles share their VLM surrogates
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                      import Units
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method  import clear_VLM_surrogate_registry, VLM_surrogate_registry_statistics
+
+from copy import deepcopy
+import sys
+import os
+import numpy as np
+
+# import vehicle file
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737  import vehicle_setup   as b737_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    vehicle = b737_setup()
+    clear_VLM_surrogate_registry()
+    start   = VLM_surrogate_registry_statistics()
+
+    # the aerodynamics analysis trains the surrogates
+    aerodynamics = get_analysis(RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method, vehicle)
+    aerodynamics.initialize()
+
+    # the stability analysis and the analyses of an identical configuration reuse them
+    stability     = get_analysis(RCAIDE.Framework.Analyses.Stability.Vortex_Lattice_Method, vehicle)
+    stability.initialize()
+    cruise_config = get_analysis(RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method, deepcopy(vehicle))
+    cruise_config.initialize()
+    stats = VLM_surrogate_registry_statistics()
+    print(stats)
+    assert stats.misses - start.misses == 1
+    assert stats.hits   - start.hits   == 2
+    assert stability.surrogates is aerodynamics.surrogates
+    assert cruise_config.surrogates is aerodynamics.surrogates
+    for key in ['S_ref','c_ref','b_ref','X_ref','Y_ref','Z_ref']:
+        assert stability.reference_values[key] == aerodynamics.reference_values[key]
+
+    # a configuration with deflected flaps is trained separately
+    landing_vehicle = deepcopy(vehicle)
+    landing_vehicle.wings.main_wing.control_surfaces.flap.deflection = 20. * Units.degrees
+    landing_config  = get_analysis(RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method, landing_vehicle)
+    landing_config.initialize()
+    stats = VLM_surrogate_registry_statistics()
+    assert stats.misses - start.misses == 2
+    assert stats.entries == 2
+    assert landing_config.surrogates is not aerodynamics.surrogates
+
+    # the shared surrogates match the ones trained without the registry
+    unshared = get_analysis(RCAIDE.Framework.Analyses.Stability.Vortex_Lattice_Method, vehicle)
+    unshared.settings.share_surrogates = False
+    unshared.initialize()
+    assert VLM_surrogate_registry_statistics().misses - start.misses == 2
+    for regime in ['subsonic','transonic','supersonic']:
+        for key, value in unshared.training[regime].items():
+            if isinstance(value, np.ndarray):
+                assert np.array_equal(value, stability.training[regime][key]), 'Failed at {} {} test'.format(regime, key)
+
+    clear_VLM_surrogate_registry()
+    assert VLM_surrogate_registry_statistics().entries == 0
+    return
+
+def get_analysis(analysis, vehicle):
+    aerodynamics                                       = analysis()
+    aerodynamics.vehicle                               = vehicle
+    aerodynamics.settings.number_of_spanwise_vortices  = 5
+    aerodynamics.settings.number_of_chordwise_vortices = 2
+    aerodynamics.training.Mach                         = np.array([0.1, 0.5, 0.9, 1.3, 1.5, 2.0])
+    return aerodynamics
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# VLM_tiled_influence_matrix_test.py
+# 
+# Created:  Oct 2026, RCAIDE Team
+# 
+# File to test that VLM gives the same results when the influence matrix is built in tiles of limited memory
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                      import Units
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method  import VLM
+
+import sys
+import os
+import numpy as np
+
+# import vehicle file
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737  import vehicle_setup   as b737_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    vehicle    = b737_setup()
+    conditions = get_conditions()
+    settings   = get_settings()
+    
+    # build the influence matrix in one piece
+    settings.influence_matrix_memory_budget = None 
+    full   = VLM(conditions, settings, vehicle)
+    
+    # build it in tiles of a few control points
+    settings.influence_matrix_memory_budget = 5E6
+    tiled  = VLM(conditions, settings, vehicle)
+    
+    print('full  : {} tile(s), peak memory {:.2f} MB'.format(full.influence_report.tiles , full.influence_report.peak_memory/1E6))
+    print('tiled : {} tile(s), peak memory {:.2f} MB'.format(tiled.influence_report.tiles, tiled.influence_report.peak_memory/1E6))
+    
+    assert tiled.influence_report.tiles > 1
+    assert tiled.influence_report.peak_memory < full.influence_report.peak_memory
+    
+    # the tiles hold the same induced velocities, so the results are identical
+    for key in ['CLift','CDrag_induced','CX','CY','CZ','CL','CM','CN','CP','gamma']:
+        assert np.array_equal(full[key], tiled[key], equal_nan=True), 'Failed at {} test'.format(key)
+    return
+
+def get_conditions():
+    machs      = np.array([0.4, 0.8, 1.4, 2.0])
+    alphas     = np.array([0. , 2. , 4. , 6. ]) * Units.degrees
+    conditions = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(len(machs))
+    conditions.freestream.mach_number[:,0]    = machs
+    conditions.freestream.velocity[:,0]       = machs * 343.
+    conditions.aerodynamics.angles.alpha[:,0] = alphas
+    return conditions
+
+def get_settings():
+    settings = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method().settings
+    settings.number_of_spanwise_vortices  = 15
+    settings.number_of_chordwise_vortices = 5 
+    settings.model_fuselage               = True
+    return settings
+
+if __name__ == '__main__':
+    main()
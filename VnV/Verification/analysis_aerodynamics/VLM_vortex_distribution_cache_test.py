@@ -0,0 +1,87 @@
+# VLM_vortex_distribution_cache_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that VLM reuses the vortex distribution of an unchanged geometry and regenerates it when the wings change
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                      import Units
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method  import VLM, clear_vortex_distribution_cache, vortex_distribution_cache_statistics
+
+import sys
+import os
+import numpy as np
+
+# import vehicle file
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737  import vehicle_setup   as b737_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    vehicle    = b737_setup()
+    conditions = get_conditions()
+    settings   = get_settings()
+    clear_vortex_distribution_cache()
+
+    # reference results without the cache
+    settings.cache_vortex_distribution = False
+    uncached = VLM(conditions, settings, vehicle)
+
+    # the first call generates the vortex distribution, the second one reuses it
+    settings.cache_vortex_distribution = True
+    start    = vortex_distribution_cache_statistics()
+    first    = VLM(conditions, settings, vehicle)
+    second   = VLM(conditions, settings, vehicle)
+    stats    = vortex_distribution_cache_statistics()
+    print(stats)
+
+    assert stats.misses - start.misses == 1
+    assert stats.hits   - start.hits   == 1
+    assert stats.entries == 1
+    for key in ['CLift','CDrag_induced','CL','CM','CP','gamma']:
+        assert np.array_equal(uncached[key], first[key] , equal_nan=True), 'Failed at {} test'.format(key)
+        assert np.array_equal(uncached[key], second[key], equal_nan=True), 'Failed at {} test'.format(key)
+
+    # a control surface deflection changes the panels, so a new vortex distribution is generated
+    vehicle.wings.main_wing.control_surfaces.flap.deflection = 10. * Units.degrees
+    deflected = VLM(conditions, settings, vehicle)
+    stats     = vortex_distribution_cache_statistics()
+    assert stats.misses - start.misses == 2
+    assert stats.entries == 2
+    assert not np.array_equal(first.CLift, deflected.CLift)
+
+    # going back to the original deflection reuses the first vortex distribution
+    vehicle.wings.main_wing.control_surfaces.flap.deflection = 0.
+    third = VLM(conditions, settings, vehicle)
+    stats = vortex_distribution_cache_statistics()
+    assert stats.hits - start.hits == 2
+    assert np.array_equal(first.CLift, third.CLift)
+
+    clear_vortex_distribution_cache()
+    assert vortex_distribution_cache_statistics().entries == 0
+    return
+
+def get_conditions():
+    machs      = np.array([0.3, 0.6, 0.8])
+    alphas     = np.array([1. , 2. , 4. ]) * Units.degrees
+    conditions = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(len(machs))
+    conditions.freestream.mach_number[:,0]    = machs
+    conditions.freestream.velocity[:,0]       = machs * 343.
+    conditions.aerodynamics.angles.alpha[:,0] = alphas
+    return conditions
+
+def get_settings():
+    settings = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method().settings
+    settings.number_of_spanwise_vortices  = 15
+    settings.number_of_chordwise_vortices = 5
+    settings.discretize_control_surfaces  = True
+    return settings
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+# airfoil_boundary_layer_lanes_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the boundary layer of a batch of angles of attack and Reynolds numbers, marched together, matches
+# the boundary layer of each angle of attack and Reynolds number computed alone
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from RCAIDE.Framework.Core                                      import Units
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method   import airfoil_analysis
+from RCAIDE.Library.Methods.Geometry.Airfoil                    import compute_naca_4series
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    airfoil_geometry = compute_naca_4series('4412', npoints = 151)
+    alpha            = np.atleast_2d(np.array([-4., 0., 5., 10.])) * Units.degrees
+    Re               = np.tile(np.array([[1E5],[5E5],[3E6]]),(1,alpha.shape[1]))
+    batch            = airfoil_analysis(airfoil_geometry, alpha, Re)
+
+    for i in range(Re.shape[0]):
+        for j in range(alpha.shape[1]):
+            single = airfoil_analysis(airfoil_geometry, alpha[:,j:j+1], Re[i:i+1,j:j+1])
+            for key in ['theta','delta_star','delta','H','cf','Re_theta','Re_x','cd_visc']:
+                reference = np.asarray(single[key])[0,0]
+                error     = np.max(np.abs(np.asarray(batch[key])[i,j] - reference)/np.maximum(np.abs(reference),1E-3*np.max(np.abs(reference))))
+                assert error < 1e-8, 'Failed at {} test, alpha index {}, Re index {}'.format(key, j, i)
+    print('batched boundary layer passed')
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# airfoil_panel_method_geometry_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the Hess-Smith panel method gives the same velocity distribution whether the cases share their
+# airfoil geometry or not
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from RCAIDE.Framework.Core                                      import Units
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method   import hess_smith
+from RCAIDE.Library.Methods.Geometry.Airfoil                    import compute_naca_4series
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    airfoil_1 = compute_naca_4series('2412', npoints = 101)
+    airfoil_2 = compute_naca_4series('4415', npoints = 101)
+    npanel    = len(airfoil_1.x_coordinates) - 1
+    alpha     = np.atleast_2d(np.array([-2., 0., 4., 8.])) * Units.degrees
+    Re        = np.ones((3,4)) * 1E6
+    ncases    = alpha.shape[1]
+    ncpts     = len(Re)
+
+    # reference solved one case at a time
+    reference = np.zeros((2,npanel,ncases,ncpts))
+    for k, airfoil in enumerate([airfoil_1, airfoil_2]):
+        for i in range(ncases):
+            x = airfoil.x_coordinates[:,None,None]
+            y = airfoil.y_coordinates[:,None,None]
+            _,_,vt,_ = hess_smith(x, y, alpha[:,i:i+1], Re[:1,:1], npanel)
+            reference[k,:,i,:] = vt[:,0,:]
+
+    # every case shares one geometry
+    x_coord  = np.tile(airfoil_1.x_coordinates[:,None,None],(1,ncases,ncpts))
+    y_coord  = np.tile(airfoil_1.y_coordinates[:,None,None],(1,ncases,ncpts))
+    _,_,vt,_ = hess_smith(x_coord, y_coord, alpha, Re, npanel)
+    error    = np.max(np.abs(vt - reference[0]))
+    print('shared geometry error   : ', error)
+    assert error < 1e-12
+
+    # the control points alternate between two geometries
+    x_coord[:,:,1] = airfoil_2.x_coordinates[:,None]
+    y_coord[:,:,1] = airfoil_2.y_coordinates[:,None]
+    _,_,vt,_ = hess_smith(x_coord, y_coord, alpha, Re, npanel)
+    error    = max(np.max(np.abs(vt[:,:,[0,2]] - reference[0][:,:,[0,2]])), np.max(np.abs(vt[:,:,1] - reference[1][:,:,1])))
+    print('two geometries error    : ', error)
+    assert error < 1e-12
+
+    # every case has its own geometry
+    x_coord  = x_coord + np.linspace(0, 1E-3, ncases*ncpts).reshape(1,ncases,ncpts)
+    _,_,vt,_ = hess_smith(x_coord, y_coord, alpha, Re, npanel)
+    for i in range(ncases):
+        for j in range(ncpts):
+            _,_,vt_ij,_ = hess_smith(x_coord[:,i:i+1,j:j+1], y_coord[:,i:i+1,j:j+1], alpha[:,i:i+1], Re[:1,:1], npanel)
+            assert np.max(np.abs(vt[:,i,j] - vt_ij[:,0,0])) < 1e-12
+    print('distinct geometries passed')
+    return
+
+if __name__ == '__main__':
+    main()
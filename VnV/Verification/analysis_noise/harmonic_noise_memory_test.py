@@ -0,0 +1,109 @@
+# harmonic_noise_memory_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the harmonic rotor noise of every fidelity does not depend on the number of microphones computed
+# together, and that a memory budget bounds the memory of the harmonic noise kernels
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                                        import Units
+from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor                  import compute_rotor_noise
+from RCAIDE.Framework.Mission.Common                                              import Results
+from RCAIDE.Framework.Mission.Segments.Segment                                    import Segment
+from RCAIDE.Library.Methods.Powertrain.Converters.Rotor.compute_rotor_performance import compute_rotor_performance
+
+import numpy as np
+import tracemalloc
+import time
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles' + os.path.sep + 'Rotors'))
+from F8745_D4_Propeller  import F8745_D4_Propeller
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    rotor                           = F8745_D4_Propeller()
+    rotor.number_azimuthal_stations = 16
+    rotor.use_2d_analysis           = True
+    theta                           = np.linspace(5,175,24)*Units.degrees
+    S                               = 4.
+    mic_positions                   = np.stack([-S*np.cos(theta), S*np.sin(theta), np.zeros_like(theta)],axis=1)
+    segment                         = setup_segment(rotor,mic_positions)
+
+    for fidelity in ['point_source', 'line_source', 'plane_source']:
+        settings          = RCAIDE.Framework.Analyses.Noise.Frequency_Domain_Buildup().settings
+        settings.fidelity = fidelity
+        settings.use_plane_loading_surrogate = False
+
+        # all microphones at once
+        settings.harmonic_noise_memory_budget = None
+        reference, reference_time, reference_peak = run_harmonic_noise(rotor,segment,settings,mic_positions)
+
+        # a budget of a single byte computes one microphone at a time
+        settings.harmonic_noise_memory_budget = 1
+        chunked, chunked_time, chunked_peak       = run_harmonic_noise(rotor,segment,settings,mic_positions)
+
+        print(fidelity + ' one chunk  : time = {:.3f} s, peak memory = {:.1f} MB'.format(reference_time,reference_peak/1E6))
+        print(fidelity + ' per mic    : time = {:.3f} s, peak memory = {:.1f} MB'.format(chunked_time,chunked_peak/1E6))
+
+        error = np.max(np.abs(chunked - reference))
+        print(fidelity + ' chunked spectrum error : ', error)
+        assert error < 1E-10
+        if fidelity == 'plane_source':
+            # the chordwise integrands of the plane source dominate the memory of the rotor noise
+            assert chunked_peak < 0.75*reference_peak
+    return
+
+# ----------------------------------------------------------------------
+#   Run the harmonic noise and record its peak memory
+# ----------------------------------------------------------------------
+def run_harmonic_noise(rotor,segment,settings,mic_positions):
+    conditions = segment.state.conditions
+    tracemalloc.start()
+    ti = time.time()
+    compute_rotor_noise(mic_positions,rotor,segment,settings)
+    tf = time.time()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    spectrum = np.array(conditions.noise.converters[rotor.tag].SPL_harmonic_bpf_spectrum)
+    return spectrum, tf - ti, peak
+
+# ----------------------------------------------------------------------
+#   Operating conditions
+# ----------------------------------------------------------------------
+def setup_segment(rotor,mic_positions):
+    a          = 343.376
+    test_omega = np.array([2390,2710]) * Units.rpm
+    ctrl_pts   = len(test_omega)
+    AoA        = np.zeros(ctrl_pts)
+
+    segment                                                = Segment()
+    conditions                                             = Results()
+    conditions.noise.relative_microphone_locations         = mic_positions[None,:,:]
+    conditions.noise.number_of_microphones                 = len(mic_positions)
+    conditions.aerodynamics.angles.alpha                   = np.atleast_2d(AoA).T
+    conditions.freestream.density                          = np.ones((ctrl_pts,1)) * 1.2250
+    conditions.freestream.dynamic_viscosity                = np.ones((ctrl_pts,1)) * 1.81E-5
+    conditions.freestream.speed_of_sound                   = np.ones((ctrl_pts,1)) * a
+    conditions.freestream.temperature                      = np.ones((ctrl_pts,1)) * 288.16889478
+    conditions.frames.inertial.velocity_vector             = np.array([[77.2, 0. ,0.],[ 77.0,0.,0.]])
+    conditions.freestream.mach_number                      = np.atleast_2d(np.linalg.norm(conditions.frames.inertial.velocity_vector,axis = 1)).T/ a
+    conditions.frames.planet.true_course                   = np.tile(np.eye(3)[None,:,:],(ctrl_pts,1,1))
+    conditions.frames.wind.transform_to_inertial           = np.tile(np.eye(3)[None,:,:],(ctrl_pts,1,1))
+    conditions.frames.body.transform_to_inertial           = np.tile(np.eye(3)[None,:,:],(ctrl_pts,1,1))
+    segment.state.conditions                               = conditions
+
+    rotor.append_operating_conditions(segment, segment.state.conditions.energy,segment.state.conditions.noise)
+    segment.state.conditions.expand_rows(ctrl_pts)
+    segment.state.conditions.energy.converters[rotor.tag].omega[:,0] = test_omega
+    compute_rotor_performance(rotor,segment.state.conditions)
+    return segment
+
+if __name__ == '__main__':
+    main()
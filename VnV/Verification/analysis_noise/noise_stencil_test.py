@@ -0,0 +1,105 @@
+# noise_stencil_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the spatial index of the ground microphones finds the same noise evaluation stencils as the
+# distances to every microphone, and that the post processed noise of a flight path is only set at the stencils
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                          import Data
+from RCAIDE.Framework.Mission.Segments.Segment      import Container
+from RCAIDE.Library.Methods.Noise.Common            import compute_relative_noise_evaluation_locations, compute_nearest_noise_evaluation_locations
+from RCAIDE.Library.Methods.Noise.Common            import generate_zero_elevation_microphone_locations, background_noise
+from RCAIDE.Library.Plots                           import post_process_noise_data
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    results = setup_results()
+
+    # stencils of the spatial index against the distances to every microphone
+    for MSL_altitude in [False, True]:
+        for segment in results.segments:
+            settings                         = segment.analyses.noise.settings
+            settings.mean_sea_level_altitude = MSL_altitude
+            n                                = settings.number_of_microphone_in_stencil
+            microphone_locations             = generate_zero_elevation_microphone_locations(settings)
+            microphone_locations[:,2]        = np.linspace(0,25,len(microphone_locations))
+
+            _,_,RML_all,PHI_all,THETA_all,_  = compute_relative_noise_evaluation_locations(settings,microphone_locations,segment)
+            _,_,locs,RML,PHI,THETA           = compute_nearest_noise_evaluation_locations(settings,microphone_locations,segment,n)
+            for i in range(len(locs)):
+                # microphones at the same distance are ordered by their index
+                reference = np.argsort(np.linalg.norm(RML_all[i],axis=1),kind='stable')[:n]
+                assert np.array_equal(locs[i],reference)
+                assert np.array_equal(RML[i],RML_all[i][reference])
+                assert np.array_equal(PHI[i],PHI_all[i][reference])
+                assert np.array_equal(THETA[i],THETA_all[i][reference])
+            settings.mean_sea_level_altitude = False
+
+    # noise of the flight path
+    noise_data = post_process_noise_data(results)
+    SPL_dBA    = noise_data.SPL_dBA
+    print('Maximum SPL_dBA : ', np.max(SPL_dBA))
+    assert np.all(SPL_dBA >= background_noise())
+    assert np.all(np.isfinite(noise_data.SPL_dBA_1_3_spectrum))
+
+    # only the stencil of each noise evaluation time is above the background noise
+    n = results.segments[0].analyses.noise.settings.number_of_microphone_in_stencil
+    for idx in range(len(noise_data.time)):
+        locs          = noise_data.microhpone_locations[idx].astype(int)
+        outside       = np.ones(SPL_dBA[idx].size,dtype=bool)
+        outside[locs] = False
+        assert len(np.unique(locs)) == n
+        assert np.all(SPL_dBA[idx].flatten()[outside] == background_noise())
+    return
+
+# ----------------------------------------------------------------------
+#   Flight path with synthetic noise hemispheres
+# ----------------------------------------------------------------------
+def setup_results():
+    rng     = np.random.default_rng(0)
+    results = Container()
+    t0      = 0.
+    x0      = -500.
+    for s,ctrl_pts in enumerate([4,6]):
+        settings                                 = RCAIDE.Framework.Analyses.Noise.Frequency_Domain_Buildup().settings
+        settings.microphone_x_resolution         = 40
+        settings.microphone_y_resolution         = 30
+        settings.microphone_min_y                = -300
+        settings.microphone_max_y                = 300
+        settings.noise_times_steps               = 41
+        N_hemisphere_mics                        = len(settings.noise_hemisphere_phi_angles)*len(settings.noise_hemisphere_theta_angles)
+
+        segment                                  = Data()
+        segment.analyses                         = Data()
+        segment.analyses.noise                   = Data()
+        segment.analyses.noise.settings          = settings
+        segment.state                            = Data()
+        segment.state.conditions                 = conditions = Data()
+        conditions.frames                        = Data()
+        conditions.frames.inertial               = Data()
+        conditions.noise                         = Data()
+
+        # straight and level flight above the microphones
+        time                                     = t0 + np.linspace(0,20,ctrl_pts)
+        position                                 = np.zeros((ctrl_pts,3))
+        position[:,0]                            = x0 + 50*(time - t0)
+        position[:,2]                            = -300
+        conditions.frames.inertial.time          = time[:,None]
+        conditions.frames.inertial.position_vector = position
+        conditions.noise.hemisphere_SPL_dBA      = 60 + 10*rng.random((ctrl_pts,N_hemisphere_mics))
+        conditions.noise.hemisphere_SPL_1_3_spectrum_dBA = 50 + 10*rng.random((ctrl_pts,N_hemisphere_mics,len(settings.center_frequencies)))
+        results.segments['segment_' + str(s)]    = segment
+        t0                                       = time[-1]
+        x0                                       = position[-1,0]
+    return results
+
+if __name__ == '__main__':
+    main()
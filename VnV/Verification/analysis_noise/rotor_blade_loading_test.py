@@ -0,0 +1,84 @@
+# rotor_blade_loading_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the blade loading of the plane source rotor noise, computed for all control points in one batch
+# and kept in the blade loading cache, matches the panel method run on each control point
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                              import Units
+from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor        import compute_rotor_blade_loading, clear_blade_loading_cache, blade_loading_cache_statistics
+from RCAIDE.Library.Methods.Geometry.Airfoil                            import import_airfoil_geometry
+from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method           import airfoil_analysis
+
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles' + os.path.sep + 'Rotors'))
+from F8745_D4_Propeller         import F8745_D4_Propeller
+from harmonic_noise_memory_test import setup_segment
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    rotor                           = F8745_D4_Propeller()
+    rotor.number_azimuthal_stations = 16
+    rotor.use_2d_analysis           = True
+    theta                           = np.array([30,90,150])*Units.degrees
+    mic_positions                   = np.stack([-4*np.cos(theta), 4*np.sin(theta), np.zeros_like(theta)],axis=1)
+    segment                         = setup_segment(rotor,mic_positions)
+    aeroacoustic_data               = segment.state.conditions.energy.converters[rotor.tag]
+
+    settings                             = RCAIDE.Framework.Analyses.Noise.Frequency_Domain_Buildup().settings
+    settings.use_plane_loading_surrogate = False
+
+    # reference computed one control point at a time
+    airfoil          = rotor.airfoils[list(rotor.airfoils.keys())[0]]
+    airfoil_geometry = import_airfoil_geometry(airfoil.coordinate_file,airfoil.number_of_points)
+    Re               = aeroacoustic_data.disc_reynolds_number
+    AOA              = aeroacoustic_data.disc_effective_angle_of_attack
+    num_cpt,num_sec,num_az = np.shape(Re)
+    chord_coord      = int(np.floor(airfoil.number_of_points/2))
+    reference_fL     = np.zeros((num_cpt,num_sec,num_az,chord_coord))
+    reference_CL     = np.zeros((num_cpt,num_sec,num_az))
+    for cpt in range(num_cpt):
+        airfoil_properties    = airfoil_analysis(airfoil_geometry,np.atleast_2d(AOA[cpt].flatten()),np.atleast_2d(Re[cpt].flatten()))
+        reference_fL[cpt]     = airfoil_properties.fL[:,:,0].T.reshape(num_sec,num_az,chord_coord)
+        reference_CL[cpt]     = airfoil_properties.cl_invisc.reshape(num_sec,num_az)
+
+    # every control point in one batch
+    clear_blade_loading_cache()
+    statistics_0 = blade_loading_cache_statistics()
+    compute_rotor_blade_loading(rotor,aeroacoustic_data,settings)
+    fL_error     = np.max(np.abs(aeroacoustic_data.disc_lift_distribution - reference_fL))
+    CL_error     = np.max(np.abs(aeroacoustic_data.disc_lift_coefficient - reference_CL))
+    print('batched lift distribution error : ', fL_error)
+    print('batched lift coefficient error  : ', CL_error)
+    assert fL_error < 1E-8
+    assert CL_error < 1E-8
+
+    # the sections are served by the cache the second time
+    statistics_1 = blade_loading_cache_statistics()
+    fL_batch     = np.copy(aeroacoustic_data.disc_lift_distribution)
+    compute_rotor_blade_loading(rotor,aeroacoustic_data,settings)
+    statistics_2 = blade_loading_cache_statistics()
+    print(statistics_2)
+    assert statistics_1.misses - statistics_0.misses == statistics_1.sections
+    assert statistics_2.hits - statistics_1.hits == statistics_1.sections
+    assert statistics_2.misses == statistics_1.misses
+    assert np.array_equal(aeroacoustic_data.disc_lift_distribution,fL_batch)
+
+    # the cache can be turned off
+    settings.share_blade_loading = False
+    compute_rotor_blade_loading(rotor,aeroacoustic_data,settings)
+    assert np.max(np.abs(aeroacoustic_data.disc_lift_distribution - fL_batch)) < 1E-8
+    assert blade_loading_cache_statistics().hits == statistics_2.hits
+    return
+
+if __name__ == '__main__':
+    main()
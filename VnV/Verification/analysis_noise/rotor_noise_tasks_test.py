@@ -0,0 +1,98 @@
+# rotor_noise_tasks_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the rotor noise computed by a pool of threads or processes, one task per rotor and block of
+# control points, is identical to the rotor noise computed serially
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                                                        import Units
+from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor                  import compute_rotor_noise, prepare_rotor_noise, compute_rotor_noise_tasks
+from RCAIDE.Framework.Mission.Common                                              import Results
+from RCAIDE.Framework.Mission.Segments.Segment                                    import Segment
+from RCAIDE.Library.Methods.Powertrain.Converters.Rotor.compute_rotor_performance import compute_rotor_performance
+
+import numpy as np
+import time
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles' + os.path.sep + 'Rotors'))
+from F8745_D4_Propeller  import F8745_D4_Propeller
+from APC_11x4_Propeller  import APC_11x4_Propeller
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    rotors = [F8745_D4_Propeller(), APC_11x4_Propeller()]
+    for rotor in rotors:
+        rotor.number_azimuthal_stations = 16
+        rotor.use_2d_analysis           = True
+    theta         = np.linspace(10,170,9)*Units.degrees
+    mic_positions = np.stack([-4*np.cos(theta), 4*np.sin(theta), np.zeros_like(theta)],axis=1)
+    omega         = [np.array([2390,2710,2630]) * Units.rpm, np.array([6000,7000,8000]) * Units.rpm]
+    segment       = setup_segment(rotors,omega,mic_positions)
+    conditions    = segment.state.conditions
+
+    for fidelity in ['line_source','plane_source']:
+        settings          = RCAIDE.Framework.Analyses.Noise.Frequency_Domain_Buildup().settings
+        settings.fidelity = fidelity
+
+        # reference computed serially by compute_rotor_noise
+        reference = []
+        for rotor in rotors:
+            compute_rotor_noise(mic_positions,rotor,segment,settings)
+            reference.append(conditions.noise.converters[rotor.tag])
+
+        for executor, workers in [('thread',1),('thread',4),('process',2)]:
+            settings.noise_executor          = executor
+            settings.number_of_noise_workers = workers
+            for rotor in rotors:
+                prepare_rotor_noise(rotor,conditions,settings)
+            ti            = time.time()
+            rotor_results = compute_rotor_noise_tasks(mic_positions,rotors,conditions,settings)
+            tf            = time.time()
+            print(fidelity + ' ' + executor + ' pool of ' + str(workers) + ' workers: {:.3f} s'.format(tf - ti))
+            for Results, Reference in zip(rotor_results,reference):
+                for name in Reference.keys():
+                    assert np.array_equal(np.asarray(Results[name]),np.asarray(Reference[name]),equal_nan=True), name
+    return
+
+# ----------------------------------------------------------------------
+#   Operating conditions
+# ----------------------------------------------------------------------
+def setup_segment(rotors,omega,mic_positions):
+    a          = 343.376
+    ctrl_pts   = len(omega[0])
+    AoA        = np.zeros(ctrl_pts)
+
+    segment                                                = Segment()
+    conditions                                             = Results()
+    conditions.noise.relative_microphone_locations         = mic_positions[None,:,:]
+    conditions.noise.number_of_microphones                 = len(mic_positions)
+    conditions.aerodynamics.angles.alpha                   = np.atleast_2d(AoA).T
+    conditions.freestream.density                          = np.ones((ctrl_pts,1)) * 1.2250
+    conditions.freestream.dynamic_viscosity                = np.ones((ctrl_pts,1)) * 1.81E-5
+    conditions.freestream.speed_of_sound                   = np.ones((ctrl_pts,1)) * a
+    conditions.freestream.temperature                      = np.ones((ctrl_pts,1)) * 288.16889478
+    conditions.frames.inertial.velocity_vector             = np.array([[77.2, 0. ,0.],[ 77.0,0.,0.], [ 77.2, 0. ,0.]])
+    conditions.freestream.mach_number                      = np.atleast_2d(np.linalg.norm(conditions.frames.inertial.velocity_vector,axis = 1)).T/ a
+    conditions.frames.planet.true_course                   = np.tile(np.eye(3)[None,:,:],(ctrl_pts,1,1))
+    conditions.frames.wind.transform_to_inertial           = np.tile(np.eye(3)[None,:,:],(ctrl_pts,1,1))
+    conditions.frames.body.transform_to_inertial           = np.tile(np.eye(3)[None,:,:],(ctrl_pts,1,1))
+    segment.state.conditions                               = conditions
+
+    for rotor in rotors:
+        rotor.append_operating_conditions(segment, segment.state.conditions.energy,segment.state.conditions.noise)
+    segment.state.conditions.expand_rows(ctrl_pts)
+    for rotor,rotor_omega in zip(rotors,omega):
+        segment.state.conditions.energy.converters[rotor.tag].omega[:,0] = rotor_omega
+        compute_rotor_performance(rotor,segment.state.conditions)
+    return segment
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# VLM_batched_control_points_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the direct VLM evaluation of a trimmed segment solves the control points sharing a deflection
+# together and gives the coefficients of a VLM solve at each control point
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from RCAIDE.Framework.Core                                      import Units
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method  import VLM, evaluate_no_surrogate, slice_VLM_conditions, clear_vortex_distribution_cache, vortex_distribution_cache_statistics
+
+import numpy as np
+import sys
+import os
+
+# import the setup of the untrimmed flight test
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from untrimmed_flight_test import vehicle_setup, configs_setup, analyses_setup, mission_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = analyses_setup(configs)
+    mission  = mission_setup(analyses)
+    segment  = mission.segments.cruise
+    segment.state.numerics.number_of_control_points = 4
+    mission.evaluate()
+
+    # trim the aircraft with two distinct elevator deflections
+    state                       = segment.state
+    state.analyses              = segment.analyses
+    aerodynamics                = segment.analyses.aerodynamics
+    aerodynamics.settings.trim_aircraft = True
+    conditions                  = state.conditions
+    elevator_deflections        = np.array([0., 2., 2., 0.]) * Units.degrees
+    conditions.control_surfaces.elevator.deflection[:,0] = elevator_deflections
+
+    clear_vortex_distribution_cache()
+    start = vortex_distribution_cache_statistics()
+    evaluate_no_surrogate(state, aerodynamics.settings, aerodynamics.vehicle)
+    stats = vortex_distribution_cache_statistics()
+    print(stats)
+
+    # the two trimmed panelizations are each generated once, then one per control surface perturbation
+    assert stats.misses - start.misses == 2 + 4
+
+    # the coefficients of each control point match a VLM solve with its own deflection
+    elevator = aerodynamics.vehicle.wings.horizontal_stabilizer.control_surfaces.elevator
+    for i, deflection in enumerate(elevator_deflections):
+        elevator.deflection = deflection
+        results = VLM(slice_VLM_conditions(conditions, [i]), aerodynamics.settings, aerodynamics.vehicle)
+        for key, coefficient in [('CLift','lift'),('CL','L'),('CM','M'),('CN','N')]:
+            error = np.abs(results[key][0,0] - conditions.static_stability.coefficients[coefficient][i,0])
+            print(key, i, error)
+            assert error < 1e-10, 'Failed at {} test'.format(key)
+        assert np.allclose(results.CP[0], conditions.aerodynamics.coefficients.surface_pressure[i], atol=1e-6)
+    return
+
+if __name__ == '__main__':
+    main()
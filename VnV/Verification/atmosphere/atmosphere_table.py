@@ -0,0 +1,63 @@
+# atmosphere_table.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the tabulated US 1976 Standard Atmosphere stays within its error bound of the layer equations
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    reference = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    tabulated = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    tabulated.settings.use_atmosphere_table = True
+
+    # geometric altitudes of geopotential altitudes within the model, including every break
+    breaks = reference.breaks.altitude
+    z      = np.hstack((np.linspace(breaks[0],breaks[-1],100001),breaks))
+    z      = z/(1 - z/reference.planet.mean_radius)
+
+    for resolution in [10.,100.]:
+        tabulated.settings.atmosphere_table_resolution = resolution
+        for temperature_deviation in [0.,15.,-20.]:
+            exact  = reference.compute_values(z,temperature_deviation)
+            table  = tabulated.compute_values(z,temperature_deviation)
+            bound  = tabulated.table.pressure_error_bound
+            p_err  = np.max(np.abs(table.pressure/exact.pressure - 1))
+            T_err  = np.max(np.abs(table.temperature - exact.temperature))
+            print('Resolution = {:5.1f} m, ISA + {:5.1f} K : pressure error = {:.3e}, bound = {:.3e}, temperature error = {:.3e}'.format(
+                  resolution,temperature_deviation,p_err,bound,T_err))
+            assert p_err <= bound
+            assert T_err < 1E-10
+            assert np.max(np.abs(table.density/exact.density - 1)) <= 2*bound
+            for name in ['speed_of_sound','dynamic_viscosity','thermal_conductivity','prandtl_number']:
+                assert np.max(np.abs(table[name]/exact[name] - 1)) < 1E-12
+
+    # the pressure is monotone with altitude
+    tabulated.settings.atmosphere_table_resolution = 10.
+    p = tabulated.compute_values(np.sort(z)).pressure[:,0]
+    assert np.all(np.diff(p) <= 0)
+
+    # typical mission vectors
+    for num_cpt in [16,64]:
+        z = np.linspace(0,11,num_cpt)[:,None]*Units.km
+        for atmosphere in [reference,tabulated]:
+            atmosphere.compute_values(z,10.)
+            ti = time.perf_counter()
+            for _ in range(200):
+                atmosphere.compute_values(z,10.)
+            tf = time.perf_counter()
+            print('{:2d} control points, table = {} : {:.1f} us per call'.format(
+                  num_cpt,atmosphere.settings.use_atmosphere_table,(tf-ti)/200*1E6))
+    return
+
+if __name__ == '__main__':
+    main()
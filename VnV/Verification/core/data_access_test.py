@@ -0,0 +1,92 @@
+# data_access_test.py
+# 
+# Created:  Oct 2026, RCAIDE Team
+
+""" Checks dotted attribute access of Data and reports its per-access cost """
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+# RCAIDE imports 
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Framework.Mission.Common import Conditions
+
+# python imports 
+import numpy as np
+import timeit
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    
+    # ------------------------------------------------------------------
+    #   Dotted access
+    # ------------------------------------------------------------------
+    conditions                     = Conditions()
+    conditions.freestream          = Conditions()
+    conditions.freestream.velocity = np.ones((4,1)) 
+    conditions.tag                 = 'conditions'
+    
+    assert 'freestream' in conditions
+    assert conditions.freestream is conditions['freestream']
+    assert np.all(conditions.freestream.velocity == 1.)
+    
+    # methods and class attributes are not keys
+    assert conditions.expand_rows.__name__ == 'expand_rows'
+    assert conditions._size == 1
+    conditions.expand_rows(4)
+    assert conditions._size == 4
+    assert '_size' not in conditions
+    
+    # keys shadow methods on lookup
+    data        = Data()
+    data.values = 1.
+    assert 'values' not in data
+    data['update'] = 2.
+    assert data.update == 2.
+    
+    # missing names still raise
+    try:
+        conditions.not_a_key
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('missing attribute did not raise')
+    
+    # ------------------------------------------------------------------
+    #   Pack and unpack
+    # ------------------------------------------------------------------
+    unknowns            = Conditions()
+    unknowns.tag        = 'unknowns'
+    unknowns.body_angle = np.linspace(0,1,4)[:,None]
+    unknowns.throttle   = np.ones((4,2))
+    unknowns.time       = 10.
+    
+    x = unknowns.pack_array()
+    assert np.all(x[:4] == unknowns.body_angle[:,0])
+    assert np.all(x[4:12] == 1.) and x[12] == 10.
+    unknowns.unpack_array(np.arange(13.))
+    assert np.all(unknowns.throttle == np.reshape(np.arange(4.,12.),(4,2),order='F'))
+    assert unknowns.time == 12.
+    
+    # the layout follows shape changes
+    unknowns.throttle = np.ones((4,1)) 
+    assert len(unknowns.pack_array()) == 9 
+    
+    # ------------------------------------------------------------------
+    #   Per access cost
+    # ------------------------------------------------------------------
+    n = 100000
+    key_time    = timeit.timeit(lambda: conditions.freestream.velocity,number=n)/n
+    method_time = timeit.timeit(lambda: conditions.expand_rows,number=n)/n
+    set_time    = timeit.timeit(lambda: setattr(conditions.freestream,'velocity',None),number=n)/n
+    
+    print('Key access    : %.3f us' % (key_time*1E6))
+    print('Method access : %.3f us' % (method_time*1E6))
+    print('Key setting   : %.3f us' % (set_time*1E6))
+     
+    return 
+
+if __name__ == '__main__': 
+    main() 
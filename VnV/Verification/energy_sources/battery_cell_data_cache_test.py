@@ -0,0 +1,90 @@
+# battery_cell_data_cache_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that battery modules of the same chemistry share the processed cell data, and that the shared and
+# precompiled discharge performance maps match the maps built from the raw data
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Library.Methods.Powertrain.Sources.Batteries.Common                 import clear_cell_data_cache, cell_data_cache_statistics
+from RCAIDE.Library.Methods.Powertrain.Sources.Batteries.Common.cell_data_cache import cell_data_cache
+from RCAIDE.Library.Components.Powertrain.Sources.Battery_Modules               import Lithium_Ion_NMC, Lithium_Ion_LFP
+from RCAIDE.Library.Components.Powertrain.Sources.Battery_Modules.Lithium_Ion_NMC import load_battery_results as load_nmc_results
+from RCAIDE.Library.Components.Powertrain.Sources.Battery_Modules.Lithium_Ion_NMC import create_discharge_performance_map as create_nmc_map
+from RCAIDE.Library.Components.Powertrain.Sources.Battery_Modules.Lithium_Ion_LFP import load_battery_results as load_lfp_results
+from RCAIDE.Library.Components.Powertrain.Sources.Battery_Modules.Lithium_Ion_LFP import create_discharge_performance_map as create_lfp_map
+
+# package imports
+import numpy as np
+import tempfile
+import shutil
+import time
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    clear_cell_data_cache()
+    hits   = cell_data_cache.hits
+    misses = cell_data_cache.misses
+
+    ti          = time.time()
+    nmc_modules = [Lithium_Ion_NMC() for i in range(20)]
+    lfp_modules = [Lithium_Ion_LFP() for i in range(20)]
+    tf          = time.time()
+    print('40 battery modules : {:.3f} s'.format(tf - ti))
+
+    # every module of a chemistry holds the same performance map, loaded once
+    statistics = cell_data_cache_statistics()
+    print(statistics)
+    assert statistics.entries == 2
+    assert statistics.misses - misses == 2
+    assert statistics.hits - hits == 38
+    for module in nmc_modules[1:]:
+        assert module.cell.discharge_performance_map is nmc_modules[0].cell.discharge_performance_map
+    for module in lfp_modules[1:]:
+        assert module.cell.discharge_performance_map is lfp_modules[0].cell.discharge_performance_map
+
+    # the shared maps match the maps built from the raw data
+    nmc_reference, lfp_reference = create_nmc_map(load_nmc_results()), create_lfp_map(load_lfp_results())
+    nmc_points, lfp_points       = sample_points()
+    compare_maps(nmc_modules[0].cell.discharge_performance_map,lfp_modules[0].cell.discharge_performance_map,
+                 nmc_reference,lfp_reference,nmc_points,lfp_points)
+
+    # precompiled processed data
+    directory = tempfile.mkdtemp()
+    try:
+        cell_data_cache.directory = directory
+        clear_cell_data_cache()
+        Lithium_Ion_NMC()
+        Lithium_Ion_LFP()
+        clear_cell_data_cache()
+        nmc_module = Lithium_Ion_NMC()
+        lfp_module = Lithium_Ion_LFP()
+        compare_maps(nmc_module.cell.discharge_performance_map,lfp_module.cell.discharge_performance_map,
+                     nmc_reference,lfp_reference,nmc_points,lfp_points)
+    finally:
+        cell_data_cache.directory = None
+        clear_cell_data_cache()
+        shutil.rmtree(directory)
+    return
+
+def sample_points():
+    """ Currents, temperatures and states of charge within the NMC and LFP data """
+    rng        = np.random.default_rng(0)
+    nmc_points = rng.uniform([0,272.65,0],[8,322.65,1],(200,3))
+    lfp_points = rng.uniform([0,0,0],[5,45,2.5],(200,3))
+    return nmc_points, lfp_points
+
+def compare_maps(nmc_map,lfp_map,nmc_reference,lfp_reference,nmc_points,lfp_points):
+    """ Checks the voltage and temperature of the NMC map and the voltage of the LFP map against the references """
+    assert np.max(np.abs(nmc_map.Voltage(nmc_points)     - nmc_reference.Voltage(nmc_points))) < 1E-12
+    assert np.max(np.abs(nmc_map.Temperature(nmc_points) - nmc_reference.Temperature(nmc_points))) < 1E-12
+    assert np.max(np.abs(lfp_map(lfp_points) - lfp_reference(lfp_points))) < 1E-12
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+# VnV/Verification/energy_sources/battery_time_marching_test.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+
+# package imports
+import numpy as np
+import time
+
+# local imports
+import sys
+import os
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Battery_Cell   import vehicle_setup , configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    ''' Compares the battery modules computed over all control points of a segment with the battery modules
+    computed one control point at a time, for both lithium-ion chemistries and bus configurations '''
+
+    curr                  = [1.5,3]
+    C_rat                 = [0.5,1]
+    mAh                   = np.array([3800,2600])
+    battery_chemistry     = ['lithium_ion_nmc','lithium_ion_lfp']
+    electrical_config     = ['Series','Parallel']
+    for j in range(len(curr)):
+        for i in range(len(battery_chemistry)):
+            results = []
+            for vectorized in [False,True]:
+                vehicle  = vehicle_setup(curr[j],C_rat[j],battery_chemistry[i],electrical_config[j])
+                for network in vehicle.networks:
+                    for bus in network.busses:
+                        bus.vectorized_battery_time_marching = vectorized
+                configs  = configs_setup(vehicle)
+                analyses = analyses_setup(configs)
+                mission  = mission_setup(analyses,battery_chemistry[i],curr[j],mAh[i])
+
+                ti       = time.time()
+                results.append(mission.evaluate())
+                tf       = time.time()
+                print(battery_chemistry[i] + ', ' + electrical_config[j] + ', vectorized = ' + str(vectorized) + ': ' + str(round(tf-ti,3)) + ' s')
+
+            for per_point_segment, vectorized_segment in zip(results[0].segments, results[1].segments):
+                per_point_bus   = per_point_segment.conditions.energy.bus
+                vectorized_bus  = vectorized_segment.conditions.energy.bus
+                error = compare_conditions(per_point_bus,vectorized_bus)
+                print(per_point_segment.tag + ' maximum relative difference: ' + str(error))
+                assert error < 1e-12
+    return
+
+def compare_conditions(per_point,vectorized):
+    ''' Returns the largest relative difference between the arrays of two conditions '''
+    error = 0.
+    for key, value in per_point.items():
+        if isinstance(value,dict):
+            error = max(error,compare_conditions(value,vectorized[key]))
+        elif isinstance(value,np.ndarray) and value.dtype.kind == 'f':
+            difference = np.abs(value - vectorized[key])
+            scale      = np.maximum(np.abs(value),1.)
+            error      = max(error,np.nanmax(difference/scale,initial=0.))
+            assert np.array_equal(np.isnan(value),np.isnan(vectorized[key]))
+    return error
+
+def analyses_setup(configs):
+
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+
+    # build a base analysis for each config
+    for tag,config in configs.items():
+        analysis = base_analysis(config)
+        analyses[tag] = analysis
+
+    return analyses
+
+def base_analysis(vehicle):
+    #   Initialize the Analyses
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    #  Energy
+    energy          = RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    #  Planet Analysis
+    planet  = RCAIDE.Framework.Analyses.Planets.Earth()
+    analyses.append(planet)
+
+    #  Atmosphere Analysis
+    atmosphere                 = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    return analyses
+
+def mission_setup(analyses,battery_chemistry,current,mAh):
+
+    #   Initialize the Mission
+    mission            = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag        = 'cell_cycle_test'
+    Segments           = RCAIDE.Framework.Mission.Segments
+    base_segment       = Segments.Segment()
+    time               = 0.8 * (mAh/1000)/current * Units.hrs
+
+    # Charge Segment
+    segment                                 = Segments.Ground.Battery_Recharge(base_segment)
+    segment.analyses.extend(analyses.charge)
+    segment.cutoff_SOC                      = 1.0
+    segment.initial_battery_state_of_charge = 0.2
+    segment.tag                             = 'Recharge'
+    mission.append_segment(segment)
+
+    # Discharge Segments
+    segment                                 = Segments.Ground.Battery_Discharge(base_segment)
+    segment.analyses.extend(analyses.discharge)
+    segment.tag                             = 'Discharge_1'
+    segment.time                            = time/2
+    segment.initial_battery_state_of_charge = 1
+    mission.append_segment(segment)
+
+    segment                                = Segments.Ground.Battery_Discharge(base_segment)
+    segment.tag                            = 'Discharge_2'
+    segment.analyses.extend(analyses.discharge)
+    segment.time                           = time/2
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+# VnV/Verification/energy_sources/fuel_cell_current_density_test.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Library.Methods.Powertrain.Converters.Fuel_Cells.Proton_Exchange_Membrane import compute_fuel_cell_current_density, evaluate_PEM, polarization_curve_cache, \
+     clear_polarization_curve_cache, polarization_curve_cache_statistics, compute_polarization_curve
+
+# package imports
+import numpy as np
+import time
+from copy import deepcopy
+
+# local imports
+import sys
+import os
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Hydrogen_Fuel_Cell   import vehicle_setup , configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+    ''' Compares the current density of the PEM fuel cell found by the bracketed root finder with the fixed step
+    relaxation it replaced, and checks that the polarization curve cache does not change the mission results '''
+
+    # mission without and with the polarization curve cache
+    results = []
+    for enabled in [False,True]:
+        clear_polarization_curve_cache()
+        polarization_curve_cache.enabled = enabled
+        results.append(run_mission())
+    polarization_curve_cache.enabled = False
+    statistics = polarization_curve_cache_statistics()
+    print('Polarization curve cache: ' + str(statistics.entries) + ' entries, ' + str(statistics.hits) + ' hits')
+    assert statistics.hits > 0
+
+    stack_conditions = [list(result.segments[0].conditions.energy.bus.fuel_cell_stacks.values())[0] for result in results]
+    for key in ['power','current','voltage_under_load','H2_mass_flow_rate']:
+        assert np.array_equal(stack_conditions[0][key],stack_conditions[1][key],equal_nan=True)
+    for key in ['current_density','stack_temperature']:
+        assert np.array_equal(stack_conditions[0].fuel_cell[key],stack_conditions[1].fuel_cell[key],equal_nan=True)
+
+    # current density at the stack states of the mission over a range of power demands
+    vehicle          = vehicle_setup('PEM')
+    fuel_cell_stack  = list(list(list(vehicle.networks)[0].busses)[0].fuel_cell_stacks)[0]
+    conditions       = deepcopy(stack_conditions[0])
+    stack_states     = np.where(np.isfinite(conditions.fuel_cell.voltage_under_load[:,0]))[0]
+    demands          = np.linspace(1,40,8)
+
+    relaxation_time  = 0.
+    converged        = 0
+    root_finder_time = 0.
+    for t_idx in stack_states:
+        for P_cell in demands:
+            ti = time.time()
+            i_relaxation, relaxation_converged = relaxation_current_density(fuel_cell_stack,conditions,t_idx,P_cell)
+            tf = time.time()
+            relaxation_time += tf - ti
+
+            ti = time.time()
+            i_root_finder = compute_fuel_cell_current_density(fuel_cell_stack,conditions,t_idx,P_cell)
+            tf = time.time()
+            root_finder_time += tf - ti
+
+            # the net power of the cell meets the demand
+            conditions.fuel_cell.current_density[t_idx] = i_root_finder
+            P_fuel_cell = evaluate_PEM(fuel_cell_stack,conditions,t_idx)[2]
+            assert np.abs(P_fuel_cell[0] - P_cell) < 1E-8
+
+            # the relaxation leaves the rising side of the polarization curve at small demands
+            if relaxation_converged:
+                assert np.abs(i_root_finder - i_relaxation) < 1E-8
+                converged += 1
+
+    print('Fixed step relaxation converged at ' + str(converged) + ' of ' + str(len(stack_states)*len(demands)) + ' operating points')
+    assert converged > 0
+
+    # demands above the maximum net power of the cell keep the operating point of the relaxation
+    for t_idx in stack_states:
+        P_cell          = 2*np.nanmax(compute_polarization_curve(fuel_cell_stack,conditions,t_idx)[1])
+        i_relaxation, _ = relaxation_current_density(fuel_cell_stack,conditions,t_idx,P_cell)
+        i_root_finder   = compute_fuel_cell_current_density(fuel_cell_stack,conditions,t_idx,P_cell)
+        assert np.abs(i_root_finder - i_relaxation) < 1E-8
+    print('Fixed step relaxation time: ' + str(round(relaxation_time,3)) + ' s')
+    print('Bracketed root finder time: ' + str(round(root_finder_time,3)) + ' s')
+    return
+
+def relaxation_current_density(fuel_cell_stack,conditions,t_idx,P_cell):
+    ''' Fixed step relaxation on the net power of the cell, previously used by compute_fuel_cell_performance,
+    returns the current density at which it stopped and whether the net power met the demand '''
+    i      = 1
+    diff_P = 10
+    alpha  = 0.05
+    for iteration in range(10000):
+        if not abs(diff_P) > 1E-8:
+            break
+        conditions.fuel_cell.current_density[t_idx] = i
+        P_fuel_cell = evaluate_PEM(fuel_cell_stack,conditions,t_idx)[2]
+        diff_P      = P_cell - P_fuel_cell[0]
+        i          += diff_P*alpha
+    return conditions.fuel_cell.current_density[t_idx,0], abs(diff_P) <= 1E-8
+
+def run_mission():
+    vehicle  = vehicle_setup('PEM')
+    configs  = configs_setup(vehicle)
+    analyses = analyses_setup(configs)
+
+    mission            = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag        = 'fuel_cell_test'
+    Segments           = RCAIDE.Framework.Mission.Segments
+    base_segment       = Segments.Segment()
+
+    segment            = Segments.Ground.Battery_Discharge(base_segment)
+    segment.analyses.extend(analyses.discharge)
+    segment.tag        = 'Discharge'
+    segment.time       = 60
+    mission.append_segment(segment)
+    return mission.evaluate()
+
+def analyses_setup(configs):
+
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+
+    # build a base analysis for each config
+    for tag,config in configs.items():
+        analysis = base_analysis(config)
+        analyses[tag] = analysis
+
+    return analyses
+
+def base_analysis(vehicle):
+    #   Initialize the Analyses
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    #  Energy
+    energy          = RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    #  Planet Analysis
+    planet  = RCAIDE.Framework.Analyses.Planets.Earth()
+    analyses.append(planet)
+
+    #  Atmosphere Analysis
+    atmosphere                 = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    return analyses
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# airfoil_database_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the airfoil database stores the properties computed by compute_airfoil_properties and loads them
+# back when the same airfoil geometry and polar files are used again
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from RCAIDE.Library.Methods.Geometry.Airfoil import import_airfoil_geometry, compute_airfoil_properties, airfoil_database_settings, clear_airfoil_database, airfoil_database_statistics
+
+import numpy as np
+import tempfile
+import shutil
+import time
+import sys
+import os
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    separator     = os.path.sep
+    airfoils_path = os.path.split(os.path.split(sys.path[0])[0])[0] + separator + 'Vehicles' + separator + 'Airfoils' + separator
+    polar_files   = [airfoils_path + 'Polars' + separator + 'Clark_y_polar_Re_' + Re + '.txt' for Re in ['50000','100000','200000','500000','1000000']]
+    geometry      = import_airfoil_geometry(airfoils_path + 'Clark_y.txt', npoints = 201)
+    directory     = tempfile.mkdtemp()
+
+    airfoil_database_settings.enabled   = True
+    airfoil_database_settings.directory = directory
+    try:
+        start = airfoil_database_statistics()
+
+        # the first call computes and stores the airfoil properties
+        t0       = time.time()
+        computed = compute_airfoil_properties(geometry, polar_files)
+        t1       = time.time()
+        stats    = airfoil_database_statistics()
+        assert stats.misses - start.misses == 1
+        assert stats.writes - start.writes == 1
+        assert stats.entries == 1
+
+        # the second call loads them
+        loaded   = compute_airfoil_properties(geometry, polar_files)
+        t2       = time.time()
+        stats    = airfoil_database_statistics()
+        print('computed time : {:.3f} s'.format(t1 - t0))
+        print('loaded time   : {:.3f} s'.format(t2 - t1))
+        assert stats.hits - start.hits == 1
+        assert list(loaded.keys()) == list(computed.keys())
+        for key in computed.keys():
+            if isinstance(computed[key], np.ndarray):
+                assert np.array_equal(loaded[key], computed[key]), 'Failed at {} test'.format(key)
+        points = np.array([[2. * np.pi / 180, 2E5], [20. * np.pi / 180, 5E6]])
+        assert np.array_equal(loaded.lift_distribution_func(points), computed.lift_distribution_func(points))
+        assert np.array_equal(loaded.drag_distribution_func(points), computed.drag_distribution_func(points))
+
+        # a modified polar file is a different airfoil
+        modified_polar = os.path.join(directory, 'modified_polar.txt')
+        with open(polar_files[-1]) as f:
+            lines = f.readlines()
+        with open(modified_polar, 'w') as f:
+            f.writelines(lines + ['\n'])
+        compute_airfoil_properties(geometry, polar_files[:-1] + [modified_polar])
+        assert airfoil_database_statistics().misses - start.misses == 2
+
+        assert clear_airfoil_database() == 2
+        assert airfoil_database_statistics().entries == 0
+    finally:
+        airfoil_database_settings.enabled   = False
+        airfoil_database_settings.directory = None
+        shutil.rmtree(directory, ignore_errors=True)
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# geodesics_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the vectorized geodesic solutions match the geodesics of single pairs of points
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from RCAIDE.Library.Methods.Geodesics             import Geodesic, compute_geodesic_inverse, compute_geodesic_direct
+from RCAIDE.Framework.Analyses.Geodesics.Geodesics import Calculate_Distance
+
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    # Wellington to Salamanca, nearly antipodal points
+    geodesic = compute_geodesic_inverse(-41.32, 174.81, 40.96, -5.50)
+    print('Wellington to Salamanca : ', geodesic.distance, geodesic.azimuth_1, geodesic.azimuth_2)
+    assert np.abs(geodesic.distance  - 19959679.267353) < 1E-5
+    assert np.abs(geodesic.azimuth_1 - 161.067669986) < 1E-8
+    assert np.abs(geodesic.azimuth_2 - 18.825195123) < 1E-8
+
+    # Perth in the direction of Bermuda
+    geodesic = compute_geodesic_direct(-32.06, 115.74, 225, 20000E3)
+    print('Perth towards Bermuda   : ', geodesic.latitude, geodesic.longitude)
+    assert np.abs(geodesic.latitude  - 32.11195529) < 1E-8
+    assert np.abs(geodesic.longitude + 63.95925278) < 1E-8
+
+    # random pairs, with nearly antipodal, meridional, equatorial, polar and coincident points
+    rng  = np.random.default_rng(0)
+    N    = 500
+    lat1 = rng.uniform(-90,90,N)
+    lon1 = rng.uniform(-180,180,N)
+    lat2 = rng.uniform(-90,90,N)
+    lon2 = rng.uniform(-180,180,N)
+    lat2[:100]    = np.clip(-lat1[:100] + rng.normal(0,0.5,100),-90,90)
+    lon2[:100]    = lon1[:100] + 180 + rng.normal(0,0.5,100)
+    lon2[100:150] = lon1[100:150]
+    lat1[150:200] = 0
+    lat2[150:200] = 0
+    lat1[200:220] = 90
+    lat2[220:240] = -90
+    lat2[240:260] = lat1[240:260]
+    lon2[240:260] = lon1[240:260]
+
+    geodesic = compute_geodesic_inverse(lat1, lon1, lat2, lon2)
+    for i in range(N):
+        reference = Geodesic.WGS84.Inverse(lat1[i], lon1[i], lat2[i], lon2[i])
+        assert np.abs(geodesic.distance[i] - reference['s12']) < 1E-6
+        assert np.abs(np.remainder(geodesic.azimuth_1[i] - reference['azi1'] + 180, 360) - 180) < 1E-9
+        assert np.abs(np.remainder(geodesic.azimuth_2[i] - reference['azi2'] + 180, 360) - 180) < 1E-9
+
+    # the direct solution returns to the second points, away from the poles
+    end   = compute_geodesic_direct(lat1, lon1, geodesic.azimuth_1, geodesic.distance)
+    valid = (geodesic.distance > 0) & (np.abs(lat1) < 90) & (np.abs(lat2) < 90)
+    assert np.max(np.abs(end.latitude - lat2)[valid]) < 1E-9
+    assert np.max(np.abs(np.remainder(end.longitude - lon2 + 180, 360) - 180)[valid]) < 1E-9
+
+    # distance matrix of a set of coordinates
+    coordinates = np.stack([rng.uniform(-80,80,300), rng.uniform(-180,180,300)],axis=1)
+    ti          = time.time()
+    distances   = Calculate_Distance(coordinates[:,None,:], coordinates[None,:,:])
+    tf          = time.time()
+    print('300 x 300 distance matrix : {:.3f} s'.format(tf - ti))
+    assert distances.shape == (300,300)
+    assert np.max(np.abs(distances - distances.T)) < 1E-9
+    assert np.abs(distances[3,7] - Calculate_Distance(coordinates[3], coordinates[7])) < 1E-9
+    return
+
+if __name__ == '__main__':
+    main()
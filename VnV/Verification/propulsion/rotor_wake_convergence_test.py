@@ -0,0 +1,69 @@
+# rotor_wake_convergence_test.py
+#
+# Created:  Oct 2026, RCAIDE Team
+#
+# File to test that the vectorized Newton solver of the Helmholtz wake inflow angle converges every blade station
+# and matches the solution of the general nonlinear solver
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core                   import Units
+from RCAIDE.Library.Methods.Performance      import rotor_aerodynamic_analysis
+from RCAIDE.Library.Methods.Powertrain.Converters.Rotor.Performance.Blade_Element_Momentum_Theory_Helmholtz_Wake import wake_model
+
+import numpy as np
+import scipy as sp
+import os
+import sys
+
+# local imports
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles' + os.path.sep + 'Rotors'))
+from Test_Propeller    import Test_Propeller
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    propeller                           = Test_Propeller()
+    propeller.use_2d_analysis           = True
+    propeller.orientation_euler_angles  = [0.,20.*Units.degrees,0]
+
+    # capture the wake inputs of the analysis to solve them again with fsolve
+    captured          = []
+    wake_convergence  = wake_model.wake_convergence
+    def capture(rotor, wake_inputs):
+        captured.append(wake_inputs)
+        return wake_convergence(rotor, wake_inputs)
+    wake_model.wake_convergence = capture
+    try:
+        results = rotor_aerodynamic_analysis(propeller,
+                                             np.array([[49.1744]]),
+                                             angular_velocity    = 207.16160479940007,
+                                             blade_pitch_command = 0,
+                                             angle_of_attack     = 0,
+                                             altitude            = 0)
+    finally:
+        wake_model.wake_convergence = wake_convergence
+
+    convergence = results.inflow_convergence
+    print('iterations  : ', np.max(convergence.iterations))
+    print('evaluations : ', convergence.evaluations)
+    print('residual    : ', np.max(np.abs(convergence.residual)))
+    assert np.all(convergence.converged)
+    assert not convergence.fallback
+
+    # the Newton solution matches the one of the general nonlinear solver
+    wake_inputs = captured[-1]
+    PSI_guess   = np.ones((wake_inputs.ctrl_pts,wake_inputs.Nr,wake_inputs.Na))
+    assert np.shape(convergence.converged) == np.shape(PSI_guess)
+    PSI_newton,_ = wake_model.solve_inflow_angle(PSI_guess,wake_inputs,propeller)
+    PSI_fsolve  = sp.optimize.fsolve(wake_model.iteration,PSI_guess,args=(wake_inputs,propeller),xtol=propeller.sol_tolerance,band=(1,0))
+    error       = np.max(np.abs(PSI_newton.flatten() - PSI_fsolve))
+    print('inflow angle difference : ', error)
+    assert error < 1e-6
+    return
+
+if __name__ == '__main__':
+    main()
@@ -13,23 +13,43 @@ sys.path.append(os.path.join(sys.path[0], 'Vehicles', 'Rotors'))
 modules = [ 
     'Verification/analysis_aerodynamics/airfoil_panel_method_test.py',    
     'Verification/analysis_aerodynamics/airfoil_panel_method_convergence.py',
+    'Verification/analysis_aerodynamics/airfoil_panel_method_geometry_test.py',
+    'Verification/analysis_aerodynamics/airfoil_boundary_layer_lanes_test.py',
     'Verification/analysis_aerodynamics/VLM_control_surface_test.py',    
     'Verification/analysis_aerodynamics/VLM_moving_surface_test.py',   
+    'Verification/analysis_aerodynamics/VLM_surrogate_cache_test.py',
+    'Verification/analysis_aerodynamics/VLM_parallel_training_test.py',
+    'Verification/analysis_aerodynamics/VLM_tiled_influence_matrix_test.py',
+    'Verification/analysis_aerodynamics/VLM_vortex_distribution_cache_test.py',
+    'Verification/analysis_aerodynamics/VLM_fused_surrogate_test.py',
+    'Verification/analysis_aerodynamics/VLM_surrogate_registry_test.py',
     'Verification/analysis_aerodynamics/AVL_test.py',     
     'Verification/atmosphere/atmosphere.py',
+    'Verification/atmosphere/atmosphere_table.py',
     'Verification/atmosphere/constant_temperature.py',
+    'Verification/core/data_access_test.py',
     'Verification/analysis_emissions/emissions_test.py',   
     'Verification/analysis_noise/digital_elevation_test.py',  
     'Verification/analysis_noise/frequency_domain_test.py', 
+    'Verification/analysis_noise/harmonic_noise_memory_test.py',
+    'Verification/analysis_noise/rotor_blade_loading_test.py',
+    'Verification/analysis_noise/rotor_noise_tasks_test.py',
+    'Verification/analysis_noise/noise_stencil_test.py',
     'Verification/analysis_noise/empirical_jet_noise_test.py',    
     'Verification/analysis_stability/trimmed_flight_test.py', 
     'Verification/analysis_stability/untrimmed_flight_test.py', 
+    'Verification/analysis_stability/VLM_batched_control_points_test.py',
     'Verification/analysis_weights/operating_empty_weight_test.py',
     'Verification/analysis_weights/cg_and_moi_test.py',
     'Verification/energy_sources/battery_cell.py',
+    'Verification/energy_sources/battery_cell_data_cache_test.py',
+    'Verification/energy_sources/battery_time_marching_test.py',
     'Verification/energy_sources/fuel_cell.py',
+    'Verification/energy_sources/fuel_cell_current_density_test.py',
     'Verification/geometry/airfoil_import_test.py', 
+    'Verification/geometry/airfoil_database_test.py',
     'Verification/geometry/airfoil_interpolation_test.py',    
+    'Verification/geometry/geodesics_test.py',
     'Verification/geometry/wing_volume_test.py',
     'Verification/geometry/wing_fuel_volume_compute.py',
     'Verification/geometry/fuselage_planform_compute.py',  
@@ -57,6 +77,7 @@ modules = [
     'Verification/propulsion/rotor_performance_test.py',  
     'Verification/propulsion/propeller_non_uniform_inflow.py',    
     'Verification/propulsion/propeller_wing_interaction_test.py', 
+    'Verification/propulsion/rotor_wake_convergence_test.py',
     'Verification/propulsion/generator_test.py',
     'Verification/propulsion/motor_test.py',
     'Verification/propulsion/reformer_test.py', 